@@ -1,4 +1,4 @@
-import socket, time, math, struct
+import socket, math, struct
 from messages_robocup_ssl_detection_pb2 import SSL_DetectionRobot
 from ssl_simulation_robot_control_pb2 import (
     RobotCommand, 
@@ -8,6 +8,7 @@ from ssl_simulation_robot_control_pb2 import (
     MoveGlobalVelocity
 )
 from triton_bot_communication_pb2 import TritonBotMessage
+from scheduler import TickScheduler
 
 # Create and populate the TritonBotMessage
 message = TritonBotMessage()
@@ -47,6 +48,7 @@ def main():
     data = message.SerializeToString()
 
     count = 0
+    scheduler = TickScheduler(rate=1)
 
     try:
         while True:
@@ -68,12 +70,13 @@ def main():
                    data = message.SerializeToString()
 
             count += 1 
-            time.sleep(1)
+            scheduler.wait()
 
        
     
     except KeyboardInterrupt:
         print('\nStopping sender.')
+        print(scheduler.stats.summary())
 
     finally:
         sock.close()
@@ -1,4 +1,4 @@
-import socket, time, math, struct, threading
+import argparse, socket, math, struct, threading
 from pynput import keyboard
 from messages_robocup_ssl_detection_pb2 import SSL_DetectionRobot
 from ssl_simulation_robot_control_pb2 import (
@@ -9,6 +9,9 @@ from ssl_simulation_robot_control_pb2 import (
     MoveGlobalVelocity
 )
 from triton_bot_communication_pb2 import TritonBotMessage
+from scheduler import TickScheduler
+from command_log import CommandRecorder, RecordingSocket
+from stage_profiler import add_profile_arguments, start_profiler
 
 # Create and populate the TritonBotMessage
 message = TritonBotMessage()
@@ -42,6 +45,13 @@ sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
 ttl = struct.pack('b', 1)
 sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
 
+parser = argparse.ArgumentParser(description="Keyboard teleop for one robot over UDP multicast")
+parser.add_argument("--record", default=None, help="Log every sent datagram to this command log")
+add_profile_arguments(parser)
+args = parser.parse_args()
+if args.record:
+    sock = RecordingSocket(sock, CommandRecorder(args.record))
+
 # Dictionary to keep track of key states
 key_states = {'w': False, # move forward
               'a': False, # move left
@@ -75,41 +85,60 @@ def on_release(key):
 listener = keyboard.Listener(on_press=on_press, on_release=on_release) 
 listener.start()
 
-while(True):
-    message.command.move_command.local_velocity.forward = 0
-    message.command.move_command.local_velocity.left = 0 
-    message.command.move_command.local_velocity.angular = 0
-    message.command.kick_speed = 0
-    message.command.dribbler_speed = 0
-
-    if (key_states['w']):
-        message.command.move_command.local_velocity.forward = 3
+scheduler = TickScheduler(rate=10)
+session = start_profiler(args, 'usercontrol', budget=0.1)
+profiler = session.profiler
+poll, build, serialize, send, output = (profiler.stage(name) for name in
+                                        ('input', 'build', 'serialize', 'sendto', 'print'))
+
+try:
+    while(True):
+        profiler.tick_begin()
+        with poll:
+            keys = dict(key_states)  # one consistent view of what the listener thread has set
+        with build:
+            message.command.move_command.local_velocity.forward = 0
+            message.command.move_command.local_velocity.left = 0 
+            message.command.move_command.local_velocity.angular = 0
+            message.command.kick_speed = 0
+            message.command.dribbler_speed = 0
+
+            if (keys['w']):
+                message.command.move_command.local_velocity.forward = 3
     
-    if (key_states['s']):
-        message.command.move_command.local_velocity.forward = -3
+            if (keys['s']):
+                message.command.move_command.local_velocity.forward = -3
 
-    if (key_states['a']):
-        message.command.move_command.local_velocity.left = -3
+            if (keys['a']):
+                message.command.move_command.local_velocity.left = -3
 
-    if (key_states['d']):
-        message.command.move_command.local_velocity.left = 3
+            if (keys['d']):
+                message.command.move_command.local_velocity.left = 3
 
-    if (key_states['j']):
-        message.command.move_command.local_velocity.angular = 25
+            if (keys['j']):
+                message.command.move_command.local_velocity.angular = 25
 
-    if (key_states['l']):
-        message.command.move_command.local_velocity.angular = -25
+            if (keys['l']):
+                message.command.move_command.local_velocity.angular = -25
 
-    if (key_states['k']):
-        message.command.kick_speed = 1
-        key_states['k'] = False
+            if (keys['k']):
+                message.command.kick_speed = 1
+                key_states['k'] = False
 
-    if (key_states['b']):
-        message.command.dribbler_speed = 1
+            if (keys['b']):
+                message.command.dribbler_speed = 1
 
-    data = message.SerializeToString()
-    sock.sendto(data, (MULTICAST_GROUP, PORT))
+        with serialize:
+            data = message.SerializeToString()
+        with send:
+            sock.sendto(data, (MULTICAST_GROUP, PORT))
     
-    print(key_states)
-
-    time.sleep(0.1)
+        with output:
+            print(key_states)
+        profiler.tick_end()
+
+        scheduler.wait()
+finally:
+    print(scheduler.stats.summary())
+    sock.close()
+    session.close()
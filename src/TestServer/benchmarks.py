@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the host-side control path.
+
+Covers the hot paths the TestServer tools run every tick:
+  - protobuf build + serialize of TritonBotMessage (as UserControl.py does) and triton_codec
+  - the wasd_teleop.py text "dash"/"kick" encoding
+  - UDP sendto on loopback, unicast vs multicast
+  - wheel kinematics (batch and per command)
+  - UART frame encode/decode
+
+Fixtures are seeded so every run measures the same inputs. Each benchmark is
+timed over several repeats; the best repeat is reported as ns/op together
+with the spread. Results are written as JSON with environment metadata, and
+`compare` flags regressions between two result files.
+
+Usage:
+    python benchmarks.py run --out before.json
+    python benchmarks.py run --out after.json --filter udp
+    python benchmarks.py compare before.json after.json --threshold 10
+"""
+import argparse
+import json
+import os
+import platform
+import socket
+import statistics
+import struct
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+BENCHMARKS = {}
+
+
+def benchmark(name: str, ops: int):
+    """Register a setup function returning a callable that performs `ops` operations per call.
+
+    A `close` attribute on the callable, if any, releases what the setup opened;
+    an `after` attribute runs after every call, outside the timed region.
+    """
+    def register(setup):
+        BENCHMARKS[name] = (setup, ops)
+        return setup
+    return register
+
+
+def _commands(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return np.column_stack([rng.uniform(-3, 3, n), rng.uniform(-3, 3, n), rng.uniform(-25, 25, n)]).astype(np.float32)
+
+
+@benchmark('pb2_build_serialize', ops=1000)
+def _pb2_build_serialize():
+    from messages import new_bot_message
+    commands = _commands(1000).tolist()
+
+    def run():
+        for forward, left, angular in commands:
+            message = new_bot_message(2)
+            vel = message.command.move_command.local_velocity
+            vel.forward = forward
+            vel.left = left
+            vel.angular = angular
+            message.SerializeToString()
+    return run
+
+
+@benchmark('pb2_refill_serialize', ops=1000)
+def _pb2_refill_serialize():
+    from messages import new_bot_message
+    commands = _commands(1000).tolist()
+    message = new_bot_message(2)
+
+    def run():
+        for forward, left, angular in commands:
+            message.command.move_command.local_velocity.forward = forward
+            message.command.move_command.local_velocity.left = left
+            message.command.move_command.local_velocity.angular = angular
+            message.command.kick_speed = 0
+            message.command.dribbler_speed = 0
+            message.SerializeToString()
+    return run
+
+
+@benchmark('triton_codec_encode', ops=1000)
+def _triton_codec_encode():
+    from triton_codec import TritonBotEncoder
+    commands = _commands(1000).tolist()
+    encoder = TritonBotEncoder(2)
+
+    def run():
+        encode = encoder.encode
+        for forward, left, angular in commands:
+            encode(forward, left, angular)
+    return run
+
+
+@benchmark('triton_codec_decode', ops=1000)
+def _triton_codec_decode():
+    from triton_codec import TritonBotEncoder, decode
+    encoder = TritonBotEncoder(2)
+    datagrams = [bytes(encoder.encode(*cmd)) for cmd in _commands(1000).tolist()]
+
+    def run():
+        for data in datagrams:
+            decode(data)
+    return run
+
+
+@benchmark('text_dash_encode', ops=1000)
+def _text_dash_encode():
+    rng = np.random.default_rng(0)
+    setpoints = rng.integers(-10, 11, (1000, 2)).tolist()
+    robot = 1
+
+    def run():
+        for power, rot in setpoints:
+            f"{robot} dash {int(power)} {int(rot)}\n".encode("utf-8")
+    return run
+
+
+@benchmark('text_kick_encode', ops=1000)
+def _text_kick_encode():
+    robot = 1
+
+    def run():
+        for _ in range(1000):
+            f"{robot} kick\n".encode("utf-8")
+    return run
+
+
+def _loopback_pair():
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+    receiver.setblocking(False)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    return receiver, sender
+
+
+def _close_pair(run, receiver: socket.socket, sender: socket.socket):
+    def close():
+        receiver.close()
+        sender.close()
+    run.close = close
+    return run
+
+
+def _drain(sock: socket.socket):
+    try:
+        while True:
+            sock.recv(2048)
+    except BlockingIOError:
+        pass
+
+
+@benchmark('udp_sendto_unicast', ops=200)
+def _udp_sendto_unicast():
+    from triton_codec import TritonBotEncoder
+    receiver, sender = _loopback_pair()
+    receiver.bind(('127.0.0.1', 0))
+    dest = receiver.getsockname()
+    data = bytes(TritonBotEncoder(2).encode(1.0, 0.0, 0.0))
+
+    def run():
+        sendto = sender.sendto
+        for _ in range(200):
+            sendto(data, dest)
+    run.after = lambda: _drain(receiver)  # keep the receive queue from filling up, untimed
+    return _close_pair(run, receiver, sender)
+
+
+@benchmark('udp_sendto_multicast', ops=200)
+def _udp_sendto_multicast():
+    from messages import MULTICAST_GROUP
+    from triton_codec import TritonBotEncoder
+    receiver, sender = _loopback_pair()
+    receiver.bind(('', 0))
+    port = receiver.getsockname()[1]
+    mreq = struct.pack('4s4s', socket.inet_aton(MULTICAST_GROUP), socket.inet_aton('0.0.0.0'))
+    receiver.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+    sender.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, struct.pack('b', 1))
+    sender.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+    dest = (MULTICAST_GROUP, port)
+    data = bytes(TritonBotEncoder(2).encode(1.0, 0.0, 0.0))
+
+    def run():
+        sendto = sender.sendto
+        for _ in range(200):
+            sendto(data, dest)
+    run.after = lambda: _drain(receiver)  # keep the receive queue from filling up, untimed
+    return _close_pair(run, receiver, sender)
+
+
+@benchmark('kinematics_batch', ops=100000)
+def _kinematics_batch():
+    from kinematics import action_to_byte_array
+    commands = _commands(100000)
+    forward, left, angular = commands[:, 0], commands[:, 1], commands[:, 2]
+
+    def run():
+        action_to_byte_array(forward, left, angular)
+    return run
+
+
+@benchmark('kinematics_scalar', ops=1000)
+def _kinematics_scalar():
+    from kinematics import wheel_speeds_scalar
+    commands = _commands(1000).tolist()
+
+    def run():
+        for forward, left, angular in commands:
+            wheel_speeds_scalar(forward, left, angular)
+    return run
+
+
+@benchmark('uart_frame_encode', ops=1000)
+def _uart_frame_encode():
+    from kinematics import uart_frame
+    commands = _commands(1000).tolist()
+
+    def run():
+        for forward, left, angular in commands:
+            uart_frame(forward, left, angular, 1.0)
+    return run
+
+
+@benchmark('uart_frame_decode', ops=100000)
+def _uart_frame_decode():
+    from uart_framer import CommandFramer, synthetic_stream
+    stream, _ = synthetic_stream(100000 * 11, 'command', garbage_every=1000)
+    stream = stream[:100000 * 11]
+    chunks = [stream[i:i + 4096] for i in range(0, len(stream), 4096)]
+    framer = CommandFramer()
+
+    def run():
+        for chunk in chunks:
+            framer.feed(chunk)
+    return run
+
+
+def environment() -> dict:
+    """Metadata needed to judge whether two result files are comparable."""
+    from google.protobuf import __version__ as protobuf_version
+    from google.protobuf.internal import api_implementation
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ''
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'host': platform.node(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'python': sys.version.split()[0],
+        'python_implementation': platform.python_implementation(),
+        'protobuf': protobuf_version,
+        'protobuf_backend': api_implementation.Type(),
+        'numpy': np.__version__,
+        'git_commit': commit,
+    }
+
+
+def _time_calls(fn, loops: int) -> float:
+    """Seconds spent in `loops` calls of fn, leaving out its `after` hook."""
+    after = getattr(fn, 'after', None)
+    if after is None:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        return time.perf_counter() - start
+    total = 0.0
+    for _ in range(loops):
+        start = time.perf_counter()
+        fn()
+        total += time.perf_counter() - start
+        after()
+    return total
+
+
+def run_benchmark(name: str, repeat: int, min_time: float) -> dict:
+    setup, ops = BENCHMARKS[name]
+    fn = setup()
+    try:
+        _time_calls(fn, 1)  # warm-up
+        # size each repeat to take at least min_time seconds
+        loops = 1
+        while _time_calls(fn, loops) < min_time:
+            loops *= 2
+        samples = []
+        for _ in range(repeat):
+            samples.append(_time_calls(fn, loops) / (loops * ops) * 1e9)
+    finally:
+        close = getattr(fn, 'close', None)
+        if close is not None:
+            close()
+    best = min(samples)
+    return {
+        'ns_per_op': best,
+        'ops_per_s': 1e9 / best,
+        'median_ns': statistics.median(samples),
+        'stdev_ns': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'repeats': repeat,
+        'ops_per_repeat': loops * ops,
+    }
+
+
+def compare(old: dict, new: dict, threshold: float) -> int:
+    """Print a comparison table and return the number of regressions beyond threshold percent."""
+    for key in ('python', 'protobuf_backend', 'machine', 'host'):
+        if old['environment'].get(key) != new['environment'].get(key):
+            print(f"note: {key} differs ({old['environment'].get(key)} vs {new['environment'].get(key)})")
+    regressions = 0
+    print(f"{'benchmark':<24} {'old ns/op':>12} {'new ns/op':>12} {'change':>9}")
+    for name in sorted(set(old['results']) | set(new['results'])):
+        if name not in old['results'] or name not in new['results']:
+            print(f"{name:<24} {'only in ' + ('new' if name in new['results'] else 'old'):>35}")
+            continue
+        before = old['results'][name]['ns_per_op']
+        after = new['results'][name]['ns_per_op']
+        change = (after - before) / before * 100.0
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressions += 1
+        elif change < -threshold:
+            flag = '  improved'
+        print(f"{name:<24} {before:12.1f} {after:12.1f} {change:+8.1f}%{flag}")
+    return regressions
+
+
+def main():
+    p = argparse.ArgumentParser(description="Benchmark the host-side control path")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    r = sub.add_parser("run", help="Run benchmarks")
+    r.add_argument("--out", default=None, help="Write JSON results to this file")
+    r.add_argument("--filter", default=None, help="Only run benchmarks whose name contains this")
+    r.add_argument("--repeat", type=int, default=5, help="Timed repeats per benchmark")
+    r.add_argument("--min-time", type=float, default=0.1, help="Minimum seconds per repeat")
+    r.add_argument("--list", action="store_true", help="List benchmark names and exit")
+    c = sub.add_parser("compare", help="Compare two result files")
+    c.add_argument("old")
+    c.add_argument("new")
+    c.add_argument("--threshold", type=float, default=10.0, help="Percent slowdown reported as a regression")
+    args = p.parse_args()
+
+    if args.cmd == "compare":
+        with open(args.old) as f:
+            old = json.load(f)
+        with open(args.new) as f:
+            new = json.load(f)
+        raise SystemExit(1 if compare(old, new, args.threshold) else 0)
+
+    names = [n for n in BENCHMARKS if not args.filter or args.filter in n]
+    if args.list:
+        print("\n".join(names))
+        return
+    results = {}
+    for name in names:
+        result = run_benchmark(name, args.repeat, args.min_time)
+        results[name] = result
+        print(f"{name:<24} {result['ns_per_op']:10.1f} ns/op  {result['ops_per_s']:14,.0f} ops/s"
+              f"  (median {result['median_ns']:.1f}, stdev {result['stdev_ns']:.1f})")
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump({'environment': environment(), 'results': results}, f, indent=2)
+        print(f"Wrote {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Timestamped capture and rate-accurate replay of outgoing command datagrams.
+
+CommandRecorder appends every datagram a sender emits (protobuf
+TritonBotMessage or the wasd_teleop text protocol) to a compact binary log:
+
+    header  : magic b'TRCL', version u16, flags u16, wall-clock start ns u64
+    record  : monotonic ns u64, IPv4 dest 4s, port u16, length u16, kind u8, payload
+
+Writes go through a large userspace buffer. Every INDEX_EVERY records a
+(timestamp, offset) pair is appended to a sidecar '<log>.idx' file, so
+CommandLog can memory-map the log and seek to any time with a bisect plus a
+short forward scan, even in hour-long sessions. A missing index is rebuilt by
+scanning the log.
+
+Usage:
+    sock = RecordingSocket(sock, CommandRecorder('match.trcl'))   # in a sender
+    python command_log.py info match.trcl
+    python command_log.py dump match.trcl --from 12.5 --limit 20
+    python command_log.py replay match.trcl --speed 1 --dest 127.0.0.1:3333
+    python command_log.py replay match.trcl --speed 0            # as fast as possible
+"""
+import argparse
+import bisect
+import mmap
+import os
+import socket
+import struct
+import time
+from array import array
+
+MAGIC = b'TRCL'
+VERSION = 1
+FILE_HEADER = struct.Struct('<4sHHQ')
+RECORD_HEADER = struct.Struct('<Q4sHHB')
+INDEX_ENTRY = struct.Struct('<QQ')
+INDEX_EVERY = 1024
+
+KIND_PROTOBUF = 0
+KIND_TEXT = 1
+KIND_NAMES = {KIND_PROTOBUF: 'protobuf', KIND_TEXT: 'text'}
+
+
+class CommandRecorder:
+    """Appends datagrams with monotonic timestamps to a command log."""
+
+    def __init__(self, path: str, buffer_size: int = 1 << 20):
+        self.path = path
+        self.file = open(path, 'wb', buffering=buffer_size)
+        self.index = open(path + '.idx', 'wb', buffering=1 << 16)
+        self.file.write(FILE_HEADER.pack(MAGIC, VERSION, 0, time.time_ns()))
+        self.offset = FILE_HEADER.size
+        self.records = 0
+        self.addresses = {}
+
+    def _pack_address(self, dest) -> bytes:
+        packed = self.addresses.get(dest[0])
+        if packed is None:
+            packed = socket.inet_aton(socket.gethostbyname(dest[0]))
+            self.addresses[dest[0]] = packed
+        return packed
+
+    def record(self, data, dest, kind: int = KIND_PROTOBUF, stamp_ns: int = None):
+        if stamp_ns is None:
+            stamp_ns = time.monotonic_ns()
+        if self.records % INDEX_EVERY == 0:
+            self.index.write(INDEX_ENTRY.pack(stamp_ns, self.offset))
+        self.file.write(RECORD_HEADER.pack(stamp_ns, self._pack_address(dest), dest[1], len(data), kind))
+        self.file.write(data)
+        self.offset += RECORD_HEADER.size + len(data)
+        self.records += 1
+
+    def close(self):
+        self.file.close()
+        self.index.close()
+
+
+class RecordingSocket:
+    """Socket wrapper that records every sendto() that succeeds, stamped with the time it was sent."""
+
+    def __init__(self, sock: socket.socket, recorder: CommandRecorder, kind: int = KIND_PROTOBUF):
+        self.sock = sock
+        self.recorder = recorder
+        self.kind = kind
+
+    def sendto(self, data, dest):
+        stamp_ns = time.monotonic_ns()
+        sent = self.sock.sendto(data, dest)  # a datagram that raised never went out: don't replay it
+        self.recorder.record(data, dest, self.kind, stamp_ns)
+        return sent
+
+    def close(self):
+        self.recorder.close()
+        self.sock.close()
+
+    def __getattr__(self, name):
+        return getattr(self.sock, name)
+
+
+class CommandLog:
+    """Read-only, memory-mapped view of a command log with time-based random access."""
+
+    def __init__(self, path: str):
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self.start_wall_ns = FILE_HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} command log")
+        self.index_ts = array('Q')
+        self.index_offsets = array('Q')
+        if not self._load_index(path + '.idx'):
+            self._build_index()
+
+    def _load_index(self, path: str) -> bool:
+        if not os.path.exists(path):
+            return False
+        with open(path, 'rb') as f:
+            raw = f.read()
+        raw = raw[:len(raw) - len(raw) % INDEX_ENTRY.size]
+        pairs = array('Q', raw)
+        self.index_ts = pairs[0::2]
+        self.index_offsets = pairs[1::2]
+        # an index written by a crashed recorder may point past the flushed log
+        while self.index_offsets and self.index_offsets[-1] >= len(self.map):
+            self.index_ts.pop()
+            self.index_offsets.pop()
+        return bool(self.index_ts)  # an empty index (recorder killed early) is rebuilt from the log
+
+    def _build_index(self):
+        for count, (offset, stamp, _, _, _) in enumerate(self._scan(FILE_HEADER.size)):
+            if count % INDEX_EVERY == 0:
+                self.index_ts.append(stamp)
+                self.index_offsets.append(offset)
+
+    def _scan(self, offset: int):
+        """Yield (offset, stamp_ns, dest, kind, payload memoryview) from offset to the last complete record."""
+        buf = self.map
+        view = memoryview(buf)
+        end = len(buf)
+        header_size = RECORD_HEADER.size
+        unpack = RECORD_HEADER.unpack_from
+        while offset + header_size <= end:
+            stamp, ip, port, length, kind = unpack(buf, offset)
+            payload_start = offset + header_size
+            if payload_start + length > end:
+                break
+            yield offset, stamp, (socket.inet_ntoa(ip), port), kind, view[payload_start:payload_start + length]
+            offset = payload_start + length
+
+    @property
+    def first_ns(self) -> int:
+        """Stamp of the first record; read from the log itself when the index is empty."""
+        if self.index_ts:
+            return self.index_ts[0]
+        for _, stamp, _, _, _ in self._scan(FILE_HEADER.size):
+            return stamp
+        return 0
+
+    def records(self, from_ns: int = None):
+        """Yield (stamp_ns, dest, kind, payload) starting at the first record at or after from_ns."""
+        offset = FILE_HEADER.size
+        if from_ns is not None and self.index_ts:
+            slot = bisect.bisect_right(self.index_ts, from_ns) - 1
+            if slot >= 0:
+                offset = self.index_offsets[slot]
+        for _, stamp, dest, kind, payload in self._scan(offset):
+            if from_ns is None or stamp >= from_ns:
+                yield stamp, dest, kind, payload
+
+    def close(self):
+        try:
+            self.map.close()
+        except BufferError:
+            pass  # payload views are still referenced; the map goes when they do
+        self.file.close()
+
+
+def replay(log: CommandLog, sock: socket.socket, speed: float = 1.0, from_ns: int = None,
+           until_ns: int = None, dest=None, spin: float = 0.0005) -> int:
+    """Re-send logged datagrams, preserving gaps scaled by 1/speed (speed 0: as fast as possible)."""
+    sent = 0
+    origin = None
+    start = 0.0
+    for stamp, original_dest, _, payload in log.records(from_ns):
+        if until_ns is not None and stamp > until_ns:
+            break
+        if origin is None:
+            origin = stamp
+            start = time.perf_counter()
+        if speed > 0:
+            deadline = start + (stamp - origin) / 1e9 / speed
+            remaining = deadline - time.perf_counter() - spin
+            if remaining > 0:
+                time.sleep(remaining)
+            while time.perf_counter() < deadline:
+                pass
+        sock.sendto(payload, dest or original_dest)
+        sent += 1
+    return sent
+
+
+def _parse_dest(text: str):
+    host, port = text.rsplit(':', 1)
+    return host, int(port)
+
+
+def main():
+    p = argparse.ArgumentParser(description="Inspect and replay command logs")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    info = sub.add_parser("info", help="Summarize a log")
+    info.add_argument("log")
+    dump = sub.add_parser("dump", help="Print records")
+    dump.add_argument("log")
+    dump.add_argument("--from", dest="start", type=float, default=None, help="Seconds from the start of the log")
+    dump.add_argument("--limit", type=int, default=50, help="Maximum records to print")
+    rep = sub.add_parser("replay", help="Re-send a log")
+    rep.add_argument("log")
+    rep.add_argument("--speed", type=float, default=1.0, help="Replay speed factor (0 = as fast as possible)")
+    rep.add_argument("--from", dest="start", type=float, default=None, help="Seconds from the start of the log")
+    rep.add_argument("--until", type=float, default=None, help="Stop at this many seconds from the start of the log")
+    rep.add_argument("--dest", default=None, help="Send everything to host:port instead of the logged destinations")
+    args = p.parse_args()
+
+    log = CommandLog(args.log)
+    first = log.first_ns
+    from_ns = None if getattr(args, 'start', None) is None else first + int(args.start * 1e9)
+
+    try:
+        if args.cmd == "info":
+            count = 0
+            last = first
+            dests = {}
+            kinds = {}
+            for stamp, dest, kind, _ in log.records():
+                count += 1
+                last = stamp
+                dests[dest] = dests.get(dest, 0) + 1
+                kinds[kind] = kinds.get(kind, 0) + 1
+            span = (last - first) / 1e9
+            started = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(log.start_wall_ns / 1e9))
+            print(f"{count} datagrams over {span:.3f} s ({count / span if span else 0:.1f}/s), started {started}")
+            for kind, n in kinds.items():
+                print(f"  {KIND_NAMES.get(kind, kind)}: {n}")
+            for dest, n in sorted(dests.items()):
+                print(f"  -> {dest[0]}:{dest[1]}: {n}")
+
+        elif args.cmd == "dump":
+            for i, (stamp, dest, kind, payload) in enumerate(log.records(from_ns)):
+                if i >= args.limit:
+                    break
+                body = bytes(payload).decode('utf-8', 'replace').strip() if kind == KIND_TEXT else bytes(payload).hex(' ')
+                print(f"{(stamp - first) / 1e9:12.6f}  {dest[0]}:{dest[1]}  {KIND_NAMES.get(kind, kind):8}  {body}")
+
+        elif args.cmd == "replay":
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, struct.pack('b', 1))
+            until_ns = None if args.until is None else first + int(args.until * 1e9)
+            dest = _parse_dest(args.dest) if args.dest else None
+            start = time.perf_counter()
+            try:
+                sent = replay(log, sock, args.speed, from_ns, until_ns, dest)
+                print(f"Replayed {sent} datagrams in {time.perf_counter() - start:.3f} s")
+            except KeyboardInterrupt:
+                print('\nStopping replay.')
+            finally:
+                sock.close()
+    finally:
+        log.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+"""
+Compact fixed-layout command format, for a single robot or a whole team per datagram.
+
+A TritonBotMessage is 79 bytes with its vision block (44 without), and the
+ESP32 uses none of it beyond three velocities, kick_speed != 0 and
+dribbler_speed > 0. The compact format carries exactly that:
+
+    header  0xC0 | version, record count                      2 bytes
+    record  id u8, flags u8 (bit 0 kick, bit 1 dribble),
+            seq u16, forward i16 mm/s, left i16 mm/s,
+            angular i16 mrad/s, little-endian                  10 bytes
+
+so one robot is 12 bytes and a team of 11 is 112 bytes in one datagram,
+which every robot on the multicast group picks its own record out of.
+Velocities are rounded to 1 mm/s and 1 mrad/s (saturating at +-32.767 m/s and rad/s); after
+the firmware's wheel_speeds that is at most 4 motor units out of 15000,
+which --check verifies.
+
+The first byte doubles as the version byte: its high nibble 0xC never starts
+a TritonBotMessage (the first tag is 0x08, 0x0a, 0x12 or 0x1a), so a receiver
+can take both formats on one port and tell them apart with is_compact().
+negotiate() picks the highest version both sides support, or None to fall
+back to TritonBotMessage. seq is per robot and lets the receiver drop
+reordered and duplicate records (serial-number arithmetic, so it wraps).
+Every sender process starts counting at 1 again, so a seq more than
+REORDER_WINDOW behind the last one, or any seq after RESET_AFTER seconds
+of silence, is taken as a restarted sender rather than a stale record.
+
+Decoding is a zero-copy NumPy structured view over a memoryview of the
+datagram; iter_datagrams() walks a buffer of back-to-back datagrams.
+
+Usage:
+    encoder = CompactEncoder()
+    sock.sendto(encoder.encode(2, forward=1.0, left=0.0, angular=0.5), dest)
+    sock.sendto(encoder.encode_team(commands), dest)     # [(id, forward, left, angular, kick, dribble), ...]
+
+    decoder = CompactDecoder()
+    for command in decoder.decode(datagram): ...
+
+    python compact_codec.py --check
+    python compact_codec.py --bench -n 100000
+    python compact_codec.py --loopback --robots 0-10      # team datagrams into emulated ESP32s
+"""
+import argparse
+import math
+import struct
+import time
+from collections import namedtuple
+
+import numpy as np
+
+MAGIC = 0xC0
+VERSION = 1
+SUPPORTED_VERSIONS = (1,)
+MAX_RECORDS = 255
+REORDER_WINDOW = 256  # a seq further behind than this comes from a restarted sender, not the network
+RESET_AFTER = 0.5     # s of silence from a robot's sender after which any seq is accepted
+
+FLAG_KICK = 0x01
+FLAG_DRIBBLE = 0x02
+
+VELOCITY_SCALE = 1000.0  # m/s -> mm/s
+ANGULAR_SCALE = 1000.0   # rad/s -> mrad/s
+_MIN, _MAX = -32768, 32767
+
+_HEADER = struct.Struct('<BB')
+_RECORD = struct.Struct('<BBHhhh')
+HEADER_SIZE = _HEADER.size
+RECORD_SIZE = _RECORD.size
+RECORD_DTYPE = np.dtype([('id', 'u1'), ('flags', 'u1'), ('seq', '<u2'),
+                         ('forward', '<i2'), ('left', '<i2'), ('angular', '<i2')])
+
+CompactCommand = namedtuple('CompactCommand', ('id', 'seq', 'forward', 'left', 'angular', 'kick', 'dribble'))
+
+
+def is_compact(data) -> bool:
+    return len(data) >= HEADER_SIZE and data[0] & 0xF0 == MAGIC
+
+
+def negotiate(offered, supported=SUPPORTED_VERSIONS):
+    """Highest version in both lists, or None to fall back to TritonBotMessage."""
+    common = set(offered) & set(supported)
+    return max(common) if common else None
+
+
+def _quantize(value: float, scale: float) -> int:
+    q = round(value * scale)
+    return _MAX if q > _MAX else _MIN if q < _MIN else q
+
+
+def _quantize_array(values, scale: float) -> np.ndarray:
+    return np.clip(np.rint(np.asarray(values, dtype=np.float64) * scale), _MIN, _MAX)
+
+
+class CompactEncoder:
+    """Encodes single-robot or whole-team datagrams into a reusable buffer, with per-robot sequence numbers."""
+
+    def __init__(self, version: int = VERSION, capacity: int = 16):
+        if version not in SUPPORTED_VERSIONS:
+            raise ValueError(f"unsupported compact version {version}")
+        if not 0 < capacity <= MAX_RECORDS:
+            raise ValueError(f"capacity must be 1-{MAX_RECORDS}")
+        self.version_byte = MAGIC | version
+        self.capacity = capacity
+        self.buffer = bytearray(HEADER_SIZE + capacity * RECORD_SIZE)
+        self.view = memoryview(self.buffer)
+        self.records = np.frombuffer(self.buffer, RECORD_DTYPE, capacity, HEADER_SIZE)
+        self.seq = [0] * 256  # last seq sent per robot id
+
+    def _pack(self, offset: int, robot_id: int, forward: float, left: float, angular: float,
+              kick: bool, dribble: bool):
+        flags = (FLAG_KICK if kick else 0) | (FLAG_DRIBBLE if dribble else 0)
+        seq = self.seq[robot_id] = (self.seq[robot_id] + 1) & 0xFFFF
+        try:
+            # rounding without the clamp is the common case; 'h' rejects anything out of range
+            _RECORD.pack_into(self.buffer, offset, robot_id, flags, seq, round(forward * VELOCITY_SCALE),
+                              round(left * VELOCITY_SCALE), round(angular * ANGULAR_SCALE))
+        except struct.error:
+            _RECORD.pack_into(self.buffer, offset, robot_id, flags, seq, _quantize(forward, VELOCITY_SCALE),
+                              _quantize(left, VELOCITY_SCALE), _quantize(angular, ANGULAR_SCALE))
+
+    def encode(self, robot_id: int, forward: float, left: float, angular: float,
+               kick: bool = False, dribble: bool = False) -> memoryview:
+        """One robot's command as a datagram; the view is overwritten by the next encode."""
+        _HEADER.pack_into(self.buffer, 0, self.version_byte, 1)
+        self._pack(HEADER_SIZE, robot_id, forward, left, angular, kick, dribble)
+        return self.view[:HEADER_SIZE + RECORD_SIZE]
+
+    def encode_team(self, commands) -> memoryview:
+        """(robot_id, forward, left, angular, kick, dribble) tuples as one datagram."""
+        offset = HEADER_SIZE
+        end = len(self.buffer)
+        for command in commands:
+            if offset == end:
+                raise ValueError(f"more than {self.capacity} commands")
+            self._pack(offset, *command)
+            offset += RECORD_SIZE
+        _HEADER.pack_into(self.buffer, 0, self.version_byte, (offset - HEADER_SIZE) // RECORD_SIZE)
+        return self.view[:offset]
+
+    def encode_arrays(self, ids, forward, left, angular, kick=None, dribble=None) -> memoryview:
+        """Vectorized encode_team from parallel arrays (ids must be unique)."""
+        ids = np.asarray(ids, dtype=np.uint8)
+        n = len(ids)
+        if n > self.capacity:
+            raise ValueError(f"more than {self.capacity} commands")
+        records = self.records[:n]
+        seq = self.seq
+        for rid in ids.tolist():
+            seq[rid] = (seq[rid] + 1) & 0xFFFF
+        records['id'] = ids
+        flags = np.zeros(n, dtype=np.uint8)
+        if kick is not None:
+            flags |= np.asarray(kick, dtype=bool).astype(np.uint8) * FLAG_KICK
+        if dribble is not None:
+            flags |= np.asarray(dribble, dtype=bool).astype(np.uint8) * FLAG_DRIBBLE
+        records['flags'] = flags
+        records['seq'] = [seq[rid] for rid in ids.tolist()]
+        records['forward'] = _quantize_array(forward, VELOCITY_SCALE)
+        records['left'] = _quantize_array(left, VELOCITY_SCALE)
+        records['angular'] = _quantize_array(angular, ANGULAR_SCALE)
+        _HEADER.pack_into(self.buffer, 0, self.version_byte, n)
+        return self.view[:HEADER_SIZE + n * RECORD_SIZE]
+
+
+class CompactStats:
+    def __init__(self):
+        self.datagrams = 0
+        self.records = 0
+        self.stale = 0
+        self.resets = 0
+        self.version_errors = 0
+        self.length_errors = 0
+
+    def summary(self) -> str:
+        return (f"compact: {self.datagrams} datagrams, {self.records} records, {self.stale} stale, {self.resets} resets, "
+                f"{self.version_errors} bad version, {self.length_errors} bad length")
+
+
+class CompactDecoder:
+    """Decodes compact datagrams as zero-copy record views and tracks per-robot sequence numbers."""
+
+    def __init__(self, versions=SUPPORTED_VERSIONS, reset_after: float = RESET_AFTER, clock=time.monotonic):
+        self.versions = frozenset(versions)
+        self.reset_after = reset_after
+        self.clock = clock
+        self.last_seq = {}   # robot id -> last accepted seq
+        self.last_time = {}  # robot id -> clock() when it was accepted
+        self.stats = CompactStats()
+
+    def records(self, data) -> np.ndarray:
+        """A structured RECORD_DTYPE view of the datagram's records (empty if it is invalid).
+
+        The view shares memory with `data`; copy it if the buffer is reused.
+        """
+        body = self._body(data)
+        if body is None:
+            return np.empty(0, RECORD_DTYPE)
+        return np.frombuffer(body, RECORD_DTYPE)
+
+    def accept(self, robot_id: int, seq: int, now: float = None) -> bool:
+        """True if seq is newer than the last one accepted for this robot, or its sender restarted (and record it)."""
+        if now is None:
+            now = self.clock()
+        last = self.last_seq.get(robot_id)
+        if last is not None and not 0 < (seq - last) & 0xFFFF < 0x8000:
+            if (last - seq) & 0xFFFF <= REORDER_WINDOW and now - self.last_time[robot_id] < self.reset_after:
+                self.stats.stale += 1
+                return False
+            self.stats.resets += 1
+        self.last_seq[robot_id] = seq
+        self.last_time[robot_id] = now
+        return True
+
+    def _body(self, data):
+        """The records part of a valid datagram as a memoryview, or None."""
+        view = memoryview(data)
+        stats = self.stats
+        if len(view) < HEADER_SIZE or view[0] & 0xF0 != MAGIC or view[0] & 0x0F not in self.versions:
+            stats.version_errors += 1
+            return None
+        if len(view) != HEADER_SIZE + view[1] * RECORD_SIZE:
+            stats.length_errors += 1
+            return None
+        stats.datagrams += 1
+        stats.records += view[1]
+        return view[HEADER_SIZE:]
+
+    def decode(self, data, fresh_only: bool = True) -> list:
+        """CompactCommands in SI units; with fresh_only, reordered and duplicate records are dropped."""
+        body = self._body(data)
+        if body is None:
+            return []
+        commands = []
+        for robot_id, flags, seq, forward, left, angular in _RECORD.iter_unpack(body):
+            if fresh_only and not self.accept(robot_id, seq):
+                continue
+            commands.append(CompactCommand(robot_id, seq, forward / VELOCITY_SCALE, left / VELOCITY_SCALE,
+                                           angular / ANGULAR_SCALE, bool(flags & FLAG_KICK),
+                                           bool(flags & FLAG_DRIBBLE)))
+        return commands
+
+    def find(self, data, robot_id: int):
+        """This robot's CompactCommand in a team datagram, or None if absent or stale."""
+        body = self._body(data)
+        if body is None:
+            return None
+        index = bytes(body[::RECORD_SIZE]).rfind(robot_id.to_bytes(1, 'little'))
+        if index < 0:
+            return None
+        _, flags, seq, forward, left, angular = _RECORD.unpack_from(body, index * RECORD_SIZE)
+        if not self.accept(robot_id, seq):
+            return None
+        return CompactCommand(robot_id, seq, forward / VELOCITY_SCALE, left / VELOCITY_SCALE,
+                              angular / ANGULAR_SCALE, bool(flags & FLAG_KICK), bool(flags & FLAG_DRIBBLE))
+
+    def decode_arrays(self, data):
+        """(ids, forward, left, angular, kick, dribble) arrays for a whole datagram, no freshness check."""
+        records = self.records(data)
+        flags = records['flags']
+        return (records['id'], records['forward'] / VELOCITY_SCALE, records['left'] / VELOCITY_SCALE,
+                records['angular'] / ANGULAR_SCALE, (flags & FLAG_KICK) != 0, (flags & FLAG_DRIBBLE) != 0)
+
+
+def iter_datagrams(buffer):
+    """Yield a memoryview per datagram from compact datagrams stored back to back."""
+    view = memoryview(buffer)
+    offset = 0
+    while offset + HEADER_SIZE <= len(view):
+        end = offset + HEADER_SIZE + view[offset + 1] * RECORD_SIZE
+        if view[offset] & 0xF0 != MAGIC or end > len(view):
+            raise ValueError(f"not a compact datagram at offset {offset}")
+        yield view[offset:end]
+        offset = end
+
+
+def check(n: int = 20000, seed: int = 0) -> int:
+    """Round trips, sequence handling and firmware wheel speeds of quantized commands; return failures."""
+    from kinematics import RESCALE_FACTOR, WHEEL_MATRIX, WHEEL_RADIUS, wheel_speeds
+
+    rng = np.random.default_rng(seed)
+    failures = 0
+    forward = rng.uniform(-3, 3, n)
+    left = rng.uniform(-3, 3, n)
+    angular = rng.uniform(-25, 25, n)
+    kick = rng.random(n) < 0.1
+    dribble = rng.random(n) < 0.5
+
+    encoder = CompactEncoder(capacity=11)
+    decoder = CompactDecoder()
+    got = []
+    for i in range(n):
+        (command,) = decoder.decode(encoder.encode(i % 16, forward[i], left[i], angular[i], kick[i], dribble[i]))
+        got.append(command)
+    got_f = np.array([c.forward for c in got])
+    got_l = np.array([c.left for c in got])
+    got_a = np.array([c.angular for c in got])
+    if np.abs(got_f - forward).max() > 0.5 / VELOCITY_SCALE or np.abs(got_a - angular).max() > 0.5 / ANGULAR_SCALE:
+        print("MISMATCH: quantization error above half a step")
+        failures += 1
+    if [c.kick for c in got] != kick.tolist() or [c.dribble for c in got] != dribble.tolist():
+        print("MISMATCH: flags")
+        failures += 1
+    # half a quantization step per input through the worst wheel, plus one for the int truncation
+    half_steps = np.array([0.5 / ANGULAR_SCALE, 0.5 / VELOCITY_SCALE, 0.5 / VELOCITY_SCALE])
+    bound = np.abs(WHEEL_MATRIX) @ half_steps / WHEEL_RADIUS * RESCALE_FACTOR
+    drift = np.abs(wheel_speeds(got_f, got_l, got_a) - wheel_speeds(forward, left, angular)).max()
+    if drift > math.floor(bound.max()) + 1:
+        print(f"MISMATCH: quantized commands move firmware wheel speeds by {drift} units")
+        failures += 1
+
+    # the scalar and vectorized team encoders agree, and every robot's record is found
+    ids = list(range(11))
+    scalar = bytes(CompactEncoder(capacity=11).encode_team(
+        zip(ids, forward[:11], left[:11], angular[:11], kick[:11], dribble[:11])))
+    vector = bytes(CompactEncoder(capacity=11).encode_arrays(ids, forward[:11], left[:11], angular[:11],
+                                                              kick[:11], dribble[:11]))
+    if scalar != vector or len(scalar) != HEADER_SIZE + 11 * RECORD_SIZE:
+        print("MISMATCH: encode_team and encode_arrays differ")
+        failures += 1
+    if [CompactDecoder().find(scalar, rid).id for rid in ids] != ids:
+        print("MISMATCH: find() in a team datagram")
+        failures += 1
+    single = bytes(CompactEncoder().encode(4, 1.0, 0.0, 0.0))
+    if [bytes(d) for d in iter_datagrams(scalar + single + scalar)] != [scalar, single, scalar]:
+        print("MISMATCH: iter_datagrams")
+        failures += 1
+
+    # out-of-range velocities saturate instead of wrapping
+    (command,) = CompactDecoder().decode(CompactEncoder().encode(1, 40.0, -40.0, 0.0))
+    if (command.forward, command.left) != (_MAX / VELOCITY_SCALE, _MIN / VELOCITY_SCALE):
+        print(f"MISMATCH: saturation {command}")
+        failures += 1
+
+    # duplicates, reordering and wrap-around
+    decoder = CompactDecoder()
+    accepted = [decoder.accept(1, s) for s in (65534, 65535, 65535, 0, 65533, 1)]
+    if accepted != [True, True, False, True, False, True]:
+        print(f"MISMATCH: sequence acceptance {accepted}")
+        failures += 1
+
+    # a restarted sender counts from 1 again: taken at once when far behind, after a silence when close
+    decoder = CompactDecoder()
+    for s in range(1, 3001):
+        decoder.accept(1, s, now=0.0)
+        decoder.accept(2, s % 100 + 1, now=0.0)
+    restarted = [decoder.accept(1, s, now=0.01) for s in (1, 2, 3)]
+    close = [decoder.accept(2, 50, now=0.01), decoder.accept(2, 51, now=RESET_AFTER + 0.01)]
+    if restarted != [True, True, True] or close != [False, True]:
+        print(f"MISMATCH: sender restart {restarted} {close}")
+        failures += 1
+
+    # other versions and TritonBot datagrams are rejected, not misread
+    from triton_codec import TritonBotEncoder
+    triton = bytes(TritonBotEncoder(2).encode(1.0, 0.0, 0.0))
+    future = bytes((MAGIC | 2,)) + scalar[1:]
+    if is_compact(triton) or CompactDecoder().decode(future) or negotiate((1, 2)) != 1 or negotiate((2,)) is not None:
+        print("MISMATCH: version handling")
+        failures += 1
+    return failures
+
+
+def _timeit(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n
+
+
+def run_benchmark(n: int, robots: int = 11):
+    """Bytes per robot per tick and per-tick encode/decode cost of each format for one team."""
+    from messages import new_bot_message
+    from triton_bot_communication_pb2 import TritonBotMessage
+    from triton_codec import TritonBotEncoder, decode
+
+    rng = np.random.default_rng(0)
+    commands = [(rid, *rng.uniform(-3, 3, 2).tolist(), float(rng.uniform(-25, 25)), False, True)
+                for rid in range(robots)]
+    messages = [new_bot_message(rid) for rid in range(robots)]
+    full = [TritonBotEncoder(rid) for rid in range(robots)]
+    bare = [TritonBotEncoder(rid, None) for rid in range(robots)]
+    compact = CompactEncoder(capacity=robots)
+    ids = np.arange(robots)
+    forward, left, angular = (np.array([c[i] for c in commands]) for i in (1, 2, 3))
+    dribble = np.ones(robots, dtype=bool)
+
+    def pb2_encode():
+        out = []
+        for (rid, f, l, a, kick, drib), message in zip(commands, messages):
+            velocity = message.command.move_command.local_velocity
+            velocity.forward, velocity.left, velocity.angular = f, l, a
+            message.command.kick_speed = 1.0 if kick else 0.0
+            message.command.dribbler_speed = 1.0 if drib else 0.0
+            out.append(message.SerializeToString())
+        return out
+
+    def fast_encode(encoders):
+        return [bytes(encoders[rid].encode(f, l, a, 1.0 if kick else 0.0, 0.0, 1.0 if drib else 0.0))
+                for rid, f, l, a, kick, drib in commands]
+
+    pb2_wire = pb2_encode()
+    bare_wire = fast_encode(bare)
+    single_wire = [bytes(compact.encode(*c)) for c in commands]
+    team_wire = bytes(compact.encode_team(commands))
+    parsed = TritonBotMessage()
+
+    def pb2_decode():
+        for data in pb2_wire:
+            parsed.ParseFromString(data)
+
+    def single_decode(decoder=CompactDecoder()):
+        for data in single_wire:
+            decoder.decode(data, fresh_only=False)
+
+    cases = (
+        ('TritonBot pb2 (vision)', robots, pb2_wire, pb2_encode, pb2_decode),
+        ('TritonBot fast (vision)', robots, pb2_wire, lambda: fast_encode(full),
+         lambda: [decode(d) for d in pb2_wire]),
+        ('TritonBot fast (no vision)', robots, bare_wire, lambda: fast_encode(bare),
+         lambda: [decode(d) for d in bare_wire]),
+        ('compact single', robots, single_wire, lambda: [bytes(compact.encode(*c)) for c in commands],
+         single_decode),
+        ('compact team', 1, [team_wire], lambda: bytes(compact.encode_team(commands)),
+         lambda decoder=CompactDecoder(): decoder.decode(team_wire, fresh_only=False)),
+        ('compact team (arrays)', 1, [team_wire],
+         lambda: bytes(compact.encode_arrays(ids, forward, left, angular, None, dribble)),
+         lambda decoder=CompactDecoder(): decoder.decode_arrays(team_wire)),
+    )
+    print(f"{robots} robots per tick, {n} ticks per case")
+    print(f"{'format':<28} {'datagrams':>9} {'B/robot':>8} {'encode us/tick':>15} {'decode us/tick':>15}")
+    for label, datagrams, wire, encode, decode_fn in cases:
+        per_robot = sum(len(d) for d in wire) / robots
+        print(f"{label:<28} {datagrams:9d} {per_robot:8.1f} {_timeit(encode, n) * 1e6:15.2f} "
+              f"{_timeit(decode_fn, n) * 1e6:15.2f}")
+
+
+async def run_loopback(robot_ids, rate: float, duration: float, port: int) -> bool:
+    """Send team datagrams to emulated ESP32s on the multicast group and compare their UART frames."""
+    import asyncio
+    import socket
+
+    from esp32_emulator import EmulatedRobot, start_robot
+    from kinematics import uart_frame
+    from messages import MULTICAST_GROUP
+
+    robots = {rid: EmulatedRobot(rid) for rid in robot_ids}
+    transports = []
+    for robot in robots.values():
+        transports += await start_robot(robot, multicast=(MULTICAST_GROUP, port))
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, struct.pack('b', 1))
+    encoder = CompactEncoder(capacity=len(robot_ids))
+    rng = np.random.default_rng(0)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    ticks = 0
+    size = 0
+    while loop.time() - start < duration:
+        commands = [(rid, *rng.uniform(-3, 3, 2).tolist(), float(rng.uniform(-25, 25)), False, bool(rid % 2))
+                    for rid in robot_ids]
+        datagram = encoder.encode_team(commands)
+        size = len(datagram)
+        sock.sendto(datagram, (MULTICAST_GROUP, port))
+        ticks += 1
+        await asyncio.sleep(max(0.0, start + ticks / rate - loop.time()))
+    await asyncio.sleep(0.2)
+    sock.close()
+    for transport in transports:
+        transport.close()
+
+    # the last tick's quantized values are what the robots should have converted
+    decoded = {c.id: c for c in CompactDecoder().decode(encoder.view[:size])}
+    ok = True
+    for rid, robot in robots.items():
+        c = decoded[rid]
+        expected = uart_frame(c.forward, c.left, c.angular, 1.0 if c.dribble else 0.0)
+        match = robot.last_frame == expected
+        ok &= match and robot.stats.frames == ticks
+        print(f"robot {rid:2d}: {robot.stats.summary()}  last frame {'ok' if match else 'MISMATCH'}")
+    print(f"{ticks} team datagrams of {size} B ({size / len(robot_ids):.1f} B/robot) at {rate:g} Hz")
+    return ok
+
+
+def main():
+    p = argparse.ArgumentParser(description="Compact fixed-layout command codec")
+    p.add_argument("--check", action="store_true", help="Verify round trips, sequence handling and quantization")
+    p.add_argument("--bench", action="store_true", help="Compare size and speed with the protobuf path")
+    p.add_argument("--loopback", action="store_true", help="Drive emulated ESP32s with team datagrams")
+    p.add_argument("-n", type=int, default=20000, help="Ticks per benchmark case")
+    p.add_argument("--robots", default="0-10", help="Robot ids for --bench/--loopback, e.g. 0-10")
+    p.add_argument("--rate", type=float, default=100.0, help="Team datagrams per second for --loopback")
+    p.add_argument("--duration", type=float, default=3.0, help="Seconds for --loopback")
+    p.add_argument("--port", type=int, default=10510, help="Multicast port for --loopback")
+    args = p.parse_args()
+
+    from messages import parse_robot_ids
+    robot_ids = parse_robot_ids(args.robots)
+    if args.check:
+        failures = check()
+        print(f"{'OK' if not failures else f'{failures} FAILED'}: compact v{VERSION} round trips, "
+              f"sequence handling and firmware wheel speeds")
+        if failures:
+            raise SystemExit(1)
+    if args.bench:
+        run_benchmark(args.n, len(robot_ids))
+    if args.loopback:
+        import asyncio
+        ok = asyncio.run(run_loopback(robot_ids, args.rate, args.duration, args.port))
+        raise SystemExit(0 if ok else 1)
+    if not (args.check or args.bench):
+        p.print_help()
+
+
+if __name__ == '__main__':
+    main()
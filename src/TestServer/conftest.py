@@ -0,0 +1,38 @@
+"""Shared pytest fixtures for the src/TestServer test modules."""
+import select
+import socket
+
+import pytest
+
+from esp32_emulator import _multicast_socket
+from messages import MULTICAST_GROUP
+
+_multicast = None
+
+
+def _multicast_loops_back() -> bool:
+    """True if a datagram sent to a multicast group comes back to a member socket on this host."""
+    try:
+        listener = _multicast_socket(MULTICAST_GROUP, 0)
+    except OSError:
+        return False
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sender.bind(('', 0))
+        sender.sendto(b'probe', (MULTICAST_GROUP, listener.getsockname()[1]))
+        return bool(select.select([listener], [], [], 0.5)[0])
+    except OSError:
+        return False
+    finally:
+        sender.close()
+        listener.close()
+
+
+@pytest.fixture
+def multicast():
+    """Skip the test unless multicast loops back on this host (the --loopback self-tests need it)."""
+    global _multicast
+    if _multicast is None:
+        _multicast = _multicast_loops_back()
+    if not _multicast:
+        pytest.skip("multicast loopback unavailable")
@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+"""
+Delta-only command transmission with a heartbeat keepalive.
+
+UserControl.py and fleet_commander.py send every robot a full TritonBotMessage
+every tick, placeholder vision block included, whether or not anything
+changed. DeltaSender keeps the last-sent state per robot and only transmits
+when there is something to say:
+
+  - a command change goes out on the next tick, followed by `repeats` copies on
+    the ticks after it so one lost datagram doesn't leave the robot stale
+  - otherwise a robot gets one heartbeat every `heartbeat` seconds
+  - the vision sub-message is omitted unless it changed (it is sent with the
+    change and its repeats) and refreshed on every `vision_refresh`-th heartbeat;
+    with `vision_move` / `vision_turn` set, only a pose that moved that far from
+    the last one sent counts as a change, smaller moves ride the refresh
+
+The command sub-message is always present: esp32.ino decodes each datagram
+into a zeroed struct, so a datagram without a command would mean "stop". A
+kick is carried by the change datagram and its repeats only.
+
+DeltaStats counts what was actually sent against the always-send baseline
+(one full datagram with vision per robot per tick).
+
+Usage:
+    sender = DeltaSender(robot_ids, sock, dest, heartbeat=0.25)
+    sender.set_command(2, forward=3, left=0, angular=0)
+    sender.tick()                      # once per control tick
+
+    python delta_sender.py --robots 0-10 --rate 100 --duration 10
+    python delta_sender.py --robots 0-10 --loss-test 0.2 --duration 10
+    python delta_sender.py --robots 0-10 --spin 5 --referee blue   # obey HALT/STOP
+    python delta_sender.py --robots 0-10 --spin 5 --sim blue       # simulator, one RobotControl per tick
+    python delta_sender.py --robots 0-10 --vision blue --predict 0.04   # poses predicted 40 ms ahead
+"""
+import argparse
+import asyncio
+import math
+import random
+import socket
+import struct
+import threading
+import time
+
+from messages import MULTICAST_GROUP, PORT, UDP_PORT, parse_robot_ids
+from scheduler import TickScheduler
+from triton_codec import DEFAULT_VISION, TritonBotEncoder
+
+
+class DeltaStats:
+    """Datagrams and bytes sent, by reason, against the always-send baseline."""
+
+    def __init__(self):
+        self.packets = 0
+        self.bytes = 0
+        self.baseline_packets = 0
+        self.baseline_bytes = 0
+        self.changes = 0
+        self.repeats = 0
+        self.heartbeats = 0
+        self.vision_sends = 0
+
+    def summary(self) -> str:
+        saved_packets = self.baseline_packets - self.packets
+        saved_bytes = self.baseline_bytes - self.bytes
+        return (f"sent {self.packets} pkts / {self.bytes} B "
+                f"(changes {self.changes}, repeats {self.repeats}, heartbeats {self.heartbeats}, "
+                f"with vision {self.vision_sends}); baseline {self.baseline_packets} pkts / "
+                f"{self.baseline_bytes} B; saved {saved_packets} pkts "
+                f"({100.0 * saved_packets / max(self.baseline_packets, 1):.1f}%), {saved_bytes} B "
+                f"({100.0 * saved_bytes / max(self.baseline_bytes, 1):.1f}%)")
+
+
+class RobotDelta:
+    """Desired and last-sent state for one robot."""
+
+    __slots__ = ('robot_id', 'bare', 'full', 'command', 'vision', 'vision_sent', 'kick_speed',
+                 'repeats_left', 'vision_left', 'last_send', 'heartbeats', 'full_size')
+
+    def __init__(self, robot_id: int, vision):
+        self.robot_id = robot_id
+        self.bare = TritonBotEncoder(robot_id, None)
+        self.full = TritonBotEncoder(robot_id, vision)
+        self.full_size = TritonBotEncoder(robot_id, DEFAULT_VISION).size
+        self.command = (0.0, 0.0, 0.0, 0.0, 0.0)  # forward, left, angular, kick_angle, dribbler_speed
+        self.vision = vision
+        self.vision_sent = None  # the vision tuple in the last datagram that carried one
+        self.kick_speed = 0.0
+        self.repeats_left = 0
+        self.vision_left = 0 if vision is None else 1
+        self.last_send = None  # None: never sent, so the first tick sends
+        self.heartbeats = 0
+
+
+class DeltaSender:
+    """Sends each robot's command only on change, with repeats and a heartbeat."""
+
+    def __init__(self, robot_ids, sock, dest, heartbeat: float = 0.25, repeats: int = 1,
+                 vision=DEFAULT_VISION, vision_refresh: int = 4, vision_move: float = 0.0,
+                 vision_turn: float = 0.0, clock=time.perf_counter):
+        self.sock = sock
+        # one (host, port) for every robot, or a {robot_id: (host, port)} table
+        self.dests = dest if isinstance(dest, dict) else dict.fromkeys(robot_ids, dest)
+        self.heartbeat = heartbeat
+        self.repeats = repeats
+        self.vision_refresh = vision_refresh
+        # a new pose is a change once x/y moved vision_move (mm) or orientation vision_turn (rad)
+        # from the last one sent; 0 for both: any new vision tuple is a change
+        self.vision_move = vision_move
+        self.vision_turn = vision_turn
+        self.clock = clock
+        self.robots = {rid: RobotDelta(rid, vision) for rid in robot_ids}
+        self.stats = DeltaStats()
+        # optional (forward, left, angular, kick_speed, kick_angle, dribbler) -> same filter applied
+        # at send time, e.g. referee.RefereeGuard's HALT/STOP limits
+        self.limit = None
+        self.lock = threading.Lock()
+        self.preempt_first_ns = 0
+
+    def _changed(self, robot: RobotDelta):
+        robot.repeats_left = 1 + self.repeats
+
+    def set_command(self, robot_id: int, forward: float, left: float, angular: float,
+                    dribbler_speed: float = None, kick_angle: float = None):
+        robot = self.robots[robot_id]
+        with self.lock:
+            old = robot.command
+            command = (forward, left, angular,
+                       old[3] if kick_angle is None else kick_angle,
+                       old[4] if dribbler_speed is None else dribbler_speed)
+            if command != old:
+                robot.command = command
+                self._changed(robot)
+
+    def kick(self, robot_id: int, speed: float = 1.0):
+        robot = self.robots[robot_id]
+        with self.lock:
+            robot.kick_speed = speed
+            self._changed(robot)
+
+    def set_vision(self, robot_id: int, vision):
+        """Replace a robot's vision tuple (VISION_FIELDS order).
+
+        Sent with the next datagram if it moved past the vision_move / vision_turn threshold,
+        otherwise with the next vision refresh heartbeat.
+        """
+        robot = self.robots[robot_id]
+        with self.lock:
+            if vision == robot.vision:
+                return
+            robot.vision = vision
+            if vision is not None:
+                robot.full.set_vision(vision)
+                if self._vision_moved(robot.vision_sent, vision):
+                    robot.vision_left = 1 + self.repeats
+                    self._changed(robot)
+
+    def _vision_moved(self, old, new) -> bool:
+        if old is None or not (self.vision_move or self.vision_turn):
+            return True
+        _, id0, x0, y0, theta0 = old[:5]
+        _, id1, x1, y1, theta1 = new[:5]
+        return (id0 != id1
+                or (self.vision_move and math.hypot(x1 - x0, y1 - y0) >= self.vision_move)
+                or (self.vision_turn and abs(math.remainder(theta1 - theta0, math.tau)) >= self.vision_turn))
+
+    def stop_all(self):
+        for rid in self.robots:
+            self.set_command(rid, 0.0, 0.0, 0.0, 0.0)
+
+    def tick(self, now: float = None) -> int:
+        """Send whatever is due this tick; return the number of datagrams sent."""
+        if now is None:
+            now = self.clock()
+        stats = self.stats
+        sent = 0
+        with self.lock:
+            for robot in self.robots.values():
+                stats.baseline_packets += 1
+                stats.baseline_bytes += robot.full_size
+                if robot.repeats_left:
+                    if robot.repeats_left > self.repeats:
+                        stats.changes += 1
+                    else:
+                        stats.repeats += 1
+                    robot.repeats_left -= 1
+                elif robot.last_send is None or now - robot.last_send >= self.heartbeat:
+                    stats.heartbeats += 1
+                    robot.heartbeats += 1
+                    if self.vision_refresh and robot.vision is not None and robot.heartbeats % self.vision_refresh == 0:
+                        robot.vision_left = max(robot.vision_left, 1)
+                else:
+                    continue
+                sent += self._send(robot, now)
+        return sent
+
+    def preempt(self, now: float = None) -> int:
+        """Send every robot its current (limited) command now, outside the tick schedule.
+
+        Counts as a change, so the usual repeats follow on the next ticks.
+        """
+        if now is None:
+            now = self.clock()
+        sent = 0
+        with self.lock:
+            for robot in self.robots.values():
+                robot.repeats_left = self.repeats
+                self.stats.changes += 1
+                if self._send(robot, now):
+                    sent += 1
+                    if sent == 1:
+                        self.preempt_first_ns = time.perf_counter_ns()
+        return sent
+
+    def _send(self, robot: RobotDelta, now: float) -> int:
+        forward, left, angular, kick_angle, dribbler = robot.command
+        kick_speed = robot.kick_speed
+        if self.limit is not None:
+            forward, left, angular, kick_speed, kick_angle, dribbler = self.limit(
+                forward, left, angular, kick_speed, kick_angle, dribbler)
+        if robot.vision_left:
+            robot.vision_left -= 1
+            encoder = robot.full
+            robot.vision_sent = robot.vision
+            self.stats.vision_sends += 1
+        else:
+            encoder = robot.bare
+        datagram = encoder.encode(forward, left, angular, kick_speed, kick_angle, dribbler)
+        try:
+            self.sock.sendto(datagram, self.dests[robot.robot_id])
+        except BlockingIOError:
+            return 0  # try again on the next tick: repeats_left is spent, so the heartbeat covers it
+        self.stats.packets += 1
+        self.stats.bytes += len(datagram)
+        robot.last_send = now
+        if not robot.repeats_left:
+            robot.kick_speed = 0.0
+        return 1
+
+
+class LossySocket:
+    """Drops each sendto() with probability `loss`; for loss testing on loopback."""
+
+    def __init__(self, sock, loss: float, seed: int = 0):
+        self.sock = sock
+        self.loss = loss
+        self.rng = random.Random(seed)
+        self.dropped = 0
+
+    def sendto(self, data, dest):
+        if self.rng.random() < self.loss:
+            self.dropped += 1
+            return len(data)
+        return self.sock.sendto(data, dest)
+
+    def close(self):
+        self.sock.close()
+
+
+async def run_loss_test(robot_ids, loss: float, duration: float, rate: float, heartbeat: float,
+                        repeats: int, port: int, seed: int = 0) -> bool:
+    """Drive emulated robots through a lossy link and check that they converge on the sent state.
+
+    Robots listen on port, port + 1, ...; port 0 picks free ports.
+    """
+    from esp32_emulator import EmulatedRobot, start_robot
+    from kinematics import uart_frame
+
+    class TrackingRobot(EmulatedRobot):
+        vision = None
+
+        def datagram_received(self, data, addr):
+            super().datagram_received(data, addr)
+            if self.message.HasField('vision') and self.message.id == self.robot_id:
+                v = self.message.vision
+                self.vision = (v.confidence, v.robot_id, v.x, v.y, v.orientation, v.pixel_x, v.pixel_y, v.height)
+
+    def f32(values):
+        return tuple(struct.unpack('<f', struct.pack('<f', v))[0] if isinstance(v, float) else v for v in values)
+
+    robots = {}
+    addrs = {}
+    transports = []
+    for index, rid in enumerate(robot_ids):
+        robots[rid] = TrackingRobot(rid)
+        transports += await start_robot(robots[rid], ('127.0.0.1', port + index if port else 0))
+        addrs[rid] = transports[-1].get_extra_info('sockname')
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setblocking(False)
+    lossy = LossySocket(sock, loss, seed)
+    sender = DeltaSender(robot_ids, lossy, addrs, heartbeat=heartbeat, repeats=repeats)
+    rng = random.Random(seed + 1)
+
+    def expected_frame(robot):
+        forward, left, angular, _, dribbler = f32(robot.command)
+        return uart_frame(forward, left, angular, dribbler)
+
+    loop = asyncio.get_running_loop()
+    period = 1.0 / rate
+    start = loop.time()
+    tick = 0
+    stale = 0
+    checked = 0
+    while loop.time() - start < duration:
+        for rid in robot_ids:
+            if rng.random() < 0.02:  # ~2 changes per robot per second at 100 Hz
+                sender.set_command(rid, rng.choice((-3.0, 0.0, 3.0)), rng.choice((-3.0, 0.0, 3.0)),
+                                   rng.choice((-25.0, 0.0, 25.0)), float(rng.random() < 0.3))
+            if rng.random() < 0.002:
+                sender.set_vision(rid, (0.9, rid, rng.uniform(-4.5, 4.5), rng.uniform(-3, 3),
+                                        rng.uniform(-3.14, 3.14), 1.0, 1.0, 1.0))
+        sender.tick()
+        tick += 1
+        await asyncio.sleep(max(0.0, start + tick * period - loop.time()))
+        for rid, robot in robots.items():
+            checked += 1
+            stale += robot.last_frame != expected_frame(sender.robots[rid])
+
+    # quiet period: only heartbeats from here on, long enough that every robot misses
+    # all of its vision refreshes with probability below 1e-4
+    refreshes = max(4, math.ceil(math.log(1e-4) / math.log(loss))) if loss > 0 else 4
+    settle = heartbeat * sender.vision_refresh * refreshes + 0.2
+    settle_end = loop.time() + settle
+    while loop.time() < settle_end:
+        sender.tick()
+        await asyncio.sleep(period)
+
+    converged = True
+    for rid, robot in robots.items():
+        state = sender.robots[rid]
+        frame_ok = robot.last_frame == expected_frame(state)
+        vision = state.vision
+        if vision[1] is None:  # DEFAULT_VISION: the robot's own id
+            vision = vision[:1] + (rid,) + vision[2:]
+        vision_ok = robot.vision == f32(vision)
+        if not (frame_ok and vision_ok):
+            converged = False
+            print(f"robot {rid:2d}: NOT converged (command {'ok' if frame_ok else 'stale'}, "
+                  f"vision {'ok' if vision_ok else 'stale'})")
+    sock.close()
+    for transport in transports:
+        transport.close()
+    print(f"loss test: {len(robot_ids)} robots, {loss * 100:.0f}% loss ({lossy.dropped} dropped), "
+          f"{heartbeat:g} s heartbeat, {repeats} repeats")
+    print(f"  stale robot-ticks during run: {stale}/{checked} ({100.0 * stale / max(checked, 1):.2f}%)")
+    print(f"  {sender.stats.summary()}")
+    print(f"  converged after {settle:.2f} s quiet period: {'yes' if converged else 'NO'}")
+    return converged
+
+
+def main():
+    p = argparse.ArgumentParser(description="Delta-only command sender with heartbeat")
+    p.add_argument("--robots", default="0-5", help="Robot ids, e.g. 0-10 or 1,2,5")
+    p.add_argument("--rate", type=float, default=100.0, help="Control tick rate (Hz)")
+    p.add_argument("--heartbeat", type=float, default=0.25, help="Seconds between keepalives for an unchanged robot")
+    p.add_argument("--repeats", type=int, default=1, help="Extra copies sent on the ticks after a change")
+    p.add_argument("--unicast", default=None, help="Send to this IP instead of the multicast group")
+    p.add_argument("--port", type=int, default=None, help="Destination port (default 10500 multicast, 3333 unicast)")
+    p.add_argument("--spin", type=float, default=0.0, help="Angular velocity command for every robot (rad/s)")
+    p.add_argument("--duration", type=float, default=0.0, help="Stop after this many seconds (0 = until Ctrl-C)")
+    p.add_argument("--loss-test", type=float, default=None, metavar="LOSS",
+                   help="Run a loopback convergence test against emulated robots with this drop probability")
+    p.add_argument("--vision", choices=("yellow", "blue"), default=None,
+                   help="Fill each robot's vision block from live SSL-Vision for this team")
+    p.add_argument("--predict", type=float, default=None, metavar="LATENCY",
+                   help="With --vision, send each pose Kalman-predicted this many seconds ahead (pose_filter)")
+    p.add_argument("--vision-move", type=float, default=20.0, metavar="MM",
+                   help="With --vision, send a pose at once when it moved this far (mm); smaller moves wait for the refresh")
+    p.add_argument("--vision-turn", type=float, default=0.05, metavar="RAD",
+                   help="With --vision, send a pose at once when it turned this far (rad)")
+    p.add_argument("--sim", choices=("yellow", "blue"), default=None, metavar="TEAM",
+                   help="Send to a simulator team port (--unicast host, default 127.0.0.1) via sim_transport")
+    p.add_argument("--referee", choices=("yellow", "blue"), default=None, metavar="TEAM",
+                   help="Obey game-controller HALT/STOP for this team, preempting the tick schedule")
+    args = p.parse_args()
+
+    robot_ids = parse_robot_ids(args.robots)
+    if args.loss_test is not None:
+        ok = asyncio.run(run_loss_test(robot_ids, args.loss_test, args.duration or 5.0, args.rate,
+                                       args.heartbeat, args.repeats, args.port or UDP_PORT))
+        raise SystemExit(0 if ok else 1)
+
+    sim = None
+    if args.sim:
+        from sim_transport import SimTransport
+        sock = sim = SimTransport(args.sim, args.unicast or '127.0.0.1', args.port)
+        dest = sim.dest
+    elif args.unicast:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        dest = (args.unicast, args.port or UDP_PORT)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, struct.pack('b', 1))
+        dest = (MULTICAST_GROUP, args.port or PORT)
+    sender = DeltaSender(robot_ids, sock, dest, args.heartbeat, args.repeats,
+                         vision_move=args.vision_move, vision_turn=args.vision_turn)
+    for rid in robot_ids:
+        sender.set_command(rid, 0.0, 0.0, args.spin)
+    vision = vision_filter = None
+    if args.vision:
+        from vision_receiver import TEAM_NAMES, VisionState, start_vision_thread
+        vision = VisionState()
+        team = TEAM_NAMES[args.vision]
+        start_vision_thread(vision)
+        if args.predict is not None:
+            from pose_filter import VisionFilter
+            vision_filter = VisionFilter(vision, latency=args.predict)
+    guard = None
+    if args.referee:
+        from referee import MODE_NAMES, RefereeGuard, start_referee_thread
+        guard = RefereeGuard(sender, args.referee, on_change=lambda mode, _: print(f"referee: {MODE_NAMES[mode]}"))
+        start_referee_thread(guard)
+
+    print(f"Delta sender: {len(robot_ids)} robots -> {dest[0]}:{dest[1]}, {args.rate:g} Hz ticks, "
+          f"{args.heartbeat:g} s heartbeat")
+    scheduler = TickScheduler(args.rate)
+    start = last_report = time.perf_counter()
+    try:
+        while True:
+            if vision is not None:
+                if vision_filter is not None:
+                    vision_filter.ingest()
+                for rid in robot_ids:
+                    if vision_filter is not None:
+                        pose = vision_filter.predicted_vision(team, rid)  # where it will be when this arrives
+                    else:
+                        pose = vision.vision_tuple(team, rid)
+                    if pose is not None:
+                        sender.set_vision(rid, pose)  # a change only once it moved past --vision-move/--vision-turn
+            sender.tick()
+            if sim is not None:
+                sim.flush()  # every robot due this tick goes out in one RobotControl
+                sim.poll_responses()
+            now = time.perf_counter()
+            if now - last_report >= 1.0:
+                print(sender.stats.summary())
+                last_report = now
+            if args.duration and now - start >= args.duration:
+                break
+            scheduler.wait()
+    except KeyboardInterrupt:
+        print('\nStopping.')
+    finally:
+        # the stop and its repeats, spaced out like the 3-datagram stop burst of wasd_teleop.py
+        sender.stop_all()
+        while True:
+            sender.tick()
+            if sim is not None:
+                sim.flush()
+            if not any(robot.repeats_left for robot in sender.robots.values()):
+                break
+            time.sleep(0.05)
+        print(sender.stats.summary())
+        if sim is not None:
+            print(sim.stats.summary())
+        if guard is not None:
+            print(guard.stats.summary())
+        sock.close()
+
+
+if __name__ == '__main__':
+    main()
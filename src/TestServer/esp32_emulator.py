@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Headless emulator of src/esp32/esp32.ino for loopback testing.
+
+Each EmulatedRobot listens for TritonBotMessages on a unicast port and/or the
+224.1.1.1:10500 multicast group, drops messages whose id isn't its own, and
+emits the same 11-byte 0xCA 0xFE wheel/dribble UART frame the ESP32 writes to
+the STM32 (built with the kinematics.py port of action_to_byte_array). Frames
+go to a pty per robot, to a file/FIFO per robot, or nowhere. Kick commands
+start the same 2000-loop (~2 s) charge timer before the kick fires, and a
+repeated kick command restarts it exactly as the firmware does. Compact
+datagrams (compact_codec.py) are accepted too: each robot takes its own
+record from a team datagram and drops stale sequence numbers.
+
+Many robots can run in one process to load-test the fleet path. Senders that
+append a send timestamp with append_send_stamp() get end-to-end latency from
+sendto to frame emitted; --load-test drives the emulators from an in-process
+sender and reports drops, decode time and latency per robot.
+
+Usage:
+    python esp32_emulator.py --robots 2 --pty                 # firmware-like single robot
+    python esp32_emulator.py --robots 0-10 --multicast --frames /tmp/robot{id}.uart
+    python esp32_emulator.py --robots 0-10 --load-test 200 --duration 10
+"""
+import argparse
+import asyncio
+import os
+import socket
+import struct
+import sys
+import time
+import tty
+from array import array
+
+from google.protobuf.message import DecodeError
+
+from compact_codec import CompactDecoder, is_compact
+from kinematics import uart_frame
+from messages import MULTICAST_GROUP, PORT, UDP_PORT, parse_robot_ids
+from triton_bot_communication_pb2 import TritonBotMessage
+from triton_codec import _read_varint, _skip
+
+# Unknown field 15, wire type fixed64, appended by instrumented senders.
+# Protobuf (and nanopb on the robot) skip it, so it never changes behaviour.
+SEND_STAMP_TAG = bytes(((15 << 3) | 1,))
+_STAMP = struct.Struct('<Q')
+
+# firmware loop runs with delay(1), so charge_timer reaches 2000 after ~2 s
+CHARGE_TIME = 2.0
+
+
+def append_send_stamp(datagram: bytes, stamp_ns: int = None) -> bytes:
+    """Append a monotonic_ns() send timestamp as an unknown protobuf field (latency_probe.py uses the same)."""
+    if stamp_ns is None:
+        stamp_ns = time.monotonic_ns()
+    return datagram + SEND_STAMP_TAG + _STAMP.pack(stamp_ns)
+
+
+def read_send_stamp(datagram: bytes):
+    """Return the timestamp added by append_send_stamp(), or None.
+
+    A trailing 0x79 byte alone could be part of a float, so the top-level
+    fields are walked to check the stamp really is the last field.
+    """
+    end = len(datagram) - 9
+    if end < 0 or datagram[end] != SEND_STAMP_TAG[0]:
+        return None
+    pos = 0
+    try:
+        while pos < end:
+            key, pos = _read_varint(datagram, pos)
+            pos = _skip(datagram, pos, key & 7)
+    except (ValueError, IndexError):
+        return None
+    if pos != end:
+        return None
+    return _STAMP.unpack_from(datagram, end + 1)[0]
+
+
+class FrameSink:
+    """Writes UART frames to a file descriptor without blocking the event loop.
+
+    `peer_fd` is the slave side of a pty, held open so the master stays
+    writable until a reader attaches; close() releases both.
+    """
+
+    def __init__(self, fd: int, name: str, peer_fd: int = None):
+        self.fd = fd
+        self.name = name
+        self.peer_fd = peer_fd
+        self.overflows = 0
+        os.set_blocking(fd, False)
+
+    @classmethod
+    def open_pty(cls):
+        master, slave = os.openpty()
+        tty.setraw(slave)
+        return cls(master, os.ttyname(slave), slave)
+
+    @classmethod
+    def open_path(cls, path: str):
+        if path.endswith('.fifo') and not os.path.exists(path):
+            os.mkfifo(path)
+        # O_RDWR keeps a FIFO open even before a reader attaches
+        return cls(os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644), path)
+
+    def write(self, frame: bytes):
+        try:
+            os.write(self.fd, frame)
+        except BlockingIOError:
+            self.overflows += 1
+
+    def close(self):
+        os.close(self.fd)
+        if self.peer_fd is not None:
+            os.close(self.peer_fd)
+
+
+class RobotStats:
+    """Per-robot packet counters, decode cost and end-to-end latency samples."""
+
+    def __init__(self, capacity: int = 65536):
+        self.received = 0
+        self.foreign = 0
+        self.decode_errors = 0
+        self.frames = 0
+        self.kicks = 0
+        self.decode_ns = 0
+        self.capacity = capacity
+        self.latency_ns = array('q', bytes(8 * capacity))
+        self.latency_count = 0
+
+    def add_latency(self, ns: int):
+        self.latency_ns[self.latency_count % self.capacity] = ns
+        self.latency_count += 1
+
+    def latency_percentile(self, q: float) -> float:
+        n = min(self.latency_count, self.capacity)
+        if n == 0:
+            return float('nan')
+        ordered = sorted(self.latency_ns[:n])
+        return ordered[min(n - 1, int(q / 100.0 * n))] / 1e3
+
+    def summary(self) -> str:
+        decoded = max(self.received - self.decode_errors, 1)
+        line = (f"rx {self.received:7d}  foreign {self.foreign:6d}  bad {self.decode_errors:4d}  "
+                f"frames {self.frames:7d}  kicks {self.kicks:3d}  decode {self.decode_ns / decoded / 1e3:6.2f} us")
+        if self.latency_count:
+            line += (f"  latency p50 {self.latency_percentile(50):7.1f} us"
+                     f"  p99 {self.latency_percentile(99):7.1f} us")
+        return line
+
+
+class EmulatedRobot(asyncio.DatagramProtocol):
+    """One ESP32: decode, filter by id, emit UART frames, run the kick timer."""
+
+    def __init__(self, robot_id: int, sink: FrameSink = None, verbose: bool = False):
+        self.robot_id = robot_id
+        self.sink = sink
+        self.verbose = verbose
+        self.stats = RobotStats()
+        self.message = TritonBotMessage()
+        self.compact = CompactDecoder()
+        self.last_frame = None
+        self.charge_handle = None
+
+    def datagram_received(self, data: bytes, addr):
+        stats = self.stats
+        stats.received += 1
+        if is_compact(data):
+            self.compact_received(data)
+            return
+        message = self.message
+        start = time.perf_counter_ns()
+        try:
+            message.ParseFromString(data)
+        except DecodeError:
+            stats.decode_errors += 1
+            return
+        stats.decode_ns += time.perf_counter_ns() - start
+        if message.id != self.robot_id:
+            stats.foreign += 1
+            return
+
+        command = message.command
+        vel = command.move_command.local_velocity
+        self.emit(uart_frame(vel.forward, vel.left, vel.angular, command.dribbler_speed),
+                  command.kick_speed != 0, read_send_stamp(data))
+
+    def compact_received(self, data: bytes):
+        stats = self.stats
+        start = time.perf_counter_ns()
+        errors = self.compact.stats.version_errors + self.compact.stats.length_errors
+        command = self.compact.find(data, self.robot_id)
+        stats.decode_ns += time.perf_counter_ns() - start
+        if command is None:
+            if self.compact.stats.version_errors + self.compact.stats.length_errors != errors:
+                stats.decode_errors += 1
+            else:
+                stats.foreign += 1  # not addressed to this robot, or a stale repeat
+            return
+        self.emit(uart_frame(command.forward, command.left, command.angular, 1.0 if command.dribble else 0.0),
+                  command.kick)
+
+    def emit(self, frame: bytes, kick: bool, stamp: int = None):
+        stats = self.stats
+        if self.sink is not None:
+            self.sink.write(frame)
+        self.last_frame = frame
+        stats.frames += 1
+
+        if stamp is not None:
+            stats.add_latency(time.monotonic_ns() - stamp)
+        if self.verbose:
+            print(f"robot {self.robot_id}: {frame.hex(' ')}")
+        if kick:
+            self.start_charge()
+
+    def start_charge(self):
+        # every kick command resets charge_timer to 1 in the firmware
+        if self.charge_handle is not None:
+            self.charge_handle.cancel()
+        loop = asyncio.get_running_loop()
+        self.charge_handle = loop.call_later(CHARGE_TIME, self.fire_kick)
+
+    def fire_kick(self):
+        self.charge_handle = None
+        self.stats.kicks += 1
+        if self.verbose:
+            print(f"robot {self.robot_id}: ---------KICKED----------")
+
+
+def _multicast_socket(group: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(('', port))
+    mreq = struct.pack('4s4s', socket.inet_aton(group), socket.inet_aton('0.0.0.0'))
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+    return sock
+
+
+async def start_robot(robot: EmulatedRobot, unicast_addr=None, multicast=None):
+    """Attach robot to a unicast (host, port) and/or multicast (group, port) endpoint."""
+    loop = asyncio.get_running_loop()
+    transports = []
+    if unicast_addr is not None:
+        transport, _ = await loop.create_datagram_endpoint(lambda: robot, local_addr=unicast_addr)
+        transports.append(transport)
+    if multicast is not None:
+        transport, _ = await loop.create_datagram_endpoint(lambda: robot, sock=_multicast_socket(*multicast))
+        transports.append(transport)
+    return transports
+
+
+async def run_load_test(robots: dict, addrs: dict, rate: float, duration: float):
+    """Send stamped commands to every robot at `rate` Hz and return packets sent per robot."""
+    from triton_codec import TritonBotEncoder
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, struct.pack('b', 1))
+    sock.setblocking(False)
+    encoders = {rid: TritonBotEncoder(rid) for rid in robots}
+    sent = dict.fromkeys(robots, 0)
+
+    loop = asyncio.get_running_loop()
+    period = 1.0 / rate
+    start = loop.time()
+    tick = 0
+    while loop.time() - start < duration:
+        angular = 25.0 if (tick // int(max(rate, 1))) % 2 else -25.0
+        for rid, encoder in encoders.items():
+            datagram = append_send_stamp(bytes(encoder.encode(3.0, 0.0, angular)))
+            try:
+                sock.sendto(datagram, addrs[rid])
+                sent[rid] += 1
+            except BlockingIOError:
+                pass
+        tick += 1
+        await asyncio.sleep(max(0.0, start + tick * period - loop.time()))
+    await asyncio.sleep(0.2)  # let the last datagrams drain
+    sock.close()
+    return sent
+
+
+async def amain(args):
+    robot_ids = parse_robot_ids(args.robots)
+    multicast = (MULTICAST_GROUP, args.multicast_port) if args.multicast else None
+    robots = {}
+    addrs = {}
+    sinks = []
+    transports = []
+    try:
+        for index, rid in enumerate(robot_ids):
+            sink = None
+            if args.pty:
+                sink = FrameSink.open_pty()
+            elif args.frames:
+                sink = FrameSink.open_path(args.frames.format(id=rid))
+            if sink is not None:
+                sinks.append(sink)
+            robot = EmulatedRobot(rid, sink, verbose=args.verbose)
+            unicast = None if args.multicast else (args.host, args.port + index)
+            transports += await start_robot(robot, unicast, multicast)
+            robots[rid] = robot
+            addrs[rid] = multicast if args.multicast else unicast
+            where = f"{addrs[rid][0]}:{addrs[rid][1]}"
+            print(f"robot {rid:2d} listening on {where}" + (f", UART frames -> {sink.name}" if sink else ""))
+
+        if args.load_test:
+            sent = await run_load_test(robots, addrs, args.load_test, args.duration or 5.0)
+            print(f"\nload test: {len(robots)} robots at {args.load_test:g} Hz")
+            for rid, robot in robots.items():
+                lost = sent[rid] - robot.stats.frames
+                print(f"robot {rid:2d}: sent {sent[rid]:7d}  lost {lost:5d}  {robot.stats.summary()}")
+            return
+
+        start = time.perf_counter()
+        while not args.duration or time.perf_counter() - start < args.duration:
+            await asyncio.sleep(args.report)
+            for rid, robot in robots.items():
+                overflows = f"  sink overflows {robot.sink.overflows}" if robot.sink else ""
+                print(f"robot {rid:2d}: {robot.stats.summary()}{overflows}")
+    finally:
+        for transport in transports:
+            transport.close()
+        for sink in sinks:
+            sink.close()
+
+
+def main():
+    p = argparse.ArgumentParser(description="Emulate ESP32 robots on loopback")
+    p.add_argument("--robots", default="2", help="Robot ids to emulate, e.g. 2 or 0-10")
+    p.add_argument("--host", default="127.0.0.1", help="Unicast bind address")
+    p.add_argument("--port", type=int, default=UDP_PORT, help="Unicast port of the first robot; robot i uses port+i")
+    p.add_argument("--multicast", action="store_true", help=f"Join {MULTICAST_GROUP} instead of binding unicast ports")
+    p.add_argument("--multicast-port", type=int, default=PORT, help="Multicast port")
+    p.add_argument("--pty", action="store_true", help="Write each robot's UART frames to its own pty")
+    p.add_argument("--frames", default=None, help="Write UART frames to this path ('{id}' is the robot id; *.fifo makes a FIFO)")
+    p.add_argument("--load-test", type=float, default=0.0, metavar="HZ", help="Drive the robots from an in-process sender at this rate")
+    p.add_argument("--duration", type=float, default=0.0, help="Seconds to run (0 = until Ctrl-C)")
+    p.add_argument("--report", type=float, default=1.0, help="Stats report interval (s)")
+    p.add_argument("--verbose", action="store_true", help="Print every frame and kick")
+    args = p.parse_args()
+
+    try:
+        asyncio.run(amain(args))
+    except KeyboardInterrupt:
+        print('\nStopping emulator.', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
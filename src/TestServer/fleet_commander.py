@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Fleet commander: drive a whole team of robots from a single send loop.
+
+Holds command state for N robots and sends one TritonBotMessage per robot per
+tick. Each robot keeps a pre-serialized template: the id and vision fields are
+encoded once, and only the command sub-message is re-encoded when that
+robot's command actually changes. Unchanged robots resend their cached bytes.
+
+Usage:
+    python fleet_commander.py --robots 0-10 --rate 100
+    python fleet_commander.py --robots 1,2,3 --unicast 192.168.8.80 --spin 12
+"""
+import argparse
+import socket
+import struct
+import time
+
+from command_log import CommandRecorder, RecordingSocket
+from messages import MULTICAST_GROUP, PORT, UDP_PORT, encode_varint, new_bot_message, parse_robot_ids
+from scheduler import CATCH_UP, SKIP, TickScheduler
+
+# TritonBotMessage.command is field 3, wire type 2 (length-delimited)
+COMMAND_TAG = b'\x1a'
+
+
+class RobotSlot:
+    """Command state and cached wire bytes for one robot."""
+
+    __slots__ = ('robot_id', 'message', 'prefix', 'datagram', 'dirty', 'kick_pending')
+
+    def __init__(self, robot_id: int):
+        self.robot_id = robot_id
+        self.message = new_bot_message(robot_id)
+        # id + vision never change, so they are serialized exactly once
+        prefix_msg = new_bot_message(robot_id)
+        prefix_msg.ClearField('command')
+        self.prefix = prefix_msg.SerializeToString()
+        self.datagram = b''
+        self.dirty = True
+        self.kick_pending = False
+
+    def encode(self) -> bytes:
+        command = self.message.command.SerializeToString()
+        self.datagram = self.prefix + COMMAND_TAG + encode_varint(len(command)) + command
+        self.dirty = False
+        return self.datagram
+
+
+class FleetStats:
+    """Achieved send rate and per-tick send cost over a reporting window."""
+
+    def __init__(self):
+        self.reset(time.perf_counter())
+
+    def reset(self, now: float):
+        self.window_start = now
+        self.ticks = 0
+        self.packets = 0
+        self.encodes = 0
+        self.send_time = 0.0
+        self.max_send_time = 0.0
+
+    def record(self, packets: int, encodes: int, elapsed: float):
+        self.ticks += 1
+        self.packets += packets
+        self.encodes += encodes
+        self.send_time += elapsed
+        if elapsed > self.max_send_time:
+            self.max_send_time = elapsed
+
+    def summary(self, now: float) -> str:
+        span = max(now - self.window_start, 1e-9)
+        ticks = max(self.ticks, 1)
+        return (f"{self.ticks / span:7.1f} Hz, {self.packets / span:8.1f} pkt/s, "
+                f"send {self.send_time / ticks * 1e6:7.1f} us/tick avg, "
+                f"{self.max_send_time * 1e6:7.1f} us max, "
+                f"{self.encodes} re-encodes")
+
+
+class FleetCommander:
+    """Command state for a team of robots, sent together once per tick."""
+
+    def __init__(self, robot_ids, sock: socket.socket, dest):
+        self.sock = sock
+        self.dest = dest
+        self.slots = {rid: RobotSlot(rid) for rid in robot_ids}
+        self.stats = FleetStats()
+
+    def set_velocity(self, robot_id: int, forward: float, left: float, angular: float):
+        slot = self.slots[robot_id]
+        vel = slot.message.command.move_command.local_velocity
+        if vel.forward != forward or vel.left != left or vel.angular != angular:
+            vel.forward = forward
+            vel.left = left
+            vel.angular = angular
+            slot.dirty = True
+
+    def set_dribbler(self, robot_id: int, speed: float):
+        slot = self.slots[robot_id]
+        if slot.message.command.dribbler_speed != speed:
+            slot.message.command.dribbler_speed = speed
+            slot.dirty = True
+
+    def kick(self, robot_id: int, speed: float = 1):
+        """Request a kick; it is sent on the next tick only."""
+        slot = self.slots[robot_id]
+        slot.message.command.kick_speed = speed
+        slot.kick_pending = True
+        slot.dirty = True
+
+    def stop_all(self):
+        for rid in self.slots:
+            self.set_velocity(rid, 0, 0, 0)
+            self.set_dribbler(rid, 0)
+
+    def tick(self) -> float:
+        """Send every robot's current message once; return the time spent."""
+        start = time.perf_counter()
+        sendto = self.sock.sendto
+        dest = self.dest
+        encodes = 0
+        for slot in self.slots.values():
+            if slot.dirty:
+                slot.encode()
+                encodes += 1
+            sendto(slot.datagram, dest)
+            if slot.kick_pending:
+                slot.message.command.kick_speed = 0
+                slot.kick_pending = False
+                slot.dirty = True
+        elapsed = time.perf_counter() - start
+        self.stats.record(len(self.slots), encodes, elapsed)
+        return elapsed
+
+
+def main():
+    p = argparse.ArgumentParser(description="Send commands to a whole team from one loop")
+    p.add_argument("--robots", default="0-5", help="Robot ids, e.g. 0-10 or 1,2,5")
+    p.add_argument("--rate", type=float, default=100.0, help="Tick rate (Hz)")
+    p.add_argument("--unicast", default=None, help="Send to this IP instead of the multicast group")
+    p.add_argument("--port", type=int, default=None, help="Destination port (default 10500 multicast, 3333 unicast)")
+    p.add_argument("--spin", type=float, default=0.0, help="Angular velocity command for every robot (rad/s)")
+    p.add_argument("--busy-wait-us", type=float, default=500.0, help="Busy-wait this long before each deadline (us)")
+    p.add_argument("--overrun", choices=(SKIP, CATCH_UP), default=SKIP, help="What to do with ticks that start late")
+    p.add_argument("--record", default=None, help="Log every sent datagram to this command log")
+    p.add_argument("--duration", type=float, default=0.0, help="Stop after this many seconds (0 = run until Ctrl-C)")
+    args = p.parse_args()
+
+    robot_ids = parse_robot_ids(args.robots)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    if args.unicast:
+        dest = (args.unicast, args.port or UDP_PORT)
+    else:
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, struct.pack('b', 1))
+        dest = (MULTICAST_GROUP, args.port or PORT)
+    if args.record:
+        sock = RecordingSocket(sock, CommandRecorder(args.record))
+
+    fleet = FleetCommander(robot_ids, sock, dest)
+    for rid in robot_ids:
+        fleet.set_velocity(rid, 0, 0, args.spin)
+
+    print(f"Fleet commander: {len(robot_ids)} robots -> {dest[0]}:{dest[1]} at {args.rate:g} Hz")
+    scheduler = TickScheduler(args.rate, spin=args.busy_wait_us * 1e-6, policy=args.overrun)
+    start = time.perf_counter()
+    last_report = start
+
+    try:
+        while True:
+            fleet.tick()
+
+            now = time.perf_counter()
+            if now - last_report >= 1.0:
+                print(fleet.stats.summary(now))
+                fleet.stats.reset(now)
+                last_report = now
+            if args.duration and now - start >= args.duration:
+                break
+            scheduler.wait()
+
+    except KeyboardInterrupt:
+        print('\nStopping fleet.')
+
+    finally:
+        print(scheduler.stats.summary())
+        fleet.stop_all()
+        for _ in range(3):
+            fleet.tick()
+            time.sleep(0.05)
+        sock.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,845 @@
+#!/usr/bin/env python3
+"""
+Command gateway that merges the text and TritonBotMessage operator streams.
+
+wasd_teleop.py sends "<id> dash <power> <rot>" / "<id> kick" text to
+239.42.42.42:10000 and UserControl.py sends TritonBotMessages to
+224.1.1.1:10500; with several operators and scripts running, every one of
+them sprays the Wi-Fi on its own schedule. The gateway subscribes to both
+groups on one event loop and sends each robot a single stream instead:
+
+  ingress      text datagrams are parsed in place by parse_text(), a byte
+               state machine with no regex, slicing or decoding; TritonBot
+               datagrams go through triton_codec.decode()
+  arbitration  every sender (protocol, address) has a priority: the first
+               of --priority HOST:PORT=N, HOST=N, text=N / triton=N that
+               matches. A command takes a robot if its sender already owns
+               it or has a higher priority; any other sender, one of the same
+               priority included, only gets the robot once the owner has been
+               silent for --freshness seconds, so two equal operators don't
+               trade it back and forth. A robot whose owner goes silent is
+               sent STOP_REPEATS stops and released
+  egress       each robot's latest command is sent at most --rate times a
+               second, right away if its slot is free, and repeated every
+               --keepalive seconds while owned; --format picks TritonBot,
+               compact_codec, text or a simulator team port (sim_transport)
+
+Commands for a robot the output can't address (not in --table with no
+--dest, or an id the output format can't encode) are dropped before
+arbitration and counted as unroutable.
+
+GatewayStats counts input per protocol, commands accepted and rejected,
+owner handovers, sends (change-driven, keepalive, stop), the coalescing
+ratio (accepted commands per change-driven send) and the added latency from
+a command's datagram arriving to the sendto() that carried it.
+
+Datagrams whose source port is the gateway's own output port are dropped,
+so writing back to a group it listens on doesn't loop.
+
+Usage:
+    python gateway.py --format triton --table 2=192.168.8.80,3=192.168.8.81
+    python gateway.py --format compact --dest 224.1.1.1:10501 --priority text=1,triton=2,192.168.8.20=5
+    python gateway.py --format sim --dest 127.0.0.1 --team blue --report 1
+    python gateway.py --loopback                 # mixed bursts from many senders into emulated ESP32s
+    python gateway.py --loopback --format compact --senders 32
+"""
+import argparse
+import asyncio
+import random
+import socket
+import struct
+import time
+
+from latency_probe import LatencyHistogram
+from messages import MULTICAST_GROUP, PORT, UDP_PORT
+from stage_profiler import NULL_PROFILER, add_profile_arguments, start_profiler
+from teleop_async import FULL_ANGULAR, FULL_FORWARD, TEXT_GROUP, TEXT_PORT, TEXT_STEPS
+from triton_codec import TritonBotEncoder, decode
+
+PROTO_TEXT = 0
+PROTO_TRITON = 1
+PROTO_NAMES = ('text', 'triton')
+
+DEFAULT_PRIORITY = {'text': 1, 'triton': 1}
+STOP_REPEATS = 3
+
+_STEP_FORWARD = FULL_FORWARD / TEXT_STEPS
+_STEP_ANGULAR = FULL_ANGULAR / TEXT_STEPS
+
+# parse_text() verbs, indexed by byte so a comparison never builds a bytes object
+_VERB_DASH = 0
+_VERB_KICK = 1
+_VERB_BAD = 2
+_VERBS = (b'dash', b'kick')
+
+
+def parse_text(data, dash, kick) -> int:
+    """Parse wasd_teleop.py text lines, calling dash(id, power, rot) and kick(id); return malformed lines.
+
+    A datagram may hold several newline-separated lines. The bytes are walked
+    once; tokens are never sliced out, so apart from the callbacks nothing is
+    allocated (power and rot are small cached ints).
+    """
+    n = len(data)
+    i = 0
+    errors = 0
+    while i < n:
+        token = -1
+        pos = 0
+        inside = False
+        verb = _VERB_BAD
+        verb_len = 0
+        digits = 0  # bit k set once token k has a digit
+        sign = 1
+        value = robot_id = power = rot = 0
+        bad = False
+        while i < n:
+            c = data[i]
+            i += 1
+            if c == 10:
+                break
+            if c == 32 or c == 9 or c == 13:
+                inside = False
+                continue
+            if bad:
+                continue
+            if inside:
+                pos += 1
+            else:
+                inside = True
+                token += 1
+                pos = 0
+                sign = 1
+                value = 0
+            if token == 1:
+                if pos == 0:
+                    verb = _VERB_DASH if c == 100 else _VERB_KICK if c == 107 else _VERB_BAD
+                elif pos >= 4 or verb == _VERB_BAD or c != _VERBS[verb][pos]:
+                    verb = _VERB_BAD
+                verb_len = pos + 1
+            elif token <= 3 and 48 <= c <= 57:
+                value = value * 10 + c - 48
+                digits |= 1 << token
+                if token == 0:
+                    robot_id = value
+                elif token == 2:
+                    power = sign * value
+                else:
+                    rot = sign * value
+            elif token >= 2 and pos == 0 and (c == 45 or c == 43):
+                sign = -1 if c == 45 else 1
+            else:
+                bad = True
+        if token < 0:
+            continue  # blank line
+        if bad or verb_len != 4 or not digits & 1:
+            errors += 1
+        elif verb == _VERB_DASH and token == 3 and digits == 0b1101:
+            dash(robot_id, power, rot)
+        elif verb == _VERB_KICK and token == 1:
+            kick(robot_id)
+        else:
+            errors += 1
+    return errors
+
+
+def parse_priorities(spec: str) -> dict:
+    """Parse "text=1,triton=2,192.168.8.20=5,10.0.0.7:40000=9" into {key: priority}.
+
+    Keys are protocol names, hosts or host:port pairs; hosts are resolved once here.
+    """
+    table = dict(DEFAULT_PRIORITY)
+    for entry in spec.split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        key, _, value = entry.partition('=')
+        key = key.strip()
+        if key not in PROTO_NAMES:
+            host, _, port = key.partition(':')
+            host = socket.gethostbyname(host)
+            key = (host, int(port)) if port else host
+        table[key] = int(value)
+    return table
+
+
+def parse_endpoint(spec: str, default_port: int):
+    host, _, port = spec.partition(':')
+    return socket.gethostbyname(host), int(port) if port else default_port
+
+
+class GatewayStats:
+    """Input, arbitration and output counters plus input-to-sendto latency."""
+
+    def __init__(self):
+        self.received = [0, 0]      # datagrams per protocol
+        self.parse_errors = [0, 0]  # malformed lines / undecodable datagrams per protocol
+        self.commands = [0, 0]      # commands parsed per protocol
+        self.looped = 0
+        self.accepted = 0
+        self.rejected = 0
+        self.unroutable = 0
+        self.handovers = 0
+        self.sent = 0
+        self.keepalives = 0
+        self.stops = 0
+        self.send_errors = 0
+        self.latency = LatencyHistogram()
+        self.started = time.perf_counter()
+
+    def summary(self) -> str:
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        inputs = '  '.join(f"{name} {self.received[p] / elapsed:7.1f}/s ({self.commands[p]} commands, "
+                           f"{self.parse_errors[p]} bad)" for p, name in enumerate(PROTO_NAMES))
+        changes = self.sent - self.keepalives - self.stops
+        ratio = self.accepted / changes if changes else 0.0
+        return (f"input {inputs}  looped {self.looped}\n"
+                f"arbitration: {self.accepted} accepted, {self.rejected} rejected, {self.unroutable} unroutable, "
+                f"{self.handovers} handovers\n"
+                f"output: {self.sent} sends ({self.sent / elapsed:.1f}/s), {self.keepalives} keepalives, "
+                f"{self.stops} stops, {self.send_errors} errors; coalescing {ratio:.2f} commands per send\n"
+                f"added latency {self.latency.summary()}")
+
+
+class RobotSlot:
+    """Arbitrated command and send state of one robot."""
+
+    __slots__ = ('robot_id', 'owner', 'priority', 'fresh_ns', 'forward', 'left', 'angular', 'dribbler',
+                 'kick', 'dirty', 'event_ns', 'sent_ns', 'stops', 'inputs', 'sends')
+
+    def __init__(self, robot_id: int):
+        self.robot_id = robot_id
+        self.owner = None     # sender key, None when released
+        self.priority = 0
+        self.fresh_ns = 0     # arrival of the owner's latest command
+        self.forward = 0.0
+        self.left = 0.0
+        self.angular = 0.0
+        self.dribbler = 0.0
+        self.kick = False     # latched until sent
+        self.dirty = False
+        self.event_ns = 0     # arrival of the oldest command not yet sent
+        self.sent_ns = 0
+        self.stops = 0        # stops still to send after release
+        self.inputs = 0
+        self.sends = 0
+
+
+class TritonOutput:
+    """TritonBotMessage per robot, to the robot table entry or one destination."""
+
+    def __init__(self, sock, table: dict, dest=None):
+        self.sock = sock
+        self.table = table
+        self.dest = dest
+        self.encoders = {}
+
+    def accepts(self, robot_id: int) -> bool:
+        # the id is an int32, and the uint32 vision robot_id repeats it
+        return 0 <= robot_id <= 0x7FFFFFFF and (robot_id in self.table or self.dest is not None)
+
+    def send(self, slot: RobotSlot):
+        encoder = self.encoders.get(slot.robot_id)
+        if encoder is None:
+            encoder = self.encoders[slot.robot_id] = TritonBotEncoder(slot.robot_id)
+        data = encoder.encode(slot.forward, slot.left, slot.angular, 1.0 if slot.kick else 0.0, 0.0, slot.dribbler)
+        self.sock.sendto(data, self.table.get(slot.robot_id, self.dest))
+
+    def flush(self):
+        pass
+
+
+class CompactOutput:
+    """One-record compact_codec datagram per robot."""
+
+    def __init__(self, sock, table: dict, dest=None):
+        from compact_codec import CompactEncoder
+
+        self.sock = sock
+        self.table = table
+        self.dest = dest
+        self.encoder = CompactEncoder(capacity=1)
+
+    def accepts(self, robot_id: int) -> bool:
+        return 0 <= robot_id <= 0xFF and (robot_id in self.table or self.dest is not None)
+
+    def send(self, slot: RobotSlot):
+        data = self.encoder.encode(slot.robot_id, slot.forward, slot.left, slot.angular,
+                                   slot.kick, slot.dribbler > 0)
+        self.sock.sendto(data, self.table.get(slot.robot_id, self.dest))
+
+    def flush(self):
+        pass
+
+
+class TextOutput:
+    """wasd_teleop.py text lines; left and dribbler have no text equivalent and are dropped."""
+
+    def __init__(self, sock, table: dict, dest=None):
+        self.sock = sock
+        self.table = table
+        self.dest = dest
+
+    def accepts(self, robot_id: int) -> bool:
+        return robot_id in self.table or self.dest is not None
+
+    def send(self, slot: RobotSlot):
+        dest = self.table.get(slot.robot_id, self.dest)
+        if slot.kick:
+            self.sock.sendto(b'%d kick\n' % slot.robot_id, dest)
+        power = max(-TEXT_STEPS, min(TEXT_STEPS, round(slot.forward / _STEP_FORWARD)))
+        rot = max(-TEXT_STEPS, min(TEXT_STEPS, round(slot.angular / _STEP_ANGULAR)))
+        self.sock.sendto(b'%d dash %d %d\n' % (slot.robot_id, power, rot), dest)
+
+    def flush(self):
+        pass
+
+
+class SimOutput:
+    """Robot commands staged in a sim_transport.SimTransport, one RobotControl datagram per pass."""
+
+    def __init__(self, transport):
+        from sim_transport import MAX_RECORD_ID
+
+        self.transport = transport
+        self.sock = transport.sock
+        self.max_id = MAX_RECORD_ID
+
+    def accepts(self, robot_id: int) -> bool:
+        return 0 <= robot_id <= self.max_id
+
+    def send(self, slot: RobotSlot):
+        self.transport.set_command(slot.robot_id, slot.forward, slot.left, slot.angular,
+                                   1.0 if slot.kick else 0.0, 0.0, slot.dribbler)
+
+    def flush(self):
+        self.transport.flush()
+        self.transport.poll_responses()
+
+
+OUTPUTS = {'triton': TritonOutput, 'compact': CompactOutput, 'text': TextOutput}
+
+
+class Gateway:
+    """Per-robot arbitration between senders and the rate-limited send loop."""
+
+    def __init__(self, output, rate: float = 50.0, keepalive: float = 0.2, freshness: float = 0.5,
+                 priorities: dict = None, profiler=None, clock=time.perf_counter_ns):
+        self.output = output
+        self.clock = clock  # ns; the inputs stamp arrivals with it and run() services with it
+        self.interval_ns = int(1e9 / rate)
+        self.keepalive_ns = int(keepalive * 1e9) if keepalive > 0 else 0
+        self.freshness_ns = int(freshness * 1e9)
+        self.priorities = dict(DEFAULT_PRIORITY) if priorities is None else priorities
+        self.profiler = profiler or NULL_PROFILER
+        self.send_stage = self.profiler.stage('send')
+        self.robots = {}
+        self.senders = {}  # (protocol, addr) -> priority
+        self.stats = GatewayStats()
+        self.own_port = output.sock.getsockname()[1] or None  # sim sockets are unbound and never reach the groups
+        self.next_wake_ns = 0
+        self.wakeup = None
+        self.stopping = False
+
+    def sender_priority(self, key) -> int:
+        priorities = self.priorities
+        protocol, addr = key
+        priority = priorities.get(addr)
+        if priority is None:
+            priority = priorities.get(addr[0])
+        if priority is None:
+            priority = priorities.get(PROTO_NAMES[protocol], 0)
+        self.senders[key] = priority
+        return priority
+
+    def _claim(self, robot_id: int, key, now: int):
+        """The robot's slot if the sender wins it, else None."""
+        slot = self.robots.get(robot_id)
+        if slot is None:
+            if not self.output.accepts(robot_id):
+                self.stats.unroutable += 1
+                return None
+            slot = self.robots[robot_id] = RobotSlot(robot_id)
+        priority = self.senders.get(key)
+        if priority is None:
+            priority = self.sender_priority(key)
+        stats = self.stats
+        if slot.owner != key:
+            if slot.owner is not None and now - slot.fresh_ns < self.freshness_ns and priority <= slot.priority:
+                stats.rejected += 1
+                return None
+            if slot.owner is not None:
+                stats.handovers += 1
+            slot.owner = key
+            slot.priority = priority
+            slot.stops = 0
+        slot.fresh_ns = now
+        slot.inputs += 1
+        stats.accepted += 1
+        if not slot.dirty:
+            slot.dirty = True
+            slot.event_ns = now
+        # wake the send loop only if this robot is due before it would wake anyway
+        due = max(slot.sent_ns + self.interval_ns, now)
+        if due < self.next_wake_ns and self.wakeup is not None and not self.wakeup.done():
+            self.wakeup.set_result(None)
+        return slot
+
+    def command(self, robot_id: int, key, now: int, forward: float, left: float, angular: float,
+                kick: bool, dribbler: float):
+        slot = self._claim(robot_id, key, now)
+        if slot is not None:
+            slot.forward = forward
+            slot.left = left
+            slot.angular = angular
+            slot.dribbler = dribbler
+            if kick:
+                slot.kick = True
+
+    def kick(self, robot_id: int, key, now: int):
+        slot = self._claim(robot_id, key, now)
+        if slot is not None:
+            slot.kick = True
+
+    def _send(self, slot: RobotSlot, now: int) -> bool:
+        try:
+            self.output.send(slot)
+        except Exception:  # OSError, or an encoder rejecting a value: one robot must not end the send loop
+            self.stats.send_errors += 1
+            slot.sent_ns = now  # retry after a full interval, not in a tight loop
+            return False
+        slot.kick = False
+        slot.sent_ns = now
+        slot.sends += 1
+        self.stats.sent += 1
+        return True
+
+    def service(self, now: int) -> int:
+        """Send every robot that is due; return when (on self.clock) something next falls due."""
+        stats = self.stats
+        interval = self.interval_ns
+        keepalive = self.keepalive_ns
+        stop_period = keepalive or interval
+        next_due = now + (keepalive or interval * 10)
+        sent = False
+        for slot in self.robots.values():
+            if slot.owner is not None and now - slot.fresh_ns >= self.freshness_ns:
+                # owner went silent: stop the robot and let anyone take it
+                slot.owner = None
+                slot.forward = slot.left = slot.angular = slot.dribbler = 0.0
+                slot.kick = False
+                slot.stops = STOP_REPEATS
+                slot.dirty = False
+                slot.sent_ns = 0
+            if slot.owner is None and not slot.stops:
+                continue
+            if slot.dirty:
+                if now >= slot.sent_ns + interval and self._send(slot, now):
+                    stats.latency.record(self.clock() - slot.event_ns)
+                    slot.dirty = False
+                    sent = True
+            elif slot.stops:
+                if now >= slot.sent_ns + stop_period and self._send(slot, now):
+                    slot.stops -= 1
+                    stats.stops += 1
+                    sent = True
+            elif keepalive and now >= slot.sent_ns + keepalive and self._send(slot, now):
+                stats.keepalives += 1
+                sent = True
+
+            if slot.dirty:
+                due = slot.sent_ns + interval
+            elif slot.stops:
+                due = slot.sent_ns + stop_period
+            elif slot.owner is not None and keepalive:
+                due = slot.sent_ns + keepalive
+            else:
+                due = next_due
+            if slot.owner is not None:
+                due = min(due, slot.fresh_ns + self.freshness_ns)
+            if due < next_due:
+                next_due = due
+        if sent:
+            self.output.flush()
+        return next_due
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        profiler = self.profiler
+        send_stage = self.send_stage
+        while not self.stopping:
+            profiler.tick_begin()
+            with send_stage:
+                self.next_wake_ns = self.service(self.clock())
+            profiler.tick_end()
+            self.wakeup = loop.create_future()
+            timeout = (self.next_wake_ns - self.clock()) / 1e9
+            if timeout > 0:
+                try:
+                    await asyncio.wait_for(self.wakeup, timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+    def stop(self):
+        self.stopping = True
+        if self.wakeup is not None and not self.wakeup.done():
+            self.wakeup.set_result(None)
+
+
+class TextInput(asyncio.DatagramProtocol):
+    """wasd_teleop.py text datagrams into the gateway."""
+
+    def __init__(self, gateway: Gateway):
+        self.gateway = gateway
+        self.stage = gateway.profiler.stage('text')
+        self.key = None
+        self.now = 0
+        # bound once so parse_text() gets the same two callables for every datagram
+        self._dash = self.dash
+        self._kick = self.kick
+
+    def dash(self, robot_id: int, power: int, rot: int):
+        power = TEXT_STEPS if power > TEXT_STEPS else -TEXT_STEPS if power < -TEXT_STEPS else power
+        rot = TEXT_STEPS if rot > TEXT_STEPS else -TEXT_STEPS if rot < -TEXT_STEPS else rot
+        self.gateway.stats.commands[PROTO_TEXT] += 1
+        self.gateway.command(robot_id, self.key, self.now, power * _STEP_FORWARD, 0.0, rot * _STEP_ANGULAR,
+                             False, 0.0)
+
+    def kick(self, robot_id: int):
+        self.gateway.stats.commands[PROTO_TEXT] += 1
+        self.gateway.kick(robot_id, self.key, self.now)
+
+    def datagram_received(self, data: bytes, addr):
+        now = self.gateway.clock()
+        stats = self.gateway.stats
+        stats.received[PROTO_TEXT] += 1
+        if addr[1] == self.gateway.own_port:
+            stats.looped += 1
+            return
+        with self.stage:
+            self.key = (PROTO_TEXT, addr)
+            self.now = now
+            stats.parse_errors[PROTO_TEXT] += parse_text(data, self._dash, self._kick)
+
+
+class TritonInput(asyncio.DatagramProtocol):
+    """TritonBotMessage datagrams into the gateway."""
+
+    def __init__(self, gateway: Gateway):
+        self.gateway = gateway
+        self.stage = gateway.profiler.stage('triton')
+
+    def datagram_received(self, data: bytes, addr):
+        gateway = self.gateway
+        now = gateway.clock()
+        stats = gateway.stats
+        stats.received[PROTO_TRITON] += 1
+        if addr[1] == gateway.own_port:
+            stats.looped += 1
+            return
+        with self.stage:
+            try:
+                fields = decode(data)
+            except (ValueError, IndexError, struct.error):
+                stats.parse_errors[PROTO_TRITON] += 1
+                return
+            stats.commands[PROTO_TRITON] += 1
+            gateway.command(fields.id, (PROTO_TRITON, addr), now, fields.forward, fields.left, fields.angular,
+                            fields.kick_speed != 0, fields.dribbler_speed)
+
+
+def _listen_socket(host: str, port: int) -> socket.socket:
+    """A socket bound to port and joined to host if it is a multicast group."""
+    from esp32_emulator import _multicast_socket
+
+    if socket.inet_aton(host)[0] >> 4 == 0xE:
+        return _multicast_socket(host, port)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.bind((host, port))
+    return sock
+
+
+async def start_inputs(gateway: Gateway, text=(TEXT_GROUP, TEXT_PORT), triton=(MULTICAST_GROUP, PORT)):
+    """Attach the gateway's text and TritonBot listeners; either endpoint may be None."""
+    loop = asyncio.get_running_loop()
+    transports = []
+    if text is not None:
+        transport, _ = await loop.create_datagram_endpoint(lambda: TextInput(gateway), sock=_listen_socket(*text))
+        transports.append(transport)
+    if triton is not None:
+        transport, _ = await loop.create_datagram_endpoint(lambda: TritonInput(gateway), sock=_listen_socket(*triton))
+        transports.append(transport)
+    return transports
+
+
+def make_output(args):
+    if args.format == 'sim':
+        from sim_transport import SimTransport
+
+        host = args.dest.partition(':')[0] if args.dest else '127.0.0.1'
+        port = int(args.dest.partition(':')[2]) if args.dest and ':' in args.dest else None
+        return SimOutput(SimTransport(args.team, host, port))
+    from unicast_fanout import load_robot_table
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, struct.pack('b', 1))
+    sock.bind(('', 0))  # a fixed source port, so the inputs can recognise our own datagrams
+    sock.setblocking(False)
+    table = load_robot_table(args.table) if args.table else {}
+    dest = parse_endpoint(args.dest, TEXT_PORT if args.format == 'text' else UDP_PORT) if args.dest else None
+    return OUTPUTS[args.format](sock, table, dest)
+
+
+async def amain(args):
+    session = start_profiler(args, 'gateway')
+    gateway = Gateway(make_output(args), args.rate, args.keepalive, args.freshness,
+                      parse_priorities(args.priority), session.profiler)
+    transports = await start_inputs(gateway, parse_endpoint(args.text, TEXT_PORT),
+                                    parse_endpoint(args.triton, PORT))
+    task = asyncio.create_task(gateway.run())
+    print(f"gateway: text {args.text}, triton {args.triton} -> {args.format} at {args.rate:g} Hz per robot")
+    start = time.perf_counter()
+    try:
+        while not args.duration or time.perf_counter() - start < args.duration:
+            await asyncio.sleep(args.report or 1.0)
+            if args.report:
+                print(gateway.stats.summary())
+    finally:
+        gateway.stop()
+        await task
+        for transport in transports:
+            transport.close()
+        print(gateway.stats.summary())
+        session.close()
+
+
+class _Sender:
+    """One loopback operator: its own socket, so its own source address and priority."""
+
+    def __init__(self, protocol: int, dest):
+        self.protocol = protocol
+        self.dest = dest
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, struct.pack('b', 1))
+        self.sock.bind(('', 0))
+        # the address the gateway will see: the interface the kernel routes the group through
+        probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        probe.connect(dest)
+        self.addr = (probe.getsockname()[0], self.sock.getsockname()[1])
+        probe.close()
+        self.encoders = {}
+        self.sent = 0
+
+    def dash(self, robot_id: int, power: int, rot: int, kick: bool = False):
+        if self.protocol == PROTO_TEXT:
+            data = b'%d dash %d %d\n' % (robot_id, power, rot)
+            if kick:
+                data = b'%d kick\n' % robot_id + data
+        else:
+            encoder = self.encoders.get(robot_id)
+            if encoder is None:
+                encoder = self.encoders[robot_id] = TritonBotEncoder(robot_id)
+            data = encoder.encode(power * _STEP_FORWARD, 0.0, rot * _STEP_ANGULAR, 1.0 if kick else 0.0)
+        self.raw(data)
+
+    def raw(self, data):
+        self.sock.sendto(data, self.dest)
+        self.sent += 1
+
+
+async def run_loopback(args) -> bool:
+    """Bursts of mixed text/TritonBot commands from many senders through a gateway into emulated ESP32s."""
+    from esp32_emulator import EmulatedRobot, start_robot
+    from messages import parse_robot_ids
+
+    loop = asyncio.get_running_loop()
+    robot_ids = parse_robot_ids(args.robots)
+    robots = {rid: EmulatedRobot(rid) for rid in robot_ids}
+    table = {}
+    transports = []
+    for rid, robot in robots.items():
+        transports += await start_robot(robot, ('127.0.0.1', 0))
+        table[rid] = transports[-1].get_extra_info('sockname')
+    out = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    out.bind(('127.0.0.1', 0))
+    out.setblocking(False)
+
+    text_sock = _listen_socket(TEXT_GROUP, 0)
+    triton_sock = _listen_socket(MULTICAST_GROUP, 0)
+    text_dest = (TEXT_GROUP, text_sock.getsockname()[1])
+    triton_dest = (MULTICAST_GROUP, triton_sock.getsockname()[1])
+    senders = [_Sender(i % 2, text_dest if i % 2 == PROTO_TEXT else triton_dest) for i in range(args.senders)]
+    boss = _Sender(PROTO_TEXT, text_dest)
+    priorities = {'text': 1, 'triton': 2, boss.addr: 5}
+
+    freshness = 0.3
+    gateway = Gateway(OUTPUTS[args.format](out, table), args.rate, args.keepalive, freshness, priorities)
+    for sock, protocol in ((text_sock, TextInput), (triton_sock, TritonInput)):
+        transport, _ = await loop.create_datagram_endpoint(lambda: protocol(gateway), sock=sock)
+        transports.append(transport)
+    task = asyncio.create_task(gateway.run())
+    failures = 0
+
+    def expected_frame(rid, power, rot):
+        """The frame the robot shows for a command that went through the chosen wire format."""
+        probe = EmulatedRobot(rid)
+        slot = RobotSlot(rid)
+        slot.forward, slot.angular = power * _STEP_FORWARD, rot * _STEP_ANGULAR
+
+        class Capture:
+            def sendto(self, data, dest):
+                probe.datagram_received(bytes(data), None)
+
+            def getsockname(self):
+                return ('127.0.0.1', 0)
+
+        OUTPUTS[args.format](Capture(), {}, None).send(slot)
+        return probe.last_frame
+
+    def expect(label, rid, power, rot):
+        nonlocal failures
+        want = expected_frame(rid, power, rot)
+        got = robots[rid].last_frame
+        ok = got == want
+        failures += not ok
+        print(f"{'OK' if ok else 'MISMATCH'}: {label}: robot {rid} "
+              f"{got.hex(' ') if got else None}" + ('' if ok else f" != {want.hex(' ')}"))
+
+    # 1. bursts: every sender fires `burst` commands back to back at random robots every 10 ms,
+    #    plus a few malformed text lines the parser has to reject
+    rng = random.Random(0)
+    start = time.perf_counter()
+    bad_lines = 0
+    last = {}
+    while time.perf_counter() - start < args.duration:
+        for sender in senders:
+            for _ in range(args.burst):
+                rid = rng.choice(robot_ids)
+                power, rot = rng.randint(-10, 10), rng.randint(-10, 10)
+                sender.dash(rid, power, rot)
+                last[rid] = (power, rot)
+        if rng.random() < 0.1:
+            senders[0].raw(b'%d dash x 3\n1 dsah 2 2\n' % robot_ids[0])
+            bad_lines += 2
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+    stats = gateway.stats
+    burst_sends = {rid: robot.stats.frames for rid, robot in robots.items()}
+    elapsed = time.perf_counter() - start
+    limit = elapsed * args.rate + 2
+    worst = max(burst_sends.values())
+    ok = worst <= limit
+    failures += not ok
+    print(f"{'OK' if ok else 'OVER'}: burst phase: {sum(s.sent for s in senders)} datagrams from "
+          f"{len(senders)} senders -> at most {worst} sends per robot in {elapsed:.2f} s "
+          f"(limit {limit:.0f} at {args.rate:g} Hz)")
+    ok = stats.parse_errors[PROTO_TEXT] == bad_lines and stats.parse_errors[PROTO_TRITON] == 0
+    failures += not ok
+    print(f"{'OK' if ok else 'MISMATCH'}: {stats.parse_errors[PROTO_TEXT]} malformed text lines rejected "
+          f"(sent {bad_lines})")
+
+    # 2. arbitration on two robots: TritonBot (priority 2) beats text (1); the boss sender (5) beats both
+    a, b = robot_ids[0], robot_ids[1 % len(robot_ids)]
+    high, low = senders[1 % len(senders)], senders[0]
+    phase = time.perf_counter()
+    while time.perf_counter() - phase < 0.5:
+        high.dash(a, 7, -3)
+        low.dash(a, -5, 5)
+        high.dash(b, 2, 2)
+        boss.dash(b, -8, 1)
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+    expect("triton over text", a, 7, -3)
+    expect("priority 5 sender over triton", b, -8, 1)
+
+    # 3. the triton sender goes quiet: text takes over once it is stale, and a text kick gets through
+    phase = time.perf_counter()
+    while time.perf_counter() - phase < freshness + 0.3:
+        low.dash(a, -5, 5, kick=time.perf_counter() - phase > freshness + 0.1)
+        boss.dash(b, -8, 1)
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+    expect("text after triton went stale", a, -5, 5)
+    ok = robots[a].charge_handle is not None
+    failures += not ok
+    print(f"{'OK' if ok else 'MISMATCH'}: kick from the text sender reached robot {a}")
+
+    # 4. commands for robots the output can't address (not in the table, beyond the compact id range,
+    #    negative) are counted as unroutable and don't disturb the robots that are
+    unknown = max(robot_ids) + 1
+    negative = TritonBotEncoder(-1, None, command_id=0).encode(0.5, 0.0, 0.0)
+    unroutable = stats.unroutable
+    phase = time.perf_counter()
+    while time.perf_counter() - phase < 0.2:
+        low.dash(unknown, 3, 3)
+        high.dash(256, 3, 3)
+        high.raw(negative)
+        low.dash(a, 4, -4)
+        boss.dash(b, -8, 1)
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+    dropped = stats.unroutable - unroutable
+    ok = dropped > 0 and not {unknown, 256, -1} & gateway.robots.keys()
+    failures += not ok
+    print(f"{'OK' if ok else 'MISMATCH'}: {dropped} commands for robots {unknown}, 256 and -1 dropped as unroutable")
+    expect("still sending after unroutable commands", a, 4, -4)
+
+    # 5. everyone stops: every robot is sent a stop and released
+    await asyncio.sleep(freshness + 3 * max(args.keepalive, 1.0 / args.rate) + 0.1)
+    for rid in robot_ids:
+        expect("stopped after all senders went stale", rid, 0, 0)
+
+    gateway.stop()
+    await task
+    for transport in transports:
+        transport.close()
+    for sender in senders + [boss]:
+        sender.sock.close()
+    for robot in robots.values():
+        if robot.charge_handle is not None:
+            robot.charge_handle.cancel()
+    print(stats.summary())
+    return failures == 0
+
+
+def main():
+    p = argparse.ArgumentParser(description="Merge text and TritonBot operator streams into one stream per robot")
+    p.add_argument("--format", choices=('triton', 'compact', 'text', 'sim'), default='triton',
+                   help="Outbound wire format")
+    p.add_argument("--table", default=None, help="Robot table, file or 'id=ip[:port],...' (triton/compact/text)")
+    p.add_argument("--dest", default=None, help="HOST[:PORT] for robots not in the table, or the simulator host")
+    p.add_argument("--team", choices=('blue', 'yellow'), default='blue', help="Simulator team for --format sim")
+    p.add_argument("--text", default=f"{TEXT_GROUP}:{TEXT_PORT}", help="Text input group or host[:port]")
+    p.add_argument("--triton", default=f"{MULTICAST_GROUP}:{PORT}", help="TritonBot input group or host[:port]")
+    p.add_argument("--priority", default='', help="Sender priorities, e.g. text=1,triton=2,192.168.8.20=5")
+    p.add_argument("--rate", type=float, default=50.0, help="Max sends per robot per second")
+    p.add_argument("--keepalive", type=float, default=0.2, help="Repeat an unchanged command every N s (0 = never)")
+    p.add_argument("--freshness", type=float, default=0.5, help="Seconds before a silent owner loses its robot")
+    p.add_argument("--report", type=float, default=0.0, help="Print stats every N s")
+    p.add_argument("--duration", type=float, default=0.0, help="Run for N s (0 = until interrupted)")
+    p.add_argument("--loopback", action="store_true", help="Run the mixed-protocol loopback test and exit")
+    p.add_argument("--robots", default="1-6", help="Robot ids for --loopback")
+    p.add_argument("--senders", type=int, default=16, help="Senders for --loopback (alternating text/triton)")
+    p.add_argument("--burst", type=int, default=5, help="Commands per sender per 10 ms for --loopback")
+    add_profile_arguments(p)
+    args = p.parse_args()
+
+    if args.loopback:
+        if args.format not in ('triton', 'compact'):
+            p.error("--loopback drives emulated ESP32s; use --format triton or compact")
+        if not args.duration:
+            args.duration = 1.0
+        ok = asyncio.run(run_loopback(args))
+        if not ok:
+            raise SystemExit(1)
+        return
+    if args.format != 'sim' and not (args.table or args.dest):
+        p.error("--table or --dest is required")
+    try:
+        asyncio.run(amain(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
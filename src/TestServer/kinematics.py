@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Host-side port of the ESP32 omni-wheel inverse kinematics.
+
+Mirrors getVelocityArray / valuesToBytes / action_to_byte_array from
+src/esp32/velocityConversions.cpp over whole arrays of (forward, left, angular)
+commands, producing the same int wheel speeds and big-endian int16 wheel bytes
+the ESP32 writes to the STM32.
+
+Matching the firmware bit for bit needs three details:
+  - the protobuf fields are float32, so inputs are rounded to float32 before
+    the double-precision math, exactly as nanopb hands them to the firmware;
+  - getWheelVelocities passes (left, forward) as (vx, vy);
+  - each wheel is summed as rotV*k + vx*cos + vy*sin in that order and then
+    truncated toward zero, so the 4x3 WHEEL_MATRIX is applied as a broadcast
+    multiply-add instead of through a BLAS matmul that may reorder the sums.
+
+Usage:
+    python kinematics.py --check          # verify against the firmware golden vectors
+    python kinematics.py --bench 1000000  # batch conversion throughput
+"""
+import argparse
+import math
+import struct
+import time
+
+import numpy as np
+
+# wheel constants (velocityConversions.h)
+WHEEL_RADIUS = 0.02425
+GEAR_RATIO = 36
+MAX_RPM = 15000
+MAX_VELOCITY = 175
+RESCALE_FACTOR = MAX_RPM / MAX_VELOCITY
+
+# front right wheel constants
+FR_X = 0.09 * math.cos(math.pi / 6)
+FR_Y = 0.09 * math.sin(math.pi / 6)
+FR_WHEEL_ANGLE = -(math.pi / 3)
+
+# back right wheel constants
+BR_X = 0.09 * math.cos(-(math.pi / 3))
+BR_Y = 0.09 * math.sin(-(math.pi / 3))
+BR_WHEEL_ANGLE = -5 * (math.pi / 6)
+
+# back left wheel constants
+BL_X = 0.09 * math.cos(-4 * (math.pi / 6))
+BL_Y = 0.09 * math.sin(-4 * (math.pi / 6))
+BL_WHEEL_ANGLE = 5 * (math.pi / 6)
+
+# front left wheel constants
+FL_X = 0.09 * math.cos(5 * (math.pi / 6))
+FL_Y = 0.09 * math.sin(5 * (math.pi / 6))
+FL_WHEEL_ANGLE = math.pi / 3
+
+WHEELS = (
+    (FR_X, FR_Y, FR_WHEEL_ANGLE),
+    (BR_X, BR_Y, BR_WHEEL_ANGLE),
+    (BL_X, BL_Y, BL_WHEEL_ANGLE),
+    (FL_X, FL_Y, FL_WHEEL_ANGLE),
+)
+
+# rows: FR, BR, BL, FL; columns: coefficient of (rotV, vx = left, vy = forward)
+WHEEL_MATRIX = np.array([
+    [math.sin(a) * x - math.cos(a) * y, math.cos(a), math.sin(a)] for x, y, a in WHEELS
+])
+# the same rows as Python floats, for wheel_speeds_scalar()
+_WHEEL_ROWS = tuple(tuple(row) for row in WHEEL_MATRIX.tolist())
+
+UART_HEADER = (0xCA, 0xFE)
+FRAME_SIZE = 11
+
+# (forward, left, angular) -> wheel speeds, generated from velocityConversions.cpp
+# compiled on the host with the same float32 inputs the ESP32 receives.
+GOLDEN_VECTORS = (
+    ((0.0, 0.0, 0.0), (0, 0, 0, 0)),
+    ((3.0, 0.0, 0.0), (-9183, -5301, 5301, 9183)),
+    ((-3.0, 0.0, 0.0), (9183, 5301, -5301, -9183)),
+    ((0.0, 3.0, 0.0), (5301, -9183, -9183, 5301)),
+    ((0.0, -3.0, 0.0), (-5301, 9183, 9183, -5301)),
+    ((0.0, 0.0, 25.0), (-7952, -7952, -7952, -7952)),
+    ((0.0, 0.0, -25.0), (7952, 7952, 7952, 7952)),
+    ((1.0, 1.0, 0.0), (-1293, -4828, -1293, 4828)),
+    ((0.1, 0.2, 0.3), (-48, -884, -530, 564)),
+    ((-0.7, 0.35, 1.5), (2284, -311, -2785, -2001)),
+    ((2.5, -1.25, -4.0), (-8589, 680, 9517, 6715)),
+    ((0.05, 0.0, 0.0), (-153, -88, 88, 153)),
+    ((0.0, 0.01, 0.0), (17, -30, -30, 17)),
+    ((1.234, -0.567, 0.891), (-5062, -728, 3633, 2491)),
+    ((10.0, 10.0, 50.0), (-14999, -14999, -14999, 14999)),
+)
+
+
+def _as_float32_doubles(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float32).astype(np.float64).reshape(-1)
+
+
+def wheel_speeds(forward, left, angular) -> np.ndarray:
+    """Return an (N, 4) int32 array of FR, BR, BL, FL wheel speeds, as getVelocityArray computes them."""
+    vy = _as_float32_doubles(forward)[:, None]
+    vx = _as_float32_doubles(left)[:, None]
+    rot = _as_float32_doubles(angular)[:, None]
+
+    speeds = rot * WHEEL_MATRIX[:, 0]
+    speeds += vx * WHEEL_MATRIX[:, 1]
+    speeds += vy * WHEEL_MATRIX[:, 2]
+    speeds /= WHEEL_RADIUS
+    np.clip(speeds, -MAX_VELOCITY, MAX_VELOCITY, out=speeds)
+    speeds *= RESCALE_FACTOR
+    return speeds.astype(np.int32)  # truncates toward zero like the (int) cast
+
+
+def values_to_bytes(speeds: np.ndarray) -> np.ndarray:
+    """Return an (N, 8) uint8 array of big-endian int16 wheel bytes, as valuesToBytes packs them."""
+    return np.ascontiguousarray(speeds, dtype='>i2').view(np.uint8).reshape(-1, 8)
+
+
+def action_to_byte_array(forward, left, angular) -> np.ndarray:
+    """Return the (N, 8) wheel bytes the ESP32 builds for each command."""
+    return values_to_bytes(wheel_speeds(forward, left, angular))
+
+
+def uart_frames(forward, left, angular, dribbler_speed=0.0) -> np.ndarray:
+    """Return (N, 11) 0xCA 0xFE + wheel bytes + dribble flag frames, as esp32.ino writes them."""
+    wheel_bytes = action_to_byte_array(forward, left, angular)
+    frames = np.empty((wheel_bytes.shape[0], FRAME_SIZE), dtype=np.uint8)
+    frames[:, 0], frames[:, 1] = UART_HEADER
+    frames[:, 2:10] = wheel_bytes
+    frames[:, 10] = np.asarray(dribbler_speed, dtype=np.float32) > 0
+    return frames
+
+
+def _float32(value: float) -> float:
+    return struct.unpack('<f', struct.pack('<f', value))[0]
+
+
+def wheel_speeds_scalar(forward: float, left: float, angular: float) -> tuple:
+    """Single-command version of wheel_speeds without NumPy call overhead."""
+    vy = _float32(forward)
+    vx = _float32(left)
+    rot = _float32(angular)
+    speeds = []
+    for k, c, s in _WHEEL_ROWS:
+        w = (rot * k + vx * c + vy * s) / WHEEL_RADIUS
+        if w > MAX_VELOCITY:
+            w = MAX_VELOCITY
+        elif w < -MAX_VELOCITY:
+            w = -MAX_VELOCITY
+        speeds.append(int(w * RESCALE_FACTOR))
+    return tuple(speeds)
+
+
+def uart_frame(forward: float, left: float, angular: float, dribbler_speed: float = 0.0) -> bytes:
+    """Single-command version of uart_frames."""
+    return struct.pack('>BB4hB', *UART_HEADER, *wheel_speeds_scalar(forward, left, angular),
+                       1 if dribbler_speed > 0 else 0)
+
+
+def check_golden() -> int:
+    """Compare both code paths with GOLDEN_VECTORS; return the number of mismatches."""
+    commands = np.array([cmd for cmd, _ in GOLDEN_VECTORS])
+    expected = np.array([speeds for _, speeds in GOLDEN_VECTORS])
+    batch = wheel_speeds(commands[:, 0], commands[:, 1], commands[:, 2])
+
+    failures = 0
+    for i, (cmd, speeds) in enumerate(GOLDEN_VECTORS):
+        got_batch = tuple(batch[i].tolist())
+        got_scalar = wheel_speeds_scalar(*cmd)
+        if got_batch != speeds or got_scalar != speeds:
+            print(f"MISMATCH {cmd}: firmware {speeds}, batch {got_batch}, scalar {got_scalar}")
+            failures += 1
+
+    packed = values_to_bytes(expected).tobytes()
+    if packed != b''.join(struct.pack('>4h', *speeds) for speeds in expected.tolist()):
+        print("MISMATCH in values_to_bytes packing")
+        failures += 1
+    return failures
+
+
+def main():
+    p = argparse.ArgumentParser(description="Batch omni-wheel kinematics matching the ESP32 firmware")
+    p.add_argument("--check", action="store_true", help="Verify against the firmware golden vectors")
+    p.add_argument("--bench", type=int, default=0, metavar="N", help="Convert N random commands and report throughput")
+    args = p.parse_args()
+
+    if args.check:
+        failures = check_golden()
+        print(f"{len(GOLDEN_VECTORS) - failures}/{len(GOLDEN_VECTORS)} golden vectors match")
+        raise SystemExit(1 if failures else 0)
+
+    if args.bench:
+        rng = np.random.default_rng(0)
+        forward = rng.uniform(-3, 3, args.bench).astype(np.float32)
+        left = rng.uniform(-3, 3, args.bench).astype(np.float32)
+        angular = rng.uniform(-25, 25, args.bench).astype(np.float32)
+        start = time.perf_counter()
+        action_to_byte_array(forward, left, angular)
+        elapsed = time.perf_counter() - start
+        print(f"{args.bench} commands in {elapsed * 1e3:.1f} ms "
+              f"({args.bench / elapsed / 1e6:.1f} M commands/s)")
+
+
+if __name__ == '__main__':
+    main()
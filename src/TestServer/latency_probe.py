@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Sequence-numbered round-trip latency probe for the command path.
+
+Each probe is a normal TritonBotMessage with a trailer of unknown protobuf
+fields appended, which protobuf and nanopb skip:
+
+    field 14 fixed64  sequence number
+    field 15 fixed64  sender time.monotonic_ns()   (same field esp32_emulator reads)
+
+A responder echoes every probe back to its sender with one more field:
+
+    field 13 fixed64  responder time.monotonic_ns() at receive
+
+CLOCK_MONOTONIC is shared by every process on a host, so on loopback the two
+legs (send -> responder and responder -> sender) are exact; against a remote
+responder only the round trip is meaningful. Latencies go into fixed-memory
+log-linear histograms (LatencyHistogram) that are written and read from the
+single asyncio thread, so no locks are needed. Loss, duplicates and
+reordering are tracked per sequence number.
+
+Usage:
+    python latency_probe.py respond --multicast                  # echo on :3333 and 224.1.1.1:10500
+    python latency_probe.py probe --unicast 127.0.0.1 --rate 1000 --duration 10
+    python latency_probe.py probe --compare --rate 500           # multicast vs unicast, side by side
+"""
+import argparse
+import asyncio
+import socket
+import struct
+import time
+from array import array
+
+from messages import MULTICAST_GROUP, PORT, UDP_PORT
+from triton_codec import TritonBotEncoder
+
+SEQ_TAG = (14 << 3) | 1
+SEND_TAG = (15 << 3) | 1
+ECHO_TAG = (13 << 3) | 1
+PROBE_TRAILER = struct.Struct('<BQBQ')
+ECHO_TRAILER = struct.Struct('<BQ')
+SUB_BUCKET_BITS = 6
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+REORDER_WINDOW = 1 << 16
+
+
+def tag_probe(datagram, seq: int, stamp_ns: int = None) -> bytes:
+    """Append the sequence/timestamp trailer to a serialized message."""
+    if stamp_ns is None:
+        stamp_ns = time.monotonic_ns()
+    return bytes(datagram) + PROBE_TRAILER.pack(SEQ_TAG, seq, SEND_TAG, stamp_ns)
+
+
+def read_probe(datagram):
+    """Return (seq, send_ns, echo_ns or None) from a tagged datagram, or None if untagged."""
+    end = len(datagram)
+    echo_ns = None
+    if end >= ECHO_TRAILER.size and datagram[end - ECHO_TRAILER.size] == ECHO_TAG:
+        echo_ns = ECHO_TRAILER.unpack_from(datagram, end - ECHO_TRAILER.size)[1]
+        end -= ECHO_TRAILER.size
+    start = end - PROBE_TRAILER.size
+    if start < 0:
+        return None
+    seq_tag, seq, send_tag, send_ns = PROBE_TRAILER.unpack_from(datagram, start)
+    if seq_tag != SEQ_TAG or send_tag != SEND_TAG:
+        return None
+    return seq, send_ns, echo_ns
+
+
+class LatencyHistogram:
+    """Log-linear histogram of nanosecond values with ~1.6% relative resolution.
+
+    Values below 64 ns get their own bucket; above that, every power of two is
+    split into 64 linear sub-buckets. Memory is fixed at construction.
+    """
+
+    def __init__(self, max_ns: int = 60 * 10**9):
+        self.max_ns = max_ns
+        self.counts = array('Q', bytes(8 * (self._index(max_ns) + 1)))
+        self.total = 0
+        self.max_seen = 0
+
+    @staticmethod
+    def _index(value: int) -> int:
+        if value < SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - SUB_BUCKET_BITS - 1
+        return (shift + 1) * SUB_BUCKETS + (value >> shift) - SUB_BUCKETS
+
+    @staticmethod
+    def _value(index: int) -> int:
+        if index < SUB_BUCKETS:
+            return index
+        shift = index // SUB_BUCKETS - 1
+        low = (index % SUB_BUCKETS + SUB_BUCKETS) << shift
+        return low + ((1 << shift) >> 1)  # bucket midpoint
+
+    def record(self, value_ns: int):
+        if value_ns < 0:
+            value_ns = 0
+        elif value_ns > self.max_ns:
+            value_ns = self.max_ns
+        self.counts[self._index(value_ns)] += 1
+        self.total += 1
+        if value_ns > self.max_seen:
+            self.max_seen = value_ns
+
+    def percentile(self, q: float) -> int:
+        if self.total == 0:
+            return 0
+        target = max(1, int(q / 100.0 * self.total + 0.5))
+        running = 0
+        for index, count in enumerate(self.counts):
+            running += count
+            if running >= target:
+                return min(self._value(index), self.max_seen)
+        return self.max_seen
+
+    def summary(self) -> str:
+        if self.total == 0:
+            return "no samples"
+        return "  ".join(f"p{q:g} {self.percentile(q) / 1e3:8.1f}" for q in (50, 90, 99, 99.9)) + \
+            f"  max {self.max_seen / 1e3:8.1f} us"
+
+
+class ProbeStats:
+    """Loss, duplicate and reordering counters plus latency histograms for one probe run."""
+
+    def __init__(self):
+        self.sent = 0
+        self.received = 0
+        self.duplicates = 0
+        self.reordered = 0
+        self.highest = -1
+        self.seen = bytearray(REORDER_WINDOW)
+        self.rtt = LatencyHistogram()
+        self.outbound = LatencyHistogram()
+        self.inbound = LatencyHistogram()
+
+    def on_echo(self, seq: int, send_ns: int, echo_ns, now_ns: int):
+        slot = seq % REORDER_WINDOW
+        if seq <= self.highest:
+            if self.seen[slot]:
+                self.duplicates += 1
+                return
+            self.reordered += 1
+        else:
+            # clear the flags of sequence numbers skipped over (lost so far)
+            for skipped in range(max(self.highest + 1, seq - REORDER_WINDOW + 1), seq):
+                self.seen[skipped % REORDER_WINDOW] = 0
+            self.highest = seq
+        self.seen[slot] = 1
+        self.received += 1
+        self.rtt.record(now_ns - send_ns)
+        if echo_ns is not None:
+            self.outbound.record(echo_ns - send_ns)
+            self.inbound.record(now_ns - echo_ns)
+
+    def loss(self) -> float:
+        return 100.0 * (self.sent - self.received) / self.sent if self.sent else 0.0
+
+    def report(self, label: str = '') -> str:
+        return (f"{label}sent {self.sent}  recv {self.received}  loss {self.loss():.2f}%  "
+                f"reordered {self.reordered}  dup {self.duplicates}\n"
+                f"{label}  rtt      {self.rtt.summary()}\n"
+                f"{label}  outbound {self.outbound.summary()}\n"
+                f"{label}  inbound  {self.inbound.summary()}")
+
+
+class EchoResponder(asyncio.DatagramProtocol):
+    """Echoes tagged probes back to their sender with a receive timestamp."""
+
+    def __init__(self):
+        self.transport = None
+        self.echoed = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr):
+        now = time.monotonic_ns()
+        if read_probe(data) is None:
+            return
+        self.transport.sendto(data + ECHO_TRAILER.pack(ECHO_TAG, now), addr)
+        self.echoed += 1
+
+
+class ProbeClient(asyncio.DatagramProtocol):
+    """Receives echoes for a probe run."""
+
+    def __init__(self, stats: ProbeStats):
+        self.stats = stats
+
+    def datagram_received(self, data: bytes, addr):
+        now = time.monotonic_ns()
+        probe = read_probe(data)
+        if probe is not None:
+            self.stats.on_echo(*probe, now)
+
+
+def _multicast_socket(group: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(('', port))
+    mreq = struct.pack('4s4s', socket.inet_aton(group), socket.inet_aton('0.0.0.0'))
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+    return sock
+
+
+async def respond(args):
+    loop = asyncio.get_running_loop()
+    responder = EchoResponder()
+    await loop.create_datagram_endpoint(lambda: responder, local_addr=(args.host, args.port))
+    where = [f"{args.host}:{args.port}"]
+    if args.multicast:
+        await loop.create_datagram_endpoint(lambda: responder, sock=_multicast_socket(MULTICAST_GROUP, args.multicast_port))
+        where.append(f"{MULTICAST_GROUP}:{args.multicast_port}")
+    print(f"Echoing probes on {', '.join(where)}")
+    while True:
+        await asyncio.sleep(1.0)
+        print(f"echoed {responder.echoed}")
+
+
+async def probe_run(dest, rate: float, duration: float, robot_id: int, live: bool, label: str = '',
+                    stats: ProbeStats = None) -> ProbeStats:
+    """Probe `dest` for `duration` s; pass `stats` to keep what was counted if the run is cancelled."""
+    loop = asyncio.get_running_loop()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, struct.pack('b', 1))
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+    sock.bind(('', 0))
+    if stats is None:
+        stats = ProbeStats()
+    transport, _ = await loop.create_datagram_endpoint(lambda: ProbeClient(stats), sock=sock)
+
+    encoder = TritonBotEncoder(robot_id)
+    datagram = bytes(encoder.encode(0.0, 0.0, 0.0))
+    period = 1.0 / rate
+    start = loop.time()
+    last_report = start
+    seq = 0
+    try:
+        while loop.time() - start < duration:
+            transport.sendto(tag_probe(datagram, seq), dest)
+            seq += 1
+            stats.sent = seq
+            now = loop.time()
+            if live and now - last_report >= 1.0:
+                print(stats.report(label))
+                last_report = now
+            await asyncio.sleep(max(0.0, start + seq * period - loop.time()))
+        await asyncio.sleep(0.5)  # collect late echoes before counting loss
+    finally:
+        transport.close()
+    return stats
+
+
+async def probe(args, results: list):
+    """Run the requested probes, appending (name, ProbeStats) to `results` as each one starts."""
+    if args.compare:
+        runs = (('multicast', (MULTICAST_GROUP, args.multicast_port)), ('unicast', (args.unicast, args.port)))
+    elif args.unicast_only:
+        runs = (('unicast', (args.unicast, args.port)),)
+    else:
+        runs = (('multicast', (MULTICAST_GROUP, args.multicast_port)),)
+
+    for name, dest in runs:
+        print(f"Probing {name} {dest[0]}:{dest[1]} at {args.rate:g} Hz for {args.duration:g} s")
+        stats = ProbeStats()
+        results.append((name, stats))
+        await probe_run(dest, args.rate, args.duration, args.robot, not args.quiet, f"[{name}] ", stats)
+    print_reports(results)
+
+
+def print_reports(results: list):
+    print()
+    for name, stats in results:
+        print(stats.report(f"[{name}] "))
+
+
+def main():
+    p = argparse.ArgumentParser(description="Round-trip latency probe for the TestServer command path")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    r = sub.add_parser("respond", help="Echo probes back to their sender")
+    r.add_argument("--host", default="0.0.0.0", help="Unicast bind address")
+    r.add_argument("--port", type=int, default=UDP_PORT, help="Unicast port")
+    r.add_argument("--multicast", action="store_true", help=f"Also echo probes sent to {MULTICAST_GROUP}")
+    r.add_argument("--multicast-port", type=int, default=PORT, help="Multicast port")
+    s = sub.add_parser("probe", help="Send probes and report latency")
+    s.add_argument("--unicast", default="127.0.0.1", help="Responder address for unicast probes")
+    s.add_argument("--unicast-only", action="store_true", help="Probe unicast only (default is multicast)")
+    s.add_argument("--compare", action="store_true", help="Probe multicast, then unicast, and compare")
+    s.add_argument("--port", type=int, default=UDP_PORT, help="Unicast port")
+    s.add_argument("--multicast-port", type=int, default=PORT, help="Multicast port")
+    s.add_argument("--robot", type=int, default=2, help="Robot id in the probe messages")
+    s.add_argument("--rate", type=float, default=100.0, help="Probes per second")
+    s.add_argument("--duration", type=float, default=10.0, help="Seconds per run")
+    s.add_argument("--quiet", action="store_true", help="Only report at exit")
+    args = p.parse_args()
+
+    results = []
+    try:
+        asyncio.run(respond(args) if args.cmd == "respond" else probe(args, results))
+    except KeyboardInterrupt:
+        print('\nStopping.')
+        if results:  # loss includes probes still in flight when interrupted
+            print_reports(results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+Command-rate ramp to find where the robot link stops keeping up.
+
+Sends randomized but valid commands for many robot ids, either as
+TritonBotMessage protobuf (triton_codec) or as the wasd_teleop.py text
+protocol, at geometrically increasing rates (10 Hz to tens of kHz by
+default). Every datagram carries a probe trailer:
+
+    protobuf  latency_probe.tag_probe's unknown fields 14/15, skipped by nanopb
+    text      a second line "#<seq hex> <send monotonic_ns hex>\\n" after the command
+
+The `respond` subcommand (or --loopback, which spawns it) echoes both
+kinds back with a receive stamp, so each step measures loss, reordering,
+duplicates and round-trip latency. A real ESP32 doesn't echo, but it
+prints "Packet length: N" for every datagram it gets out of
+udp.parsePacket(); --serial-log counts those on its USB serial port to
+measure loss against the actual firmware.
+
+The knee is the highest clean rate before the first --patience degraded
+steps in a row (the same rule that stops the ramp): loss above --max-loss,
+reordering above --max-reorder, or p99 RTT above --latency-factor x the
+low-rate p99 (and at least --latency-floor over it; only judged on steps
+with --min-echoes RTT samples). Steps where the generator itself couldn't
+reach the target rate are marked sender-limited, and a sender-limited knee
+is reported at its achieved rate. --csv appends every step with a --label, so runs
+against different firmware builds can be tracked in one file.
+
+Usage:
+    python load_generator.py ramp --loopback                           # spawn a local responder
+    python load_generator.py ramp --loopback --protocol text --stop 20000
+    python load_generator.py respond --multicast                       # echo on :3333 and both groups
+    python load_generator.py ramp --ip 192.168.8.80 --serial-log /dev/ttyUSB0 --label fw-1.4 --csv rates.csv
+"""
+import argparse
+import csv
+import errno
+import os
+import selectors
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+
+from latency_probe import ECHO_TAG, ECHO_TRAILER, EchoResponder, ProbeStats, read_probe, tag_probe
+from messages import MULTICAST_GROUP, PORT, UDP_PORT, parse_robot_ids
+from teleop_async import TEXT_GROUP, TEXT_PORT, TEXT_STEPS
+from triton_codec import TritonBotEncoder
+
+PAYLOAD_VARIANTS = 64   # pre-encoded random commands per robot
+MAX_BURST = 256         # datagrams sent per pacing pass before servicing echoes
+ESP32_PACKET_LINE = b'Packet length'
+CSV_FIELDS = ('label', 'protocol', 'robots', 'rate', 'achieved', 'sent', 'received', 'loss_pct',
+              'reordered', 'duplicates', 'p50_us', 'p99_us', 'max_us', 'send_errors', 'remote_received')
+
+
+def tag_text(line: bytes, seq: int, stamp_ns: int = None) -> bytes:
+    """Append the text probe line to a text command."""
+    if stamp_ns is None:
+        stamp_ns = time.monotonic_ns()
+    return b'%s#%x %x\n' % (line, seq, stamp_ns)
+
+
+def read_text_probe(datagram: bytes):
+    """Return (seq, send_ns, echo_ns or None) from a tagged text command, or None if untagged."""
+    mark = datagram.rfind(b'#')
+    if mark < 0 or not datagram.endswith(b'\n'):
+        return None
+    echo_ns = None
+    at = datagram.rfind(b'@', mark)
+    try:
+        if at > 0:
+            echo_ns = int(datagram[at + 1:-1], 16)
+            body = datagram[mark + 1:at]
+        else:
+            body = datagram[mark + 1:]
+        seq, send_ns = body.split()
+        return int(seq, 16), int(send_ns, 16), echo_ns
+    except ValueError:
+        return None
+
+
+class LoadResponder(EchoResponder):
+    """EchoResponder that also echoes tagged text commands, appending "@<receive ns hex>\\n"."""
+
+    def datagram_received(self, data: bytes, addr):
+        now = time.monotonic_ns()
+        if read_probe(data) is not None:
+            self.transport.sendto(data + ECHO_TRAILER.pack(ECHO_TAG, now), addr)
+        elif read_text_probe(data) is not None:
+            self.transport.sendto(b'%s@%x\n' % (data, now), addr)
+        else:
+            return
+        self.echoed += 1
+
+
+def protobuf_payloads(robot_ids, variants: int = PAYLOAD_VARIANTS, seed: int = 0) -> list:
+    """Encoded TritonBotMessages with random in-range commands, interleaved across robots."""
+    rng = np.random.default_rng(seed)
+    encoders = [TritonBotEncoder(rid) for rid in robot_ids]
+    payloads = []
+    for _ in range(variants):
+        for encoder in encoders:
+            kick = rng.random() < 0.02
+            payloads.append(bytes(encoder.encode(
+                float(rng.uniform(-3.0, 3.0)), float(rng.uniform(-3.0, 3.0)), float(rng.uniform(-25.0, 25.0)),
+                kick_speed=4.0 if kick else 0.0, dribbler_speed=float(rng.choice((0.0, 1500.0))))))
+    return payloads
+
+
+def text_payloads(robot_ids, variants: int = PAYLOAD_VARIANTS, seed: int = 0) -> list:
+    """wasd_teleop.py "<id> dash <power> <rot>" / "<id> kick" lines, interleaved across robots."""
+    rng = np.random.default_rng(seed)
+    payloads = []
+    for _ in range(variants):
+        for rid in robot_ids:
+            if rng.random() < 0.02:
+                payloads.append(b'%d kick\n' % rid)
+            else:
+                power, rot = rng.integers(-TEXT_STEPS, TEXT_STEPS + 1, 2).tolist()
+                payloads.append(b'%d dash %d %d\n' % (rid, power, rot))
+    return payloads
+
+
+class SerialPacketCounter:
+    """Counts the ESP32's per-datagram "Packet length" log lines on its USB serial port."""
+
+    def __init__(self, path: str, baud: int = 115200):
+        import termios
+        import tty
+
+        self.fd = os.open(path, os.O_RDONLY | os.O_NOCTTY)
+        tty.setraw(self.fd)
+        attrs = termios.tcgetattr(self.fd)
+        attrs[4] = attrs[5] = getattr(termios, f'B{baud}')
+        termios.tcsetattr(self.fd, termios.TCSANOW, attrs)
+        self.count = 0
+        self._thread = threading.Thread(target=self._read, name='serial-log', daemon=True)
+        self._thread.start()
+
+    def _read(self):
+        tail = b''
+        keep = len(ESP32_PACKET_LINE) - 1
+        while True:
+            try:
+                chunk = os.read(self.fd, 65536)
+            except OSError:
+                return
+            if not chunk:
+                return
+            data = tail + chunk
+            self.count += data.count(ESP32_PACKET_LINE)
+            # one byte shorter than the line: a line split across reads is found in tail + chunk,
+            # a line already counted never is
+            tail = data[-keep:]
+
+    def close(self):
+        os.close(self.fd)
+
+
+class StepResult:
+    """One ramp step: the probe stats plus what the sender and the serial log saw."""
+
+    def __init__(self, rate: float, stats: ProbeStats, elapsed: float, send_errors: int, remote_received):
+        self.rate = rate
+        self.stats = stats
+        self.achieved = stats.sent / elapsed if elapsed > 0 else 0.0
+        self.send_errors = send_errors
+        self.remote_received = remote_received
+        self.note = ''
+
+    @property
+    def sender_limited(self) -> bool:
+        return self.achieved < 0.9 * self.rate
+
+    def loss(self, echo: bool) -> float:
+        sent = self.stats.sent
+        if echo:
+            return self.stats.loss()
+        if self.remote_received is not None and sent:
+            return 100.0 * max(0, sent - self.remote_received) / sent
+        return float('nan')
+
+    def row(self, label: str, protocol: str, robots: int, echo: bool) -> dict:
+        s = self.stats
+        latency = s.rtt.total > 0
+        return {
+            'label': label, 'protocol': protocol, 'robots': robots, 'rate': f"{self.rate:g}",
+            'achieved': f"{self.achieved:.0f}", 'sent': s.sent, 'received': s.received if echo else '',
+            'loss_pct': f"{self.loss(echo):.3f}", 'reordered': s.reordered if echo else '',
+            'duplicates': s.duplicates if echo else '',
+            'p50_us': f"{s.rtt.percentile(50) / 1e3:.1f}" if latency else '',
+            'p99_us': f"{s.rtt.percentile(99) / 1e3:.1f}" if latency else '',
+            'max_us': f"{s.rtt.max_seen / 1e3:.1f}" if latency else '',
+            'send_errors': self.send_errors,
+            'remote_received': '' if self.remote_received is None else self.remote_received,
+        }
+
+
+class LoadGenerator:
+    """Paces tagged payloads at a target rate on one socket and collects echoes on the same socket."""
+
+    def __init__(self, payloads: list, dest, protocol: str, serial: SerialPacketCounter = None):
+        self.payloads = payloads
+        self.dest = dest
+        self.tag = tag_probe if protocol == 'protobuf' else tag_text
+        self.read = read_probe if protocol == 'protobuf' else read_text_probe
+        self.serial = serial
+        self.seq = 0
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, struct.pack('b', 1))
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 << 20)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 << 20)
+        self.sock.bind(('', 0))
+        self.sock.setblocking(False)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.sock, selectors.EVENT_READ)
+        self._stats = None
+        self._base = 0
+
+    def _drain(self, timeout: float = 0.0):
+        if timeout > 0:
+            self.selector.select(timeout)
+        sock, read, stats, base = self.sock, self.read, self._stats, self._base
+        while True:
+            try:
+                data = sock.recv(2048)
+            except (BlockingIOError, InterruptedError):
+                return
+            except ConnectionRefusedError:
+                continue  # ICMP port unreachable from a previous send
+            now = time.monotonic_ns()
+            probe = read(data)
+            if probe is None or probe[0] < base:
+                continue  # late echo from an earlier step
+            seq, send_ns, echo_ns = probe
+            stats.on_echo(seq - base, send_ns, echo_ns, now)
+
+    def run_step(self, rate: float, duration: float, drain: float) -> StepResult:
+        stats = self._stats = ProbeStats()
+        self._base = self.seq
+        remote_before = self.serial.count if self.serial else None
+        payloads, count = self.payloads, len(self.payloads)
+        sock, dest, tag = self.sock, self.dest, self.tag
+        send_errors = 0
+
+        start = time.perf_counter()
+        end = start + duration
+        sent = 0
+        while True:
+            now = time.perf_counter()
+            if now >= end:
+                break
+            due = min(int((now - start) * rate) + 1 - sent, MAX_BURST)
+            seq = self.seq
+            for _ in range(due):
+                try:
+                    sock.sendto(tag(payloads[seq % count], seq), dest)
+                except (BlockingIOError, InterruptedError):
+                    send_errors += 1
+                    break
+                except OSError as e:
+                    if e.errno not in (errno.ENOBUFS, errno.ECONNREFUSED):
+                        raise
+                    send_errors += 1
+                    break
+                seq += 1
+            sent += seq - self.seq
+            self.seq = seq
+            stats.sent = sent
+            self._drain(max(0.0, min(start + sent / rate - time.perf_counter(), 0.002)))
+        elapsed = time.perf_counter() - start
+
+        drain_end = time.perf_counter() + drain
+        while time.perf_counter() < drain_end:
+            self._drain(drain_end - time.perf_counter())
+        remote = self.serial.count - remote_before if self.serial else None
+        return StepResult(rate, stats, elapsed, send_errors, remote)
+
+    def close(self):
+        self.selector.close()
+        self.sock.close()
+
+
+def ramp_rates(start: float, stop: float, per_decade: int) -> list:
+    count = int(round(np.log10(stop / start) * per_decade)) + 1
+    return [float(f"{r:.3g}") for r in np.geomspace(start, stop, count)]
+
+
+def low_rate_p99(results: list):
+    """Best p99 RTT among the first three steps, the reference for the latency criterion."""
+    p99s = [r.stats.rtt.percentile(99) for r in results[:3] if r.stats.rtt.total]
+    return min(p99s) if p99s else None
+
+
+def degradation(result: StepResult, baseline, echo: bool, args) -> list:
+    """Names of the criteria this step fails."""
+    reasons = []
+    loss = result.loss(echo)
+    if loss == loss and loss > args.max_loss:
+        reasons.append('loss')
+    stats = result.stats
+    if echo and stats.received and 100.0 * stats.reordered / stats.received > args.max_reorder:
+        reasons.append('reorder')
+    if baseline is not None and stats.rtt.total >= args.min_echoes:
+        p99 = stats.rtt.percentile(99)
+        if p99 > baseline * args.latency_factor and p99 > baseline + args.latency_floor * 1e6:
+            reasons.append('latency')
+    return reasons
+
+
+def find_knee(results: list, echo: bool, args) -> tuple:
+    """Note each step's problems; return (knee rate or None, index of the first degraded step or None).
+
+    The first degraded step is the start of the first run of --patience degraded steps (or of a
+    shorter run that ends the ramp); the knee is the last clean step before it, at its achieved
+    rate if it was sender-limited.
+    """
+    baseline = low_rate_p99(results)
+    degraded = []
+    for r in results:
+        reasons = degradation(r, baseline, echo, args)
+        degraded.append(bool(reasons))
+        if r.sender_limited:
+            reasons.append('sender-limited')
+        r.note = '+'.join(reasons)
+    knee, first_bad = None, None
+    run = 0
+    for i, r in enumerate(results):
+        if degraded[i]:
+            run += 1
+            if run >= args.patience or i == len(results) - 1:
+                first_bad = i - run + 1
+                break
+        else:
+            run = 0
+            knee = r.achieved if r.sender_limited else r.rate
+    return knee, first_bad
+
+
+def print_table(results: list, echo: bool):
+    print(f"{'rate':>8} {'achieved':>9} {'sent':>8} {'recv':>8} {'loss%':>7} {'reord':>6} {'dup':>5} "
+          f"{'p50 us':>8} {'p99 us':>8} {'max us':>9} {'errs':>5}  note")
+    for r in results:
+        s = r.stats
+        recv = s.received if echo else (r.remote_received if r.remote_received is not None else '-')
+        lat = s.rtt.total > 0
+        print(f"{r.rate:8g} {r.achieved:9.0f} {s.sent:8d} {recv!s:>8} {r.loss(echo):7.2f} "
+              f"{s.reordered if echo else '-':>6} {s.duplicates if echo else '-':>5} "
+              f"{s.rtt.percentile(50) / 1e3 if lat else float('nan'):8.1f} "
+              f"{s.rtt.percentile(99) / 1e3 if lat else float('nan'):8.1f} "
+              f"{s.rtt.max_seen / 1e3 if lat else float('nan'):9.1f} {r.send_errors:5d}  {r.note}")
+
+
+def spawn_responder(port: int) -> subprocess.Popen:
+    proc = subprocess.Popen([sys.executable, os.path.abspath(__file__), 'respond', '--host', '127.0.0.1',
+                             '--port', str(port), '--quiet'], stdout=subprocess.PIPE)
+    proc.stdout.readline()  # "Echoing ..." once it is bound
+    return proc
+
+
+def ramp(args):
+    robot_ids = parse_robot_ids(args.robots)
+    text = args.protocol == 'text'
+    payloads = (text_payloads if text else protobuf_payloads)(robot_ids, seed=args.seed)
+
+    responder = None
+    if args.loopback:
+        probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+        probe.close()
+        responder = spawn_responder(port)
+        dest = ('127.0.0.1', port)
+    elif args.ip:
+        dest = (args.ip, args.port)
+    else:
+        dest = (TEXT_GROUP, TEXT_PORT) if text else (MULTICAST_GROUP, PORT)
+
+    serial = SerialPacketCounter(args.serial_log, args.baud) if args.serial_log else None
+    generator = LoadGenerator(payloads, dest, args.protocol, serial)
+    print(f"Ramping {args.protocol} to {dest[0]}:{dest[1]} for {len(robot_ids)} robots, "
+          f"{args.start:g} -> {args.stop:g} Hz, {args.step_duration:g} s per step")
+
+    results = []
+    echo = None
+    degraded = 0
+    try:
+        for rate in ramp_rates(args.start, args.stop, args.per_decade):
+            result = generator.run_step(rate, args.step_duration, args.drain)
+            results.append(result)
+            if echo is None:
+                echo = result.stats.received > 0
+                if not echo:
+                    print("no echoes; " + ("loss from the serial log" if serial else "loss and latency unknown"))
+            s = result.stats
+            print(f"  {rate:8g} Hz: sent {s.sent}, achieved {result.achieved:.0f}/s, loss {result.loss(echo):.2f}%"
+                  + (f", p99 {s.rtt.percentile(99) / 1e3:.1f} us" if s.rtt.total else ''))
+            bad = degradation(result, low_rate_p99(results), echo, args)
+            degraded = degraded + 1 if bad else 0
+            if degraded >= args.patience:
+                break
+    except KeyboardInterrupt:
+        print("interrupted")
+    finally:
+        generator.close()
+        if serial:
+            serial.close()
+        if responder:
+            responder.terminate()
+            responder.wait()
+
+    if not results:
+        return
+    knee, bad = find_knee(results, echo, args)
+    print()
+    print_table(results, echo)
+    if knee is None:
+        print("knee: degraded from the first step")
+    elif bad is None:
+        print(f"knee: not reached; clean up to {knee:g} Hz")
+    else:
+        print(f"knee: {knee:g} Hz (next step {results[bad].rate:g} Hz: {results[bad].note})")
+
+    if args.csv:
+        new = not os.path.exists(args.csv)
+        with open(args.csv, 'a', newline='') as f:
+            writer = csv.DictWriter(f, CSV_FIELDS)
+            if new:
+                writer.writeheader()
+            for r in results:
+                writer.writerow(r.row(args.label, args.protocol, len(robot_ids), echo))
+        print(f"appended {len(results)} rows to {args.csv}")
+
+
+def respond(args):
+    import asyncio
+
+    async def serve():
+        loop = asyncio.get_running_loop()
+        responder = LoadResponder()
+        await loop.create_datagram_endpoint(lambda: responder, local_addr=(args.host, args.port))
+        where = [f"{args.host}:{args.port}"]
+        if args.multicast:
+            from latency_probe import _multicast_socket
+            for group, port in ((MULTICAST_GROUP, PORT), (TEXT_GROUP, TEXT_PORT)):
+                await loop.create_datagram_endpoint(lambda: responder, sock=_multicast_socket(group, port))
+                where.append(f"{group}:{port}")
+        print(f"Echoing protobuf and text probes on {', '.join(where)}", flush=True)
+        while True:
+            await asyncio.sleep(1.0)
+            if not args.quiet:
+                print(f"echoed {responder.echoed}", flush=True)
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    p = argparse.ArgumentParser(description="Ramp the command rate to find the robot link's knee")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    r = sub.add_parser("respond", help="Echo tagged protobuf and text commands back to their sender")
+    r.add_argument("--host", default="0.0.0.0", help="Unicast bind address")
+    r.add_argument("--port", type=int, default=UDP_PORT, help="Unicast port")
+    r.add_argument("--multicast", action="store_true", help=f"Also echo on {MULTICAST_GROUP}:{PORT} and {TEXT_GROUP}:{TEXT_PORT}")
+    r.add_argument("--quiet", action="store_true", help="Don't print the echo count every second")
+
+    s = sub.add_parser("ramp", help="Ramp the send rate and report loss/latency per step")
+    s.add_argument("--protocol", choices=("protobuf", "text"), default="protobuf", help="Payload kind (default: protobuf)")
+    s.add_argument("--robots", default="0-15", help="Robot ids to spread commands over (default: 0-15)")
+    s.add_argument("--loopback", action="store_true", help="Spawn a local responder and ramp against it")
+    s.add_argument("--ip", default=None, help="Unicast target (default: the protocol's multicast group)")
+    s.add_argument("--port", type=int, default=UDP_PORT, help=f"Unicast port (default: {UDP_PORT})")
+    s.add_argument("--serial-log", default=None, metavar="TTY", help="Count the ESP32's per-packet log lines on this port")
+    s.add_argument("--baud", type=int, default=115200, help="Serial log baud rate (default: 115200)")
+    s.add_argument("--start", type=float, default=10.0, help="First rate in Hz (default: 10)")
+    s.add_argument("--stop", type=float, default=50000.0, help="Last rate in Hz (default: 50000)")
+    s.add_argument("--per-decade", type=int, default=4, help="Rate steps per decade (default: 4)")
+    s.add_argument("--step-duration", type=float, default=2.0, help="Seconds per step (default: 2)")
+    s.add_argument("--drain", type=float, default=0.3, help="Seconds to collect late echoes after each step (default: 0.3)")
+    s.add_argument("--max-loss", type=float, default=1.0, help="Loss %% that marks a step degraded (default: 1)")
+    s.add_argument("--max-reorder", type=float, default=0.1, help="Reordered %% that marks a step degraded (default: 0.1)")
+    s.add_argument("--latency-factor", type=float, default=4.0, help="p99 multiple of the low-rate p99 (default: 4)")
+    s.add_argument("--latency-floor", type=float, default=1.0, help="Minimum p99 increase in ms (default: 1)")
+    s.add_argument("--min-echoes", type=int, default=100,
+                   help="RTT samples a step needs before its p99 is judged (default: 100)")
+    s.add_argument("--patience", type=int, default=2, help="Stop after this many degraded steps in a row (default: 2)")
+    s.add_argument("--seed", type=int, default=0, help="Random command seed")
+    s.add_argument("--label", default="", help="Build label written to the CSV")
+    s.add_argument("--csv", default=None, help="Append per-step results to this CSV file")
+    args = p.parse_args()
+
+    if args.cmd == "respond":
+        respond(args)
+    else:
+        ramp(args)
+
+
+if __name__ == '__main__':
+    main()
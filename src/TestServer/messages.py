@@ -0,0 +1,64 @@
+"""
+Shared TritonBotMessage builders for the TestServer scripts.
+
+Every sender fills the same placeholder vision block and zeroed command, so
+the defaults live here instead of being copied into each script.
+"""
+import math
+
+from triton_bot_communication_pb2 import TritonBotMessage
+
+UDP_IP = '192.168.8.80'  # Replace with the ESP32's IP address
+UDP_PORT = 3333
+
+MULTICAST_GROUP = '224.1.1.1'
+PORT = 10500
+
+
+def new_bot_message(robot_id: int) -> TritonBotMessage:
+    """Return a TritonBotMessage for robot_id populated like UserControl.py does."""
+    message = TritonBotMessage()
+    message.id = robot_id
+
+    message.vision.confidence = 0.8
+    message.vision.robot_id = robot_id
+    message.vision.x = 1.0
+    message.vision.y = 1.0
+    message.vision.orientation = math.pi
+    message.vision.pixel_x = 1.0
+    message.vision.pixel_y = 1.0
+    message.vision.height = 1.0
+
+    message.command.id = robot_id
+    message.command.move_command.local_velocity.forward = 0
+    message.command.move_command.local_velocity.left = 0
+    message.command.move_command.local_velocity.angular = 0
+    message.command.kick_speed = 0
+    message.command.kick_angle = 0
+    message.command.dribbler_speed = 0
+    return message
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as a protobuf base-128 varint."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def parse_robot_ids(spec: str) -> list:
+    """Parse a robot id list such as "0-5" or "1,2,7" (ranges inclusive)."""
+    ids = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            lo, hi = part.split('-', 1)
+            ids.extend(range(int(lo), int(hi) + 1))
+        else:
+            ids.append(int(part))
+    return ids
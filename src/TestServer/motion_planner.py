@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Saturation-aware motion planner for (forward, left, angular) setpoints.
+
+getVelocityArray (src/esp32/velocityConversions.cpp) clamps each wheel to
++-MAX_VELOCITY on its own, so a command that saturates one wheel comes out
+in a different direction than was asked for: full forward plus full spin
+turns into a curve. The proportional rescale that would keep the direction
+is commented out in the firmware. The teleop scripts also step straight
+from 0 to 3 m/s or 25 rad/s.
+
+The planner runs on the host before a setpoint is sent:
+
+  - the target is scaled down as a whole until no wheel exceeds
+    MAX_VELOCITY, which keeps its direction in (forward, left, angular);
+  - the commanded velocity moves towards it under acceleration and jerk
+    limits (translation as one vector so it does not bend either, angular
+    on its own), easing into the target instead of overshooting it;
+  - the output is scaled again, so every command it emits is one the
+    firmware passes through unclamped.
+
+Wheel speeds are linear in the command, so the largest feasible multiple
+of a command depends only on its direction. FeasibilityTable stores that
+limit over a grid of directions (azimuth of the translation, elevation of
+the angular part scaled by the wheel radius from the centre) and
+interpolates it bilinearly, so a lookup is the same O(1) work whatever
+kinematic model the table was built from. `margin` absorbs the interpolation
+error, measured on random directions when the table is built (about 1.5%
+at 256 x 128, mostly where two wheels saturate together). For the current
+4 x 3 WHEEL_MATRIX the exact solve is only twelve multiply-adds, cheaper and
+exact, so MotionPlanner uses ExactLimits unless given a table; --bench
+reports both, along with how far the firmware clamp, the exact scaling and
+the table bend the achieved direction.
+
+Usage:
+    planner = MotionPlanner(robots=11, dt=0.01)
+    commands = planner.update(targets)        # (11, 3) forward, left, angular per tick
+
+    python motion_planner.py --check
+    python motion_planner.py --bench
+    python motion_planner.py --profile 3 0 25  # one step response, printed per tick
+"""
+import argparse
+import math
+import time
+
+import numpy as np
+
+from kinematics import MAX_VELOCITY, RESCALE_FACTOR, WHEEL_MATRIX, WHEEL_RADIUS, wheel_speeds
+
+WHEEL_DISTANCE = 0.09  # m from the centre to each wheel (kinematics.py FR_X etc.)
+
+MAX_ACCEL = 3.0            # m/s^2
+MAX_JERK = 30.0            # m/s^3
+MAX_ANGULAR_ACCEL = 40.0   # rad/s^2
+MAX_ANGULAR_JERK = 400.0   # rad/s^3
+
+# wheel surface speed limit, m/s
+MAX_WHEEL_SPEED = MAX_VELOCITY * WHEEL_RADIUS
+
+# wheel speed per unit of (forward, left, angular), columns reordered from WHEEL_MATRIX's (rotV, vx, vy)
+COMMAND_MATRIX = WHEEL_MATRIX[:, [2, 1, 0]]
+_ROWS = tuple(tuple(row) for row in (COMMAND_MATRIX / MAX_WHEEL_SPEED).tolist())
+
+
+def exact_load(forward: float, left: float, angular: float) -> float:
+    """Largest |wheel speed| / limit for a command; above 1 the firmware would clamp."""
+    worst = 0.0
+    for f, l, a in _ROWS:
+        w = forward * f + left * l + angular * a
+        if w < 0:
+            w = -w
+        if w > worst:
+            worst = w
+    return worst
+
+
+def exact_load_array(commands) -> np.ndarray:
+    """exact_load over an (N, 3) array of commands."""
+    return np.abs(np.asarray(commands, dtype=np.float64) @ (COMMAND_MATRIX.T / MAX_WHEEL_SPEED)).max(axis=1)
+
+
+class FeasibilityTable:
+    """Wheel load per unit command magnitude over a grid of directions, bilinearly interpolated."""
+
+    def __init__(self, azimuth_steps: int = 256, elevation_steps: int = 128, matrix=COMMAND_MATRIX,
+                 wheel_limit: float = MAX_WHEEL_SPEED, lever: float = WHEEL_DISTANCE,
+                 samples: int = 200000, seed: int = 0):
+        self.azimuth_steps = azimuth_steps
+        self.elevation_steps = elevation_steps
+        self.lever = lever
+        self.inv_lever = 1.0 / lever
+        self.azimuth_scale = azimuth_steps / (2 * math.pi)
+        self.elevation_scale = elevation_steps / math.pi
+        self.matrix = np.asarray(matrix, dtype=np.float64) / wheel_limit
+
+        azimuth = np.linspace(-math.pi, math.pi, azimuth_steps + 1)
+        elevation = np.linspace(-math.pi / 2, math.pi / 2, elevation_steps + 1)
+        az, el = np.meshgrid(azimuth, elevation, indexing='ij')
+        self.table = self._load(np.cos(el) * np.cos(az), np.cos(el) * np.sin(az), np.sin(el))
+        self._flat = self.table.ravel().tolist()
+        self._stride = elevation_steps + 1
+
+        # interpolation error on random directions, used as the safety margin
+        rng = np.random.default_rng(seed)
+        unit = rng.normal(size=(samples, 3))
+        unit /= np.linalg.norm(unit, axis=1, keepdims=True)
+        exact = self._load(unit[:, 0], unit[:, 1], unit[:, 2])
+        approx = self.lookup_array(unit[:, 0], unit[:, 1], unit[:, 2] * self.inv_lever)
+        self.max_error = float(np.max(np.abs(approx - exact) / exact))
+        self.margin = 1.0 + 2.0 * self.max_error
+
+    def _load(self, forward, left, rim):
+        # rim = angular * lever, so all three axes are in m/s
+        m = self.matrix
+        return np.abs(np.multiply.outer(forward, m[:, 0]) + np.multiply.outer(left, m[:, 1])
+                      + np.multiply.outer(rim * self.inv_lever, m[:, 2])).max(axis=-1)
+
+    def lookup(self, forward: float, left: float, angular: float) -> float:
+        """Interpolated exact_load(forward, left, angular)."""
+        rim = angular * self.lever
+        planar = math.hypot(forward, left)
+        magnitude = math.hypot(planar, rim)
+        if magnitude == 0.0:
+            return 0.0
+        a = (math.atan2(left, forward) + math.pi) * self.azimuth_scale
+        e = (math.atan2(rim, planar) + math.pi / 2) * self.elevation_scale
+        i = int(a)
+        j = int(e)
+        if i >= self.azimuth_steps:
+            i = self.azimuth_steps - 1
+        if j >= self.elevation_steps:
+            j = self.elevation_steps - 1
+        ta = a - i
+        te = e - j
+        flat = self._flat
+        k = i * self._stride + j
+        low = flat[k] + (flat[k + self._stride] - flat[k]) * ta
+        high = flat[k + 1] + (flat[k + self._stride + 1] - flat[k + 1]) * ta
+        return magnitude * (low + (high - low) * te)
+
+    def lookup_array(self, forward, left, angular) -> np.ndarray:
+        forward = np.asarray(forward, dtype=np.float64)
+        left = np.asarray(left, dtype=np.float64)
+        rim = np.asarray(angular, dtype=np.float64) * self.lever
+        planar = np.hypot(forward, left)
+        magnitude = np.hypot(planar, rim)
+        a = (np.arctan2(left, forward) + math.pi) * self.azimuth_scale
+        e = (np.arctan2(rim, planar) + math.pi / 2) * self.elevation_scale
+        i = np.minimum(a.astype(np.intp), self.azimuth_steps - 1)
+        j = np.minimum(e.astype(np.intp), self.elevation_steps - 1)
+        ta = a - i
+        te = e - j
+        t = self.table
+        low = t[i, j] + (t[i + 1, j] - t[i, j]) * ta
+        high = t[i, j + 1] + (t[i + 1, j + 1] - t[i, j + 1]) * ta
+        return magnitude * (low + (high - low) * te)
+
+    def limit(self, forward: float, left: float, angular: float) -> tuple:
+        """Scale a command down along its direction until every wheel is within the limit."""
+        load = self.lookup(forward, left, angular) * self.margin
+        if load <= 1.0:
+            return forward, left, angular
+        s = 1.0 / load
+        return forward * s, left * s, angular * s
+
+    def limit_array(self, commands: np.ndarray) -> np.ndarray:
+        """limit() over an (N, 3) array, in place; returns it."""
+        load = self.lookup_array(commands[:, 0], commands[:, 1], commands[:, 2]) * self.margin
+        np.maximum(load, 1.0, out=load)
+        commands /= load[:, None]
+        return commands
+
+
+def limit_exact(forward: float, left: float, angular: float) -> tuple:
+    """Direction-preserving saturation from the exact wheel solve."""
+    load = exact_load(forward, left, angular)
+    if load <= 1.0:
+        return forward, left, angular
+    s = 1.0 / load
+    return forward * s, left * s, angular * s
+
+
+class ExactLimits:
+    """The exact wheel solve behind FeasibilityTable's interface."""
+
+    margin = 1.0
+    max_error = 0.0
+
+    lookup = staticmethod(exact_load)
+    limit = staticmethod(limit_exact)
+
+    @staticmethod
+    def lookup_array(forward, left, angular) -> np.ndarray:
+        return exact_load_array(np.column_stack([forward, left, angular]))
+
+    @staticmethod
+    def limit_array(commands: np.ndarray) -> np.ndarray:
+        load = exact_load_array(commands)
+        np.maximum(load, 1.0, out=load)
+        commands /= load[:, None]
+        return commands
+
+
+def _group_norm(v: np.ndarray) -> np.ndarray:
+    """Per-row |translation| in columns 0-1 and |angular| in column 2."""
+    norm = np.abs(v)
+    norm[:, 0] = norm[:, 1] = np.hypot(v[:, 0], v[:, 1])
+    return norm
+
+
+class MotionPlanner:
+    """Acceleration/jerk-limited, saturation-scaled commands for a batch of robots.
+
+    `limits` is ExactLimits() by default: for this robot the exact solve is a
+    4 x 3 product and beats the table on both cost and accuracy (see --bench).
+    Pass a FeasibilityTable for a kinematic model that is costly to solve.
+    """
+
+    def __init__(self, robots: int = 1, dt: float = 0.01, max_accel: float = MAX_ACCEL,
+                 max_jerk: float = MAX_JERK, max_angular_accel: float = MAX_ANGULAR_ACCEL,
+                 max_angular_jerk: float = MAX_ANGULAR_JERK, limits=None):
+        self.dt = dt
+        self.limits = limits if limits is not None else ExactLimits()
+        self.max_accel = np.array([max_accel, max_accel, max_angular_accel])
+        self.max_jerk = np.array([max_jerk, max_jerk, max_angular_jerk])
+        self.velocity = np.zeros((robots, 3))
+        self.accel = np.zeros((robots, 3))
+
+    def reset(self, idx=None):
+        if idx is None:
+            idx = slice(None)
+        self.velocity[idx] = 0.0
+        self.accel[idx] = 0.0
+
+    def update(self, targets, dt: float = None) -> np.ndarray:
+        """Advance every robot one tick towards its (forward, left, angular) target; return the commands.
+
+        Translation and rotation each aim for the acceleration that still lets
+        the jerk limit bring it back to zero on arrival, sqrt(2 * jerk * |error|),
+        capped by the acceleration limit and by reaching the target this tick,
+        and the acceleration moves towards that by at most jerk * dt.
+        """
+        dt = self.dt if dt is None else dt
+        targets = self.limits.limit_array(np.array(targets, dtype=np.float64).reshape(-1, 3))
+        error = targets - self.velocity
+        distance = _group_norm(error)
+        wanted = np.minimum(np.minimum(self.max_accel, np.sqrt(2.0 * self.max_jerk * distance)), distance / dt)
+        desired = np.divide(error * wanted, distance, out=np.zeros_like(error), where=distance > 0)
+        change = desired - self.accel
+        step = _group_norm(change)
+        jerk_step = self.max_jerk * dt
+        np.divide(change * jerk_step, step, out=change, where=step > jerk_step)
+        accel = self.accel
+        accel += change
+        velocity = self.velocity
+        velocity += accel * dt
+        self.limits.limit_array(velocity)
+        # snap onto the target once within one jerk step so the last tick doesn't dither
+        close = np.all(np.abs(targets - velocity) <= jerk_step * dt, axis=1)
+        velocity[close] = targets[close]
+        accel[close] = 0.0
+        return velocity.copy()
+
+
+def achieved(commands: np.ndarray) -> np.ndarray:
+    """(forward, left, angular) the robot actually drives after the firmware's per-wheel clamp."""
+    speeds = wheel_speeds(commands[:, 0], commands[:, 1], commands[:, 2])
+    wheels = speeds / RESCALE_FACTOR * WHEEL_RADIUS
+    body = wheels @ np.linalg.pinv(WHEEL_MATRIX).T  # (rotV, left, forward)
+    return body[:, [2, 1, 0]]
+
+
+def direction_error(requested: np.ndarray, driven: np.ndarray) -> np.ndarray:
+    """Angle in degrees between requested and driven commands, angular scaled by WHEEL_DISTANCE."""
+    scale = np.array([1.0, 1.0, WHEEL_DISTANCE])
+    a = requested * scale
+    b = driven * scale
+    cos = np.sum(a * b, axis=1) / (np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1))
+    return np.degrees(np.arccos(np.clip(cos, -1.0, 1.0)))
+
+
+def random_commands(n: int, seed: int = 0) -> np.ndarray:
+    """Commands spread over the teleop range, most of them saturating a wheel."""
+    rng = np.random.default_rng(seed)
+    return rng.uniform([-4.0, -4.0, -30.0], [4.0, 4.0, 30.0], (n, 3))
+
+
+def check(table: FeasibilityTable) -> int:
+    failures = 0
+    commands = random_commands(50000, seed=1)
+
+    # nothing the table lets through gets clamped by the firmware
+    limited = table.limit_array(commands.copy())
+    over = exact_load_array(limited).max()
+    if over > 1.0 + 1e-9:
+        print(f"MISMATCH: table-limited command still loads a wheel to {over:.6f}")
+        failures += 1
+    # ...and it keeps the direction
+    bend = direction_error(commands, limited).max()
+    if bend > 1e-4:  # arccos resolution near 0
+        print(f"MISMATCH: table limiting bent the direction by {bend:.2g} deg")
+        failures += 1
+    # scalar and array paths agree
+    for row in commands[:200]:
+        if abs(table.lookup(*row) - table.lookup_array(*row[:, None])[0]) > 1e-12 or \
+                abs(exact_load(*row) - exact_load_array(row[None])[0]) > 1e-12:
+            print(f"MISMATCH: scalar and array paths differ at {row}")
+            failures += 1
+            break
+
+    # step response: monotone, within the accel limit, arrives, stays feasible
+    for limits in (ExactLimits(), table):
+        planner = MotionPlanner(1, 0.01, limits=limits)
+        history = np.array([planner.update([[3.0, 0.0, 25.0]])[0] for _ in range(300)])
+        target = limits.limit(3.0, 0.0, 25.0)
+        accel = np.diff(history[:, 0]) / 0.01
+        name = type(limits).__name__
+        if not np.allclose(history[-1], target):
+            print(f"MISMATCH: {name} planner ended at {history[-1]}, target {target}")
+            failures += 1
+        if np.any(np.diff(history[:, 0]) < -1e-12) or accel.max() > MAX_ACCEL + 1e-6:
+            print(f"MISMATCH: {name} forward not monotone or accel {accel.max():.3f} > {MAX_ACCEL}")
+            failures += 1
+        if exact_load_array(history).max() > 1.0 + 1e-9:
+            print(f"MISMATCH: {name} planner emitted a command the firmware would clamp")
+            failures += 1
+    return failures
+
+
+def _per_call(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n
+
+
+def run_benchmark(table: FeasibilityTable, n: int, robots: int):
+    commands = random_commands(n)
+    saturated = exact_load_array(commands) > 1.0
+    print(f"table {table.azimuth_steps} x {table.elevation_steps} directions, interpolation error "
+          f"max {table.max_error:.2e} (margin {table.margin - 1:.2e}); {saturated.mean():.0%} of {n} "
+          f"random commands saturate a wheel")
+
+    exact = np.array([limit_exact(*row) for row in commands.tolist()])
+    lut = table.limit_array(commands.copy())
+    loss = 1.0 - np.linalg.norm(lut, axis=1) / np.linalg.norm(exact, axis=1)
+    print(f"\n{'saturation handling':<26} {'direction error deg':>20} {'max wheel load':>15}")
+    for label, sent in (('firmware clamp only', commands), ('exact scaling', exact), ('table scaling', lut)):
+        bend = direction_error(commands[saturated], achieved(sent[saturated]))
+        print(f"{label:<26} {np.percentile(bend, 50):9.2f} p50 {bend.max():6.2f} max "
+              f"{exact_load_array(sent).max():10.4f}")
+    print(f"table speed given up vs exact: mean {loss.mean():.2e}, max {loss.max():.2e}")
+
+    rows = commands[:1000].tolist()
+    reps = max(1, 200000 // len(rows))
+
+    def loop(fn):
+        return lambda: [fn(*row) for row in rows]
+
+    batch = commands[:robots].copy()
+    planner = MotionPlanner(robots)
+    table_planner = MotionPlanner(robots, limits=table)
+    print(f"\n{'per-call cost':<34} {'us':>8}")
+    for label, fn, calls in (
+            ('exact_load (scalar)', loop(exact_load), len(rows)),
+            ('table.lookup (scalar)', loop(table.lookup), len(rows)),
+            ('limit_exact (scalar)', loop(limit_exact), len(rows)),
+            ('table.limit (scalar)', loop(table.limit), len(rows)),
+            (f'exact_load_array ({robots} robots)', lambda: exact_load_array(batch), 1),
+            (f'table.lookup_array ({robots} robots)', lambda: table.lookup_array(*batch.T), 1),
+            (f'planner, exact ({robots} robots)', lambda: planner.update(batch), 1),
+            (f'planner, table ({robots} robots)', lambda: table_planner.update(batch), 1)):
+        r = reps if calls > 1 else reps * 50
+        print(f"{label:<34} {_per_call(fn, max(1, r // 10)) / calls * 1e6:8.3f}")
+
+
+def main():
+    p = argparse.ArgumentParser(description="Saturation-aware, accel/jerk-limited setpoint planner")
+    p.add_argument("--check", action="store_true", help="Verify feasibility, direction and the step response")
+    p.add_argument("--bench", action="store_true", help="Table vs exact solve: accuracy and per-call cost")
+    p.add_argument("--profile", type=float, nargs=3, metavar=("FORWARD", "LEFT", "ANGULAR"),
+                   help="Print the planned step response to this target")
+    p.add_argument("--table", action="store_true", help="Plan --profile with the feasibility table")
+    p.add_argument("-n", type=int, default=200000, help="Random commands for --bench")
+    p.add_argument("--robots", type=int, default=11, help="Batch size for --bench")
+    p.add_argument("--rate", type=float, default=100.0, help="Planner tick rate for --profile (Hz)")
+    p.add_argument("--azimuth-steps", type=int, default=256, help="Table resolution in translation direction")
+    p.add_argument("--elevation-steps", type=int, default=128, help="Table resolution towards pure rotation")
+    args = p.parse_args()
+
+    start = time.perf_counter()
+    table = FeasibilityTable(args.azimuth_steps, args.elevation_steps)
+    built = time.perf_counter() - start
+    if args.check:
+        failures = check(table)
+        print(f"{'OK' if not failures else f'{failures} FAILED'}: table limiting is feasible and "
+              f"direction-preserving, planner respects its limits (table built in {built * 1e3:.0f} ms)")
+        if failures:
+            raise SystemExit(1)
+    if args.bench:
+        run_benchmark(table, args.n, args.robots)
+    if args.profile:
+        planner = MotionPlanner(1, 1.0 / args.rate, limits=table if args.table else None)
+        target = planner.limits.limit(*args.profile)
+        print(f"target {tuple(args.profile)} -> feasible {tuple(round(v, 3) for v in target)}")
+        for tick in range(int(args.rate * 3)):
+            command = planner.update([args.profile])[0]
+            print(f"{tick / args.rate:5.2f} s  forward {command[0]:+6.3f}  left {command[1]:+6.3f}  "
+                  f"angular {command[2]:+7.3f}  load {exact_load(*command):.3f}")
+            if np.allclose(command, target):
+                break
+    if not (args.check or args.bench or args.profile):
+        p.print_help()
+
+
+if __name__ == '__main__':
+    main()
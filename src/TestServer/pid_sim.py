@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Vectorized replay of the STM32 wheel PID for offline gain sweeps.
+
+Reproduces pid_calculate from src/drivetrain/Core/Src/PID.c step for step in
+float32, over an array of (kp, ki, kd, IntegralLimit) gain sets at once, and
+closes the loop through a first-order motor/gearbox model running at the
+main.c control rate (HAL_Delay(10), ~100 Hz):
+
+    measure  = (int16) rotor rpm reported over CAN, optionally `delay` ticks old
+    output   = pid_calculate(target, measure), clamped to +-MaxOutput (9999)
+    command  = (int16) output, as setMotorSpeeds truncates it
+    rotor    = first-order lag towards gain * command, clamped to +-MAX_RPM
+
+Targets are the int16 wheel speeds the ESP32 sends over UART, either step
+setpoints or a recorded trace: a command_log.py .trcl capture (decoded and run
+through kinematics.wheel_speeds, sample-and-hold on the 10 ms grid, zeroed
+after the firmware's 200-loop timeout) or a .npy/.csv array with one column
+per wheel and one row per control tick.
+
+Every setpoint change is scored as a step: 10-90% rise time (crossings
+interpolated between ticks), overshoot and 2%
+settling time, plus the mean absolute tracking error over the whole run.
+Per gain set the worst step counts; NaN means some step never rose/settled.
+
+Usage:
+    python pid_sim.py --check                                  # compare with PID.c golden vectors
+    python pid_sim.py --kp 0.05:1.5:30 --ki 0:0.3:12 --kd 0:2:8 --top 15
+    python pid_sim.py --trace capture.trcl --robot 0 --workers 4 --csv sweep.csv
+    python pid_sim.py --step 3000,-9000 --tau 0.08 --delay 1
+"""
+import argparse
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from kinematics import GEAR_RATIO, MAX_RPM, wheel_speeds
+
+# Unloaded M2006 through the C610: a small current command already spins the rotor
+# fast, so the steady-state gain is far above MAX_RPM / MaxOutput. Rough defaults;
+# fit --tau/--motor-gain from a captured step on the real wheel.
+MOTOR_TAU = 0.25        # s
+MOTOR_GAIN = 40.0       # rotor rpm per ESC command unit at steady state
+
+# main.c control loop
+DT = 0.01
+MAX_OUTPUT = 9999
+FIRMWARE_GAINS = (0.3, 0.0, 0.0, 1000.0)  # Kp1, Ki1, Kd1, pid_init integral_limit
+TIMEOUT_LOOPS = 200
+
+SETTLE_BAND = 0.02
+MIN_STEP = 50           # rpm; smaller setpoint changes are not scored as steps
+HISTORY_BUDGET = 1 << 24  # float32 samples of response history per simulated chunk
+
+METRICS = ('rise', 'overshoot', 'settling', 'iae', 'final_error')
+
+# (kp, ki, kd, IntegralLimit) -> outputs of pid_calculate for GOLDEN_TARGETS/GOLDEN_MEASURES,
+# generated from PID.c compiled on the host with gcc -ffp-contract=off.
+GOLDEN_TARGETS = (0, 5000, 5000, 5000, 5000, -3000, -3000, 12000,
+                  12000, 12000, 0, 0, 15000, 15000, -15000, -15000)
+GOLDEN_MEASURES = (0, 0, 812, 2301, 3987, 4710, 2210, -1020,
+                   3500, 9050, 11200, 6102, 2500, 9000, 13000, -2000)
+GOLDEN_VECTORS = (
+    ((0.3, 0.0, 0.0, 1000.0),
+     (0, 1500, 1256.40002, 809.700012, 303.900024, -2313, -1563.00012, 3906.00024,
+      2550, 885.000061, -3360.00024, -1830.6001, 3750.00024, 1800.00012, -8400, -3900.00024)),
+    ((0.3, 0.02, 0.4, 1000.0),
+     (0, 3520, 951.599976, 234.099976, -350.5, -5822.2002, -583.000122, 9999,
+      762, -1315, -9040, 188.599976, 9999, -779.999878, -9999, 2079.99976)),
+    ((1.7, 0.35, 2.5, 300.0),
+     (0, 9999, 5194.6001, 970.800293, -2387.8999, -9999, -2712, 9999,
+      3255, -8755, -9999, 2266.59961, 9999, -5945, -9999, 9999)),
+)
+
+
+class VectorPID:
+    """PID_TypeDef over arrays: gains are (G, 1) columns, state broadcasts to (G, W)."""
+
+    def __init__(self, gains, width: int = 1, max_output: float = MAX_OUTPUT):
+        gains = np.asarray(gains, dtype=np.float32).reshape(-1, 4)
+        self.kp, self.ki, self.kd, self.limit = (gains[:, i:i + 1].copy() for i in range(4))
+        self.neg_limit = -self.limit
+        self.max_output = np.float32(max_output)
+        shape = (len(gains), width)
+        self.error = np.zeros(shape, np.float32)
+        self.last_error = np.zeros(shape, np.float32)
+        self.integral = np.zeros(shape, np.float32)
+        self.output = np.zeros(shape, np.float32)
+        self._term = np.zeros(shape, np.float32)
+
+    def calculate(self, target, measure) -> np.ndarray:
+        """One pid_calculate call; every operation rounds to float32 in the C order."""
+        self.last_error, self.error = self.error, self.last_error
+        np.subtract(np.float32(target) if np.isscalar(target) else target, measure, out=self.error)
+        np.add(self.integral, self.error, out=self.integral)
+        np.minimum(self.integral, self.limit, out=self.integral)
+        np.maximum(self.integral, self.neg_limit, out=self.integral)
+
+        out, term = self.output, self._term
+        np.multiply(self.kp, self.error, out=out)
+        np.multiply(self.ki, self.integral, out=term)
+        np.add(out, term, out=out)
+        np.subtract(self.error, self.last_error, out=term)
+        np.multiply(self.kd, term, out=term)
+        np.add(out, term, out=out)
+        np.minimum(out, self.max_output, out=out)
+        np.maximum(out, -self.max_output, out=out)
+        return out
+
+
+class MotorModel:
+    """First-order rotor response to the int16 ESC command, sampled every DT."""
+
+    def __init__(self, shape, tau: float = MOTOR_TAU, gain: float = MOTOR_GAIN,
+                 max_rpm: float = MAX_RPM, delay: int = 0, dt: float = DT):
+        self.decay = np.exp(-dt / tau) if tau > 0 else 0.0
+        self.drive = (1.0 - self.decay) * gain
+        self.max_rpm = max_rpm
+        self.rpm = np.zeros(shape)
+        self._reported = [np.zeros(shape, np.float32) for _ in range(delay + 1)]
+
+    def feedback(self) -> np.ndarray:
+        """speed_data as the STM32 sees it: the int16 CAN value, `delay` ticks old."""
+        return self._reported[0]
+
+    def step(self, command: np.ndarray):
+        self.rpm *= self.decay
+        self.rpm += self.drive * np.trunc(command)
+        np.clip(self.rpm, -self.max_rpm, self.max_rpm, out=self.rpm)
+        latest = self._reported.pop(0)
+        np.trunc(self.rpm, out=latest, casting='unsafe')
+        self._reported.append(latest)
+
+
+def simulate(gains, setpoint, motor: dict = None) -> np.ndarray:
+    """Run every gain set against an (T, W) setpoint; return the (T, G, W) reported rotor rpm."""
+    setpoint = np.asarray(setpoint, dtype=np.float32)
+    steps, width = setpoint.shape
+    pid = VectorPID(gains, width)
+    plant = MotorModel(pid.error.shape, **(motor or {}))
+    history = np.empty((steps,) + pid.error.shape, np.float32)
+    for k in range(steps):
+        measure = plant.feedback()
+        history[k] = measure
+        plant.step(pid.calculate(setpoint[k], measure))
+    return history
+
+
+def step_segments(setpoint: np.ndarray, min_step: float = MIN_STEP):
+    """Yield (column, start, end, previous, target) for every setpoint change worth scoring."""
+    steps, width = setpoint.shape
+    for w in range(width):
+        column = setpoint[:, w]
+        changes = np.flatnonzero(np.diff(column)) + 1
+        starts = np.concatenate(([0], changes))
+        ends = np.concatenate((changes, [steps]))
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            previous = float(column[start - 1]) if start else 0.0
+            target = float(column[start])
+            if abs(target - previous) >= min_step:
+                yield w, start, end, previous, target
+
+
+def _crossing(progress, prior, level: float, dt: float) -> np.ndarray:
+    """Time after the step at which each column first reaches `level`, linearly interpolated
+    between control ticks (tick j of the segment is at j * dt, `prior` at -dt); NaN if never."""
+    extended = np.vstack((prior[None, :], progress))
+    reached = extended >= level
+    k = np.maximum(reached.argmax(axis=0), 1)
+    cols = np.arange(extended.shape[1])
+    low, high = extended[k - 1, cols], extended[k, cols]
+    span = np.where(high != low, high - low, 1.0)
+    crossing = (k - 2 + np.clip((level - low) / span, 0.0, 1.0)) * dt
+    crossing[~reached.any(axis=0)] = np.nan
+    return crossing
+
+
+def score(setpoint, history, dt: float = DT) -> dict:
+    """Worst-step rise/overshoot/settling and mean tracking error per gain set."""
+    setpoint = np.asarray(setpoint, dtype=np.float32)
+    n_gains = history.shape[1]
+    rise = np.zeros(n_gains)
+    overshoot = np.zeros(n_gains)
+    settling = np.zeros(n_gains)
+    for w, start, end, previous, target in step_segments(setpoint):
+        progress = (history[start:end, :, w] - previous) / (target - previous)
+        prior = (history[start - 1, :, w] - previous) / (target - previous) if start else np.zeros(n_gains)
+        seg_rise = _crossing(progress, prior, 0.9, dt) - _crossing(progress, prior, 0.1, dt)
+
+        seg_overshoot = np.maximum(progress.max(axis=0) - 1.0, 0.0) * 100.0
+
+        outside = np.abs(progress - 1.0) > SETTLE_BAND
+        last_out = len(progress) - 1 - outside[::-1].argmax(axis=0)
+        seg_settling = np.where(outside.any(axis=0), (last_out + 1) * dt, 0.0)
+        seg_settling[outside[-1]] = np.nan
+
+        rise = np.maximum(rise, seg_rise)
+        overshoot = np.maximum(overshoot, seg_overshoot)
+        settling = np.maximum(settling, seg_settling)
+
+    error = np.abs(history - setpoint[:, None, :])
+    tail = max(1, len(history) // 10)
+    return {
+        'rise': rise,
+        'overshoot': overshoot,
+        'settling': settling,
+        'iae': error.mean(axis=(0, 2)),
+        'final_error': error[-tail:].mean(axis=(0, 2)),
+    }
+
+
+def _sweep_chunk(args) -> dict:
+    gains, setpoint, motor = args
+    return score(setpoint, simulate(gains, setpoint, motor))
+
+
+def sweep(gains, setpoint, motor: dict = None, workers: int = 0) -> dict:
+    """Score all gain sets, chunked to bound history memory and optionally across processes."""
+    gains = np.asarray(gains, dtype=np.float32).reshape(-1, 4)
+    setpoint = np.asarray(setpoint, dtype=np.float32)
+    chunk = max(1, HISTORY_BUDGET // setpoint.size)
+    if workers > 1:
+        chunk = min(chunk, -(-len(gains) // workers))
+    jobs = [(gains[i:i + chunk], setpoint, motor) for i in range(0, len(gains), chunk)]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_sweep_chunk, jobs))
+    else:
+        parts = [_sweep_chunk(job) for job in jobs]
+    return {name: np.concatenate([part[name] for part in parts]) for name in METRICS}
+
+
+def gain_grid(kp, ki, kd, limit) -> np.ndarray:
+    """Cartesian product of the per-gain value lists as a (G, 4) float32 array."""
+    return np.array(list(itertools.product(kp, ki, kd, limit)), dtype=np.float32)
+
+
+def parse_values(text: str) -> list:
+    """'0.3', '0.1,0.2,0.5' or 'start:stop:count' (inclusive linspace)."""
+    if text.count(':') == 2:
+        start, stop, count = text.split(':')
+        return np.linspace(float(start), float(stop), int(count)).tolist()
+    return [float(v) for v in text.split(',') if v]
+
+
+def step_setpoint(levels, duration: float, dt: float = DT) -> np.ndarray:
+    """One column per step level, held for the whole run from rest."""
+    steps = max(2, int(round(duration / dt)))
+    return np.tile(np.asarray(levels, dtype=np.float32), (steps, 1))
+
+
+def load_trace(path: str, robot_id: int = None, settle: float = 0.5, dt: float = DT) -> np.ndarray:
+    """(T, 4) wheel setpoints from a .npy/.csv array or a command_log.py capture."""
+    if path.endswith('.npy'):
+        setpoint = np.asarray(np.load(path), dtype=np.float32)
+        return setpoint.reshape(len(setpoint), -1)
+    if path.endswith(('.csv', '.txt')):
+        return np.atleast_2d(np.loadtxt(path, delimiter=',', dtype=np.float32, ndmin=2))
+
+    from command_log import KIND_PROTOBUF, CommandLog
+    from triton_codec import decode
+
+    stamps, commands = [], []
+    log = CommandLog(path)
+    try:
+        for stamp, _dest, kind, payload in log.records():
+            if kind != KIND_PROTOBUF:
+                continue
+            fields = decode(payload)
+            if robot_id is not None and fields.id != robot_id:
+                continue
+            stamps.append(stamp)
+            commands.append((fields.forward, fields.left, fields.angular))
+    finally:
+        log.close()
+    if not stamps:
+        raise SystemExit(f"{path}: no protobuf commands" + (f" for robot {robot_id}" if robot_id is not None else ""))
+
+    stamps = np.asarray(stamps, dtype=np.int64)
+    commands = np.asarray(commands)
+    speeds = wheel_speeds(commands[:, 0], commands[:, 1], commands[:, 2]).astype(np.float32)
+    dt_ns = int(dt * 1e9)
+    grid = stamps[0] + np.arange((stamps[-1] - stamps[0]) // dt_ns + 1 + int(settle / dt)) * dt_ns
+    latest = np.searchsorted(stamps, grid, side='right') - 1
+    setpoint = speeds[latest]
+    setpoint[grid - stamps[latest] > TIMEOUT_LOOPS * dt_ns] = 0
+    return setpoint
+
+
+def check_golden() -> int:
+    """Run GOLDEN_VECTORS through VectorPID in one batch; return the number of mismatches."""
+    pid = VectorPID([gains for gains, _ in GOLDEN_VECTORS])
+    outputs = []
+    for target, measure in zip(GOLDEN_TARGETS, GOLDEN_MEASURES):
+        outputs.append(pid.calculate(target, np.float32(measure))[:, 0].copy())
+    outputs = np.array(outputs).T
+
+    failures = 0
+    for (gains, expected), got in zip(GOLDEN_VECTORS, outputs):
+        if not np.array_equal(np.asarray(expected, dtype=np.float32), got):
+            print(f"MISMATCH {gains}: firmware {expected}, got {got.tolist()}")
+            failures += 1
+    return failures
+
+
+def main():
+    p = argparse.ArgumentParser(description="Vectorized STM32 wheel PID + motor model for gain sweeps")
+    p.add_argument("--check", action="store_true", help="Verify against the PID.c golden vectors")
+    p.add_argument("--kp", default="0.05:1.5:30", help="kp values: list or start:stop:count (default: 0.05:1.5:30)")
+    p.add_argument("--ki", default="0:0.3:12", help="ki values (default: 0:0.3:12)")
+    p.add_argument("--kd", default="0:2:8", help="kd values (default: 0:2:8)")
+    p.add_argument("--ilimit", default="1000,5000", help="IntegralLimit values (default: 1000,5000)")
+    p.add_argument("--step", default="3000,9000", help="Step setpoints in rotor rpm, one per column (default: 3000,9000)")
+    p.add_argument("--duration", type=float, default=1.0, help="Step response length in seconds (default: 1.0)")
+    p.add_argument("--trace", help="Recorded setpoints: .trcl command log, .npy or .csv (overrides --step)")
+    p.add_argument("--robot", type=int, default=None, help="Robot id to take from a .trcl capture")
+    p.add_argument("--tau", type=float, default=MOTOR_TAU, help=f"Motor time constant in seconds (default: {MOTOR_TAU})")
+    p.add_argument("--motor-gain", type=float, default=MOTOR_GAIN,
+                   help=f"Steady-state rotor rpm per ESC command unit (default: {MOTOR_GAIN})")
+    p.add_argument("--delay", type=int, default=0, help="CAN feedback delay in control ticks (default: 0)")
+    p.add_argument("--workers", type=int, default=0, help="Process pool size, 0 = in-process, -1 = one per CPU (default: 0)")
+    p.add_argument("--sort", choices=METRICS, default='iae', help="Ranking metric (default: iae)")
+    p.add_argument("--top", type=int, default=10, help="Rows to print (default: 10)")
+    p.add_argument("--csv", help="Write every gain set and its metrics to this CSV file")
+    args = p.parse_args()
+
+    if args.check:
+        failures = check_golden()
+        print(f"{len(GOLDEN_VECTORS) - failures}/{len(GOLDEN_VECTORS)} golden vectors match")
+        raise SystemExit(1 if failures else 0)
+
+    if args.trace:
+        setpoint = load_trace(args.trace, args.robot)
+    else:
+        setpoint = step_setpoint(parse_values(args.step), args.duration)
+    gains = np.concatenate((
+        np.array([FIRMWARE_GAINS], dtype=np.float32),
+        gain_grid(parse_values(args.kp), parse_values(args.ki), parse_values(args.kd), parse_values(args.ilimit)),
+    ))
+    motor = {'tau': args.tau, 'gain': args.motor_gain, 'delay': args.delay}
+
+    workers = args.workers if args.workers >= 0 else os.cpu_count()
+    start = time.perf_counter()
+    results = sweep(gains, setpoint, motor, workers)
+    elapsed = time.perf_counter() - start
+    print(f"{len(gains)} gain sets x {setpoint.shape[1]} wheels x {len(setpoint)} ticks "
+          f"in {elapsed:.2f} s ({len(gains) / elapsed:.0f} gain sets/s)")
+
+    key = results[args.sort]
+    order = np.lexsort((key, np.isnan(key)))
+    header = f"{'':>9} {'kp':>7} {'ki':>7} {'kd':>7} {'ilimit':>7} {'rise':>7} {'over%':>7} {'settle':>7} {'iae':>8} {'final':>8}"
+    print(header)
+
+    def row(label, i):
+        kp, ki, kd, limit = gains[i].tolist()
+        print(f"{label:>9} {kp:7.3f} {ki:7.3f} {kd:7.3f} {limit:7.0f} {results['rise'][i]:7.4f} "
+              f"{results['overshoot'][i]:7.1f} {results['settling'][i]:7.2f} "
+              f"{results['iae'][i]:8.1f} {results['final_error'][i]:8.1f}")
+
+    row('firmware', 0)
+    for rank, i in enumerate(order[:args.top], 1):
+        row(f"#{rank}", i)
+    wheel = setpoint.max() / GEAR_RATIO
+    print(f"(rotor rpm; peak setpoint {setpoint.max():.0f} rpm = {wheel:.0f} wheel rpm, times in s)")
+
+    if args.csv:
+        table = np.column_stack([gains] + [results[name] for name in METRICS])
+        np.savetxt(args.csv, table, delimiter=',', fmt='%.6g',
+                   header=','.join(('kp', 'ki', 'kd', 'ilimit') + METRICS), comments='')
+        print(f"wrote {len(gains)} rows to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Batched constant-velocity Kalman filter over vision poses, with latency-compensated prediction.
+
+A command built from the last vision frame reaches the STM32 PID loop tens of
+milliseconds after that frame was captured, and the robot has moved on by
+then. PoseFilter tracks every object with an independent constant-velocity
+filter per axis (x, y and, for robots, orientation), all held in (N, axes)
+NumPy arrays so one update() call filters a whole frame's detections.
+Because each axis is a 2-state filter with a position-only measurement, the
+covariance update is closed form and needs no matrix inverses.
+
+extrapolate(t) predicts every pose forward to time t without touching the
+filter state; VisionFilter uses it to hand the senders each robot's pose at
+"now + command latency" instead of at the capture time. The latency is
+either configured or taken from a latency_probe.py measurement. A track not
+seen for max_age seconds is reset, so a robot that leaves vision reads as
+untracked instead of coasting on at its last velocity.
+
+Units follow SSL-Vision: mm, rad, seconds.
+
+Usage:
+    filt = VisionFilter(vision_state, latency=0.04)
+    filt.ingest()                                   # after new frames arrive
+    pose = filt.predicted_vision(TEAM_YELLOW, 2)    # for TritonBotEncoder.set_vision()
+
+    python pose_filter.py --bench                   # update cost per frame, 22 robots + ball
+    python pose_filter.py --accuracy --latency 0.05 # RMSE on noisy synthetic trajectories
+"""
+import argparse
+import math
+import time
+
+import numpy as np
+
+from vision_receiver import MAX_ROBOTS, VisionState
+
+
+def wrap_angle(a):
+    return (a + np.pi) % (2 * np.pi) - np.pi
+
+
+class PoseFilter:
+    """N independent constant-velocity Kalman filters with `axes` position axes each."""
+
+    def __init__(self, n: int, accel_noise, meas_noise, angular_axes=(), initial_speed: float = 5000.0):
+        accel_noise = np.asarray(accel_noise, dtype=np.float64)
+        self.n = n
+        self.axes = len(accel_noise)
+        self.q = accel_noise ** 2              # white-noise acceleration spectral density per axis
+        self.r = np.asarray(meas_noise, dtype=np.float64) ** 2
+        self.angular = np.zeros(self.axes, dtype=bool)
+        self.angular[list(angular_axes)] = True
+        self.initial_var = np.where(self.angular, 4 * math.pi ** 2, initial_speed ** 2)
+        # rows of each filter's state: position, velocity and the 2x2 covariance terms,
+        # kept in one array so an update is a single gather and a single scatter
+        self.state = np.zeros((n, 5, self.axes))
+        self.pos = self.state[:, 0]
+        self.vel = self.state[:, 1]
+        self.p00 = self.state[:, 2]
+        self.p01 = self.state[:, 3]
+        self.p11 = self.state[:, 4]
+        self.t = np.zeros(n)
+        self.active = np.zeros(n, dtype=bool)
+        self._any_angular = bool(self.angular.any())
+
+    def reset(self, idx=None):
+        idx = slice(None) if idx is None else idx
+        self.active[idx] = False
+
+    def update(self, idx, z, t):
+        """Fuse measurements z (m, axes) taken at times t (m,) into filters idx (m,)."""
+        idx = np.asarray(idx)
+        z = np.asarray(z, dtype=np.float64)
+        t = np.broadcast_to(np.asarray(t, dtype=np.float64), idx.shape)
+        new = ~self.active[idx]
+        if new.any():
+            fresh = idx[new]
+            init = np.zeros((len(fresh), 5, self.axes))
+            init[:, 0] = z[new]
+            init[:, 2] = self.r
+            init[:, 4] = self.initial_var
+            self.state[fresh] = init
+            self.t[fresh] = t[new]
+            self.active[fresh] = True
+            keep = ~new
+            idx, z, t = idx[keep], z[keep], t[keep]
+            if not len(idx):
+                return
+
+        x = self.state[idx]
+        pos, vel, p00, p01, p11 = x[:, 0], x[:, 1], x[:, 2], x[:, 3], x[:, 4]
+        # predict to the measurement time
+        dt = np.maximum(t - self.t[idx], 0.0)[:, None]
+        q_dt = self.q * dt
+        pos += vel * dt
+        p00 += dt * (2 * p01 + dt * p11) + q_dt * dt * dt / 3
+        p01 += dt * p11 + q_dt * dt / 2
+        p11 += q_dt
+
+        # correct with a position measurement (H = [1, 0])
+        innovation = z - pos
+        if self._any_angular:
+            innovation[:, self.angular] = wrap_angle(innovation[:, self.angular])
+        k0 = p00 / (p00 + self.r)
+        k1 = p01 / (p00 + self.r)
+        pos += k0 * innovation
+        vel += k1 * innovation
+        p11 -= k1 * p01
+        p01 *= 1 - k0
+        p00 *= 1 - k0
+        if self._any_angular:
+            pos[:, self.angular] = wrap_angle(pos[:, self.angular])
+
+        self.state[idx] = x
+        self.t[idx] = t
+
+    def extrapolate(self, t):
+        """Predicted positions (N, axes) at time t (scalar or (N,)); the filter state is unchanged."""
+        dt = (np.asarray(t, dtype=np.float64) - self.t)
+        pos = self.pos + self.vel * np.reshape(dt, (-1, 1))
+        if self._any_angular:
+            pos[:, self.angular] = wrap_angle(pos[:, self.angular])
+        return pos
+
+    def position_std(self):
+        return np.sqrt(self.p00)
+
+
+def latency_from_probe(stats) -> float:
+    """One-way command latency in seconds from a latency_probe.ProbeStats run."""
+    if stats.outbound.total:
+        return stats.outbound.percentile(50) / 1e9
+    return stats.rtt.percentile(50) / 2e9
+
+
+class VisionFilter:
+    """Filters a VisionState's robots (x, y, orientation) and ball (x, y) and predicts them ahead."""
+
+    def __init__(self, state: VisionState, latency: float = 0.04,
+                 robot_accel=3000.0, robot_angular_accel=30.0, ball_accel=6000.0,
+                 position_noise=5.0, angle_noise=0.03, max_age: float = 0.5):
+        self.state = state
+        self.latency = latency
+        self.max_age = max_age  # s since the last capture before a track is dropped
+        self.max_robots = state.max_robots
+        self.robots = PoseFilter(2 * state.max_robots,
+                                 (robot_accel, robot_accel, robot_angular_accel),
+                                 (position_noise, position_noise, angle_noise), angular_axes=(2,))
+        self.ball = PoseFilter(1, (ball_accel, ball_accel), (position_noise, position_noise))
+        self.last_capture = np.zeros(2 * state.max_robots)
+        self.last_ball_capture = 0.0
+        # capture time (vision clock) -> local time.time(); vision and sender clocks may differ
+        self.clock_offset = 0.0
+
+    def ingest(self) -> int:
+        """Fuse every detection that arrived since the last call; return how many were new."""
+        robots, ball = self.state.snapshot()
+        flat = robots.reshape(-1)
+        fresh = flat['valid'] & (flat['t_capture'] > self.last_capture)
+        idx = np.flatnonzero(fresh)
+        if len(idx):
+            rows = flat[idx]
+            z = np.column_stack([rows['x'], rows['y'], rows['orientation']])
+            self.robots.update(idx, z, rows['t_capture'])
+            self.last_capture[idx] = rows['t_capture']
+            self.clock_offset = float(np.median(rows['t_received'] - rows['t_capture']))
+        if ball['valid'] and ball['t_capture'] > self.last_ball_capture:
+            self.ball.update([0], [[ball['x'], ball['y']]], [ball['t_capture']])
+            self.last_ball_capture = float(ball['t_capture'])
+        return len(idx)
+
+    def _target_time(self, now: float = None, latency: float = None) -> float:
+        now = time.time() if now is None else now
+        return now - self.clock_offset + (self.latency if latency is None else latency)
+
+    def expire(self, now: float = None) -> int:
+        """Reset tracks not seen for max_age seconds (robot or ball left vision); return how many."""
+        vision_now = self._target_time(now, 0.0)
+        stale = self.robots.active & (vision_now - self.last_capture > self.max_age)
+        if stale.any():
+            self.robots.reset(stale)
+        if self.ball.active[0] and vision_now - self.last_ball_capture > self.max_age:
+            self.ball.reset()
+        return int(stale.sum())
+
+    def predicted_poses(self, now: float = None, latency: float = None):
+        """(2, max_robots, 3) array of x, y, orientation at now + latency; NaN for untracked or stale robots."""
+        self.expire(now)
+        poses = self.robots.extrapolate(self._target_time(now, latency))
+        poses[~self.robots.active] = np.nan
+        return poses.reshape(2, self.max_robots, 3)
+
+    def predicted_vision(self, team: int, robot_id: int, now: float = None, latency: float = None):
+        """The robot's vision tuple with x, y, orientation predicted to now + latency, or None."""
+        self.expire(now)
+        row = self.state.robot(team, robot_id)
+        slot = team * self.max_robots + robot_id
+        if row is None or not self.robots.active[slot]:
+            return None
+        t = self._target_time(now, latency)
+        x, y, orientation = self.robots.pos[slot] + self.robots.vel[slot] * (t - self.robots.t[slot])
+        return (float(row['confidence']), robot_id, float(x), float(y), float(wrap_angle(orientation)),
+                float(row['pixel_x']), float(row['pixel_y']), float(row['height']))
+
+
+def _synthetic_tracks(n: int, duration: float, rate: float, seed: int):
+    """Smoothly accelerating robot paths sampled at `rate`: returns times (T,) and truth (T, n, 3)."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(0.0, duration, 1.0 / rate)
+    # sum of two sinusoids per axis: speeds up to ~2 m/s, accelerations a few m/s^2
+    amp = rng.uniform(300, 1500, (2, n, 3))
+    freq = rng.uniform(0.1, 0.5, (2, n, 3)) * 2 * math.pi
+    phase = rng.uniform(0, 2 * math.pi, (2, n, 3))
+    amp[:, :, 2] = rng.uniform(0.5, 2.0, (2, n))
+    truth = (amp[0] * np.sin(freq[0] * t[:, None, None] + phase[0])
+             + amp[1] * np.sin(freq[1] * t[:, None, None] + phase[1]))
+    truth[:, :, 2] = wrap_angle(truth[:, :, 2])
+    return t, truth, (amp, freq, phase)
+
+
+def _truth_at(params, t):
+    amp, freq, phase = params
+    pose = amp[0] * np.sin(freq[0] * t + phase[0]) + amp[1] * np.sin(freq[1] * t + phase[1])
+    pose[:, 2] = wrap_angle(pose[:, 2])
+    return pose
+
+
+def run_accuracy(n: int, rate: float, latency: float, noise: float, angle_noise: float, seed: int = 0) -> dict:
+    """Print and return {estimate: (pos RMSE mm, pos p95 mm, angle RMSE rad)} on synthetic tracks."""
+    times, truth, params = _synthetic_tracks(n, 20.0, rate, seed)
+    rng = np.random.default_rng(seed + 1)
+    meas = truth + rng.normal(0, 1, truth.shape) * np.array([noise, noise, angle_noise])
+    meas[:, :, 2] = wrap_angle(meas[:, :, 2])
+    filt = PoseFilter(n, (3000.0, 3000.0, 30.0), (noise, noise, angle_noise), angular_axes=(2,))
+    idx = np.arange(n)
+    err = {'raw': [], 'filtered': [], 'hold': [], 'predicted': []}
+    warmup = int(rate)  # skip the first second while velocities converge
+    for k, t in enumerate(times):
+        filt.update(idx, meas[k], t)
+        if k < warmup:
+            continue
+        future = _truth_at(params, t + latency)
+        for name, estimate, reference in (('raw', meas[k], truth[k]), ('filtered', filt.pos, truth[k]),
+                                          ('hold', meas[k], future), ('predicted', filt.extrapolate(t + latency), future)):
+            diff = estimate - reference
+            err[name].append((np.hypot(diff[:, 0], diff[:, 1]), np.abs(wrap_angle(diff[:, 2]))))
+
+    print(f"{n} tracks, {rate:g} Hz, noise {noise:g} mm / {angle_noise:g} rad, latency {latency * 1e3:g} ms")
+    print(f"{'estimate':<34} {'pos RMSE mm':>12} {'pos p95 mm':>11} {'angle RMSE rad':>15}")
+    labels = {'raw': 'raw measurement vs now', 'filtered': 'filtered vs now',
+              'hold': 'raw measurement vs now+latency', 'predicted': 'predicted vs now+latency'}
+    results = {}
+    for name in ('raw', 'filtered', 'hold', 'predicted'):
+        pos = np.concatenate([e[0] for e in err[name]])
+        ang = np.concatenate([e[1] for e in err[name]])
+        results[name] = (math.sqrt(np.mean(pos ** 2)), float(np.percentile(pos, 95)), math.sqrt(np.mean(ang ** 2)))
+        print(f"{labels[name]:<34} {results[name][0]:12.2f} {results[name][1]:11.2f} {results[name][2]:15.4f}")
+    return results
+
+
+def run_benchmark(n_robots: int = 22, frames: int = 20000):
+    rng = np.random.default_rng(0)
+    robots = PoseFilter(2 * MAX_ROBOTS, (3000.0, 3000.0, 30.0), (5.0, 5.0, 0.03), angular_axes=(2,))
+    ball = PoseFilter(1, (6000.0, 6000.0), (5.0, 5.0))
+    slots = np.concatenate([np.arange(n_robots // 2), MAX_ROBOTS + np.arange(n_robots - n_robots // 2)])
+    z = rng.normal(0, 1000, (frames, n_robots, 3))
+    zb = rng.normal(0, 1000, (frames, 1, 2))
+    times = np.arange(frames) / 60.0
+    robots.update(slots, z[0], 0.0)
+    ball.update([0], zb[0], 0.0)
+    start = time.perf_counter()
+    for k in range(1, frames):
+        robots.update(slots, z[k], times[k])
+        ball.update([0], zb[k], times[k])
+    update = (time.perf_counter() - start) / (frames - 1)
+    start = time.perf_counter()
+    for k in range(frames):
+        robots.extrapolate(times[k] + 0.04)
+    extrapolate = (time.perf_counter() - start) / frames
+
+    state = VisionState()
+    filt = VisionFilter(state)
+    flat = state.robots.reshape(-1)
+    flat['valid'][slots] = True
+    start = time.perf_counter()
+    for k in range(2000):
+        flat['t_capture'][slots] = times[k + 1]
+        flat['x'][slots] = z[k, :, 0]
+        filt.ingest()
+    ingest = (time.perf_counter() - start) / 2000
+    print(f"{n_robots} robots + ball: update {update * 1e6:.1f} us/frame, extrapolate {extrapolate * 1e6:.1f} us, "
+          f"VisionFilter.ingest {ingest * 1e6:.1f} us/frame ({1 / update:,.0f} frames/s)")
+
+
+def main():
+    p = argparse.ArgumentParser(description="Batched constant-velocity pose filter")
+    p.add_argument("--bench", action="store_true", help="Time filter updates for a full field")
+    p.add_argument("--accuracy", action="store_true", help="RMSE on noisy synthetic trajectories")
+    p.add_argument("--robots", type=int, default=22, help="Robots in the benchmark / accuracy run")
+    p.add_argument("--rate", type=float, default=60.0, help="Vision frame rate for --accuracy")
+    p.add_argument("--latency", type=float, default=0.05, help="Prediction horizon (s)")
+    p.add_argument("--noise", type=float, default=10.0, help="Position noise for --accuracy (mm)")
+    p.add_argument("--angle-noise", type=float, default=0.03, help="Orientation noise for --accuracy (rad)")
+    args = p.parse_args()
+    if not (args.bench or args.accuracy):
+        p.print_help()
+        return
+    if args.bench:
+        run_benchmark(args.robots)
+    if args.accuracy:
+        run_accuracy(args.robots, args.rate, args.latency, args.noise, args.angle_noise)
+
+
+if __name__ == '__main__':
+    main()
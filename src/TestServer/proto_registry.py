@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Cached compile step and startup benchmark for the lazy `protocols` package.
+
+--compile runs protoc over src/protobuf/classes into protocols/. It only
+does work for .proto files whose SHA-256 differs from the one recorded in
+protocols/_index.py. The protoc version is recorded too but is not part of
+the staleness key, so --check passes on machines with a different protoc;
+after upgrading protoc, regenerate everything with --compile --force.
+Generated imports are rewritten to package-relative ones ("from . import
+x_pb2"), stale modules of deleted .proto files are removed, and the index
+of top-level message/enum names -> module is rebuilt from a descriptor set
+so nothing has to be imported to build it. --check exits non-zero if
+anything is out of date, for CI.
+
+A generated module only depends on the descriptors it imports by name, so
+regenerating just the changed file is enough when a dependency changes.
+
+--bench times fresh interpreters (median of --repeat runs) importing the
+package, resolving one type through it, importing every module eagerly,
+and importing the teleop and vision entry points.
+
+Usage:
+    python proto_registry.py --compile            # regenerate what changed
+    python proto_registry.py --compile --force    # everything, e.g. after a protoc upgrade
+    python proto_registry.py --check              # exit 1 if protocols/ is stale
+    python proto_registry.py --bench --repeat 15
+"""
+import argparse
+import glob
+import hashlib
+import os
+import pprint
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROTO_DIR = os.path.normpath(os.path.join(HERE, '..', 'protobuf', 'classes'))
+PACKAGE = 'protocols'
+PACKAGE_DIR = os.path.join(HERE, PACKAGE)
+INDEX_PATH = os.path.join(PACKAGE_DIR, '_index.py')
+
+_FLAT_IMPORT = re.compile(r'^import (\w+_pb2) as ', re.MULTILINE)
+
+BENCH_CASES = (
+    ('import protocols', 'import protocols'),
+    ('protocols.Referee', 'import protocols; protocols.Referee()'),
+    ('all modules eagerly', 'import protocols; [protocols.module(m) for m in sorted(set(protocols.MODULES.values()))]'),
+    ('import teleop_async', 'import teleop_async'),
+    ('import vision_receiver', 'import vision_receiver'),
+    ('python -c pass', 'pass'),
+)
+
+
+def proto_files(proto_dir: str = PROTO_DIR) -> list:
+    return sorted(os.path.basename(p) for p in glob.glob(os.path.join(proto_dir, '*.proto')))
+
+
+def file_hashes(proto_dir: str = PROTO_DIR) -> dict:
+    hashes = {}
+    for name in proto_files(proto_dir):
+        with open(os.path.join(proto_dir, name), 'rb') as f:
+            hashes[name] = hashlib.sha256(f.read()).hexdigest()
+    return hashes
+
+
+def protoc_version(protoc: str = 'protoc') -> str:
+    return subprocess.run([protoc, '--version'], capture_output=True, text=True, check=True).stdout.strip()
+
+
+def load_index() -> dict:
+    """The recorded hashes and protoc version, or empty values if there is no index yet."""
+    namespace = {}
+    if os.path.exists(INDEX_PATH):
+        with open(INDEX_PATH) as f:
+            exec(f.read(), namespace)
+    return {'hashes': namespace.get('PROTO_HASHES', {}), 'protoc': namespace.get('PROTOC_VERSION')}
+
+
+def module_name(proto: str) -> str:
+    return proto[:-len('.proto')] + '_pb2'
+
+
+def stale_files(proto_dir: str = PROTO_DIR) -> tuple:
+    """Return (changed .proto files, removed .proto files, current hashes)."""
+    hashes = file_hashes(proto_dir)
+    recorded = load_index()
+    changed = [name for name, digest in hashes.items() if recorded['hashes'].get(name) != digest]
+    removed = sorted(set(recorded['hashes']) - set(hashes))
+    return changed, removed, hashes
+
+
+def _rewrite_imports(path: str):
+    with open(path) as f:
+        source = f.read()
+    rewritten = _FLAT_IMPORT.sub(r'from . import \1 as ', source)
+    if rewritten != source:
+        with open(path, 'w') as f:
+            f.write(rewritten)
+
+
+def build_index(proto_dir: str, protoc: str) -> tuple:
+    """({full name: module}, {unique short name: full name}, [ambiguous short names]) from a descriptor set."""
+    from google.protobuf import descriptor_pb2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, 'set.pb')
+        subprocess.run([protoc, f'-I{proto_dir}', f'--descriptor_set_out={out}'] + proto_files(proto_dir),
+                       cwd=proto_dir, check=True)
+        with open(out, 'rb') as f:
+            descriptor_set = descriptor_pb2.FileDescriptorSet.FromString(f.read())
+
+    modules = {}
+    by_short = {}
+    for file in descriptor_set.file:
+        prefix = f"{file.package}." if file.package else ''
+        for name in [m.name for m in file.message_type] + [e.name for e in file.enum_type]:
+            modules[prefix + name] = module_name(file.name)
+            by_short.setdefault(name, []).append(prefix + name)
+    short = {name: full[0] for name, full in by_short.items() if len(full) == 1}
+    ambiguous = sorted(name for name, full in by_short.items() if len(full) > 1)
+    return modules, short, ambiguous
+
+
+def write_index(hashes: dict, version: str, modules: dict, short: dict):
+    with open(INDEX_PATH, 'w') as f:
+        f.write('# Generated by proto_registry.py --compile. DO NOT EDIT.\n')
+        f.write(f'PROTOC_VERSION = {version!r}\n\n')
+        f.write(f'PROTO_HASHES = {pprint.pformat(hashes, width=110)}\n\n')
+        f.write(f'# full protobuf name -> generated module\nMODULES = {pprint.pformat(modules, width=110)}\n\n')
+        f.write(f'# short names defined by exactly one package\nSHORT_NAMES = {pprint.pformat(short, width=110)}\n')
+
+
+def compile_protos(proto_dir: str = PROTO_DIR, protoc: str = 'protoc', force: bool = False) -> list:
+    """Regenerate changed modules and the index; return the .proto files that were compiled."""
+    changed, removed, hashes = stale_files(proto_dir)
+    if force:
+        changed = list(hashes)
+    if not changed and not removed:
+        return []
+    version = protoc_version(protoc)
+
+    os.makedirs(PACKAGE_DIR, exist_ok=True)
+    if changed:
+        subprocess.run([protoc, f'-I{proto_dir}', f'--python_out={PACKAGE_DIR}'] + changed, cwd=proto_dir, check=True)
+        for name in changed:
+            _rewrite_imports(os.path.join(PACKAGE_DIR, module_name(name) + '.py'))
+    for name in removed:
+        stale = os.path.join(PACKAGE_DIR, module_name(name) + '.py')
+        if os.path.exists(stale):
+            os.remove(stale)
+
+    modules, short, ambiguous = build_index(proto_dir, protoc)
+    write_index(hashes, version, modules, short)
+    if ambiguous:
+        print(f"short names only reachable by full name: {', '.join(ambiguous)}")
+    return changed
+
+
+def time_case(code: str, repeat: int) -> float:
+    """Median wall time of a fresh interpreter running `code` from this directory."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=HERE, check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def run_benchmark(repeat: int):
+    results = [(label, time_case(code, repeat)) for label, code in BENCH_CASES]
+    baseline = results[-1][1]
+    print(f"{'case':<24} {'median':>9} {'over bare python':>17}   ({repeat} fresh interpreters each)")
+    for label, elapsed in results:
+        extra = '' if label == 'python -c pass' else f"{(elapsed - baseline) * 1e3:+14.1f} ms"
+        print(f"{label:<24} {elapsed * 1e3:7.1f} ms {extra:>17}")
+
+
+def main():
+    p = argparse.ArgumentParser(description="Compile src/protobuf/classes into the lazy protocols package")
+    p.add_argument("--compile", action="store_true", help="Regenerate modules whose .proto changed")
+    p.add_argument("--force", action="store_true", help="With --compile, regenerate everything")
+    p.add_argument("--check", action="store_true", help="Exit 1 if any generated module is out of date")
+    p.add_argument("--bench", action="store_true", help="Time startup imports in fresh interpreters")
+    p.add_argument("--repeat", type=int, default=9, help="Interpreters per benchmark case (default: 9)")
+    p.add_argument("--protoc", default="protoc", help="protoc executable (default: protoc on PATH)")
+    p.add_argument("--proto-dir", default=PROTO_DIR, help="Directory of .proto files")
+    args = p.parse_args()
+
+    if not (args.compile or args.check or args.bench):
+        p.print_help()
+        return
+
+    if args.check:
+        changed, removed, _ = stale_files(args.proto_dir)
+        if changed or removed:
+            print(f"out of date: {', '.join(changed + removed)}")
+            raise SystemExit(1)
+        print(f"{PACKAGE}/ is up to date with {len(proto_files(args.proto_dir))} .proto files")
+
+    if args.compile:
+        start = time.perf_counter()
+        compiled = compile_protos(args.proto_dir, args.protoc, args.force)
+        elapsed = time.perf_counter() - start
+        if compiled:
+            print(f"compiled {len(compiled)} .proto files in {elapsed:.2f} s")
+        else:
+            print(f"nothing to do ({elapsed * 1e3:.0f} ms)")
+
+    if args.bench:
+        run_benchmark(args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Generated protobuf modules for every .proto in src/protobuf/classes, imported lazily.
+
+Importing this package only loads the small generated index; a message
+module (and its descriptor pool entries) is imported the first time one of
+its types is used:
+
+    from protocols import Referee, SSL_WrapperPacket   # imports just those two modules
+    protocols.get('proto.gc.Referee')                   # by full name
+    protocols.module('ssl_gc_state_pb2')                # a whole generated module
+
+Short names that two packages both define are only reachable by full name.
+Regenerate with `python proto_registry.py --compile`.
+"""
+import importlib
+
+from ._index import MODULES, SHORT_NAMES
+
+__all__ = sorted(SHORT_NAMES)
+
+
+def module(name: str):
+    """Import and return a generated module, e.g. 'ssl_gc_referee_message_pb2'."""
+    return importlib.import_module(f'{__name__}.{name}')
+
+
+def get(full_name: str):
+    """Return the message or enum class registered under a full protobuf name, e.g. 'proto.gc.Referee'."""
+    try:
+        module_name = MODULES[full_name]
+    except KeyError:
+        raise KeyError(f"no generated type {full_name!r}") from None
+    return getattr(module(module_name), full_name.rpartition('.')[2])
+
+
+def __getattr__(name: str):
+    full_name = SHORT_NAMES.get(name)
+    if full_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = get(full_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(SHORT_NAMES))
@@ -0,0 +1,259 @@
+# Generated by proto_registry.py --compile. DO NOT EDIT.
+PROTOC_VERSION = 'libprotoc 29.2'
+
+PROTO_HASHES = {'ai_debug_info.proto': '5c10b66465c6d03c1321852aa5aaf52daef641f02ae4121c97a07bf7cd29dde8',
+ 'coordinated_pass_info.proto': '552ef4b1b3e51330b3a8ca9d1ebda38bc5ced7675f521b7e8dbb4d64a5a0a855',
+ 'filtered_object.proto': '81d070cfba60a6ac8e34e837f3c12b8ce9438927628a41e5a2593f4ef6bb07a4',
+ 'messages_robocup_ssl_detection.proto': '055fa0408af8d9e0ad3df2c97a81213572b748a1b3848e4b713f92fbb06f81af',
+ 'messages_robocup_ssl_detection_tracked.proto': '50c3a04e88b6f154f7934c6e2936ae2bd9c4d1a2fd0b18821ff6a7e70c6f1b3a',
+ 'messages_robocup_ssl_geometry.proto': '8cb167df9063d991573a8e56c3168defdc4629b2323adef3d19c4c9057794148',
+ 'messages_robocup_ssl_refbox_log.proto': '3ff93bf80efe490644727519f593305544cae4436f1d2366a1538607220a19fb',
+ 'messages_robocup_ssl_wrapper.proto': '3bfed765c0362a5408fe5690684329f7c8bb65ebc285db4b840d2b904ab65f29',
+ 'messages_robocup_ssl_wrapper_tracked.proto': '5ea8261e00fa2cff5cb561b5275dee16a89c9b21f9fb5cbf119ba8a4e4b1887b',
+ 'ssl_autoref_ci.proto': 'acdbe9e863e48e4dcd210577f2297a2cb006a791c58ab5458d2046e36049ed7e',
+ 'ssl_gc_api.proto': '496017a3b700f458d5746b71c8fa3153ff843cf3c8e348b76f565cf1d84b9f50',
+ 'ssl_gc_change.proto': 'd7275839bdf7f45683acf9e4398c060731bb37939907ab63584cababf05edbe5',
+ 'ssl_gc_ci.proto': '4ae5b171f0557fc2553a4a0f8abba51685dd9032c3483d49a189fcfab05a59de',
+ 'ssl_gc_common.proto': '221cc4d5ddfcf7003cce459949d253eee64c496489692ade20ff55b2f1b64dde',
+ 'ssl_gc_engine.proto': 'd575c20da694a1a6f8e62b4dda67b846915c4253d2abc0de0120d64d4925810e',
+ 'ssl_gc_engine_config.proto': 'c777ff83abdc2f7f56d0aee3dc82c5172cce5f922f006160ef4c630e2bffc91c',
+ 'ssl_gc_game_event.proto': '063d92e66b1f9dec826e966fbc7dcc9423ddaf56e18d4e51c38710f0f664a0c8',
+ 'ssl_gc_geometry.proto': '466b8ae1c240e8574e7e88b0fa76c3608be00757760a9835dcc663cd027d4b21',
+ 'ssl_gc_rcon.proto': '71a84a9434b893099f84e5f4ac489d53ecb7c8f5a9fdddf76b0054fd53ac7285',
+ 'ssl_gc_rcon_autoref.proto': '6b1a50d75f12a988c3ed78892245dcfddec6e7324ce452133b7278658fb6f60a',
+ 'ssl_gc_rcon_remotecontrol.proto': '3f629917393dc5f7c7d51ed573e73cc60ad77e6288417ca19bf8f27281b5fb97',
+ 'ssl_gc_rcon_team.proto': 'b624526cb6762074df36cfce2bda1454eaf59d05592be24e3191e3c4c7c00a50',
+ 'ssl_gc_referee_message.proto': 'ecd762a2a99f41b7881e5a6d71733ec2da55176d7a114cfa5bb4832b68090d5b',
+ 'ssl_gc_state.proto': 'beae4dfdb39917a93c7fb10bef3fdb0dd6b28ae38cb8a87d73ed1122ff5ff66a',
+ 'ssl_simulation_config.proto': 'd4261767b0d07c02eda23530da5af9f32d8a3601c715755d6f1240e5109271b0',
+ 'ssl_simulation_control.proto': '901489a3868e6a391a85cf3663cfaca52b65c732f37a5b37838b54948b77c2f5',
+ 'ssl_simulation_custom_erforce_robot_spec.proto': 'f08f95719e6e63b173ee3b2dc5d7b4e9cf9e181638105f23504396fca580910e',
+ 'ssl_simulation_error.proto': '943c6db8950c6a99666dc2b9fd191d8de3b7273b4daea5b9127660013f1fd66f',
+ 'ssl_simulation_robot_control.proto': '19fbdde965dc684cd68743adae2f2b2e20a7ed9533e9e8c6ea36dcd770fbe7ee',
+ 'ssl_simulation_robot_feedback.proto': 'ed06fbf8a71e2c804ec2f1b350d2e289e28c59fd97410c4fa0700247eaf71efc',
+ 'ssl_simulation_synchronous.proto': '02ca04d5ed3e00b4a7123c87bc8bc55eccb4343dfd441996b7eb1ebee5ce3a9d',
+ 'ssl_vision_detection.proto': '688e66191f038ab37410f8ce7f47dcfc84cdce0c9b31839f0aa2e6e61669e585',
+ 'ssl_vision_geometry.proto': '716c5d40cff5cbe0fa63a0b9b763756fb37930e1a6d234e4ba64543d618adca4',
+ 'triton_bot_communication.proto': 'c62587b6229606ffb4b6a300c143c2d9f267907095d97ee2791c99d9d8c83a2d'}
+
+# full protobuf name -> generated module
+MODULES = {'proto.gc.AdvantageChoice': 'ssl_gc_rcon_team_pb2',
+ 'proto.gc.AutoRefCiInput': 'ssl_autoref_ci_pb2',
+ 'proto.gc.AutoRefCiOutput': 'ssl_autoref_ci_pb2',
+ 'proto.gc.AutoRefConfig': 'ssl_gc_engine_config_pb2',
+ 'proto.gc.AutoRefRegistration': 'ssl_gc_rcon_autoref_pb2',
+ 'proto.gc.AutoRefToController': 'ssl_gc_rcon_autoref_pb2',
+ 'proto.gc.Ball': 'ssl_gc_engine_pb2',
+ 'proto.gc.Change': 'ssl_gc_change_pb2',
+ 'proto.gc.CiInput': 'ssl_gc_ci_pb2',
+ 'proto.gc.CiOutput': 'ssl_gc_ci_pb2',
+ 'proto.gc.Command': 'ssl_gc_state_pb2',
+ 'proto.gc.Config': 'ssl_gc_engine_config_pb2',
+ 'proto.gc.ContinueAction': 'ssl_gc_engine_pb2',
+ 'proto.gc.ContinueHint': 'ssl_gc_engine_pb2',
+ 'proto.gc.ControllerReply': 'ssl_gc_rcon_pb2',
+ 'proto.gc.ControllerToAutoRef': 'ssl_gc_rcon_autoref_pb2',
+ 'proto.gc.ControllerToRemoteControl': 'ssl_gc_rcon_remotecontrol_pb2',
+ 'proto.gc.ControllerToTeam': 'ssl_gc_rcon_team_pb2',
+ 'proto.gc.Foul': 'ssl_gc_state_pb2',
+ 'proto.gc.GameEvent': 'ssl_gc_game_event_pb2',
+ 'proto.gc.GameEventProposalGroup': 'ssl_gc_referee_message_pb2',
+ 'proto.gc.GameState': 'ssl_gc_state_pb2',
+ 'proto.gc.GcState': 'ssl_gc_engine_pb2',
+ 'proto.gc.GcStateAutoRef': 'ssl_gc_engine_pb2',
+ 'proto.gc.GcStateTeam': 'ssl_gc_engine_pb2',
+ 'proto.gc.GcStateTracker': 'ssl_gc_engine_pb2',
+ 'proto.gc.Input': 'ssl_gc_api_pb2',
+ 'proto.gc.MatchType': 'ssl_gc_referee_message_pb2',
+ 'proto.gc.Output': 'ssl_gc_api_pb2',
+ 'proto.gc.Proposal': 'ssl_gc_state_pb2',
+ 'proto.gc.ProposalGroup': 'ssl_gc_state_pb2',
+ 'proto.gc.Protocol': 'ssl_gc_api_pb2',
+ 'proto.gc.ProtocolEntry': 'ssl_gc_api_pb2',
+ 'proto.gc.RedCard': 'ssl_gc_state_pb2',
+ 'proto.gc.Referee': 'ssl_gc_referee_message_pb2',
+ 'proto.gc.RemoteControlRegistration': 'ssl_gc_rcon_remotecontrol_pb2',
+ 'proto.gc.RemoteControlRequestType': 'ssl_gc_rcon_remotecontrol_pb2',
+ 'proto.gc.RemoteControlTeamState': 'ssl_gc_rcon_remotecontrol_pb2',
+ 'proto.gc.RemoteControlToController': 'ssl_gc_rcon_remotecontrol_pb2',
+ 'proto.gc.Robot': 'ssl_gc_engine_pb2',
+ 'proto.gc.ShootoutState': 'ssl_gc_state_pb2',
+ 'proto.gc.Signature': 'ssl_gc_rcon_pb2',
+ 'proto.gc.State': 'ssl_gc_state_pb2',
+ 'proto.gc.StateChange': 'ssl_gc_change_pb2',
+ 'proto.gc.TeamAdvantageChoice': 'ssl_gc_engine_pb2',
+ 'proto.gc.TeamInfo': 'ssl_gc_state_pb2',
+ 'proto.gc.TeamRegistration': 'ssl_gc_rcon_team_pb2',
+ 'proto.gc.TeamToController': 'ssl_gc_rcon_team_pb2',
+ 'proto.gc.Vector2': 'ssl_gc_geometry_pb2',
+ 'proto.gc.Vector3': 'ssl_gc_geometry_pb2',
+ 'proto.gc.YellowCard': 'ssl_gc_state_pb2',
+ 'proto.simulation.Division': 'ssl_gc_common_pb2',
+ 'proto.simulation.MoveGlobalVelocity': 'ssl_simulation_robot_control_pb2',
+ 'proto.simulation.MoveLocalVelocity': 'ssl_simulation_robot_control_pb2',
+ 'proto.simulation.MoveWheelVelocity': 'ssl_simulation_robot_control_pb2',
+ 'proto.simulation.RealismConfig': 'ssl_simulation_config_pb2',
+ 'proto.simulation.RobotCommand': 'ssl_simulation_robot_control_pb2',
+ 'proto.simulation.RobotControl': 'ssl_simulation_robot_control_pb2',
+ 'proto.simulation.RobotControlResponse': 'ssl_simulation_robot_feedback_pb2',
+ 'proto.simulation.RobotFeedback': 'ssl_simulation_robot_feedback_pb2',
+ 'proto.simulation.RobotId': 'ssl_gc_common_pb2',
+ 'proto.simulation.RobotLimits': 'ssl_simulation_config_pb2',
+ 'proto.simulation.RobotMoveCommand': 'ssl_simulation_robot_control_pb2',
+ 'proto.simulation.RobotSpecs': 'ssl_simulation_config_pb2',
+ 'proto.simulation.RobotWheelAngles': 'ssl_simulation_config_pb2',
+ 'proto.simulation.SSL_BallModelChipFixedLoss': 'ssl_vision_geometry_pb2',
+ 'proto.simulation.SSL_BallModelStraightTwoPhase': 'ssl_vision_geometry_pb2',
+ 'proto.simulation.SSL_DetectionBall': 'ssl_vision_detection_pb2',
+ 'proto.simulation.SSL_DetectionFrame': 'ssl_vision_detection_pb2',
+ 'proto.simulation.SSL_DetectionRobot': 'ssl_vision_detection_pb2',
+ 'proto.simulation.SSL_FieldCircularArc': 'ssl_vision_geometry_pb2',
+ 'proto.simulation.SSL_FieldLineSegment': 'ssl_vision_geometry_pb2',
+ 'proto.simulation.SSL_FieldShapeType': 'ssl_vision_geometry_pb2',
+ 'proto.simulation.SSL_GeometryCameraCalibration': 'ssl_vision_geometry_pb2',
+ 'proto.simulation.SSL_GeometryData': 'ssl_vision_geometry_pb2',
+ 'proto.simulation.SSL_GeometryFieldSize': 'ssl_vision_geometry_pb2',
+ 'proto.simulation.SSL_GeometryModels': 'ssl_vision_geometry_pb2',
+ 'proto.simulation.SimulationSyncRequest': 'ssl_simulation_synchronous_pb2',
+ 'proto.simulation.SimulationSyncResponse': 'ssl_simulation_synchronous_pb2',
+ 'proto.simulation.SimulatorCommand': 'ssl_simulation_control_pb2',
+ 'proto.simulation.SimulatorConfig': 'ssl_simulation_config_pb2',
+ 'proto.simulation.SimulatorControl': 'ssl_simulation_control_pb2',
+ 'proto.simulation.SimulatorError': 'ssl_simulation_error_pb2',
+ 'proto.simulation.SimulatorResponse': 'ssl_simulation_control_pb2',
+ 'proto.simulation.Team': 'ssl_gc_common_pb2',
+ 'proto.simulation.TeleportBall': 'ssl_simulation_control_pb2',
+ 'proto.simulation.TeleportRobot': 'ssl_simulation_control_pb2',
+ 'proto.simulation.Vector2f': 'ssl_vision_geometry_pb2',
+ 'proto.triton.AllyCapture': 'filtered_object_pb2',
+ 'proto.triton.Ball': 'filtered_object_pb2',
+ 'proto.triton.CoordinatedPass': 'coordinated_pass_info_pb2',
+ 'proto.triton.Debug': 'ai_debug_info_pb2',
+ 'proto.triton.DebugPath': 'ai_debug_info_pb2',
+ 'proto.triton.DebugVector': 'ai_debug_info_pb2',
+ 'proto.triton.FilteredWrapperPacket': 'filtered_object_pb2',
+ 'proto.triton.FoeCapture': 'filtered_object_pb2',
+ 'proto.triton.Free': 'filtered_object_pb2',
+ 'proto.triton.MoveRobot': 'coordinated_pass_info_pb2',
+ 'proto.triton.Robot': 'filtered_object_pb2',
+ 'proto.triton.TritonBotMessage': 'triton_bot_communication_pb2',
+ 'proto.vision.Capability': 'messages_robocup_ssl_detection_tracked_pb2',
+ 'proto.vision.KickedBall': 'messages_robocup_ssl_detection_tracked_pb2',
+ 'proto.vision.Log_Frame': 'messages_robocup_ssl_refbox_log_pb2',
+ 'proto.vision.Refbox_Log': 'messages_robocup_ssl_refbox_log_pb2',
+ 'proto.vision.RobotId': 'messages_robocup_ssl_detection_tracked_pb2',
+ 'proto.vision.SSL_BallModelChipFixedLoss': 'messages_robocup_ssl_geometry_pb2',
+ 'proto.vision.SSL_BallModelStraightTwoPhase': 'messages_robocup_ssl_geometry_pb2',
+ 'proto.vision.SSL_DetectionBall': 'messages_robocup_ssl_detection_pb2',
+ 'proto.vision.SSL_DetectionFrame': 'messages_robocup_ssl_detection_pb2',
+ 'proto.vision.SSL_DetectionRobot': 'messages_robocup_ssl_detection_pb2',
+ 'proto.vision.SSL_FieldCircularArc': 'messages_robocup_ssl_geometry_pb2',
+ 'proto.vision.SSL_FieldLineSegment': 'messages_robocup_ssl_geometry_pb2',
+ 'proto.vision.SSL_FieldShapeType': 'messages_robocup_ssl_geometry_pb2',
+ 'proto.vision.SSL_GeometryCameraCalibration': 'messages_robocup_ssl_geometry_pb2',
+ 'proto.vision.SSL_GeometryData': 'messages_robocup_ssl_geometry_pb2',
+ 'proto.vision.SSL_GeometryFieldSize': 'messages_robocup_ssl_geometry_pb2',
+ 'proto.vision.SSL_GeometryModels': 'messages_robocup_ssl_geometry_pb2',
+ 'proto.vision.SSL_WrapperPacket': 'messages_robocup_ssl_wrapper_pb2',
+ 'proto.vision.TeamColor': 'messages_robocup_ssl_detection_tracked_pb2',
+ 'proto.vision.TrackedBall': 'messages_robocup_ssl_detection_tracked_pb2',
+ 'proto.vision.TrackedFrame': 'messages_robocup_ssl_detection_tracked_pb2',
+ 'proto.vision.TrackedRobot': 'messages_robocup_ssl_detection_tracked_pb2',
+ 'proto.vision.TrackerWrapperPacket': 'messages_robocup_ssl_wrapper_tracked_pb2',
+ 'proto.vision.Vector2': 'messages_robocup_ssl_detection_tracked_pb2',
+ 'proto.vision.Vector2f': 'messages_robocup_ssl_geometry_pb2',
+ 'proto.vision.Vector3': 'messages_robocup_ssl_detection_tracked_pb2',
+ 'sslsim.RobotSpecErForce': 'ssl_simulation_custom_erforce_robot_spec_pb2'}
+
+# short names defined by exactly one package
+SHORT_NAMES = {'AdvantageChoice': 'proto.gc.AdvantageChoice',
+ 'AllyCapture': 'proto.triton.AllyCapture',
+ 'AutoRefCiInput': 'proto.gc.AutoRefCiInput',
+ 'AutoRefCiOutput': 'proto.gc.AutoRefCiOutput',
+ 'AutoRefConfig': 'proto.gc.AutoRefConfig',
+ 'AutoRefRegistration': 'proto.gc.AutoRefRegistration',
+ 'AutoRefToController': 'proto.gc.AutoRefToController',
+ 'Capability': 'proto.vision.Capability',
+ 'Change': 'proto.gc.Change',
+ 'CiInput': 'proto.gc.CiInput',
+ 'CiOutput': 'proto.gc.CiOutput',
+ 'Command': 'proto.gc.Command',
+ 'Config': 'proto.gc.Config',
+ 'ContinueAction': 'proto.gc.ContinueAction',
+ 'ContinueHint': 'proto.gc.ContinueHint',
+ 'ControllerReply': 'proto.gc.ControllerReply',
+ 'ControllerToAutoRef': 'proto.gc.ControllerToAutoRef',
+ 'ControllerToRemoteControl': 'proto.gc.ControllerToRemoteControl',
+ 'ControllerToTeam': 'proto.gc.ControllerToTeam',
+ 'CoordinatedPass': 'proto.triton.CoordinatedPass',
+ 'Debug': 'proto.triton.Debug',
+ 'DebugPath': 'proto.triton.DebugPath',
+ 'DebugVector': 'proto.triton.DebugVector',
+ 'Division': 'proto.simulation.Division',
+ 'FilteredWrapperPacket': 'proto.triton.FilteredWrapperPacket',
+ 'FoeCapture': 'proto.triton.FoeCapture',
+ 'Foul': 'proto.gc.Foul',
+ 'Free': 'proto.triton.Free',
+ 'GameEvent': 'proto.gc.GameEvent',
+ 'GameEventProposalGroup': 'proto.gc.GameEventProposalGroup',
+ 'GameState': 'proto.gc.GameState',
+ 'GcState': 'proto.gc.GcState',
+ 'GcStateAutoRef': 'proto.gc.GcStateAutoRef',
+ 'GcStateTeam': 'proto.gc.GcStateTeam',
+ 'GcStateTracker': 'proto.gc.GcStateTracker',
+ 'Input': 'proto.gc.Input',
+ 'KickedBall': 'proto.vision.KickedBall',
+ 'Log_Frame': 'proto.vision.Log_Frame',
+ 'MatchType': 'proto.gc.MatchType',
+ 'MoveGlobalVelocity': 'proto.simulation.MoveGlobalVelocity',
+ 'MoveLocalVelocity': 'proto.simulation.MoveLocalVelocity',
+ 'MoveRobot': 'proto.triton.MoveRobot',
+ 'MoveWheelVelocity': 'proto.simulation.MoveWheelVelocity',
+ 'Output': 'proto.gc.Output',
+ 'Proposal': 'proto.gc.Proposal',
+ 'ProposalGroup': 'proto.gc.ProposalGroup',
+ 'Protocol': 'proto.gc.Protocol',
+ 'ProtocolEntry': 'proto.gc.ProtocolEntry',
+ 'RealismConfig': 'proto.simulation.RealismConfig',
+ 'RedCard': 'proto.gc.RedCard',
+ 'Refbox_Log': 'proto.vision.Refbox_Log',
+ 'Referee': 'proto.gc.Referee',
+ 'RemoteControlRegistration': 'proto.gc.RemoteControlRegistration',
+ 'RemoteControlRequestType': 'proto.gc.RemoteControlRequestType',
+ 'RemoteControlTeamState': 'proto.gc.RemoteControlTeamState',
+ 'RemoteControlToController': 'proto.gc.RemoteControlToController',
+ 'RobotCommand': 'proto.simulation.RobotCommand',
+ 'RobotControl': 'proto.simulation.RobotControl',
+ 'RobotControlResponse': 'proto.simulation.RobotControlResponse',
+ 'RobotFeedback': 'proto.simulation.RobotFeedback',
+ 'RobotLimits': 'proto.simulation.RobotLimits',
+ 'RobotMoveCommand': 'proto.simulation.RobotMoveCommand',
+ 'RobotSpecErForce': 'sslsim.RobotSpecErForce',
+ 'RobotSpecs': 'proto.simulation.RobotSpecs',
+ 'RobotWheelAngles': 'proto.simulation.RobotWheelAngles',
+ 'SSL_WrapperPacket': 'proto.vision.SSL_WrapperPacket',
+ 'ShootoutState': 'proto.gc.ShootoutState',
+ 'Signature': 'proto.gc.Signature',
+ 'SimulationSyncRequest': 'proto.simulation.SimulationSyncRequest',
+ 'SimulationSyncResponse': 'proto.simulation.SimulationSyncResponse',
+ 'SimulatorCommand': 'proto.simulation.SimulatorCommand',
+ 'SimulatorConfig': 'proto.simulation.SimulatorConfig',
+ 'SimulatorControl': 'proto.simulation.SimulatorControl',
+ 'SimulatorError': 'proto.simulation.SimulatorError',
+ 'SimulatorResponse': 'proto.simulation.SimulatorResponse',
+ 'State': 'proto.gc.State',
+ 'StateChange': 'proto.gc.StateChange',
+ 'Team': 'proto.simulation.Team',
+ 'TeamAdvantageChoice': 'proto.gc.TeamAdvantageChoice',
+ 'TeamColor': 'proto.vision.TeamColor',
+ 'TeamInfo': 'proto.gc.TeamInfo',
+ 'TeamRegistration': 'proto.gc.TeamRegistration',
+ 'TeamToController': 'proto.gc.TeamToController',
+ 'TeleportBall': 'proto.simulation.TeleportBall',
+ 'TeleportRobot': 'proto.simulation.TeleportRobot',
+ 'TrackedBall': 'proto.vision.TrackedBall',
+ 'TrackedFrame': 'proto.vision.TrackedFrame',
+ 'TrackedRobot': 'proto.vision.TrackedRobot',
+ 'TrackerWrapperPacket': 'proto.vision.TrackerWrapperPacket',
+ 'TritonBotMessage': 'proto.triton.TritonBotMessage',
+ 'YellowCard': 'proto.gc.YellowCard'}
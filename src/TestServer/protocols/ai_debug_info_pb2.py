@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: ai_debug_info.proto
+# Protobuf Python Version: 5.29.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    2,
+    '',
+    'ai_debug_info.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13\x61i_debug_info.proto\x12\x0cproto.triton\".\n\x05\x44\x65\x62ug\x12%\n\x04path\x18\x01 \x01(\x0b\x32\x17.proto.triton.DebugPath\"\xc3\x01\n\tDebugPath\x12\n\n\x02id\x18\x01 \x01(\x05\x12*\n\x07\x66romPos\x18\x03 \x01(\x0b\x32\x19.proto.triton.DebugVector\x12(\n\x05toPos\x18\x04 \x01(\x0b\x32\x19.proto.triton.DebugVector\x12*\n\x07nextPos\x18\x05 \x01(\x0b\x32\x19.proto.triton.DebugVector\x12(\n\x05nodes\x18\x02 \x03(\x0b\x32\x19.proto.triton.DebugVector\"#\n\x0b\x44\x65\x62ugVector\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ai_debug_info_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_DEBUG']._serialized_start=37
+  _globals['_DEBUG']._serialized_end=83
+  _globals['_DEBUGPATH']._serialized_start=86
+  _globals['_DEBUGPATH']._serialized_end=281
+  _globals['_DEBUGVECTOR']._serialized_start=283
+  _globals['_DEBUGVECTOR']._serialized_end=318
+# @@protoc_insertion_point(module_scope)
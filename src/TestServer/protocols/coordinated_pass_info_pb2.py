@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: coordinated_pass_info.proto
+# Protobuf Python Version: 5.29.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    2,
+    '',
+    'coordinated_pass_info.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1b\x63oordinated_pass_info.proto\x12\x0cproto.triton\"[\n\x0f\x43oordinatedPass\x12\x12\n\nreceiverID\x18\x01 \x01(\x05\x12\x10\n\x08senderID\x18\x02 \x01(\x05\x12\x10\n\x08passLocX\x18\x03 \x01(\x02\x12\x10\n\x08passLocY\x18\x04 \x01(\x02\"5\n\tMoveRobot\x12\x13\n\x0bmoveVectorX\x18\x01 \x01(\x02\x12\x13\n\x0bmoveVectorY\x18\x02 \x01(\x02\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'coordinated_pass_info_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_COORDINATEDPASS']._serialized_start=45
+  _globals['_COORDINATEDPASS']._serialized_end=136
+  _globals['_MOVEROBOT']._serialized_start=138
+  _globals['_MOVEROBOT']._serialized_end=191
+# @@protoc_insertion_point(module_scope)
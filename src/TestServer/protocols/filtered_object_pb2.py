@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: filtered_object.proto
+# Protobuf Python Version: 5.29.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    2,
+    '',
+    'filtered_object.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import messages_robocup_ssl_geometry_pb2 as messages__robocup__ssl__geometry__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x15\x66iltered_object.proto\x12\x0cproto.triton\x1a#messages_robocup_ssl_geometry.proto\"\xb8\x02\n\x04\x42\x61ll\x12\x11\n\ttimestamp\x18\x01 \x01(\x03\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\t\n\x01x\x18\x03 \x01(\x02\x12\t\n\x01y\x18\x04 \x01(\x02\x12\t\n\x01z\x18\x05 \x01(\x02\x12\n\n\x02vx\x18\x06 \x01(\x02\x12\n\n\x02vy\x18\x07 \x01(\x02\x12\n\n\x02vz\x18\x08 \x01(\x02\x12\r\n\x05\x61\x63\x63_x\x18\t \x01(\x02\x12\r\n\x05\x61\x63\x63_y\x18\n \x01(\x02\x12\r\n\x05\x61\x63\x63_z\x18\x0b \x01(\x02\x12\"\n\x04\x66ree\x18\x0c \x01(\x0b\x32\x12.proto.triton.FreeH\x00\x12\x31\n\x0c\x61lly_capture\x18\r \x01(\x0b\x32\x19.proto.triton.AllyCaptureH\x00\x12/\n\x0b\x66oe_capture\x18\x0e \x01(\x0b\x32\x18.proto.triton.FoeCaptureH\x00\x42\x0f\n\rcapture_state\"\x06\n\x04\x46ree\"\x19\n\x0b\x41llyCapture\x12\n\n\x02id\x18\x01 \x01(\x05\"\x18\n\nFoeCapture\x12\n\n\x02id\x18\x01 \x01(\x05\"\xf1\x01\n\x05Robot\x12\x11\n\ttimestamp\x18\x01 \x01(\x03\x12\n\n\x02id\x18\x02 \x01(\x05\x12\t\n\x01x\x18\x03 \x01(\x02\x12\t\n\x01y\x18\x04 \x01(\x02\x12\x13\n\x0borientation\x18\x05 \x01(\x02\x12\n\n\x02vx\x18\x06 \x01(\x02\x12\n\n\x02vy\x18\x07 \x01(\x02\x12\x0f\n\x07\x61ngular\x18\x08 \x01(\x02\x12\r\n\x05\x61\x63\x63_x\x18\t \x01(\x02\x12\r\n\x05\x61\x63\x63_y\x18\n \x01(\x02\x12\x13\n\x0b\x61\x63\x63_angular\x18\x0b \x01(\x02\x12\x10\n\x08has_ball\x18\x0c \x01(\x08\x12\x17\n\x0f\x64ribble_start_x\x18\r \x01(\x02\x12\x17\n\x0f\x64ribble_start_y\x18\x0e \x01(\x02\"\x84\x03\n\x15\x46ilteredWrapperPacket\x12\x11\n\ttimestamp\x18\x01 \x01(\x03\x12\x32\n\x05\x66ield\x18\x02 \x01(\x0b\x32#.proto.vision.SSL_GeometryFieldSize\x12 \n\x04\x62\x61ll\x18\x03 \x01(\x0b\x32\x12.proto.triton.Ball\x12?\n\x06\x61llies\x18\x04 \x03(\x0b\x32/.proto.triton.FilteredWrapperPacket.AlliesEntry\x12;\n\x04\x66oes\x18\x05 \x03(\x0b\x32-.proto.triton.FilteredWrapperPacket.FoesEntry\x1a\x42\n\x0b\x41lliesEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\"\n\x05value\x18\x02 \x01(\x0b\x32\x13.proto.triton.Robot:\x02\x38\x01\x1a@\n\tFoesEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\"\n\x05value\x18\x02 \x01(\x0b\x32\x13.proto.triton.Robot:\x02\x38\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'filtered_object_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_FILTEREDWRAPPERPACKET_ALLIESENTRY']._loaded_options = None
+  _globals['_FILTEREDWRAPPERPACKET_ALLIESENTRY']._serialized_options = b'8\001'
+  _globals['_FILTEREDWRAPPERPACKET_FOESENTRY']._loaded_options = None
+  _globals['_FILTEREDWRAPPERPACKET_FOESENTRY']._serialized_options = b'8\001'
+  _globals['_BALL']._serialized_start=77
+  _globals['_BALL']._serialized_end=389
+  _globals['_FREE']._serialized_start=391
+  _globals['_FREE']._serialized_end=397
+  _globals['_ALLYCAPTURE']._serialized_start=399
+  _globals['_ALLYCAPTURE']._serialized_end=424
+  _globals['_FOECAPTURE']._serialized_start=426
+  _globals['_FOECAPTURE']._serialized_end=450
+  _globals['_ROBOT']._serialized_start=453
+  _globals['_ROBOT']._serialized_end=694
+  _globals['_FILTEREDWRAPPERPACKET']._serialized_start=697
+  _globals['_FILTEREDWRAPPERPACKET']._serialized_end=1085
+  _globals['_FILTEREDWRAPPERPACKET_ALLIESENTRY']._serialized_start=953
+  _globals['_FILTEREDWRAPPERPACKET_ALLIESENTRY']._serialized_end=1019
+  _globals['_FILTEREDWRAPPERPACKET_FOESENTRY']._serialized_start=1021
+  _globals['_FILTEREDWRAPPERPACKET_FOESENTRY']._serialized_end=1085
+# @@protoc_insertion_point(module_scope)
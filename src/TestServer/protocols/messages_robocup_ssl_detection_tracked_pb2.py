@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: messages_robocup_ssl_detection_tracked.proto
+# Protobuf Python Version: 5.29.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    2,
+    '',
+    'messages_robocup_ssl_detection_tracked.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n,messages_robocup_ssl_detection_tracked.proto\x12\x0cproto.vision\"\x1f\n\x07Vector2\x12\t\n\x01x\x18\x01 \x02(\x02\x12\t\n\x01y\x18\x02 \x02(\x02\"*\n\x07Vector3\x12\t\n\x01x\x18\x01 \x02(\x02\x12\t\n\x01y\x18\x02 \x02(\x02\x12\t\n\x01z\x18\x03 \x02(\x02\"B\n\x07RobotId\x12\n\n\x02id\x18\x01 \x02(\r\x12+\n\nteam_color\x18\x02 \x02(\x0e\x32\x17.proto.vision.TeamColor\"i\n\x0bTrackedBall\x12\"\n\x03pos\x18\x01 \x02(\x0b\x32\x15.proto.vision.Vector3\x12\"\n\x03vel\x18\x02 \x01(\x0b\x32\x15.proto.vision.Vector3\x12\x12\n\nvisibility\x18\x03 \x01(\x02\"\xd7\x01\n\nKickedBall\x12\"\n\x03pos\x18\x01 \x02(\x0b\x32\x15.proto.vision.Vector2\x12\"\n\x03vel\x18\x02 \x02(\x0b\x32\x15.proto.vision.Vector3\x12\x17\n\x0fstart_timestamp\x18\x03 \x02(\x01\x12\x16\n\x0estop_timestamp\x18\x04 \x01(\x01\x12\'\n\x08stop_pos\x18\x05 \x01(\x0b\x32\x15.proto.vision.Vector2\x12\'\n\x08robot_id\x18\x06 \x01(\x0b\x32\x15.proto.vision.RobotId\"\xbd\x01\n\x0cTrackedRobot\x12\'\n\x08robot_id\x18\x01 \x02(\x0b\x32\x15.proto.vision.RobotId\x12\"\n\x03pos\x18\x02 \x02(\x0b\x32\x15.proto.vision.Vector2\x12\x13\n\x0borientation\x18\x03 \x02(\x02\x12\"\n\x03vel\x18\x04 \x01(\x0b\x32\x15.proto.vision.Vector2\x12\x13\n\x0bvel_angular\x18\x05 \x01(\x02\x12\x12\n\nvisibility\x18\x06 \x01(\x02\"\xec\x01\n\x0cTrackedFrame\x12\x14\n\x0c\x66rame_number\x18\x01 \x02(\r\x12\x11\n\ttimestamp\x18\x02 \x02(\x01\x12(\n\x05\x62\x61lls\x18\x03 \x03(\x0b\x32\x19.proto.vision.TrackedBall\x12*\n\x06robots\x18\x04 \x03(\x0b\x32\x1a.proto.vision.TrackedRobot\x12-\n\x0bkicked_ball\x18\x05 \x01(\x0b\x32\x18.proto.vision.KickedBall\x12.\n\x0c\x63\x61pabilities\x18\x06 \x03(\x0e\x32\x18.proto.vision.Capability*O\n\tTeamColor\x12\x16\n\x12TEAM_COLOR_UNKNOWN\x10\x00\x12\x15\n\x11TEAM_COLOR_YELLOW\x10\x01\x12\x13\n\x0fTEAM_COLOR_BLUE\x10\x02*\x92\x01\n\nCapability\x12\x16\n\x12\x43\x41PABILITY_UNKNOWN\x10\x00\x12\"\n\x1e\x43\x41PABILITY_DETECT_FLYING_BALLS\x10\x01\x12$\n CAPABILITY_DETECT_MULTIPLE_BALLS\x10\x02\x12\"\n\x1e\x43\x41PABILITY_DETECT_KICKED_BALLS\x10\x03')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'messages_robocup_ssl_detection_tracked_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_TEAMCOLOR']._serialized_start=963
+  _globals['_TEAMCOLOR']._serialized_end=1042
+  _globals['_CAPABILITY']._serialized_start=1045
+  _globals['_CAPABILITY']._serialized_end=1191
+  _globals['_VECTOR2']._serialized_start=62
+  _globals['_VECTOR2']._serialized_end=93
+  _globals['_VECTOR3']._serialized_start=95
+  _globals['_VECTOR3']._serialized_end=137
+  _globals['_ROBOTID']._serialized_start=139
+  _globals['_ROBOTID']._serialized_end=205
+  _globals['_TRACKEDBALL']._serialized_start=207
+  _globals['_TRACKEDBALL']._serialized_end=312
+  _globals['_KICKEDBALL']._serialized_start=315
+  _globals['_KICKEDBALL']._serialized_end=530
+  _globals['_TRACKEDROBOT']._serialized_start=533
+  _globals['_TRACKEDROBOT']._serialized_end=722
+  _globals['_TRACKEDFRAME']._serialized_start=725
+  _globals['_TRACKEDFRAME']._serialized_end=961
+# @@protoc_insertion_point(module_scope)
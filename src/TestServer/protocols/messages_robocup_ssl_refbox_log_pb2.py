@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: messages_robocup_ssl_refbox_log.proto
+# Protobuf Python Version: 5.29.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    2,
+    '',
+    'messages_robocup_ssl_refbox_log.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import messages_robocup_ssl_detection_pb2 as messages__robocup__ssl__detection__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n%messages_robocup_ssl_refbox_log.proto\x12\x0cproto.vision\x1a$messages_robocup_ssl_detection.proto\"P\n\tLog_Frame\x12/\n\x05\x66rame\x18\x01 \x02(\x0b\x32 .proto.vision.SSL_DetectionFrame\x12\x12\n\nrefbox_cmd\x18\x02 \x02(\t\"2\n\nRefbox_Log\x12$\n\x03log\x18\x01 \x03(\x0b\x32\x17.proto.vision.Log_Frame')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'messages_robocup_ssl_refbox_log_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_LOG_FRAME']._serialized_start=93
+  _globals['_LOG_FRAME']._serialized_end=173
+  _globals['_REFBOX_LOG']._serialized_start=175
+  _globals['_REFBOX_LOG']._serialized_end=225
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: messages_robocup_ssl_wrapper.proto
+# Protobuf Python Version: 5.29.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    2,
+    '',
+    'messages_robocup_ssl_wrapper.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import messages_robocup_ssl_detection_pb2 as messages__robocup__ssl__detection__pb2
+from . import messages_robocup_ssl_geometry_pb2 as messages__robocup__ssl__geometry__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\"messages_robocup_ssl_wrapper.proto\x12\x0cproto.vision\x1a$messages_robocup_ssl_detection.proto\x1a#messages_robocup_ssl_geometry.proto\"z\n\x11SSL_WrapperPacket\x12\x33\n\tdetection\x18\x01 \x01(\x0b\x32 .proto.vision.SSL_DetectionFrame\x12\x30\n\x08geometry\x18\x02 \x01(\x0b\x32\x1e.proto.vision.SSL_GeometryData')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'messages_robocup_ssl_wrapper_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_SSL_WRAPPERPACKET']._serialized_start=127
+  _globals['_SSL_WRAPPERPACKET']._serialized_end=249
+# @@protoc_insertion_point(module_scope)
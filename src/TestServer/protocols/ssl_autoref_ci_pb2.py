@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: ssl_autoref_ci.proto
+# Protobuf Python Version: 5.29.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    2,
+    '',
+    'ssl_autoref_ci.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import messages_robocup_ssl_wrapper_tracked_pb2 as messages__robocup__ssl__wrapper__tracked__pb2
+from . import ssl_gc_referee_message_pb2 as ssl__gc__referee__message__pb2
+from . import messages_robocup_ssl_geometry_pb2 as messages__robocup__ssl__geometry__pb2
+from . import messages_robocup_ssl_detection_pb2 as messages__robocup__ssl__detection__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14ssl_autoref_ci.proto\x12\x08proto.gc\x1a*messages_robocup_ssl_wrapper_tracked.proto\x1a\x1cssl_gc_referee_message.proto\x1a#messages_robocup_ssl_geometry.proto\x1a$messages_robocup_ssl_detection.proto\"\xe7\x01\n\x0e\x41utoRefCiInput\x12*\n\x0freferee_message\x18\x01 \x01(\x0b\x32\x11.proto.gc.Referee\x12\x42\n\x16tracker_wrapper_packet\x18\x02 \x01(\x0b\x32\".proto.vision.TrackerWrapperPacket\x12\x33\n\tdetection\x18\x03 \x03(\x0b\x32 .proto.vision.SSL_DetectionFrame\x12\x30\n\x08geometry\x18\x04 \x01(\x0b\x32\x1e.proto.vision.SSL_GeometryData\"U\n\x0f\x41utoRefCiOutput\x12\x42\n\x16tracker_wrapper_packet\x18\x01 \x01(\x0b\x32\".proto.vision.TrackerWrapperPacketBDZBgithub.com/RoboCup-SSL/ssl-game-controller/internal/app/ci/autoref')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ssl_autoref_ci_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'ZBgithub.com/RoboCup-SSL/ssl-game-controller/internal/app/ci/autoref'
+  _globals['_AUTOREFCIINPUT']._serialized_start=184
+  _globals['_AUTOREFCIINPUT']._serialized_end=415
+  _globals['_AUTOREFCIOUTPUT']._serialized_start=417
+  _globals['_AUTOREFCIOUTPUT']._serialized_end=502
+# @@protoc_insertion_point(module_scope)
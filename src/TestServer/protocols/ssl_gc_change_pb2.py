@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: ssl_gc_change.proto
+# Protobuf Python Version: 5.29.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    2,
+    '',
+    'ssl_gc_change.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import ssl_gc_state_pb2 as ssl__gc__state__pb2
+from . import ssl_gc_common_pb2 as ssl__gc__common__pb2
+from . import ssl_gc_geometry_pb2 as ssl__gc__geometry__pb2
+from . import ssl_gc_game_event_pb2 as ssl__gc__game__event__pb2
+from . import ssl_gc_referee_message_pb2 as ssl__gc__referee__message__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from google.protobuf import wrappers_pb2 as google_dot_protobuf_dot_wrappers__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13ssl_gc_change.proto\x12\x08proto.gc\x1a\x12ssl_gc_state.proto\x1a\x13ssl_gc_common.proto\x1a\x15ssl_gc_geometry.proto\x1a\x17ssl_gc_game_event.proto\x1a\x1cssl_gc_referee_message.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/wrappers.proto\"\xae\x01\n\x0bStateChange\x12\n\n\x02id\x18\x01 \x01(\x05\x12\"\n\tstate_pre\x18\x02 \x01(\x0b\x32\x0f.proto.gc.State\x12\x1e\n\x05state\x18\x03 \x01(\x0b\x32\x0f.proto.gc.State\x12 \n\x06\x63hange\x18\x04 \x01(\x0b\x32\x10.proto.gc.Change\x12-\n\ttimestamp\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xd4\x17\n\x06\x43hange\x12\x0e\n\x06origin\x18\x01 \x01(\t\x12\x12\n\nrevertible\x18\x10 \x01(\x08\x12\x39\n\x12new_command_change\x18\x02 \x01(\x0b\x32\x1b.proto.gc.Change.NewCommandH\x00\x12;\n\x13\x63hange_stage_change\x18\x03 \x01(\x0b\x32\x1c.proto.gc.Change.ChangeStageH\x00\x12M\n\x1dset_ball_placement_pos_change\x18\x04 \x01(\x0b\x32$.proto.gc.Change.SetBallPlacementPosH\x00\x12@\n\x16\x61\x64\x64_yellow_card_change\x18\x05 \x01(\x0b\x32\x1e.proto.gc.Change.AddYellowCardH\x00\x12:\n\x13\x61\x64\x64_red_card_change\x18\x06 \x01(\x0b\x32\x1b.proto.gc.Change.AddRedCardH\x00\x12\x42\n\x17yellow_card_over_change\x18\x07 \x01(\x0b\x32\x1f.proto.gc.Change.YellowCardOverH\x00\x12>\n\x15\x61\x64\x64_game_event_change\x18\x08 \x01(\x0b\x32\x1d.proto.gc.Change.AddGameEventH\x00\x12M\n\x1d\x61\x64\x64_passive_game_event_change\x18\x13 \x01(\x0b\x32$.proto.gc.Change.AddPassiveGameEventH\x00\x12;\n\x13\x61\x64\x64_proposal_change\x18\t \x01(\x0b\x32\x1c.proto.gc.Change.AddProposalH\x00\x12=\n\x14update_config_change\x18\x0c \x01(\x0b\x32\x1d.proto.gc.Change.UpdateConfigH\x00\x12\x44\n\x18update_team_state_change\x18\r \x01(\x0b\x32 .proto.gc.Change.UpdateTeamStateH\x00\x12=\n\x14switch_colors_change\x18\x0e \x01(\x0b\x32\x1d.proto.gc.Change.SwitchColorsH\x00\x12\x30\n\rrevert_change\x18\x0f \x01(\x0b\x32\x17.proto.gc.Change.RevertH\x00\x12>\n\x15new_game_state_change\x18\x11 \x01(\x0b\x32\x1d.proto.gc.Change.NewGameStateH\x00\x12L\n\x1c\x61\x63\x63\x65pt_proposal_group_change\x18\x12 \x01(\x0b\x32$.proto.gc.Change.AcceptProposalGroupH\x00\x1a\x30\n\nNewCommand\x12\"\n\x07\x63ommand\x18\x01 \x01(\x0b\x32\x11.proto.gc.Command\x1a\x39\n\x0b\x43hangeStage\x12*\n\tnew_stage\x18\x01 \x01(\x0e\x32\x17.proto.gc.Referee.Stage\x1a\x35\n\x13SetBallPlacementPos\x12\x1e\n\x03pos\x18\x01 \x01(\x0b\x32\x11.proto.gc.Vector2\x1al\n\rAddYellowCard\x12(\n\x08\x66or_team\x18\x01 \x01(\x0e\x32\x16.proto.simulation.Team\x12\x31\n\x14\x63\x61used_by_game_event\x18\x02 \x01(\x0b\x32\x13.proto.gc.GameEvent\x1ai\n\nAddRedCard\x12(\n\x08\x66or_team\x18\x01 \x01(\x0e\x32\x16.proto.simulation.Team\x12\x31\n\x14\x63\x61used_by_game_event\x18\x02 \x01(\x0b\x32\x13.proto.gc.GameEvent\x1a:\n\x0eYellowCardOver\x12(\n\x08\x66or_team\x18\x01 \x01(\x0e\x32\x16.proto.simulation.Team\x1a\x37\n\x0c\x41\x64\x64GameEvent\x12\'\n\ngame_event\x18\x01 \x01(\x0b\x32\x13.proto.gc.GameEvent\x1a>\n\x13\x41\x64\x64PassiveGameEvent\x12\'\n\ngame_event\x18\x01 \x01(\x0b\x32\x13.proto.gc.GameEvent\x1a\x33\n\x0b\x41\x64\x64Proposal\x12$\n\x08proposal\x18\x01 \x01(\x0b\x32\x12.proto.gc.Proposal\x1a<\n\x13\x41\x63\x63\x65ptProposalGroup\x12\x10\n\x08group_id\x18\x03 \x01(\t\x12\x13\n\x0b\x61\x63\x63\x65pted_by\x18\x02 \x01(\t\x1a\x9f\x01\n\x0cUpdateConfig\x12,\n\x08\x64ivision\x18\x01 \x01(\x0e\x32\x1a.proto.simulation.Division\x12\x32\n\x12\x66irst_kickoff_team\x18\x02 \x01(\x0e\x32\x16.proto.simulation.Team\x12\'\n\nmatch_type\x18\x04 \x01(\x0e\x32\x13.proto.gc.MatchTypeJ\x04\x08\x03\x10\x04\x1a\x95\x08\n\x0fUpdateTeamState\x12(\n\x08\x66or_team\x18\x01 \x01(\x0e\x32\x16.proto.simulation.Team\x12/\n\tteam_name\x18\x02 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12*\n\x05goals\x18\x03 \x01(\x0b\x32\x1b.google.protobuf.Int32Value\x12/\n\ngoalkeeper\x18\x04 \x01(\x0b\x32\x1b.google.protobuf.Int32Value\x12\x32\n\rtimeouts_left\x18\x05 \x01(\x0b\x32\x1b.google.protobuf.Int32Value\x12\x37\n\x11timeout_time_left\x18\x06 \x01(\x0b\x32\x1c.google.protobuf.StringValue\x12\x34\n\x10on_positive_half\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12<\n\x17\x62\x61ll_placement_failures\x18\x08 \x01(\x0b\x32\x1b.google.protobuf.Int32Value\x12\x32\n\x0e\x63\x61n_place_ball\x18\t \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x39\n\x14\x63hallenge_flags_left\x18\x15 \x01(\x0b\x32\x1b.google.protobuf.Int32Value\x12=\n\x19requests_bot_substitution\x18\n \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x34\n\x10requests_timeout\x18\x11 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12\x36\n\x12requests_challenge\x18\x12 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12;\n\x17requests_emergency_stop\x18\x13 \x01(\x0b\x32\x1a.google.protobuf.BoolValue\x12)\n\x0byellow_card\x18\x14 \x01(\x0b\x32\x14.proto.gc.YellowCard\x12#\n\x08red_card\x18\x0c \x01(\x0b\x32\x11.proto.gc.RedCard\x12\x1c\n\x04\x66oul\x18\r \x01(\x0b\x32\x0e.proto.gc.Foul\x12\x38\n\x12remove_yellow_card\x18\x0e \x01(\x0b\x32\x1c.google.protobuf.UInt32Value\x12\x35\n\x0fremove_red_card\x18\x0f \x01(\x0b\x32\x1c.google.protobuf.UInt32Value\x12\x31\n\x0bremove_foul\x18\x10 \x01(\x0b\x32\x1c.google.protobuf.UInt32Value\x1a\x0e\n\x0cSwitchColors\x1a\x1b\n\x06Revert\x12\x11\n\tchange_id\x18\x01 \x01(\x05\x1a\x37\n\x0cNewGameState\x12\'\n\ngame_state\x18\x01 \x01(\x0b\x32\x13.proto.gc.GameStateB\x08\n\x06\x63hangeBFZDgithub.com/RoboCup-SSL/ssl-game-controller/internal/app/statemachine')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ssl_gc_change_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'ZDgithub.com/RoboCup-SSL/ssl-game-controller/internal/app/statemachine'
+  _globals['_STATECHANGE']._serialized_start=218
+  _globals['_STATECHANGE']._serialized_end=392
+  _globals['_CHANGE']._serialized_start=395
+  _globals['_CHANGE']._serialized_end=3423
+  _globals['_CHANGE_NEWCOMMAND']._serialized_start=1426
+  _globals['_CHANGE_NEWCOMMAND']._serialized_end=1474
+  _globals['_CHANGE_CHANGESTAGE']._serialized_start=1476
+  _globals['_CHANGE_CHANGESTAGE']._serialized_end=1533
+  _globals['_CHANGE_SETBALLPLACEMENTPOS']._serialized_start=1535
+  _globals['_CHANGE_SETBALLPLACEMENTPOS']._serialized_end=1588
+  _globals['_CHANGE_ADDYELLOWCARD']._serialized_start=1590
+  _globals['_CHANGE_ADDYELLOWCARD']._serialized_end=1698
+  _globals['_CHANGE_ADDREDCARD']._serialized_start=1700
+  _globals['_CHANGE_ADDREDCARD']._serialized_end=1805
+  _globals['_CHANGE_YELLOWCARDOVER']._serialized_start=1807
+  _globals['_CHANGE_YELLOWCARDOVER']._serialized_end=1865
+  _globals['_CHANGE_ADDGAMEEVENT']._serialized_start=1867
+  _globals['_CHANGE_ADDGAMEEVENT']._serialized_end=1922
+  _globals['_CHANGE_ADDPASSIVEGAMEEVENT']._serialized_start=1924
+  _globals['_CHANGE_ADDPASSIVEGAMEEVENT']._serialized_end=1986
+  _globals['_CHANGE_ADDPROPOSAL']._serialized_start=1988
+  _globals['_CHANGE_ADDPROPOSAL']._serialized_end=2039
+  _globals['_CHANGE_ACCEPTPROPOSALGROUP']._serialized_start=2041
+  _globals['_CHANGE_ACCEPTPROPOSALGROUP']._serialized_end=2101
+  _globals['_CHANGE_UPDATECONFIG']._serialized_start=2104
+  _globals['_CHANGE_UPDATECONFIG']._serialized_end=2263
+  _globals['_CHANGE_UPDATETEAMSTATE']._serialized_start=2266
+  _globals['_CHANGE_UPDATETEAMSTATE']._serialized_end=3311
+  _globals['_CHANGE_SWITCHCOLORS']._serialized_start=3313
+  _globals['_CHANGE_SWITCHCOLORS']._serialized_end=3327
+  _globals['_CHANGE_REVERT']._serialized_start=3329
+  _globals['_CHANGE_REVERT']._serialized_end=3356
+  _globals['_CHANGE_NEWGAMESTATE']._serialized_start=3358
+  _globals['_CHANGE_NEWGAMESTATE']._serialized_end=3413
+# @@protoc_insertion_point(module_scope)
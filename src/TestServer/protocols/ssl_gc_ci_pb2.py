@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: ssl_gc_ci.proto
+# Protobuf Python Version: 5.29.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    2,
+    '',
+    'ssl_gc_ci.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import messages_robocup_ssl_wrapper_tracked_pb2 as messages__robocup__ssl__wrapper__tracked__pb2
+from . import ssl_gc_api_pb2 as ssl__gc__api__pb2
+from . import ssl_gc_referee_message_pb2 as ssl__gc__referee__message__pb2
+from . import messages_robocup_ssl_geometry_pb2 as messages__robocup__ssl__geometry__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0fssl_gc_ci.proto\x12\x08proto.gc\x1a*messages_robocup_ssl_wrapper_tracked.proto\x1a\x10ssl_gc_api.proto\x1a\x1cssl_gc_referee_message.proto\x1a#messages_robocup_ssl_geometry.proto\"\xaf\x01\n\x07\x43iInput\x12\x11\n\ttimestamp\x18\x01 \x01(\x03\x12:\n\x0etracker_packet\x18\x02 \x01(\x0b\x32\".proto.vision.TrackerWrapperPacket\x12#\n\napi_inputs\x18\x03 \x03(\x0b\x32\x0f.proto.gc.Input\x12\x30\n\x08geometry\x18\x04 \x01(\x0b\x32\x1e.proto.vision.SSL_GeometryData\"2\n\x08\x43iOutput\x12&\n\x0breferee_msg\x18\x01 \x01(\x0b\x32\x11.proto.gc.RefereeB<Z:github.com/RoboCup-SSL/ssl-game-controller/internal/app/ci')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ssl_gc_ci_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z:github.com/RoboCup-SSL/ssl-game-controller/internal/app/ci'
+  _globals['_CIINPUT']._serialized_start=159
+  _globals['_CIINPUT']._serialized_end=334
+  _globals['_CIOUTPUT']._serialized_start=336
+  _globals['_CIOUTPUT']._serialized_end=386
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: ssl_gc_engine.proto
+# Protobuf Python Version: 5.29.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    2,
+    '',
+    'ssl_gc_engine.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import ssl_gc_geometry_pb2 as ssl__gc__geometry__pb2
+from . import ssl_gc_common_pb2 as ssl__gc__common__pb2
+from . import messages_robocup_ssl_detection_tracked_pb2 as messages__robocup__ssl__detection__tracked__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13ssl_gc_engine.proto\x12\x08proto.gc\x1a\x15ssl_gc_geometry.proto\x1a\x13ssl_gc_common.proto\x1a,messages_robocup_ssl_detection_tracked.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"\xdc\x03\n\x07GcState\x12\x34\n\nteam_state\x18\x01 \x03(\x0b\x32 .proto.gc.GcState.TeamStateEntry\x12;\n\x0e\x61uto_ref_state\x18\x02 \x03(\x0b\x32#.proto.gc.GcState.AutoRefStateEntry\x12\x31\n\x08trackers\x18\x03 \x03(\x0b\x32\x1f.proto.gc.GcState.TrackersEntry\x12\x32\n\x10\x63ontinue_actions\x18\x04 \x03(\x0b\x32\x18.proto.gc.ContinueAction\x12.\n\x0e\x63ontinue_hints\x18\x05 \x03(\x0b\x32\x16.proto.gc.ContinueHint\x1aG\n\x0eTeamStateEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12$\n\x05value\x18\x02 \x01(\x0b\x32\x15.proto.gc.GcStateTeam:\x02\x38\x01\x1aM\n\x11\x41utoRefStateEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\'\n\x05value\x18\x02 \x01(\x0b\x32\x18.proto.gc.GcStateAutoRef:\x02\x38\x01\x1a/\n\rTrackersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xc4\x01\n\x0bGcStateTeam\x12\x11\n\tconnected\x18\x01 \x01(\x08\x12\x1b\n\x13\x63onnection_verified\x18\x02 \x01(\x08\x12 \n\x18remote_control_connected\x18\x03 \x01(\x08\x12*\n\"remote_control_connection_verified\x18\x04 \x01(\x08\x12\x37\n\x10\x61\x64vantage_choice\x18\x05 \x01(\x0b\x32\x1d.proto.gc.TeamAdvantageChoice\"\x7f\n\x13TeamAdvantageChoice\x12=\n\x06\x63hoice\x18\x01 \x01(\x0e\x32-.proto.gc.TeamAdvantageChoice.AdvantageChoice\")\n\x0f\x41\x64vantageChoice\x12\x08\n\x04STOP\x10\x00\x12\x0c\n\x08\x43ONTINUE\x10\x01\"-\n\x0eGcStateAutoRef\x12\x1b\n\x13\x63onnection_verified\x18\x01 \x01(\x08\"r\n\x0eGcStateTracker\x12\x13\n\x0bsource_name\x18\x01 \x01(\t\x12\x0c\n\x04uuid\x18\x04 \x01(\t\x12\x1c\n\x04\x62\x61ll\x18\x02 \x01(\x0b\x32\x0e.proto.gc.Ball\x12\x1f\n\x06robots\x18\x03 \x03(\x0b\x32\x0f.proto.gc.Robot\"F\n\x04\x42\x61ll\x12\x1e\n\x03pos\x18\x01 \x01(\x0b\x32\x11.proto.gc.Vector3\x12\x1e\n\x03vel\x18\x02 \x01(\x0b\x32\x11.proto.gc.Vector3\"J\n\x05Robot\x12!\n\x02id\x18\x01 \x01(\x0b\x32\x15.proto.vision.RobotId\x12\x1e\n\x03pos\x18\x02 \x01(\x0b\x32\x11.proto.gc.Vector2\"\xd6\x05\n\x0e\x43ontinueAction\x12+\n\x04type\x18\x01 \x02(\x0e\x32\x1d.proto.gc.ContinueAction.Type\x12(\n\x08\x66or_team\x18\x02 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x1b\n\x13\x63ontinuation_issues\x18\x03 \x03(\t\x12,\n\x08ready_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12-\n\x05state\x18\x05 \x01(\x0e\x32\x1e.proto.gc.ContinueAction.State\"\x8c\x03\n\x04Type\x12\x10\n\x0cTYPE_UNKNOWN\x10\x00\x12\x08\n\x04HALT\x10\x01\x12\x14\n\x10RESUME_FROM_HALT\x10\n\x12\r\n\tSTOP_GAME\x10\x02\x12\x0f\n\x0b\x46ORCE_START\x10\x0b\x12\r\n\tFREE_KICK\x10\x11\x12\x10\n\x0cNEXT_COMMAND\x10\x03\x12\x18\n\x14\x42\x41LL_PLACEMENT_START\x10\x04\x12\x19\n\x15\x42\x41LL_PLACEMENT_CANCEL\x10\t\x12\x1b\n\x17\x42\x41LL_PLACEMENT_COMPLETE\x10\x0e\x12\x17\n\x13\x42\x41LL_PLACEMENT_FAIL\x10\x0f\x12\x11\n\rTIMEOUT_START\x10\x05\x12\x10\n\x0cTIMEOUT_STOP\x10\x06\x12\x14\n\x10\x42OT_SUBSTITUTION\x10\x07\x12\x0e\n\nNEXT_STAGE\x10\x08\x12\x0c\n\x08\x45ND_GAME\x10\x10\x12\x0f\n\x0b\x41\x43\x43\x45PT_GOAL\x10\x0c\x12\x10\n\x0cNORMAL_START\x10\r\x12\x14\n\x10\x43HALLENGE_ACCEPT\x10\x12\x12\x14\n\x10\x43HALLENGE_REJECT\x10\x13\"d\n\x05State\x12\x11\n\rSTATE_UNKNOWN\x10\x00\x12\x0b\n\x07\x42LOCKED\x10\x01\x12\x0b\n\x07WAITING\x10\x02\x12\x0e\n\nREADY_AUTO\x10\x03\x12\x10\n\x0cREADY_MANUAL\x10\x04\x12\x0c\n\x08\x44ISABLED\x10\x05\"\x1f\n\x0c\x43ontinueHint\x12\x0f\n\x07message\x18\x01 \x02(\tB@Z>github.com/RoboCup-SSL/ssl-game-controller/internal/app/engine')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ssl_gc_engine_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z>github.com/RoboCup-SSL/ssl-game-controller/internal/app/engine'
+  _globals['_GCSTATE_TEAMSTATEENTRY']._loaded_options = None
+  _globals['_GCSTATE_TEAMSTATEENTRY']._serialized_options = b'8\001'
+  _globals['_GCSTATE_AUTOREFSTATEENTRY']._loaded_options = None
+  _globals['_GCSTATE_AUTOREFSTATEENTRY']._serialized_options = b'8\001'
+  _globals['_GCSTATE_TRACKERSENTRY']._loaded_options = None
+  _globals['_GCSTATE_TRACKERSENTRY']._serialized_options = b'8\001'
+  _globals['_GCSTATE']._serialized_start=157
+  _globals['_GCSTATE']._serialized_end=633
+  _globals['_GCSTATE_TEAMSTATEENTRY']._serialized_start=434
+  _globals['_GCSTATE_TEAMSTATEENTRY']._serialized_end=505
+  _globals['_GCSTATE_AUTOREFSTATEENTRY']._serialized_start=507
+  _globals['_GCSTATE_AUTOREFSTATEENTRY']._serialized_end=584
+  _globals['_GCSTATE_TRACKERSENTRY']._serialized_start=586
+  _globals['_GCSTATE_TRACKERSENTRY']._serialized_end=633
+  _globals['_GCSTATETEAM']._serialized_start=636
+  _globals['_GCSTATETEAM']._serialized_end=832
+  _globals['_TEAMADVANTAGECHOICE']._serialized_start=834
+  _globals['_TEAMADVANTAGECHOICE']._serialized_end=961
+  _globals['_TEAMADVANTAGECHOICE_ADVANTAGECHOICE']._serialized_start=920
+  _globals['_TEAMADVANTAGECHOICE_ADVANTAGECHOICE']._serialized_end=961
+  _globals['_GCSTATEAUTOREF']._serialized_start=963
+  _globals['_GCSTATEAUTOREF']._serialized_end=1008
+  _globals['_GCSTATETRACKER']._serialized_start=1010
+  _globals['_GCSTATETRACKER']._serialized_end=1124
+  _globals['_BALL']._serialized_start=1126
+  _globals['_BALL']._serialized_end=1196
+  _globals['_ROBOT']._serialized_start=1198
+  _globals['_ROBOT']._serialized_end=1272
+  _globals['_CONTINUEACTION']._serialized_start=1275
+  _globals['_CONTINUEACTION']._serialized_end=2001
+  _globals['_CONTINUEACTION_TYPE']._serialized_start=1503
+  _globals['_CONTINUEACTION_TYPE']._serialized_end=1899
+  _globals['_CONTINUEACTION_STATE']._serialized_start=1901
+  _globals['_CONTINUEACTION_STATE']._serialized_end=2001
+  _globals['_CONTINUEHINT']._serialized_start=2003
+  _globals['_CONTINUEHINT']._serialized_end=2034
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: ssl_gc_game_event.proto
+# Protobuf Python Version: 5.29.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    2,
+    '',
+    'ssl_gc_game_event.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import ssl_gc_common_pb2 as ssl__gc__common__pb2
+from . import ssl_gc_geometry_pb2 as ssl__gc__geometry__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x17ssl_gc_game_event.proto\x12\x08proto.gc\x1a\x13ssl_gc_common.proto\x1a\x15ssl_gc_geometry.proto\"\xddJ\n\tGameEvent\x12\n\n\x02id\x18\x32 \x01(\t\x12&\n\x04type\x18( \x01(\x0e\x32\x18.proto.gc.GameEvent.Type\x12\x0e\n\x06origin\x18) \x03(\t\x12\x19\n\x11\x63reated_timestamp\x18\x31 \x01(\x04\x12G\n\x1a\x62\x61ll_left_field_touch_line\x18\x06 \x01(\x0b\x32!.proto.gc.GameEvent.BallLeftFieldH\x00\x12\x46\n\x19\x62\x61ll_left_field_goal_line\x18\x07 \x01(\x0b\x32!.proto.gc.GameEvent.BallLeftFieldH\x00\x12\x37\n\x0c\x61imless_kick\x18\x0b \x01(\x0b\x32\x1f.proto.gc.GameEvent.AimlessKickH\x00\x12_\n\"attacker_too_close_to_defense_area\x18\x13 \x01(\x0b\x32\x31.proto.gc.GameEvent.AttackerTooCloseToDefenseAreaH\x00\x12M\n\x18\x64\x65\x66\x65nder_in_defense_area\x18\x1f \x01(\x0b\x32).proto.gc.GameEvent.DefenderInDefenseAreaH\x00\x12\x41\n\x11\x62oundary_crossing\x18+ \x01(\x0b\x32$.proto.gc.GameEvent.BoundaryCrossingH\x00\x12>\n\x10keeper_held_ball\x18\r \x01(\x0b\x32\".proto.gc.GameEvent.KeeperHeldBallH\x00\x12N\n\x19\x62ot_dribbled_ball_too_far\x18\x11 \x01(\x0b\x32).proto.gc.GameEvent.BotDribbledBallTooFarH\x00\x12:\n\x0e\x62ot_pushed_bot\x18\x18 \x01(\x0b\x32 .proto.gc.GameEvent.BotPushedBotH\x00\x12Q\n\x1a\x62ot_held_ball_deliberately\x18\x1a \x01(\x0b\x32+.proto.gc.GameEvent.BotHeldBallDeliberatelyH\x00\x12<\n\x0f\x62ot_tipped_over\x18\x1b \x01(\x0b\x32!.proto.gc.GameEvent.BotTippedOverH\x00\x12\x65\n%attacker_touched_ball_in_defense_area\x18\x0f \x01(\x0b\x32\x34.proto.gc.GameEvent.AttackerTouchedBallInDefenseAreaH\x00\x12L\n\x18\x62ot_kicked_ball_too_fast\x18\x12 \x01(\x0b\x32(.proto.gc.GameEvent.BotKickedBallTooFastH\x00\x12>\n\x10\x62ot_crash_unique\x18\x16 \x01(\x0b\x32\".proto.gc.GameEvent.BotCrashUniqueH\x00\x12<\n\x0f\x62ot_crash_drawn\x18\x15 \x01(\x0b\x32!.proto.gc.GameEvent.BotCrashDrawnH\x00\x12[\n defender_too_close_to_kick_point\x18\x1d \x01(\x0b\x32/.proto.gc.GameEvent.DefenderTooCloseToKickPointH\x00\x12\x44\n\x14\x62ot_too_fast_in_stop\x18\x1c \x01(\x0b\x32$.proto.gc.GameEvent.BotTooFastInStopH\x00\x12N\n\x18\x62ot_interfered_placement\x18\x14 \x01(\x0b\x32*.proto.gc.GameEvent.BotInterferedPlacementH\x00\x12\x31\n\rpossible_goal\x18\' \x01(\x0b\x32\x18.proto.gc.GameEvent.GoalH\x00\x12(\n\x04goal\x18\x08 \x01(\x0b\x32\x18.proto.gc.GameEvent.GoalH\x00\x12\x30\n\x0cinvalid_goal\x18, \x01(\x0b\x32\x18.proto.gc.GameEvent.GoalH\x00\x12U\n\x1c\x61ttacker_double_touched_ball\x18\x0e \x01(\x0b\x32-.proto.gc.GameEvent.AttackerDoubleTouchedBallH\x00\x12\x45\n\x13placement_succeeded\x18\x05 \x01(\x0b\x32&.proto.gc.GameEvent.PlacementSucceededH\x00\x12\x44\n\x13penalty_kick_failed\x18- \x01(\x0b\x32%.proto.gc.GameEvent.PenaltyKickFailedH\x00\x12\x43\n\x13no_progress_in_game\x18\x02 \x01(\x0b\x32$.proto.gc.GameEvent.NoProgressInGameH\x00\x12?\n\x10placement_failed\x18\x03 \x01(\x0b\x32#.proto.gc.GameEvent.PlacementFailedH\x00\x12;\n\x0emultiple_cards\x18  \x01(\x0b\x32!.proto.gc.GameEvent.MultipleCardsH\x00\x12;\n\x0emultiple_fouls\x18\" \x01(\x0b\x32!.proto.gc.GameEvent.MultipleFoulsH\x00\x12?\n\x10\x62ot_substitution\x18% \x01(\x0b\x32#.proto.gc.GameEvent.BotSubstitutionH\x00\x12<\n\x0ftoo_many_robots\x18& \x01(\x0b\x32!.proto.gc.GameEvent.TooManyRobotsH\x00\x12;\n\x0e\x63hallenge_flag\x18. \x01(\x0b\x32!.proto.gc.GameEvent.ChallengeFlagH\x00\x12J\n\x16\x63hallenge_flag_handled\x18\x30 \x01(\x0b\x32(.proto.gc.GameEvent.ChallengeFlagHandledH\x00\x12;\n\x0e\x65mergency_stop\x18/ \x01(\x0b\x32!.proto.gc.GameEvent.EmergencyStopH\x00\x12P\n\x19unsporting_behavior_minor\x18# \x01(\x0b\x32+.proto.gc.GameEvent.UnsportingBehaviorMinorH\x00\x12P\n\x19unsporting_behavior_major\x18$ \x01(\x0b\x32+.proto.gc.GameEvent.UnsportingBehaviorMajorH\x00\x12\x34\n\x08prepared\x18\x01 \x01(\x0b\x32\x1c.proto.gc.GameEvent.PreparedB\x02\x18\x01H\x00\x12=\n\rindirect_goal\x18\t \x01(\x0b\x32 .proto.gc.GameEvent.IndirectGoalB\x02\x18\x01H\x00\x12;\n\x0c\x63hipped_goal\x18\n \x01(\x0b\x32\x1f.proto.gc.GameEvent.ChippedGoalB\x02\x18\x01H\x00\x12;\n\x0ckick_timeout\x18\x0c \x01(\x0b\x32\x1f.proto.gc.GameEvent.KickTimeoutB\x02\x18\x01H\x00\x12q\n)attacker_touched_opponent_in_defense_area\x18\x10 \x01(\x0b\x32\x38.proto.gc.GameEvent.AttackerTouchedOpponentInDefenseAreaB\x02\x18\x01H\x00\x12y\n1attacker_touched_opponent_in_defense_area_skipped\x18* \x01(\x0b\x32\x38.proto.gc.GameEvent.AttackerTouchedOpponentInDefenseAreaB\x02\x18\x01H\x00\x12J\n\x18\x62ot_crash_unique_skipped\x18\x17 \x01(\x0b\x32\".proto.gc.GameEvent.BotCrashUniqueB\x02\x18\x01H\x00\x12\x46\n\x16\x62ot_pushed_bot_skipped\x18\x19 \x01(\x0b\x32 .proto.gc.GameEvent.BotPushedBotB\x02\x18\x01H\x00\x12\x64\n\"defender_in_defense_area_partially\x18\x1e \x01(\x0b\x32\x32.proto.gc.GameEvent.DefenderInDefenseAreaPartiallyB\x02\x18\x01H\x00\x12X\n\x1bmultiple_placement_failures\x18! \x01(\x0b\x32-.proto.gc.GameEvent.MultiplePlacementFailuresB\x02\x18\x01H\x00\x1am\n\rBallLeftField\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x1a\x95\x01\n\x0b\x41imlessKick\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x12(\n\rkick_location\x18\x04 \x01(\x0b\x32\x11.proto.gc.Vector2\x1a\xa3\x02\n\x04Goal\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12,\n\x0ckicking_team\x18\x06 \x01(\x0e\x32\x16.proto.simulation.Team\x12\x13\n\x0bkicking_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x12(\n\rkick_location\x18\x04 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x17\n\x0fmax_ball_height\x18\x05 \x01(\x02\x12\x1a\n\x12num_robots_by_team\x18\x07 \x01(\r\x12\x1a\n\x12last_touch_by_team\x18\x08 \x01(\x04\x12\x0f\n\x07message\x18\t \x01(\t\x1a\x96\x01\n\x0cIndirectGoal\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x12(\n\rkick_location\x18\x04 \x01(\x0b\x32\x11.proto.gc.Vector2\x1a\xae\x01\n\x0b\x43hippedGoal\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x12(\n\rkick_location\x18\x04 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x17\n\x0fmax_ball_height\x18\x05 \x01(\x02\x1a\x7f\n\x10\x42otTooFastInStop\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\r\n\x05speed\x18\x04 \x01(\x02\x1a\x8d\x01\n\x1b\x44\x65\x66\x65nderTooCloseToKickPoint\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x10\n\x08\x64istance\x18\x04 \x01(\x02\x1a\x98\x01\n\rBotCrashDrawn\x12\x12\n\nbot_yellow\x18\x01 \x01(\r\x12\x10\n\x08\x62ot_blue\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x13\n\x0b\x63rash_speed\x18\x04 \x01(\x02\x12\x12\n\nspeed_diff\x18\x05 \x01(\x02\x12\x13\n\x0b\x63rash_angle\x18\x06 \x01(\x02\x1a\xbe\x01\n\x0e\x42otCrashUnique\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x10\n\x08violator\x18\x02 \x01(\r\x12\x0e\n\x06victim\x18\x03 \x01(\r\x12#\n\x08location\x18\x04 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x13\n\x0b\x63rash_speed\x18\x05 \x01(\x02\x12\x12\n\nspeed_diff\x18\x06 \x01(\x02\x12\x13\n\x0b\x63rash_angle\x18\x07 \x01(\x02\x1a\x97\x01\n\x0c\x42otPushedBot\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x10\n\x08violator\x18\x02 \x01(\r\x12\x0e\n\x06victim\x18\x03 \x01(\r\x12#\n\x08location\x18\x04 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x17\n\x0fpushed_distance\x18\x05 \x01(\x02\x1a\x97\x01\n\rBotTippedOver\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x12(\n\rball_location\x18\x04 \x01(\x0b\x32\x11.proto.gc.Vector2\x1a\x87\x01\n\x15\x44\x65\x66\x65nderInDefenseArea\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x10\n\x08\x64istance\x18\x04 \x01(\x02\x1a\xba\x01\n\x1e\x44\x65\x66\x65nderInDefenseAreaPartially\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x10\n\x08\x64istance\x18\x04 \x01(\x02\x12(\n\rball_location\x18\x05 \x01(\x0b\x32\x11.proto.gc.Vector2\x1a\x92\x01\n AttackerTouchedBallInDefenseArea\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x10\n\x08\x64istance\x18\x04 \x01(\x02\x1a\xa1\x01\n\x14\x42otKickedBallTooFast\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x1a\n\x12initial_ball_speed\x18\x04 \x01(\x02\x12\x0f\n\x07\x63hipped\x18\x05 \x01(\x08\x1a\x92\x01\n\x15\x42otDribbledBallTooFar\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12 \n\x05start\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x1e\n\x03\x65nd\x18\x04 \x01(\x0b\x32\x11.proto.gc.Vector2\x1a\x94\x01\n$AttackerTouchedOpponentInDefenseArea\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12\x0e\n\x06victim\x18\x04 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x1ay\n\x19\x41ttackerDoubleTouchedBall\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x1a\xb9\x01\n\x1d\x41ttackerTooCloseToDefenseArea\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x10\n\x08\x64istance\x18\x04 \x01(\x02\x12(\n\rball_location\x18\x05 \x01(\x0b\x32\x11.proto.gc.Vector2\x1a\x89\x01\n\x17\x42otHeldBallDeliberately\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x10\n\x08\x64uration\x18\x04 \x01(\x02\x1av\n\x16\x42otInterferedPlacement\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06\x62y_bot\x18\x02 \x01(\r\x12#\n\x08location\x18\x03 \x01(\x0b\x32\x11.proto.gc.Vector2\x1a\x38\n\rMultipleCards\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x1ai\n\rMultipleFouls\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12/\n\x12\x63\x61used_game_events\x18\x02 \x03(\x0b\x32\x13.proto.gc.GameEvent\x1a\x44\n\x19MultiplePlacementFailures\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x1ai\n\x0bKickTimeout\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12#\n\x08location\x18\x02 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x0c\n\x04time\x18\x03 \x01(\x02\x1a\x45\n\x10NoProgressInGame\x12#\n\x08location\x18\x01 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x0c\n\x04time\x18\x02 \x01(\x02\x1aV\n\x0fPlacementFailed\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x1a\n\x12remaining_distance\x18\x02 \x01(\x02\x1aR\n\x17UnsportingBehaviorMinor\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06reason\x18\x02 \x02(\t\x1aR\n\x17UnsportingBehaviorMajor\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x0e\n\x06reason\x18\x02 \x02(\t\x1ap\n\x0eKeeperHeldBall\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12#\n\x08location\x18\x02 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x10\n\x08\x64uration\x18\x03 \x01(\x02\x1av\n\x12PlacementSucceeded\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x12\n\ntime_taken\x18\x02 \x01(\x02\x12\x11\n\tprecision\x18\x03 \x01(\x02\x12\x10\n\x08\x64istance\x18\x04 \x01(\x02\x1a\x1e\n\x08Prepared\x12\x12\n\ntime_taken\x18\x01 \x01(\x02\x1a:\n\x0f\x42otSubstitution\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x1a\x38\n\rChallengeFlag\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x1aQ\n\x14\x43hallengeFlagHandled\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x10\n\x08\x61\x63\x63\x65pted\x18\x02 \x02(\x08\x1a\x38\n\rEmergencyStop\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x1a\x9b\x01\n\rTooManyRobots\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12\x1a\n\x12num_robots_allowed\x18\x02 \x01(\x05\x12\x1b\n\x13num_robots_on_field\x18\x03 \x01(\x05\x12(\n\rball_location\x18\x04 \x01(\x0b\x32\x11.proto.gc.Vector2\x1a`\n\x10\x42oundaryCrossing\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12#\n\x08location\x18\x02 \x01(\x0b\x32\x11.proto.gc.Vector2\x1aq\n\x11PenaltyKickFailed\x12\'\n\x07\x62y_team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12#\n\x08location\x18\x02 \x01(\x0b\x32\x11.proto.gc.Vector2\x12\x0e\n\x06reason\x18\x03 \x01(\t\"\xfe\t\n\x04Type\x12\x1b\n\x17UNKNOWN_GAME_EVENT_TYPE\x10\x00\x12\x1e\n\x1a\x42\x41LL_LEFT_FIELD_TOUCH_LINE\x10\x06\x12\x1d\n\x19\x42\x41LL_LEFT_FIELD_GOAL_LINE\x10\x07\x12\x10\n\x0c\x41IMLESS_KICK\x10\x0b\x12&\n\"ATTACKER_TOO_CLOSE_TO_DEFENSE_AREA\x10\x13\x12\x1c\n\x18\x44\x45\x46\x45NDER_IN_DEFENSE_AREA\x10\x1f\x12\x15\n\x11\x42OUNDARY_CROSSING\x10)\x12\x14\n\x10KEEPER_HELD_BALL\x10\r\x12\x1d\n\x19\x42OT_DRIBBLED_BALL_TOO_FAR\x10\x11\x12\x12\n\x0e\x42OT_PUSHED_BOT\x10\x18\x12\x1e\n\x1a\x42OT_HELD_BALL_DELIBERATELY\x10\x1a\x12\x13\n\x0f\x42OT_TIPPED_OVER\x10\x1b\x12)\n%ATTACKER_TOUCHED_BALL_IN_DEFENSE_AREA\x10\x0f\x12\x1c\n\x18\x42OT_KICKED_BALL_TOO_FAST\x10\x12\x12\x14\n\x10\x42OT_CRASH_UNIQUE\x10\x16\x12\x13\n\x0f\x42OT_CRASH_DRAWN\x10\x15\x12$\n DEFENDER_TOO_CLOSE_TO_KICK_POINT\x10\x1d\x12\x18\n\x14\x42OT_TOO_FAST_IN_STOP\x10\x1c\x12\x1c\n\x18\x42OT_INTERFERED_PLACEMENT\x10\x14\x12\x11\n\rPOSSIBLE_GOAL\x10\'\x12\x08\n\x04GOAL\x10\x08\x12\x10\n\x0cINVALID_GOAL\x10*\x12 \n\x1c\x41TTACKER_DOUBLE_TOUCHED_BALL\x10\x0e\x12\x17\n\x13PLACEMENT_SUCCEEDED\x10\x05\x12\x17\n\x13PENALTY_KICK_FAILED\x10+\x12\x17\n\x13NO_PROGRESS_IN_GAME\x10\x02\x12\x14\n\x10PLACEMENT_FAILED\x10\x03\x12\x12\n\x0eMULTIPLE_CARDS\x10 \x12\x12\n\x0eMULTIPLE_FOULS\x10\"\x12\x14\n\x10\x42OT_SUBSTITUTION\x10%\x12\x13\n\x0fTOO_MANY_ROBOTS\x10&\x12\x12\n\x0e\x43HALLENGE_FLAG\x10,\x12\x1a\n\x16\x43HALLENGE_FLAG_HANDLED\x10.\x12\x12\n\x0e\x45MERGENCY_STOP\x10-\x12\x1d\n\x19UNSPORTING_BEHAVIOR_MINOR\x10#\x12\x1d\n\x19UNSPORTING_BEHAVIOR_MAJOR\x10$\x12\x10\n\x08PREPARED\x10\x01\x1a\x02\x08\x01\x12\x15\n\rINDIRECT_GOAL\x10\t\x1a\x02\x08\x01\x12\x14\n\x0c\x43HIPPED_GOAL\x10\n\x1a\x02\x08\x01\x12\x14\n\x0cKICK_TIMEOUT\x10\x0c\x1a\x02\x08\x01\x12\x31\n)ATTACKER_TOUCHED_OPPONENT_IN_DEFENSE_AREA\x10\x10\x1a\x02\x08\x01\x12\x39\n1ATTACKER_TOUCHED_OPPONENT_IN_DEFENSE_AREA_SKIPPED\x10(\x1a\x02\x08\x01\x12 \n\x18\x42OT_CRASH_UNIQUE_SKIPPED\x10\x17\x1a\x02\x08\x01\x12\x1e\n\x16\x42OT_PUSHED_BOT_SKIPPED\x10\x19\x1a\x02\x08\x01\x12*\n\"DEFENDER_IN_DEFENSE_AREA_PARTIALLY\x10\x1e\x1a\x02\x08\x01\x12#\n\x1bMULTIPLE_PLACEMENT_FAILURES\x10!\x1a\x02\x08\x01\x42\x07\n\x05\x65ventB?Z=github.com/RoboCup-SSL/ssl-game-controller/internal/app/state')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ssl_gc_game_event_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z=github.com/RoboCup-SSL/ssl-game-controller/internal/app/state'
+  _globals['_GAMEEVENT_TYPE'].values_by_name["PREPARED"]._loaded_options = None
+  _globals['_GAMEEVENT_TYPE'].values_by_name["PREPARED"]._serialized_options = b'\010\001'
+  _globals['_GAMEEVENT_TYPE'].values_by_name["INDIRECT_GOAL"]._loaded_options = None
+  _globals['_GAMEEVENT_TYPE'].values_by_name["INDIRECT_GOAL"]._serialized_options = b'\010\001'
+  _globals['_GAMEEVENT_TYPE'].values_by_name["CHIPPED_GOAL"]._loaded_options = None
+  _globals['_GAMEEVENT_TYPE'].values_by_name["CHIPPED_GOAL"]._serialized_options = b'\010\001'
+  _globals['_GAMEEVENT_TYPE'].values_by_name["KICK_TIMEOUT"]._loaded_options = None
+  _globals['_GAMEEVENT_TYPE'].values_by_name["KICK_TIMEOUT"]._serialized_options = b'\010\001'
+  _globals['_GAMEEVENT_TYPE'].values_by_name["ATTACKER_TOUCHED_OPPONENT_IN_DEFENSE_AREA"]._loaded_options = None
+  _globals['_GAMEEVENT_TYPE'].values_by_name["ATTACKER_TOUCHED_OPPONENT_IN_DEFENSE_AREA"]._serialized_options = b'\010\001'
+  _globals['_GAMEEVENT_TYPE'].values_by_name["ATTACKER_TOUCHED_OPPONENT_IN_DEFENSE_AREA_SKIPPED"]._loaded_options = None
+  _globals['_GAMEEVENT_TYPE'].values_by_name["ATTACKER_TOUCHED_OPPONENT_IN_DEFENSE_AREA_SKIPPED"]._serialized_options = b'\010\001'
+  _globals['_GAMEEVENT_TYPE'].values_by_name["BOT_CRASH_UNIQUE_SKIPPED"]._loaded_options = None
+  _globals['_GAMEEVENT_TYPE'].values_by_name["BOT_CRASH_UNIQUE_SKIPPED"]._serialized_options = b'\010\001'
+  _globals['_GAMEEVENT_TYPE'].values_by_name["BOT_PUSHED_BOT_SKIPPED"]._loaded_options = None
+  _globals['_GAMEEVENT_TYPE'].values_by_name["BOT_PUSHED_BOT_SKIPPED"]._serialized_options = b'\010\001'
+  _globals['_GAMEEVENT_TYPE'].values_by_name["DEFENDER_IN_DEFENSE_AREA_PARTIALLY"]._loaded_options = None
+  _globals['_GAMEEVENT_TYPE'].values_by_name["DEFENDER_IN_DEFENSE_AREA_PARTIALLY"]._serialized_options = b'\010\001'
+  _globals['_GAMEEVENT_TYPE'].values_by_name["MULTIPLE_PLACEMENT_FAILURES"]._loaded_options = None
+  _globals['_GAMEEVENT_TYPE'].values_by_name["MULTIPLE_PLACEMENT_FAILURES"]._serialized_options = b'\010\001'
+  _globals['_GAMEEVENT'].fields_by_name['prepared']._loaded_options = None
+  _globals['_GAMEEVENT'].fields_by_name['prepared']._serialized_options = b'\030\001'
+  _globals['_GAMEEVENT'].fields_by_name['indirect_goal']._loaded_options = None
+  _globals['_GAMEEVENT'].fields_by_name['indirect_goal']._serialized_options = b'\030\001'
+  _globals['_GAMEEVENT'].fields_by_name['chipped_goal']._loaded_options = None
+  _globals['_GAMEEVENT'].fields_by_name['chipped_goal']._serialized_options = b'\030\001'
+  _globals['_GAMEEVENT'].fields_by_name['kick_timeout']._loaded_options = None
+  _globals['_GAMEEVENT'].fields_by_name['kick_timeout']._serialized_options = b'\030\001'
+  _globals['_GAMEEVENT'].fields_by_name['attacker_touched_opponent_in_defense_area']._loaded_options = None
+  _globals['_GAMEEVENT'].fields_by_name['attacker_touched_opponent_in_defense_area']._serialized_options = b'\030\001'
+  _globals['_GAMEEVENT'].fields_by_name['attacker_touched_opponent_in_defense_area_skipped']._loaded_options = None
+  _globals['_GAMEEVENT'].fields_by_name['attacker_touched_opponent_in_defense_area_skipped']._serialized_options = b'\030\001'
+  _globals['_GAMEEVENT'].fields_by_name['bot_crash_unique_skipped']._loaded_options = None
+  _globals['_GAMEEVENT'].fields_by_name['bot_crash_unique_skipped']._serialized_options = b'\030\001'
+  _globals['_GAMEEVENT'].fields_by_name['bot_pushed_bot_skipped']._loaded_options = None
+  _globals['_GAMEEVENT'].fields_by_name['bot_pushed_bot_skipped']._serialized_options = b'\030\001'
+  _globals['_GAMEEVENT'].fields_by_name['defender_in_defense_area_partially']._loaded_options = None
+  _globals['_GAMEEVENT'].fields_by_name['defender_in_defense_area_partially']._serialized_options = b'\030\001'
+  _globals['_GAMEEVENT'].fields_by_name['multiple_placement_failures']._loaded_options = None
+  _globals['_GAMEEVENT'].fields_by_name['multiple_placement_failures']._serialized_options = b'\030\001'
+  _globals['_GAMEEVENT']._serialized_start=82
+  _globals['_GAMEEVENT']._serialized_end=9647
+  _globals['_GAMEEVENT_BALLLEFTFIELD']._serialized_start=3467
+  _globals['_GAMEEVENT_BALLLEFTFIELD']._serialized_end=3576
+  _globals['_GAMEEVENT_AIMLESSKICK']._serialized_start=3579
+  _globals['_GAMEEVENT_AIMLESSKICK']._serialized_end=3728
+  _globals['_GAMEEVENT_GOAL']._serialized_start=3731
+  _globals['_GAMEEVENT_GOAL']._serialized_end=4022
+  _globals['_GAMEEVENT_INDIRECTGOAL']._serialized_start=4025
+  _globals['_GAMEEVENT_INDIRECTGOAL']._serialized_end=4175
+  _globals['_GAMEEVENT_CHIPPEDGOAL']._serialized_start=4178
+  _globals['_GAMEEVENT_CHIPPEDGOAL']._serialized_end=4352
+  _globals['_GAMEEVENT_BOTTOOFASTINSTOP']._serialized_start=4354
+  _globals['_GAMEEVENT_BOTTOOFASTINSTOP']._serialized_end=4481
+  _globals['_GAMEEVENT_DEFENDERTOOCLOSETOKICKPOINT']._serialized_start=4484
+  _globals['_GAMEEVENT_DEFENDERTOOCLOSETOKICKPOINT']._serialized_end=4625
+  _globals['_GAMEEVENT_BOTCRASHDRAWN']._serialized_start=4628
+  _globals['_GAMEEVENT_BOTCRASHDRAWN']._serialized_end=4780
+  _globals['_GAMEEVENT_BOTCRASHUNIQUE']._serialized_start=4783
+  _globals['_GAMEEVENT_BOTCRASHUNIQUE']._serialized_end=4973
+  _globals['_GAMEEVENT_BOTPUSHEDBOT']._serialized_start=4976
+  _globals['_GAMEEVENT_BOTPUSHEDBOT']._serialized_end=5127
+  _globals['_GAMEEVENT_BOTTIPPEDOVER']._serialized_start=5130
+  _globals['_GAMEEVENT_BOTTIPPEDOVER']._serialized_end=5281
+  _globals['_GAMEEVENT_DEFENDERINDEFENSEAREA']._serialized_start=5284
+  _globals['_GAMEEVENT_DEFENDERINDEFENSEAREA']._serialized_end=5419
+  _globals['_GAMEEVENT_DEFENDERINDEFENSEAREAPARTIALLY']._serialized_start=5422
+  _globals['_GAMEEVENT_DEFENDERINDEFENSEAREAPARTIALLY']._serialized_end=5608
+  _globals['_GAMEEVENT_ATTACKERTOUCHEDBALLINDEFENSEAREA']._serialized_start=5611
+  _globals['_GAMEEVENT_ATTACKERTOUCHEDBALLINDEFENSEAREA']._serialized_end=5757
+  _globals['_GAMEEVENT_BOTKICKEDBALLTOOFAST']._serialized_start=5760
+  _globals['_GAMEEVENT_BOTKICKEDBALLTOOFAST']._serialized_end=5921
+  _globals['_GAMEEVENT_BOTDRIBBLEDBALLTOOFAR']._serialized_start=5924
+  _globals['_GAMEEVENT_BOTDRIBBLEDBALLTOOFAR']._serialized_end=6070
+  _globals['_GAMEEVENT_ATTACKERTOUCHEDOPPONENTINDEFENSEAREA']._serialized_start=6073
+  _globals['_GAMEEVENT_ATTACKERTOUCHEDOPPONENTINDEFENSEAREA']._serialized_end=6221
+  _globals['_GAMEEVENT_ATTACKERDOUBLETOUCHEDBALL']._serialized_start=6223
+  _globals['_GAMEEVENT_ATTACKERDOUBLETOUCHEDBALL']._serialized_end=6344
+  _globals['_GAMEEVENT_ATTACKERTOOCLOSETODEFENSEAREA']._serialized_start=6347
+  _globals['_GAMEEVENT_ATTACKERTOOCLOSETODEFENSEAREA']._serialized_end=6532
+  _globals['_GAMEEVENT_BOTHELDBALLDELIBERATELY']._serialized_start=6535
+  _globals['_GAMEEVENT_BOTHELDBALLDELIBERATELY']._serialized_end=6672
+  _globals['_GAMEEVENT_BOTINTERFEREDPLACEMENT']._serialized_start=6674
+  _globals['_GAMEEVENT_BOTINTERFEREDPLACEMENT']._serialized_end=6792
+  _globals['_GAMEEVENT_MULTIPLECARDS']._serialized_start=6794
+  _globals['_GAMEEVENT_MULTIPLECARDS']._serialized_end=6850
+  _globals['_GAMEEVENT_MULTIPLEFOULS']._serialized_start=6852
+  _globals['_GAMEEVENT_MULTIPLEFOULS']._serialized_end=6957
+  _globals['_GAMEEVENT_MULTIPLEPLACEMENTFAILURES']._serialized_start=6959
+  _globals['_GAMEEVENT_MULTIPLEPLACEMENTFAILURES']._serialized_end=7027
+  _globals['_GAMEEVENT_KICKTIMEOUT']._serialized_start=7029
+  _globals['_GAMEEVENT_KICKTIMEOUT']._serialized_end=7134
+  _globals['_GAMEEVENT_NOPROGRESSINGAME']._serialized_start=7136
+  _globals['_GAMEEVENT_NOPROGRESSINGAME']._serialized_end=7205
+  _globals['_GAMEEVENT_PLACEMENTFAILED']._serialized_start=7207
+  _globals['_GAMEEVENT_PLACEMENTFAILED']._serialized_end=7293
+  _globals['_GAMEEVENT_UNSPORTINGBEHAVIORMINOR']._serialized_start=7295
+  _globals['_GAMEEVENT_UNSPORTINGBEHAVIORMINOR']._serialized_end=7377
+  _globals['_GAMEEVENT_UNSPORTINGBEHAVIORMAJOR']._serialized_start=7379
+  _globals['_GAMEEVENT_UNSPORTINGBEHAVIORMAJOR']._serialized_end=7461
+  _globals['_GAMEEVENT_KEEPERHELDBALL']._serialized_start=7463
+  _globals['_GAMEEVENT_KEEPERHELDBALL']._serialized_end=7575
+  _globals['_GAMEEVENT_PLACEMENTSUCCEEDED']._serialized_start=7577
+  _globals['_GAMEEVENT_PLACEMENTSUCCEEDED']._serialized_end=7695
+  _globals['_GAMEEVENT_PREPARED']._serialized_start=7697
+  _globals['_GAMEEVENT_PREPARED']._serialized_end=7727
+  _globals['_GAMEEVENT_BOTSUBSTITUTION']._serialized_start=7729
+  _globals['_GAMEEVENT_BOTSUBSTITUTION']._serialized_end=7787
+  _globals['_GAMEEVENT_CHALLENGEFLAG']._serialized_start=7789
+  _globals['_GAMEEVENT_CHALLENGEFLAG']._serialized_end=7845
+  _globals['_GAMEEVENT_CHALLENGEFLAGHANDLED']._serialized_start=7847
+  _globals['_GAMEEVENT_CHALLENGEFLAGHANDLED']._serialized_end=7928
+  _globals['_GAMEEVENT_EMERGENCYSTOP']._serialized_start=7930
+  _globals['_GAMEEVENT_EMERGENCYSTOP']._serialized_end=7986
+  _globals['_GAMEEVENT_TOOMANYROBOTS']._serialized_start=7989
+  _globals['_GAMEEVENT_TOOMANYROBOTS']._serialized_end=8144
+  _globals['_GAMEEVENT_BOUNDARYCROSSING']._serialized_start=8146
+  _globals['_GAMEEVENT_BOUNDARYCROSSING']._serialized_end=8242
+  _globals['_GAMEEVENT_PENALTYKICKFAILED']._serialized_start=8244
+  _globals['_GAMEEVENT_PENALTYKICKFAILED']._serialized_end=8357
+  _globals['_GAMEEVENT_TYPE']._serialized_start=8360
+  _globals['_GAMEEVENT_TYPE']._serialized_end=9638
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: ssl_gc_rcon_autoref.proto
+# Protobuf Python Version: 5.29.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    2,
+    '',
+    'ssl_gc_rcon_autoref.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import ssl_gc_game_event_pb2 as ssl__gc__game__event__pb2
+from . import ssl_gc_rcon_pb2 as ssl__gc__rcon__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19ssl_gc_rcon_autoref.proto\x12\x08proto.gc\x1a\x17ssl_gc_game_event.proto\x1a\x11ssl_gc_rcon.proto\"Q\n\x13\x41utoRefRegistration\x12\x12\n\nidentifier\x18\x01 \x02(\t\x12&\n\tsignature\x18\x02 \x01(\x0b\x32\x13.proto.gc.Signature\"r\n\x13\x41utoRefToController\x12&\n\tsignature\x18\x01 \x01(\x0b\x32\x13.proto.gc.Signature\x12\'\n\ngame_event\x18\x02 \x01(\x0b\x32\x13.proto.gc.GameEventJ\x04\x08\x03\x10\x04J\x04\x08\x04\x10\x05\"S\n\x13\x43ontrollerToAutoRef\x12\x35\n\x10\x63ontroller_reply\x18\x01 \x01(\x0b\x32\x19.proto.gc.ControllerReplyH\x00\x42\x05\n\x03msgB>Z<github.com/RoboCup-SSL/ssl-game-controller/internal/app/rcon')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ssl_gc_rcon_autoref_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z<github.com/RoboCup-SSL/ssl-game-controller/internal/app/rcon'
+  _globals['_AUTOREFREGISTRATION']._serialized_start=83
+  _globals['_AUTOREFREGISTRATION']._serialized_end=164
+  _globals['_AUTOREFTOCONTROLLER']._serialized_start=166
+  _globals['_AUTOREFTOCONTROLLER']._serialized_end=280
+  _globals['_CONTROLLERTOAUTOREF']._serialized_start=282
+  _globals['_CONTROLLERTOAUTOREF']._serialized_end=365
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: ssl_gc_rcon_remotecontrol.proto
+# Protobuf Python Version: 5.29.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    2,
+    '',
+    'ssl_gc_rcon_remotecontrol.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import ssl_gc_common_pb2 as ssl__gc__common__pb2
+from . import ssl_gc_rcon_pb2 as ssl__gc__rcon__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1fssl_gc_rcon_remotecontrol.proto\x12\x08proto.gc\x1a\x13ssl_gc_common.proto\x1a\x11ssl_gc_rcon.proto\"i\n\x19RemoteControlRegistration\x12$\n\x04team\x18\x01 \x02(\x0e\x32\x16.proto.simulation.Team\x12&\n\tsignature\x18\x02 \x01(\x0b\x32\x13.proto.gc.Signature\"\xcf\x02\n\x19RemoteControlToController\x12&\n\tsignature\x18\x01 \x01(\x0b\x32\x13.proto.gc.Signature\x12>\n\x07request\x18\x02 \x01(\x0e\x32+.proto.gc.RemoteControlToController.RequestH\x00\x12\x18\n\x0e\x64\x65sired_keeper\x18\x03 \x01(\x05H\x00\x12$\n\x1arequest_robot_substitution\x18\x04 \x01(\x08H\x00\x12\x19\n\x0frequest_timeout\x18\x05 \x01(\x08H\x00\x12 \n\x16request_emergency_stop\x18\x06 \x01(\x08H\x00\"F\n\x07Request\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x08\n\x04PING\x10\x01\x12\x12\n\x0e\x43HALLENGE_FLAG\x10\x02\x12\x10\n\x0cSTOP_TIMEOUT\x10\x03\x42\x05\n\x03msg\"\x81\x01\n\x19\x43ontrollerToRemoteControl\x12\x33\n\x10\x63ontroller_reply\x18\x01 \x01(\x0b\x32\x19.proto.gc.ControllerReply\x12/\n\x05state\x18\x02 \x01(\x0b\x32 .proto.gc.RemoteControlTeamState\"\x9e\x03\n\x16RemoteControlTeamState\x12$\n\x04team\x18\x0c \x01(\x0e\x32\x16.proto.simulation.Team\x12>\n\x12\x61vailable_requests\x18\x01 \x03(\x0e\x32\".proto.gc.RemoteControlRequestType\x12;\n\x0f\x61\x63tive_requests\x18\x02 \x03(\x0e\x32\".proto.gc.RemoteControlRequestType\x12\x11\n\tkeeper_id\x18\x03 \x01(\x05\x12\x19\n\x11\x65mergency_stop_in\x18\x04 \x01(\x02\x12\x15\n\rtimeouts_left\x18\x05 \x01(\x05\x12\x19\n\x11timeout_time_left\x18\n \x01(\x02\x12\x1c\n\x14\x63hallenge_flags_left\x18\x06 \x01(\x05\x12\x12\n\nmax_robots\x18\x07 \x01(\x05\x12\x17\n\x0frobots_on_field\x18\t \x01(\x05\x12\x18\n\x10yellow_cards_due\x18\x08 \x03(\x02\x12\x1c\n\x14\x63\x61n_substitute_robot\x18\x0b \x01(\x08*\xa9\x01\n\x18RemoteControlRequestType\x12\x18\n\x14UNKNOWN_REQUEST_TYPE\x10\x00\x12\x12\n\x0e\x45MERGENCY_STOP\x10\x01\x12\x16\n\x12ROBOT_SUBSTITUTION\x10\x02\x12\x0b\n\x07TIMEOUT\x10\x03\x12\x12\n\x0e\x43HALLENGE_FLAG\x10\x04\x12\x14\n\x10\x43HANGE_KEEPER_ID\x10\x05\x12\x10\n\x0cSTOP_TIMEOUT\x10\x06\x42>Z<github.com/RoboCup-SSL/ssl-game-controller/internal/app/rcon')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ssl_gc_rcon_remotecontrol_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z<github.com/RoboCup-SSL/ssl-game-controller/internal/app/rcon'
+  _globals['_REMOTECONTROLREQUESTTYPE']._serialized_start=1080
+  _globals['_REMOTECONTROLREQUESTTYPE']._serialized_end=1249
+  _globals['_REMOTECONTROLREGISTRATION']._serialized_start=85
+  _globals['_REMOTECONTROLREGISTRATION']._serialized_end=190
+  _globals['_REMOTECONTROLTOCONTROLLER']._serialized_start=193
+  _globals['_REMOTECONTROLTOCONTROLLER']._serialized_end=528
+  _globals['_REMOTECONTROLTOCONTROLLER_REQUEST']._serialized_start=451
+  _globals['_REMOTECONTROLTOCONTROLLER_REQUEST']._serialized_end=521
+  _globals['_CONTROLLERTOREMOTECONTROL']._serialized_start=531
+  _globals['_CONTROLLERTOREMOTECONTROL']._serialized_end=660
+  _globals['_REMOTECONTROLTEAMSTATE']._serialized_start=663
+  _globals['_REMOTECONTROLTEAMSTATE']._serialized_end=1077
+# @@protoc_insertion_point(module_scope)
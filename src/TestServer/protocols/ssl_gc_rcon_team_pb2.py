@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: ssl_gc_rcon_team.proto
+# Protobuf Python Version: 5.29.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    2,
+    '',
+    'ssl_gc_rcon_team.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import ssl_gc_rcon_pb2 as ssl__gc__rcon__pb2
+from . import ssl_gc_common_pb2 as ssl__gc__common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x16ssl_gc_rcon_team.proto\x12\x08proto.gc\x1a\x11ssl_gc_rcon.proto\x1a\x13ssl_gc_common.proto\"s\n\x10TeamRegistration\x12\x11\n\tteam_name\x18\x01 \x02(\t\x12&\n\tsignature\x18\x02 \x01(\x0b\x32\x13.proto.gc.Signature\x12$\n\x04team\x18\x03 \x01(\x0e\x32\x16.proto.simulation.Team\"\xbc\x01\n\x10TeamToController\x12&\n\tsignature\x18\x01 \x01(\x0b\x32\x13.proto.gc.Signature\x12\x18\n\x0e\x64\x65sired_keeper\x18\x02 \x01(\x05H\x00\x12\x35\n\x10\x61\x64vantage_choice\x18\x03 \x01(\x0e\x32\x19.proto.gc.AdvantageChoiceH\x00\x12\x18\n\x0esubstitute_bot\x18\x04 \x01(\x08H\x00\x12\x0e\n\x04ping\x18\x05 \x01(\x08H\x00\x42\x05\n\x03msg\"V\n\x10\x43ontrollerToTeam\x12\x35\n\x10\x63ontroller_reply\x18\x01 \x01(\x0b\x32\x19.proto.gc.ControllerReplyH\x00\x42\x05\n\x03msgJ\x04\x08\x02\x10\x03*)\n\x0f\x41\x64vantageChoice\x12\x08\n\x04STOP\x10\x00\x12\x0c\n\x08\x43ONTINUE\x10\x01\x42>Z<github.com/RoboCup-SSL/ssl-game-controller/internal/app/rcon')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ssl_gc_rcon_team_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z<github.com/RoboCup-SSL/ssl-game-controller/internal/app/rcon'
+  _globals['_ADVANTAGECHOICE']._serialized_start=472
+  _globals['_ADVANTAGECHOICE']._serialized_end=513
+  _globals['_TEAMREGISTRATION']._serialized_start=76
+  _globals['_TEAMREGISTRATION']._serialized_end=191
+  _globals['_TEAMTOCONTROLLER']._serialized_start=194
+  _globals['_TEAMTOCONTROLLER']._serialized_end=382
+  _globals['_CONTROLLERTOTEAM']._serialized_start=384
+  _globals['_CONTROLLERTOTEAM']._serialized_end=470
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: ssl_simulation_robot_control.proto
+# Protobuf Python Version: 5.29.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    2,
+    '',
+    'ssl_simulation_robot_control.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\"ssl_simulation_robot_control.proto\x12\x10proto.simulation\"\x97\x01\n\x0cRobotCommand\x12\n\n\x02id\x18\x01 \x02(\r\x12\x38\n\x0cmove_command\x18\x02 \x01(\x0b\x32\".proto.simulation.RobotMoveCommand\x12\x12\n\nkick_speed\x18\x03 \x01(\x02\x12\x15\n\nkick_angle\x18\x04 \x01(\x02:\x01\x30\x12\x16\n\x0e\x64ribbler_speed\x18\x05 \x01(\x02\"\xdc\x01\n\x10RobotMoveCommand\x12=\n\x0ewheel_velocity\x18\x01 \x01(\x0b\x32#.proto.simulation.MoveWheelVelocityH\x00\x12=\n\x0elocal_velocity\x18\x02 \x01(\x0b\x32#.proto.simulation.MoveLocalVelocityH\x00\x12?\n\x0fglobal_velocity\x18\x03 \x01(\x0b\x32$.proto.simulation.MoveGlobalVelocityH\x00\x42\t\n\x07\x63ommand\"c\n\x11MoveWheelVelocity\x12\x13\n\x0b\x66ront_right\x18\x01 \x02(\x02\x12\x12\n\nback_right\x18\x02 \x02(\x02\x12\x11\n\tback_left\x18\x03 \x02(\x02\x12\x12\n\nfront_left\x18\x04 \x02(\x02\"C\n\x11MoveLocalVelocity\x12\x0f\n\x07\x66orward\x18\x01 \x02(\x02\x12\x0c\n\x04left\x18\x02 \x02(\x02\x12\x0f\n\x07\x61ngular\x18\x03 \x02(\x02\";\n\x12MoveGlobalVelocity\x12\t\n\x01x\x18\x01 \x02(\x02\x12\t\n\x01y\x18\x02 \x02(\x02\x12\x0f\n\x07\x61ngular\x18\x03 \x02(\x02\"F\n\x0cRobotControl\x12\x36\n\x0erobot_commands\x18\x01 \x03(\x0b\x32\x1e.proto.simulation.RobotCommandB8Z6github.com/RoboCup-SSL/ssl-simulation-protocol/pkg/sim')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'ssl_simulation_robot_control_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z6github.com/RoboCup-SSL/ssl-simulation-protocol/pkg/sim'
+  _globals['_ROBOTCOMMAND']._serialized_start=57
+  _globals['_ROBOTCOMMAND']._serialized_end=208
+  _globals['_ROBOTMOVECOMMAND']._serialized_start=211
+  _globals['_ROBOTMOVECOMMAND']._serialized_end=431
+  _globals['_MOVEWHEELVELOCITY']._serialized_start=433
+  _globals['_MOVEWHEELVELOCITY']._serialized_end=532
+  _globals['_MOVELOCALVELOCITY']._serialized_start=534
+  _globals['_MOVELOCALVELOCITY']._serialized_end=601
+  _globals['_MOVEGLOBALVELOCITY']._serialized_start=603
+  _globals['_MOVEGLOBALVELOCITY']._serialized_end=662
+  _globals['_ROBOTCONTROL']._serialized_start=664
+  _globals['_ROBOTCONTROL']._serialized_end=734
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+Game-controller referee listener that preempts robot commands on HALT/STOP.
+
+Referee packets (ssl_gc_referee_message.proto, multicast 224.5.23.1:10003)
+are received on their own thread. The command and command_counter are
+pulled out of the first few bytes by peek_command() before anything else
+runs; fields 1-5 lead the serialized message, so this is a short varint
+walk rather than a full decode. When the resulting mode changes:
+
+    HALT                        every robot gets all zeros
+    STOP, opponent's placement  translation scaled down to --stop-speed,
+                                kick and dribbler off
+    anything else               commands pass through unchanged
+
+the guard installs the matching limit on the DeltaSender and calls its
+preempt(), which sends every robot its limited command from the referee
+thread right away instead of on the next control tick. The full Referee
+message is decoded afterwards into RefereeState (stage, time left, score,
+designated position) for whoever wants it.
+
+RefereeStats records the time from a referee packet's recv() returning to
+the first and to the last preempting sendto(). RefereeEmitter publishes
+scripted Referee packets for loopback tests.
+
+Usage:
+    python referee.py --listen                                  # print command/stage changes
+    python referee.py --emit --interval 2                       # loopback game controller
+    python referee.py --loopback --robots 0-10 --duration 10    # emitter + guarded sender + robots
+    python delta_sender.py --robots 0-5 --referee yellow        # guard a live sender
+"""
+import argparse
+import math
+import socket
+import struct
+import threading
+import time
+
+from latency_probe import LatencyHistogram
+from protocols import Referee
+from vision_receiver import vision_socket
+
+REFEREE_GROUP = '224.5.23.1'
+REFEREE_PORT = 10003
+
+# The rules cap robot speed at 1.5 m/s during STOP; stay under it.
+STOP_SPEED = 1.2
+
+MODE_RUN = 0
+MODE_STOP = 1
+MODE_HALT = 2
+MODE_NAMES = ('run', 'stop', 'halt')
+
+_STOP_COMMANDS = {Referee.STOP}
+_PLACEMENT = {Referee.BALL_PLACEMENT_YELLOW: 'yellow', Referee.BALL_PLACEMENT_BLUE: 'blue'}
+
+_VARINT, _FIXED64, _LEN, _FIXED32 = 0, 1, 2, 5
+
+
+def peek_command(data):
+    """Return (command, command_counter) from a serialized Referee without decoding it, or None."""
+    pos = 0
+    end = len(data)
+    command = counter = None
+    try:
+        while pos < end:
+            key = data[pos]
+            pos += 1
+            if key & 0x80:
+                key, pos = _read_varint_tail(data, pos, key)
+            field, wire_type = key >> 3, key & 7
+            if wire_type == _VARINT:
+                value = data[pos]
+                pos += 1
+                if value & 0x80:
+                    value, pos = _read_varint_tail(data, pos, value)
+                if field == 4:
+                    command = value
+                elif field == 5:
+                    counter = value
+                if command is not None and counter is not None:
+                    return command, counter
+            elif wire_type == _LEN:
+                length = data[pos]
+                pos += 1
+                if length & 0x80:
+                    length, pos = _read_varint_tail(data, pos, length)
+                pos += length
+            elif wire_type == _FIXED64:
+                pos += 8
+            elif wire_type == _FIXED32:
+                pos += 4
+            else:
+                return None
+    except IndexError:
+        return None
+    return None if command is None else (command, counter)
+
+
+def _read_varint_tail(data, pos: int, first: int):
+    value = first & 0x7F
+    shift = 7
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def command_mode(command: int, team: str = None) -> int:
+    """MODE_* for a referee command; our own ball placement doesn't restrict us."""
+    if command == Referee.HALT:
+        return MODE_HALT
+    if command in _STOP_COMMANDS:
+        return MODE_STOP
+    placing = _PLACEMENT.get(command)
+    if placing is not None and placing != team:
+        return MODE_STOP
+    return MODE_RUN
+
+
+def halt_limit(forward, left, angular, kick_speed, kick_angle, dribbler):
+    return 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+
+
+def make_stop_limit(max_speed: float = STOP_SPEED):
+    """Limit filter that caps translation speed and keeps the ball alone."""
+
+    def stop_limit(forward, left, angular, kick_speed, kick_angle, dribbler):
+        speed = math.hypot(forward, left)
+        if speed > max_speed:
+            scale = max_speed / speed
+            forward *= scale
+            left *= scale
+        return forward, left, angular, 0.0, kick_angle, 0.0
+
+    return stop_limit
+
+
+class RefereeState:
+    """Latest game-controller state, replaced attribute by attribute from the receive thread."""
+
+    def __init__(self):
+        self.command = None
+        self.command_counter = None
+        self.stage = None
+        self.stage_time_left = None
+        self.designated_position = None
+        self.score = (0, 0)
+        self.last_packet = None
+        self.packets = 0
+
+    def update(self, referee: Referee, received: float):
+        self.command = referee.command
+        self.command_counter = referee.command_counter
+        self.stage = referee.stage
+        self.stage_time_left = referee.stage_time_left if referee.HasField('stage_time_left') else None
+        if referee.HasField('designated_position'):
+            self.designated_position = (referee.designated_position.x, referee.designated_position.y)
+        else:
+            self.designated_position = None
+        self.score = (referee.yellow.score, referee.blue.score)
+        self.last_packet = received
+        self.packets += 1
+
+    def describe(self) -> str:
+        if self.command is None:
+            return "no referee packets"
+        left = '' if self.stage_time_left is None else f", {self.stage_time_left / 1e6:.0f} s left"
+        return (f"{Referee.Command.Name(self.command)} #{self.command_counter} in "
+                f"{Referee.Stage.Name(self.stage)}{left}, score {self.score[0]}:{self.score[1]}")
+
+
+class RefereeStats:
+    """Packet counters and referee-packet-to-preempting-send latency."""
+
+    def __init__(self):
+        self.packets = 0
+        self.decode_errors = 0
+        self.transitions = 0
+        self.preempted = 0
+        self.first_send = LatencyHistogram()
+        self.last_send = LatencyHistogram()
+
+    def summary(self) -> str:
+        return (f"{self.packets} referee packets, {self.decode_errors} undecodable, {self.transitions} transitions, "
+                f"{self.preempted} preempting sends\n"
+                f"packet-to-first-send {self.first_send.summary()}\n"
+                f"packet-to-last-send  {self.last_send.summary()}")
+
+
+class RefereeGuard:
+    """Applies the referee mode to a DeltaSender the moment a packet changes it."""
+
+    def __init__(self, sender=None, team: str = None, stop_speed: float = STOP_SPEED, on_change=None):
+        self.sender = sender
+        self.team = team
+        self.limits = {MODE_RUN: None, MODE_STOP: make_stop_limit(stop_speed), MODE_HALT: halt_limit}
+        self.on_change = on_change
+        self.state = RefereeState()
+        self.stats = RefereeStats()
+        self.mode = None
+        self.counter = None
+        self._message = Referee()
+
+    def handle_packet(self, data: bytes, received_ns: int = None):
+        if received_ns is None:
+            received_ns = time.perf_counter_ns()
+        self.stats.packets += 1
+        peek = peek_command(data)
+        if peek is None:
+            self.stats.decode_errors += 1
+            return
+        command, counter = peek
+        if counter != self.counter:
+            self.counter = counter
+            mode = command_mode(command, self.team)
+            if mode != self.mode:
+                self._apply(mode, command, received_ns)
+
+        message = self._message
+        try:
+            message.ParseFromString(data)
+        except Exception:
+            self.stats.decode_errors += 1
+            return
+        self.state.update(message, received_ns / 1e9)
+
+    def _apply(self, mode: int, command: int, received_ns: int):
+        self.mode = mode
+        self.stats.transitions += 1
+        sender = self.sender
+        if sender is not None:
+            sender.limit = self.limits[mode]
+            sent = sender.preempt()
+            done = time.perf_counter_ns()
+            self.stats.preempted += sent
+            if sent:
+                self.stats.first_send.record(sender.preempt_first_ns - received_ns)
+                self.stats.last_send.record(done - received_ns)
+        if self.on_change is not None:
+            self.on_change(mode, command)
+
+
+def start_referee_thread(guard: RefereeGuard, group: str = REFEREE_GROUP, port: int = REFEREE_PORT,
+                         iface: str = '0.0.0.0') -> threading.Thread:
+    """Receive referee packets on a dedicated daemon thread."""
+    sock = vision_socket(group, port, iface)
+
+    def receive():
+        recv = sock.recv
+        while True:
+            data = recv(65536)
+            guard.handle_packet(data, time.perf_counter_ns())
+
+    thread = threading.Thread(target=receive, name='referee', daemon=True)
+    thread.start()
+    return thread
+
+
+def team_info(name: str) -> Referee.TeamInfo:
+    return Referee.TeamInfo(name=name, score=0, red_cards=0, yellow_cards=0, timeouts=4,
+                            timeout_time=300_000_000, goalkeeper=0)
+
+
+class RefereeEmitter:
+    """Publishes Referee packets like the game controller: every `period` seconds and on every change."""
+
+    SCRIPT = (Referee.HALT, Referee.STOP, Referee.FORCE_START, Referee.STOP,
+              Referee.BALL_PLACEMENT_BLUE, Referee.NORMAL_START, Referee.HALT)
+
+    def __init__(self, dest=(REFEREE_GROUP, REFEREE_PORT), period: float = 0.1):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, struct.pack('b', 1))
+        self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+        self.dest = dest
+        self.period = period
+        self.message = Referee(source_identifier='TestServer referee.py', stage=Referee.NORMAL_FIRST_HALF,
+                               command=Referee.HALT, command_counter=0, packet_timestamp=0,
+                               command_timestamp=int(time.time() * 1e6), stage_time_left=300_000_000,
+                               yellow=team_info('yellow'), blue=team_info('blue'))
+        self.sent = 0
+
+    def send(self):
+        message = self.message
+        message.packet_timestamp = int(time.time() * 1e6)
+        self.sock.sendto(message.SerializeToString(), self.dest)
+        self.sent += 1
+
+    def set_command(self, command: int, designated_position=None):
+        message = self.message
+        message.command = command
+        message.command_counter += 1
+        message.command_timestamp = int(time.time() * 1e6)
+        if designated_position is None:
+            message.ClearField('designated_position')
+        else:
+            message.designated_position.x, message.designated_position.y = designated_position
+        self.send()
+
+    def run(self, interval: float, duration: float = None, on_command=None):
+        """Step through SCRIPT every `interval` seconds, re-sending the state every `period`."""
+        start = time.perf_counter()
+        next_command = start
+        step = 0
+        while duration is None or time.perf_counter() - start < duration:
+            now = time.perf_counter()
+            if now >= next_command:
+                command = self.SCRIPT[step % len(self.SCRIPT)]
+                place = (1000.0, -500.0) if command in _PLACEMENT else None
+                if on_command is not None:
+                    on_command(command)
+                self.set_command(command, place)
+                step += 1
+                next_command += interval
+            else:
+                self.send()
+            time.sleep(max(0.0, min(self.period, next_command - time.perf_counter())))
+
+    def close(self):
+        self.sock.close()
+
+
+def run_loopback(robot_ids, duration: float, interval: float, rate: float, team: str, stop_speed: float):
+    """Emitter -> guard -> DeltaSender -> a robot socket; checks what robots receive after each command."""
+    from delta_sender import DeltaSender
+    from scheduler import TickScheduler
+    from triton_codec import decode
+
+    robot_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    robot_sock.bind(('127.0.0.1', 0))
+    robot_sock.settimeout(0.1)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender = DeltaSender(robot_ids, sock, robot_sock.getsockname(), heartbeat=0.25)
+
+    guard = RefereeGuard(sender, team, stop_speed)
+    start_referee_thread(guard)
+
+    # every robot drives at 3 m/s; once a robot has received a datagram respecting a new
+    # HALT/STOP, everything after it must respect it too
+    issued = []
+    arrivals = LatencyHistogram()
+    violations = [0]
+    pending = {}      # robot id -> (perf_counter_ns when the emitter issued the change, new mode)
+    expected = {}     # robot id -> mode its datagrams must respect
+
+    def complies(mode, fields) -> bool:
+        speed = math.hypot(fields.forward, fields.left)
+        if mode == MODE_HALT:
+            return not (speed or fields.angular or fields.kick_speed or fields.dribbler_speed)
+        if mode == MODE_STOP:
+            return speed <= stop_speed + 1e-3 and not fields.kick_speed
+        return True
+
+    def receive():
+        while True:
+            try:
+                data = robot_sock.recv(2048)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            now = time.perf_counter_ns()
+            fields = decode(data)
+            change = pending.get(fields.id)
+            if change is not None:
+                stamp, mode = change
+                if complies(mode, fields):
+                    del pending[fields.id]
+                    expected[fields.id] = mode
+                    if mode != MODE_RUN:
+                        arrivals.record(now - stamp)
+                continue  # datagrams sent before the guard saw the change may still be in flight
+            if not complies(expected.get(fields.id, MODE_RUN), fields):
+                violations[0] += 1
+
+    def on_command(command):
+        issued.append(command)
+        mode = command_mode(command, team)
+        if mode != guard.mode:
+            stamp = time.perf_counter_ns()
+            for rid in robot_ids:
+                pending[rid] = (stamp, mode)
+
+    threading.Thread(target=receive, name='robots', daemon=True).start()
+    emitter = RefereeEmitter()
+    threading.Thread(target=emitter.run, args=(interval, duration, on_command), name='emitter', daemon=True).start()
+
+    scheduler = TickScheduler(rate)
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        for i, rid in enumerate(robot_ids):
+            angle = time.perf_counter() + i
+            sender.set_command(rid, 3.0 * math.cos(angle), 3.0 * math.sin(angle), 1.0)
+        sender.tick()
+        scheduler.wait()
+    time.sleep(0.2)
+    emitter.close()
+    robot_sock.close()
+
+    print(guard.stats.summary())
+    print(f"issued-to-limited-command-at-robot {arrivals.summary()}")
+    print(f"commands issued {len(issued)}, final state: {guard.state.describe()}")
+    print(f"limit violations seen by robots after a mode change: {violations[0]} "
+          f"(next-tick baseline would add ~{500 / rate:.1f} ms on average at {rate:g} Hz)")
+    print(sender.stats.summary())
+    return violations[0] == 0
+
+
+def main():
+    p = argparse.ArgumentParser(description="Referee listener that preempts robot commands on HALT/STOP")
+    p.add_argument("--listen", action="store_true", help="Print referee command/stage changes")
+    p.add_argument("--emit", action="store_true", help="Publish scripted referee packets (loopback game controller)")
+    p.add_argument("--loopback", action="store_true", help="Run emitter, guarded DeltaSender and a robot socket")
+    p.add_argument("--group", default=REFEREE_GROUP, help=f"Referee multicast group (default: {REFEREE_GROUP})")
+    p.add_argument("--port", type=int, default=REFEREE_PORT, help=f"Referee port (default: {REFEREE_PORT})")
+    p.add_argument("--team", choices=("yellow", "blue"), default=None, help="Our team, for ball placement")
+    p.add_argument("--stop-speed", type=float, default=STOP_SPEED, help=f"STOP speed cap in m/s (default: {STOP_SPEED})")
+    p.add_argument("--robots", default="0-5", help="Loopback robot ids (default: 0-5)")
+    p.add_argument("--rate", type=float, default=100.0, help="Loopback sender tick rate in Hz (default: 100)")
+    p.add_argument("--interval", type=float, default=1.0, help="Seconds between scripted commands (default: 1)")
+    p.add_argument("--duration", type=float, default=None, help="Stop after this many seconds")
+    args = p.parse_args()
+
+    if args.loopback:
+        from messages import parse_robot_ids
+        ok = run_loopback(parse_robot_ids(args.robots), args.duration or 8.0, args.interval, args.rate,
+                          args.team, args.stop_speed)
+        raise SystemExit(0 if ok else 1)
+    if args.emit:
+        emitter = RefereeEmitter((args.group, args.port))
+        print(f"Emitting referee packets to {args.group}:{args.port}, a new command every {args.interval:g} s")
+        try:
+            emitter.run(args.interval, args.duration,
+                        lambda command: print(f"-> {Referee.Command.Name(command)}"))
+        except KeyboardInterrupt:
+            pass
+        emitter.close()
+        return
+    if args.listen:
+        guard = RefereeGuard(team=args.team, on_change=lambda mode, command: print(
+            f"{Referee.Command.Name(command)}: {MODE_NAMES[mode]}"))
+        start_referee_thread(guard, args.group, args.port)
+        print(f"Listening for referee packets on {args.group}:{args.port}")
+        start = time.monotonic()
+        try:
+            while args.duration is None or time.monotonic() - start < args.duration:
+                time.sleep(1.0)
+        except KeyboardInterrupt:
+            pass
+        print(guard.state.describe())
+        print(f"{guard.stats.packets} packets, {guard.stats.decode_errors} undecodable")
+        return
+    p.print_help()
+
+
+if __name__ == '__main__':
+    main()
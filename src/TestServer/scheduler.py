@@ -0,0 +1,92 @@
+"""
+Drift-free fixed-rate tick scheduler for the TestServer send loops.
+
+Sleeping for a fixed period after doing the work makes every loop run slower
+than its target and drift with the cost of serialization and printing.
+TickScheduler waits for absolute deadlines (start + k * period) instead, can
+spin-wait the last fraction of a millisecond for tighter timing, and records
+tick-to-tick jitter and missed deadlines.
+
+Usage:
+    scheduler = TickScheduler(rate=100)
+    while True:
+        send_commands()
+        scheduler.wait()
+    print(scheduler.stats.summary())
+"""
+import time
+from array import array
+
+CATCH_UP = 'catch-up'  # run late ticks back-to-back until back on schedule
+SKIP = 'skip'          # drop late ticks and resume at the next future deadline
+
+
+class JitterStats:
+    """Tick-to-tick jitter over the most recent `capacity` ticks, plus missed deadline counts."""
+
+    def __init__(self, period: float, capacity: int = 4096):
+        self.period = period
+        self.capacity = capacity
+        self.samples = array('d', bytes(8 * capacity))
+        self.count = 0
+        self.max_jitter = 0.0
+        self.missed = 0
+        self.skipped = 0
+
+    def record(self, interval: float):
+        jitter = abs(interval - self.period)
+        self.samples[self.count % self.capacity] = jitter
+        self.count += 1
+        if jitter > self.max_jitter:
+            self.max_jitter = jitter
+
+    def percentile(self, q: float) -> float:
+        n = min(self.count, self.capacity)
+        if n == 0:
+            return 0.0
+        ordered = sorted(self.samples[:n])
+        return ordered[min(n - 1, int(q / 100.0 * n))]
+
+    def summary(self) -> str:
+        return (f"jitter p50 {self.percentile(50) * 1e6:.0f} us, "
+                f"p99 {self.percentile(99) * 1e6:.0f} us, "
+                f"max {self.max_jitter * 1e6:.0f} us, "
+                f"missed {self.missed}, skipped {self.skipped}")
+
+
+class TickScheduler:
+    """Paces a loop at `rate` Hz against absolute deadlines."""
+
+    def __init__(self, rate: float, spin: float = 0.0, policy: str = SKIP, clock=time.perf_counter):
+        if policy not in (CATCH_UP, SKIP):
+            raise ValueError(f"unknown overrun policy {policy!r}")
+        self.period = 1.0 / max(rate, 1e-3)
+        self.spin = spin
+        self.policy = policy
+        self.clock = clock
+        self.stats = JitterStats(self.period)
+        self.last_tick = clock()
+        self.deadline = self.last_tick + self.period
+
+    def wait(self) -> float:
+        """Block until the next deadline and return the time it fired."""
+        clock = self.clock
+        now = clock()
+        if now > self.deadline:
+            self.stats.missed += 1
+            if self.policy == SKIP:
+                late = int((now - self.deadline) / self.period)
+                self.stats.skipped += late
+                self.deadline += late * self.period
+        else:
+            remaining = self.deadline - now - self.spin
+            if remaining > 0:
+                time.sleep(remaining)
+            while clock() < self.deadline:
+                pass
+            now = clock()
+
+        self.stats.record(now - self.last_tick)
+        self.last_tick = now
+        self.deadline += self.period
+        return now
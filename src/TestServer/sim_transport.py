@@ -0,0 +1,675 @@
+#!/usr/bin/env python3
+"""
+Simulator transport speaking the SSL simulation protocol, plus a local stand-in simulator.
+
+The real robots take one TritonBotMessage per robot per tick. A simulator
+(grSim, ER-Force) instead takes one RobotControl per team on its team port,
+a repeated RobotCommand covering every robot, and answers each datagram with
+a RobotControlResponse carrying per-robot feedback and errors. SimTransport
+keeps the current command of every robot of one team and sends them all in
+a single datagram per flush().
+
+Each RobotCommand is a fixed 38-byte record (id, local velocity, kick speed,
+kick angle, dribbler), so the team datagram is kept in one bytearray and a
+command update packs four floats into its slot; no message objects are built
+per tick. --check verifies that the bytes are exactly what the protobuf
+runtime serializes for the same RobotControl.
+
+SimTransport also has a sendto(datagram, dest) that decodes TritonBot
+datagrams and stages their commands, so DeltaSender, fleet_commander-style
+loops and teleop_async's ProtobufTransport drive a simulator unchanged; call
+flush() once per tick (or pass autoflush=True for single-robot senders).
+
+LocalSimulator is a minimal simulator for one Linux box: it listens on both
+team ports, runs each command through the firmware's wheel_speeds
+(saturation and int truncation included), lags the wheels with a first-order
+motor response, maps the wheel speeds back to a body twist with the
+pseudo-inverse of WHEEL_MATRIX, integrates the poses, and publishes them as
+SSL-Vision frames on the vision multicast group. Robots without a command
+for COMMAND_TIMEOUT seconds stop, like the STM32 safety timeout. The
+simulator control port (10300: teleport, ball placement) is not implemented.
+
+Usage:
+    sim = SimTransport('blue', '127.0.0.1')
+    sim.set_command(2, forward=1.0, left=0.0, angular=0.5)
+    sim.flush()                        # one RobotControl for the whole team
+    sim.poll_responses()               # -> sim.feedback, sim.errors
+
+    python sim_transport.py --check
+    python sim_transport.py --serve                      # stand-in simulator
+    python sim_transport.py --loopback --robots 11       # closed loop through vision
+    python sim_transport.py --bench 100000
+"""
+import argparse
+import math
+import socket
+import struct
+import threading
+import time
+
+import numpy as np
+from google.protobuf.message import DecodeError
+
+from kinematics import MAX_VELOCITY, RESCALE_FACTOR, WHEEL_MATRIX, WHEEL_RADIUS, wheel_speeds
+from triton_codec import TritonBotEncoder, decode
+from vision_receiver import (TEAM_BLUE, TEAM_NAMES, TEAM_YELLOW, VISION_GROUP, VISION_PORT,
+                             VisionFrameGenerator)
+
+CONTROL_PORT = 10300
+TEAM_PORTS = {'blue': 10301, 'yellow': 10302}
+
+COMMAND_TIMEOUT = 2.0  # s; the STM32 stops after 200 loops at 100 Hz without a frame
+WHEEL_TAU = 0.05       # s; first-order wheel response of the stand-in simulator
+ROBOT_RADIUS = 90.0    # mm
+BALL_RADIUS = 21.5     # mm
+
+# RobotCommand { id=1 varint, move_command=2 { local_velocity=2 { forward=1 left=2 angular=3 } },
+#                kick_speed=3, kick_angle=4, dribbler_speed=5 } inside RobotControl.robot_commands=1
+_RECORD = struct.Struct('<8B' + 'Bf' * 6)
+RECORD_SIZE = _RECORD.size
+_RECORD_BODY = RECORD_SIZE - 2
+_VELOCITY = struct.Struct('<fBfBf')  # forward, left tag, left, angular tag, angular
+_VELOCITY_OFFSET = 9
+_KICK = struct.Struct('<f')
+_KICK_OFFSET = 24
+MAX_RECORD_ID = 127  # ids above this need a two-byte varint
+
+# (forward, left, angular) of the body for FR, BR, BL, FL wheel surface speeds in m/s
+BODY_MATRIX = np.linalg.pinv(WHEEL_MATRIX)
+
+
+def encode_record(robot_id: int, forward: float, left: float, angular: float,
+                  kick_speed: float = 0.0, kick_angle: float = 0.0, dribbler_speed: float = 0.0) -> bytes:
+    """One RobotControl.robot_commands entry with a local-velocity move command."""
+    return _RECORD.pack(1 << 3 | 2, _RECORD_BODY, 1 << 3, robot_id, 2 << 3 | 2, 17, 2 << 3 | 2, 15,
+                        1 << 3 | 5, forward, 2 << 3 | 5, left, 3 << 3 | 5, angular,
+                        3 << 3 | 5, kick_speed, 4 << 3 | 5, kick_angle, 5 << 3 | 5, dribbler_speed)
+
+
+class SimStats:
+    """What a SimTransport sent and what the simulator answered."""
+
+    def __init__(self):
+        self.datagrams = 0
+        self.bytes = 0
+        self.commands = 0
+        self.staged = 0
+        self.responses = 0
+        self.feedback = 0
+        self.errors = 0
+        self.decode_errors = 0
+
+    def summary(self) -> str:
+        per = self.commands / self.datagrams if self.datagrams else 0.0
+        return (f"sim: {self.datagrams} datagrams ({self.bytes} B, {per:.1f} robots each), "
+                f"{self.responses} responses, {self.feedback} feedback, {self.errors} errors, "
+                f"{self.decode_errors} undecodable")
+
+
+class SimTransport:
+    """All robots of one team in one RobotControl datagram per flush()."""
+
+    def __init__(self, team: str = 'blue', host: str = '127.0.0.1', port: int = None,
+                 sock=None, autoflush: bool = False):
+        self.team = team
+        self.dest = (host, port or TEAM_PORTS[team])
+        if sock is None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+            sock.setblocking(False)
+        self.sock = sock
+        self.autoflush = autoflush
+        self.buffer = bytearray()
+        self.slots = {}  # robot id -> record offset in self.buffer
+        self.kicking = set()
+        self.dirty = False
+        self.feedback = {}  # robot id -> latest RobotFeedback
+        self.errors = []    # (code, message) of every SimulatorError received
+        self.stats = SimStats()
+
+    def _slot(self, robot_id: int) -> int:
+        offset = self.slots.get(robot_id)
+        if offset is None:
+            if not 0 <= robot_id <= MAX_RECORD_ID:
+                raise ValueError(f"robot id {robot_id} out of range 0-{MAX_RECORD_ID}")
+            offset = self.slots[robot_id] = len(self.buffer)
+            self.buffer += encode_record(robot_id, 0.0, 0.0, 0.0)
+        return offset
+
+    def set_command(self, robot_id: int, forward: float, left: float, angular: float,
+                    kick_speed: float = 0.0, kick_angle: float = 0.0, dribbler_speed: float = 0.0):
+        """Replace a robot's command; it goes out with the next flush(). A kick is sent once."""
+        offset = self._slot(robot_id)
+        _RECORD.pack_into(self.buffer, offset, 1 << 3 | 2, _RECORD_BODY, 1 << 3, robot_id, 2 << 3 | 2, 17,
+                          2 << 3 | 2, 15, 1 << 3 | 5, forward, 2 << 3 | 5, left, 3 << 3 | 5, angular,
+                          3 << 3 | 5, kick_speed, 4 << 3 | 5, kick_angle, 5 << 3 | 5, dribbler_speed)
+        if kick_speed:
+            self.kicking.add(robot_id)
+        self.dirty = True
+        if self.autoflush:
+            self.flush()
+
+    def set_velocity(self, robot_id: int, forward: float, left: float, angular: float):
+        """Update only the velocity of a robot already set, keeping its kick and dribbler fields."""
+        _VELOCITY.pack_into(self.buffer, self._slot(robot_id) + _VELOCITY_OFFSET,
+                            forward, 2 << 3 | 5, left, 3 << 3 | 5, angular)
+        self.dirty = True
+
+    def sendto(self, data, dest=None) -> int:
+        """Stage the command of a TritonBot datagram, so TritonBot senders can use this as their socket."""
+        try:
+            fields = decode(data)
+        except ValueError:
+            self.stats.decode_errors += 1
+            return len(data)
+        if not 0 <= fields.id <= MAX_RECORD_ID:
+            self.stats.decode_errors += 1  # an id no RobotCommand can carry
+            return len(data)
+        self.stats.staged += 1
+        self.set_command(fields.id, fields.forward, fields.left, fields.angular,
+                         fields.kick_speed, fields.kick_angle, fields.dribbler_speed)
+        return len(data)
+
+    def flush(self) -> int:
+        """Send every robot's current command in one datagram if anything changed; return bytes sent."""
+        if not self.dirty:
+            return 0
+        try:
+            sent = self.sock.sendto(self.buffer, self.dest)
+        except BlockingIOError:
+            return 0  # stays dirty: the next flush retries
+        self.dirty = False
+        stats = self.stats
+        stats.datagrams += 1
+        stats.bytes += sent
+        stats.commands += len(self.slots)
+        for rid in self.kicking:
+            _KICK.pack_into(self.buffer, self.slots[rid] + _KICK_OFFSET, 0.0)
+        self.kicking.clear()
+        return sent
+
+    def poll_responses(self) -> int:
+        """Read every pending RobotControlResponse without blocking; return how many were read."""
+        from protocols import RobotControlResponse
+
+        stats = self.stats
+        count = 0
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            except ConnectionRefusedError:
+                continue  # nothing listening on the team port (yet)
+            response = RobotControlResponse()
+            try:
+                response.ParseFromString(data)
+            except DecodeError:
+                stats.decode_errors += 1
+                continue
+            count += 1
+            for feedback in response.feedback:
+                self.feedback[feedback.id] = feedback
+            for error in response.errors:
+                self.errors.append((error.code, error.message))
+            stats.feedback += len(response.feedback)
+            stats.errors += len(response.errors)
+        stats.responses += count
+        return count
+
+    def close(self):
+        self.sock.close()
+
+
+class SimVision(VisionFrameGenerator):
+    """Publishes LocalSimulator's poses through the VisionFrameGenerator frame builder."""
+
+    def __init__(self, sim, cameras: int = 1, noise: float = 1.0, seed: int = 0):
+        super().__init__(cameras, sim.robots_per_team, sim.field, noise=noise, seed=seed)
+        self.sim = sim
+
+    def truth(self, t: float):
+        # yellow first, as VisionFrameGenerator lays robots out; NaN hides absent robots
+        return self.sim.snapshot()
+
+    def ball(self, t: float):
+        return self.sim.ball
+
+
+class LocalSimulator:
+    """Stand-in simulator: omni-wheel kinematics per robot, both team ports, vision out."""
+
+    def __init__(self, robots_per_team: int = 11, host: str = '127.0.0.1', ports=None,
+                 field=(12000, 9000), vision_dest=(VISION_GROUP, VISION_PORT), vision_rate: float = 60.0,
+                 wheel_tau: float = WHEEL_TAU, timeout: float = COMMAND_TIMEOUT):
+        self.robots_per_team = robots_per_team
+        self.field = field
+        self.vision_rate = vision_rate
+        self.vision_dest = vision_dest
+        self.wheel_tau = wheel_tau
+        self.timeout = timeout
+        self.ball = (0.0, 0.0)
+        n = robots_per_team
+        # (team, robot) arrays, indexed by vision_receiver's TEAM_YELLOW / TEAM_BLUE
+        self.pose = np.zeros((2, n, 3))           # x mm, y mm, orientation rad
+        self.wheels = np.zeros((2, n, 4))         # FR, BR, BL, FL surface speed, m/s
+        self.target = np.zeros((2, n, 4))
+        self.last_command = np.full((2, n), -math.inf)
+        self.present = np.ones((2, n), dtype=bool)
+        self.ball_contact = np.zeros((2, n), dtype=bool)
+        self.commands = 0
+        self.datagrams = 0
+        self.rejected = 0
+        self.kicks = 0
+        self.place_robots()
+
+        ports = ports or TEAM_PORTS
+        self.socks = {}
+        for name, port in ports.items():
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+            sock.bind((host, port))
+            sock.setblocking(False)
+            self.socks[TEAM_NAMES[name]] = sock
+        self.vision_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        self.vision_sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, struct.pack('b', 1))
+        self.vision_sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+        self.vision = SimVision(self)
+        self._stop = threading.Event()
+
+    def place_robots(self):
+        """Kick-off formation: each team in a column on its own half, facing the centre."""
+        n = self.robots_per_team
+        spacing = min(400.0, (self.field[1] - 1000) / max(n - 1, 1))
+        y = (np.arange(n) - (n - 1) / 2) * spacing
+        self.pose[TEAM_YELLOW] = np.column_stack([np.full(n, -1500.0), y, np.zeros(n)])
+        self.pose[TEAM_BLUE] = np.column_stack([np.full(n, 1500.0), y, np.full(n, math.pi)])
+        self.wheels[:] = 0.0
+        self.target[:] = 0.0
+
+    def snapshot(self):
+        """(x, y, orientation) of every robot as flat arrays, yellow first, NaN for absent ones."""
+        pose = np.where(self.present[..., None], self.pose, np.nan).reshape(-1, 3)
+        return pose[:, 0], pose[:, 1], pose[:, 2]
+
+    def apply_commands(self, team: int, control, now: float) -> list:
+        """Set wheel targets from a RobotControl; return SimulatorErrors as (code, message)."""
+        errors = []
+        n = self.robots_per_team
+        for command in control.robot_commands:
+            rid = command.id
+            if rid >= n or not self.present[team, rid]:
+                errors.append(('UNKNOWN_ROBOT', f"no robot {rid} in this team"))
+                continue
+            self.commands += 1
+            self.last_command[team, rid] = now
+            if command.kick_speed > 0:
+                self.kicks += 1
+            move = command.move_command
+            kind = move.WhichOneof('command')
+            if kind is None:
+                continue  # keeps the previous move command
+            if kind == 'wheel_velocity':
+                w = move.wheel_velocity
+                speeds = np.array([w.front_right, w.back_right, w.back_left, w.front_left], dtype=np.float32)
+                # the firmware saturates and truncates in motor units
+                speeds = np.clip(speeds.astype(np.float64) / WHEEL_RADIUS, -MAX_VELOCITY, MAX_VELOCITY)
+                self.target[team, rid] = np.trunc(speeds * RESCALE_FACTOR) / RESCALE_FACTOR * WHEEL_RADIUS
+                continue
+            if kind == 'local_velocity':
+                v = move.local_velocity
+                forward, left, angular = v.forward, v.left, v.angular
+            else:
+                v = move.global_velocity
+                theta = self.pose[team, rid, 2]
+                c, s = math.cos(theta), math.sin(theta)
+                forward, left, angular = v.x * c + v.y * s, -v.x * s + v.y * c, v.angular
+            speeds = wheel_speeds(forward, left, angular)[0]
+            self.target[team, rid] = speeds / RESCALE_FACTOR * WHEEL_RADIUS
+        return errors
+
+    def handle_datagram(self, team: int, data: bytes, now: float) -> bytes:
+        """Apply one RobotControl and build the RobotControlResponse for it."""
+        from protocols import RobotControl, RobotControlResponse
+
+        self.datagrams += 1
+        response = RobotControlResponse()
+        control = RobotControl()
+        try:
+            control.ParseFromString(data)
+        except DecodeError:
+            self.rejected += 1
+            response.errors.add(code='DECODE', message='could not parse RobotControl')
+            return response.SerializeToString()
+        for code, message in self.apply_commands(team, control, now):
+            response.errors.add(code=code, message=message)
+        seen = set()
+        for command in control.robot_commands:
+            rid = command.id
+            if rid < self.robots_per_team and rid not in seen:
+                seen.add(rid)
+                response.feedback.add(id=rid, dribbler_ball_contact=bool(self.ball_contact[team, rid]))
+        return response.SerializeToString()
+
+    def receive(self, now: float) -> int:
+        """Drain both team ports, answering every datagram; return datagrams handled."""
+        handled = 0
+        for team, sock in self.socks.items():
+            while True:
+                try:
+                    data, addr = sock.recvfrom(65536)
+                except (BlockingIOError, InterruptedError):
+                    break
+                try:
+                    sock.sendto(self.handle_datagram(team, data, now), addr)
+                except (BlockingIOError, ConnectionRefusedError):
+                    pass
+                handled += 1
+        return handled
+
+    def step(self, dt: float, now: float):
+        """Advance every robot by dt seconds."""
+        stale = now - self.last_command > self.timeout
+        self.target[stale] = 0.0
+        self.wheels += (self.target - self.wheels) * (1.0 - math.exp(-dt / self.wheel_tau))
+        # columns of BODY_MATRIX rows: (rotV, vx = left, vy = forward), as in WHEEL_MATRIX
+        body = self.wheels @ BODY_MATRIX.T
+        angular, left, forward = body[..., 0], body[..., 1], body[..., 2]
+        theta = self.pose[..., 2]
+        c, s = np.cos(theta), np.sin(theta)
+        self.pose[..., 0] += (forward * c - left * s) * 1000.0 * dt
+        self.pose[..., 1] += (forward * s + left * c) * 1000.0 * dt
+        self.pose[..., 2] = (theta + angular * dt + math.pi) % (2 * math.pi) - math.pi
+        half_l, half_w = self.field[0] / 2, self.field[1] / 2
+        np.clip(self.pose[..., 0], -half_l, half_l, out=self.pose[..., 0])
+        np.clip(self.pose[..., 1], -half_w, half_w, out=self.pose[..., 1])
+        # ball contact: ball touching the front of the robot
+        dx = self.ball[0] - self.pose[..., 0]
+        dy = self.ball[1] - self.pose[..., 1]
+        facing = np.abs((np.arctan2(dy, dx) - theta + math.pi) % (2 * math.pi) - math.pi) < math.pi / 6
+        self.ball_contact = facing & (np.hypot(dx, dy) < ROBOT_RADIUS + BALL_RADIUS + 10.0)
+
+    def publish_vision(self, t: float) -> int:
+        for camera in range(self.vision.cameras):
+            self.vision_sock.sendto(self.vision.frame(camera, t), self.vision_dest)
+        return self.vision.cameras
+
+    def run(self, rate: float = 200.0, duration: float = 0.0):
+        """Physics at `rate` Hz, vision every 1/vision_rate s, until stop() or `duration` s."""
+        from scheduler import TickScheduler
+
+        scheduler = TickScheduler(rate)
+        dt = 1.0 / rate
+        vision_every = max(1, round(rate / self.vision_rate))
+        self.vision_sock.sendto(self.vision.geometry(), self.vision_dest)
+        start = time.perf_counter()
+        tick = 0
+        while not self._stop.is_set():
+            now = time.perf_counter()
+            if duration and now - start >= duration:
+                break
+            self.receive(now)
+            self.step(dt, now)
+            if tick % vision_every == 0:
+                self.publish_vision(time.time())
+            tick += 1
+            scheduler.wait()
+        return tick
+
+    def start(self, rate: float = 200.0) -> threading.Thread:
+        thread = threading.Thread(target=self.run, args=(rate,), name='simulator', daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
+
+    def close(self):
+        for sock in self.socks.values():
+            sock.close()
+        self.vision_sock.close()
+
+
+def check_encoding(n: int = 1000, seed: int = 0) -> int:
+    """Compare the hand-packed team datagram with protobuf serialization; return mismatches."""
+    from protocols import RobotControl
+
+    rng = np.random.default_rng(seed)
+    failures = 0
+
+    class Capture:
+        def sendto(self, data, dest):
+            self.data = bytes(data)
+            return len(data)
+
+    for _ in range(n):
+        capture = Capture()
+        transport = SimTransport(sock=capture)
+        expected = RobotControl()
+        ids = rng.permutation(16)[:rng.integers(1, 17)]
+        for rid in ids.tolist():
+            values = rng.normal(0, 3, 6).astype(np.float32).tolist()
+            if rng.random() < 0.5:
+                values[3] = 0.0
+            transport.set_command(rid, *values)
+            command = expected.robot_commands.add(id=rid, kick_speed=values[3], kick_angle=values[4],
+                                                  dribbler_speed=values[5])
+            command.move_command.local_velocity.forward = values[0]
+            command.move_command.local_velocity.left = values[1]
+            command.move_command.local_velocity.angular = values[2]
+        transport.flush()
+        if capture.data != expected.SerializeToString():
+            failures += 1
+            if failures <= 3:
+                print(f"MISMATCH for robots {ids.tolist()}")
+                print(f"  hand     {capture.data.hex()}")
+                print(f"  protobuf {expected.SerializeToString().hex()}")
+
+    # a kick goes out once, then the slot is back to zero
+    capture = Capture()
+    transport = SimTransport(sock=capture)
+    transport.set_command(3, 1.0, 0.0, 0.0, kick_speed=4.0)
+    transport.flush()
+    transport.set_velocity(3, 1.0, 0.5, 0.0)
+    transport.flush()
+    parsed = RobotControl.FromString(capture.data).robot_commands[0]
+    if parsed.kick_speed != 0.0 or parsed.move_command.local_velocity.left != 0.5:
+        print(f"MISMATCH: kick not cleared after flush: {parsed}")
+        failures += 1
+
+    # TritonBot datagrams staged through sendto()
+    capture = Capture()
+    transport = SimTransport(sock=capture)
+    transport.sendto(TritonBotEncoder(7).encode(1.5, -0.5, 2.0, 0.0, 0.0, 1.0), None)
+    transport.flush()
+    parsed = RobotControl.FromString(capture.data).robot_commands[0]
+    local = parsed.move_command.local_velocity
+    if (parsed.id, local.forward, local.left, local.angular, parsed.dribbler_speed) != (7, 1.5, -0.5, 2.0, 1.0):
+        print(f"MISMATCH: TritonBot datagram staged as {parsed}")
+        failures += 1
+    return failures
+
+
+def check_kinematics() -> int:
+    """An unsaturated local velocity must come back out of the wheel model unchanged."""
+    failures = 0
+    for forward, left, angular in ((1.0, 0.0, 0.0), (0.0, -1.0, 0.0), (0.0, 0.0, 3.0), (0.7, 0.4, -2.0)):
+        wheels = wheel_speeds(forward, left, angular)[0] / RESCALE_FACTOR * WHEEL_RADIUS
+        rot, vx, vy = BODY_MATRIX @ wheels
+        # motor-unit truncation costs at most ~1e-3 m/s
+        if max(abs(vy - forward), abs(vx - left), abs(rot - angular) * 0.09) > 2e-3:
+            print(f"MISMATCH: ({forward}, {left}, {angular}) -> ({vy:.4f}, {vx:.4f}, {rot:.4f})")
+            failures += 1
+    return failures
+
+
+def run_benchmark(n: int, robots: int = 11):
+    """Per-tick encode cost: hand-packed RobotControl vs protobuf RobotControl vs one TritonBot per robot."""
+    from protocols import RobotControl
+
+    class Discard:
+        def sendto(self, data, dest):
+            return len(data)
+
+    rng = np.random.default_rng(0)
+    commands = rng.normal(0, 1, (256, robots, 3)).astype(np.float32).tolist()
+    transport = SimTransport(sock=Discard())
+    encoders = [TritonBotEncoder(rid) for rid in range(robots)]
+
+    def hand(tick):
+        for rid, (f, l, a) in enumerate(commands[tick & 255]):
+            transport.set_velocity(rid, f, l, a)
+        return transport.flush()
+
+    def protobuf(tick):
+        control = RobotControl()
+        for rid, (f, l, a) in enumerate(commands[tick & 255]):
+            local = control.robot_commands.add(id=rid, kick_speed=0.0, kick_angle=0.0,
+                                               dribbler_speed=0.0).move_command.local_velocity
+            local.forward, local.left, local.angular = f, l, a
+        return len(control.SerializeToString())
+
+    def triton(tick):
+        size = 0
+        for rid, (f, l, a) in enumerate(commands[tick & 255]):
+            size += len(encoders[rid].encode(f, l, a, 0.0, 0.0, 0.0))
+        return size
+
+    for rid in range(robots):
+        transport.set_command(rid, 0.0, 0.0, 0.0)
+    print(f"{robots} robots per tick, {n} ticks")
+    print(f"{'encoder':<28} {'us/tick':>8} {'bytes/tick':>11} {'datagrams/tick':>15}")
+    for label, fn, datagrams in (('hand-packed RobotControl', hand, 1),
+                                 ('protobuf RobotControl', protobuf, 1),
+                                 ('TritonBot per robot', triton, robots)):
+        size = fn(0)
+        start = time.perf_counter()
+        for tick in range(n):
+            fn(tick)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<28} {elapsed / n * 1e6:8.2f} {size:11d} {datagrams:15d}")
+
+
+def run_loopback(args) -> bool:
+    """Drive one team to waypoints through the stand-in simulator and its vision, then report."""
+    from scheduler import TickScheduler
+    from vision_receiver import VisionState, start_vision_thread
+
+    n = args.robots
+    team = TEAM_NAMES[args.team]
+    vision_dest = (VISION_GROUP, args.vision_port)
+    sim = LocalSimulator(n, vision_dest=vision_dest, vision_rate=args.vision_rate)
+    state = VisionState()
+    start_vision_thread(state, VISION_GROUP, args.vision_port)
+    sim.start(args.physics_rate)
+    transport = SimTransport(args.team)
+
+    # waypoints: a circle around the team's half, every robot facing the centre spot
+    side = -1.0 if team == TEAM_YELLOW else 1.0
+    angle = np.linspace(0, 2 * math.pi, n, endpoint=False)
+    goal = np.column_stack([side * 2500 + 1500 * np.cos(angle), 1500 * np.sin(angle)])
+    goal_heading = np.arctan2(-goal[:, 1], -goal[:, 0])
+
+    scheduler = TickScheduler(args.rate)
+    start = time.perf_counter()
+    settled_at = None
+    triton_bytes = 0
+    encoders = [TritonBotEncoder(rid) for rid in range(n)]
+    while time.perf_counter() - start < args.duration:
+        rows = state.snapshot()[0][team, :n]
+        if rows['valid'].all():
+            ex = goal[:, 0] - rows['x']
+            ey = goal[:, 1] - rows['y']
+            theta = rows['orientation'].astype(np.float64)
+            distance = np.hypot(ex, ey) / 1000.0
+            speed = np.minimum(args.gain * distance, args.max_speed)
+            scale = np.divide(speed, distance, out=np.zeros(n), where=distance > 1e-6)
+            vx, vy = ex / 1000.0 * scale, ey / 1000.0 * scale
+            forward = vx * np.cos(theta) + vy * np.sin(theta)
+            left = -vx * np.sin(theta) + vy * np.cos(theta)
+            heading_error = (goal_heading - theta + math.pi) % (2 * math.pi) - math.pi
+            angular = np.clip(4.0 * heading_error, -6.0, 6.0)
+            for rid in range(n):
+                transport.set_velocity(rid, float(forward[rid]), float(left[rid]), float(angular[rid]))
+                triton_bytes += len(encoders[rid].encode(forward[rid], left[rid], angular[rid], 0.0, 0.0, 0.0))
+            transport.flush()
+            if settled_at is None and np.all(np.hypot(ex, ey) < args.tolerance) and \
+                    np.all(np.abs(heading_error) < 0.05):
+                settled_at = time.perf_counter() - start
+        transport.poll_responses()
+        scheduler.wait()
+
+    # a command for a robot the simulator doesn't have must come back as an error
+    transport.set_command(n, 0.0, 0.0, 0.0)
+    transport.flush()
+    time.sleep(0.1)
+    transport.poll_responses()
+    sim.stop()
+    time.sleep(0.05)
+
+    x, y, orientation = sim.pose[team, :, 0], sim.pose[team, :, 1], sim.pose[team, :, 2]
+    error = np.hypot(goal[:, 0] - x, goal[:, 1] - y)
+    heading = np.abs((goal_heading - orientation + math.pi) % (2 * math.pi) - math.pi)
+    stats = transport.stats
+    ticks = stats.datagrams - 1
+    print(f"loopback: {n} {args.team} robots, "
+          f"{args.rate:g} Hz control, {args.physics_rate:g} Hz physics, {args.vision_rate:g} Hz vision")
+    print(f"  settled within {args.tolerance:g} mm in "
+          f"{'never' if settled_at is None else f'{settled_at:.2f} s'}; final position error "
+          f"mean {error.mean():.1f} mm max {error.max():.1f} mm, heading error max {math.degrees(heading.max()):.2f} deg")
+    print(f"  {stats.summary()}")
+    if ticks > 0:
+        print(f"  per tick: 1 datagram of {RECORD_SIZE * n} B vs {n} TritonBot datagrams of "
+              f"{triton_bytes / ticks:.0f} B total")
+    print(f"  simulator: {sim.datagrams} datagrams, {sim.commands} commands, vision {state.stats.frames} frames")
+    unknown = [code for code, _ in transport.errors]
+    print(f"  errors reported: {unknown}")
+    sim.close()
+    transport.close()
+    return settled_at is not None and unknown == ['UNKNOWN_ROBOT'] and stats.feedback > 0
+
+
+def main():
+    p = argparse.ArgumentParser(description="SSL simulation protocol transport and a local stand-in simulator")
+    mode = p.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--check", action="store_true", help="Verify the hand-packed encoding and the wheel model")
+    mode.add_argument("--serve", action="store_true", help="Run the stand-in simulator until Ctrl-C")
+    mode.add_argument("--loopback", action="store_true", help="Closed-loop waypoint test against the stand-in")
+    mode.add_argument("--bench", type=int, default=0, metavar="N", help="Encode N ticks with each encoder")
+    p.add_argument("--robots", type=int, default=11, help="Robots per team")
+    p.add_argument("--team", choices=sorted(TEAM_PORTS), default='blue', help="Team driven by --loopback")
+    p.add_argument("--host", default='127.0.0.1', help="Address the simulator binds for --serve")
+    p.add_argument("--rate", type=float, default=100.0, help="Control rate for --loopback (Hz)")
+    p.add_argument("--physics-rate", type=float, default=200.0, help="Simulator step rate (Hz)")
+    p.add_argument("--vision-rate", type=float, default=60.0, help="Simulator vision rate (Hz)")
+    p.add_argument("--vision-port", type=int, default=VISION_PORT, help="Vision port the simulator publishes to")
+    p.add_argument("--duration", type=float, default=6.0, help="Seconds for --loopback")
+    p.add_argument("--gain", type=float, default=3.0, help="Position gain for --loopback (1/s)")
+    p.add_argument("--max-speed", type=float, default=2.0, help="Speed limit for --loopback (m/s)")
+    p.add_argument("--tolerance", type=float, default=20.0, help="Settled position tolerance for --loopback (mm)")
+    args = p.parse_args()
+
+    if args.check:
+        failures = check_encoding() + check_kinematics()
+        print(f"{'OK' if not failures else f'{failures} FAILED'}: hand-packed RobotControl matches protobuf, "
+              f"wheel model inverts the firmware kinematics")
+        raise SystemExit(1 if failures else 0)
+    if args.bench:
+        run_benchmark(args.bench, args.robots)
+        return
+    if args.loopback:
+        raise SystemExit(0 if run_loopback(args) else 1)
+
+    sim = LocalSimulator(args.robots, args.host, vision_dest=(VISION_GROUP, args.vision_port),
+                         vision_rate=args.vision_rate)
+    print(f"Simulating {args.robots} robots per team: blue on {TEAM_PORTS['blue']}, yellow on "
+          f"{TEAM_PORTS['yellow']}, vision to {VISION_GROUP}:{args.vision_port}")
+    try:
+        sim.run(args.physics_rate)
+    except KeyboardInterrupt:
+        print('\nStopping.')
+    finally:
+        print(f"{sim.datagrams} datagrams, {sim.commands} commands, {sim.kicks} kicks, {sim.rejected} rejected")
+        sim.close()
+
+
+if __name__ == '__main__':
+    main()
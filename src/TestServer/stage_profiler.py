@@ -0,0 +1,534 @@
+#!/usr/bin/env python3
+"""
+Per-stage timing for the TestServer send loops, with JSON lines and Prometheus export.
+
+A loop names its stages once and brackets each one with the monotonic
+nanosecond clock:
+
+    profiler = Profiler(budget=0.01)
+    build = profiler.stage('build')
+    ...
+    profiler.tick_begin()
+    with build:
+        data = message.SerializeToString()
+    profiler.tick_end()
+
+Each Stage keeps a total, a max and a log2 histogram (bucket =
+ns.bit_length(), so recording is an int method call and a list increment;
+the count is the histogram's sum). tick_end() compares the tick with the
+budget; an over-budget tick is counted and sampled with the time each
+stage took within it (the difference of its running total since the
+previous tick), so a slow tick shows where the time went rather than just
+that it happened.
+
+Disabled profiling is NULL_PROFILER, whose stages are one shared object
+with empty methods; add_profile_arguments() / start_profiler() give every
+script the same --profile flags and return it when none is given. That is
+cheap, not free: `with` still calls the empty __enter__ and __exit__, about
+a third of an enabled stage (roughly 200 ns against 600-900 ns, and 700-1000
+ns for tick_begin() + tick_end(), depending on the machine). At the 10-100
+Hz of these loops that is a few microseconds per tick either way; a loop
+that times something much shorter should not wrap it in its own stage.
+--bench measures all of these.
+
+Snapshots go out as JSON lines (appended to a file) or the Prometheus text
+exposition format (rewritten atomically, for the node-exporter textfile
+collector), every `interval` seconds, and/or over HTTP on loopback at
+/metrics and /snapshot.
+
+Usage:
+    python UserControl.py --profile --profile-out /tmp/teleop.prom --profile-port 9464
+    curl -s localhost:9464/metrics
+
+    python stage_profiler.py --bench
+    python stage_profiler.py --check
+    python stage_profiler.py --demo --profile-port 9464 --duration 30
+"""
+import argparse
+import collections
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+perf_counter_ns = time.perf_counter_ns
+
+BUCKETS = 64
+# exported histogram bounds: 2**8 ns (256 ns) .. 2**32 ns (4.3 s)
+_EXPORT_BUCKETS = range(8, 33)
+
+
+class Stage:
+    """Total, max and a log2 histogram of one named stage, in nanoseconds.
+
+    A stage has one start slot, so it cannot be nested inside itself (or
+    entered from two threads at once); that raises RuntimeError instead of
+    recording a wrong time. Give each nesting level or thread its own stage.
+    """
+
+    __slots__ = ('name', 'total', 'max', 'buckets', '_start')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.total = 0
+        self.max = 0
+        self.buckets = [0] * BUCKETS
+        self._start = 0
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets)
+
+    def add(self, ns: int):
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+        self.buckets[ns.bit_length()] += 1
+
+    def __enter__(self):
+        if self._start:
+            raise RuntimeError(f"stage {self.name!r} entered again before it exited")
+        self._start = perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        ns = perf_counter_ns() - self._start  # add() inlined: this is the hot path
+        self._start = 0
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+        self.buckets[ns.bit_length()] += 1
+        return False
+
+    def percentile(self, q: float) -> float:
+        """Upper bound (ns) of the bucket holding the q-th percentile; 0 if empty."""
+        count = self.count
+        if not count:
+            return 0.0
+        rank = q / 100.0 * count
+        seen = 0
+        for b, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return float(1 << b)
+        return float(self.max)
+
+    def snapshot(self) -> dict:
+        count = self.count
+        return {'count': count, 'total_ns': self.total, 'max_ns': self.max,
+                'mean_ns': self.total / count if count else 0.0,
+                'p50_ns': self.percentile(50), 'p99_ns': self.percentile(99),
+                'buckets': {str(1 << b): n for b, n in enumerate(self.buckets) if n}}
+
+
+class _NullStage:
+    """Stand-in for a Stage when profiling is off."""
+
+    __slots__ = ()
+
+    def add(self, ns: int):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_STAGE = _NullStage()
+
+
+class Profiler:
+    """Named stages, a per-tick total, and samples of ticks over `budget` seconds."""
+
+    enabled = True
+
+    def __init__(self, name: str = 'testserver', budget: float = None, max_samples: int = 256):
+        self.name = name
+        self.budget_ns = int(budget * 1e9) if budget else 0
+        self.stages = {}
+        self.tick = Stage('tick')
+        self.overruns = 0
+        self.samples = collections.deque(maxlen=max_samples)
+        self.started = time.time()
+        self._tick_start = 0
+        self._stage_list = []
+        self._marks = []  # stage totals at the end of the previous tick
+
+    def stage(self, name: str) -> Stage:
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = Stage(name)
+            self._stage_list.append(stage)
+            self._marks.append(0)
+        return stage
+
+    def tick_begin(self):
+        self._tick_start = perf_counter_ns()
+
+    def tick_end(self) -> bool:
+        """Close the tick; True (and a sample) if it ran over budget."""
+        elapsed = perf_counter_ns() - self._tick_start
+        self.tick.add(elapsed)
+        if not self.budget_ns:
+            return False
+        # per-tick stage times are differences of the running totals, so the
+        # stages themselves keep nothing per tick
+        stages, marks = self._stage_list, self._marks
+        over = elapsed > self.budget_ns
+        if over:
+            self.overruns += 1
+            self.samples.append({'time': time.time(), 'tick_ns': elapsed,
+                                 'stages': {s.name: s.total - m for s, m in zip(stages, marks) if s.total > m}})
+        for i, stage in enumerate(stages):
+            marks[i] = stage.total
+        return over
+
+    def snapshot(self) -> dict:
+        return {'name': self.name, 'time': time.time(), 'uptime': time.time() - self.started,
+                'budget_ns': self.budget_ns, 'overruns': self.overruns, 'tick': self.tick.snapshot(),
+                'stages': {name: stage.snapshot() for name, stage in self.stages.items()},
+                'recent_overruns': list(self.samples)[-8:]}
+
+    def json_line(self) -> str:
+        return json.dumps(self.snapshot(), separators=(',', ':')) + '\n'
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition: one histogram per stage and the tick, plus the overrun counter."""
+        metric = f"{self.name}_stage_seconds"
+        lines = [f"# HELP {metric} Time spent per pipeline stage.", f"# TYPE {metric} histogram"]
+        for stage in [self.tick] + self._stage_list:
+            label = f'stage="{stage.name}"'
+            # bucket b holds durations with bit_length b, i.e. below 2**b ns
+            cumulative = sum(stage.buckets[:_EXPORT_BUCKETS.start])
+            for b in _EXPORT_BUCKETS:
+                cumulative += stage.buckets[b]
+                lines.append(f'{metric}_bucket{{{label},le="{(1 << b) / 1e9:.9g}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{{label},le="+Inf"}} {stage.count}')
+            lines.append(f'{metric}_sum{{{label}}} {stage.total / 1e9:.9f}')
+            lines.append(f'{metric}_count{{{label}}} {stage.count}')
+        lines += [f"# HELP {self.name}_tick_overruns_total Ticks that exceeded the budget.",
+                  f"# TYPE {self.name}_tick_overruns_total counter",
+                  f"{self.name}_tick_overruns_total {self.overruns}",
+                  f"# HELP {self.name}_tick_budget_seconds Tick budget (0 = none).",
+                  f"# TYPE {self.name}_tick_budget_seconds gauge",
+                  f"{self.name}_tick_budget_seconds {self.budget_ns / 1e9:.9g}"]
+        return '\n'.join(lines) + '\n'
+
+    def summary(self) -> str:
+        lines = [f"{'stage':<12} {'count':>8} {'mean us':>9} {'p99 us':>9} {'max us':>9} {'share':>6}"]
+        tick_total = self.tick.total or sum(s.total for s in self._stage_list) or 1
+        for stage in self._stage_list + [self.tick]:
+            if not stage.count:
+                continue
+            lines.append(f"{stage.name:<12} {stage.count:8d} {stage.total / stage.count / 1e3:9.2f} "
+                         f"{stage.percentile(99) / 1e3:9.1f} {stage.max / 1e3:9.1f} "
+                         f"{stage.total / tick_total:6.1%}")
+        if self.budget_ns:
+            lines.append(f"{self.overruns} of {self.tick.count} ticks over the {self.budget_ns / 1e6:g} ms budget")
+            if self.samples:
+                worst = max(self.samples, key=lambda s: s['tick_ns'])
+                parts = ', '.join(f"{k} {v / 1e3:.0f} us" for k, v in
+                                  sorted(worst['stages'].items(), key=lambda kv: -kv[1]))
+                lines.append(f"worst sampled tick {worst['tick_ns'] / 1e3:.0f} us: {parts}")
+        return '\n'.join(lines)
+
+
+class _NullProfiler:
+    """Profiler with every method a no-op, for uninstrumented runs."""
+
+    enabled = False
+    stages = {}
+    overruns = 0
+
+    def stage(self, name: str):
+        return NULL_STAGE
+
+    def tick_begin(self):
+        pass
+
+    def tick_end(self) -> bool:
+        return False
+
+    def summary(self) -> str:
+        return ''
+
+
+NULL_PROFILER = _NullProfiler()
+
+
+class SnapshotWriter:
+    """Writes a snapshot every `interval` s: appended JSON lines, or an atomically replaced .prom file."""
+
+    def __init__(self, profiler: Profiler, path: str, interval: float = 1.0):
+        self.profiler = profiler
+        self.path = path
+        self.interval = interval
+        self.prometheus = path.endswith('.prom')
+        self._stop = threading.Event()
+        self.thread = threading.Thread(target=self._run, name='profile-writer', daemon=True)
+        self.thread.start()
+
+    def write(self):
+        if self.prometheus:
+            tmp = f"{self.path}.tmp"
+            with open(tmp, 'w') as f:
+                f.write(self.profiler.prometheus())
+            os.replace(tmp, self.path)
+        else:
+            with open(self.path, 'a') as f:
+                f.write(self.profiler.json_line())
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def close(self):
+        self._stop.set()
+        self.thread.join()
+        self.write()
+
+
+def serve_metrics(profiler: Profiler, port: int, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """Serve /metrics (Prometheus) and /snapshot (JSON) from a daemon thread."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith('/metrics'):
+                body, kind = profiler.prometheus(), 'text/plain; version=0.0.4'
+            elif self.path.startswith('/snapshot'):
+                body, kind = json.dumps(profiler.snapshot()), 'application/json'
+            else:
+                self.send_error(404)
+                return
+            data = body.encode()
+            self.send_response(200)
+            self.send_header('Content-Type', kind)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name='profile-http', daemon=True).start()
+    return server
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser):
+    group = parser.add_argument_group('profiling')
+    group.add_argument("--profile", action="store_true", help="Time each pipeline stage and print a summary")
+    group.add_argument("--profile-out", default=None, metavar="PATH",
+                       help="Also write snapshots: PATH.prom (Prometheus text) or JSON lines otherwise")
+    group.add_argument("--profile-port", type=int, default=None, metavar="PORT",
+                       help="Also serve /metrics and /snapshot on 127.0.0.1:PORT")
+    group.add_argument("--profile-interval", type=float, default=1.0, help="Seconds between written snapshots")
+
+
+class ProfileSession:
+    """A profiler plus the exporters start_profiler() attached to it."""
+
+    def __init__(self, profiler, writer: SnapshotWriter = None, server: ThreadingHTTPServer = None):
+        self.profiler = profiler
+        self.writer = writer
+        self.server = server
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        if self.server is not None:
+            self.server.shutdown()
+        if self.profiler.enabled:
+            print(self.profiler.summary())
+
+
+def start_profiler(args, name: str, budget: float = None) -> ProfileSession:
+    """Profiler and exporters for add_profile_arguments() flags; NULL_PROFILER when none are set."""
+    if not (args.profile or args.profile_out or args.profile_port):
+        return ProfileSession(NULL_PROFILER)
+    profiler = Profiler(name, budget)
+    writer = SnapshotWriter(profiler, args.profile_out, args.profile_interval) if args.profile_out else None
+    server = serve_metrics(profiler, args.profile_port) if args.profile_port else None
+    return ProfileSession(profiler, writer, server)
+
+
+def run_benchmark(n: int):
+    """Cost of one timed stage (clock reads included) with profiling on and off."""
+    profiler = Profiler('bench', budget=0.01)
+    stage = profiler.stage('stage')
+    null = NULL_PROFILER.stage('stage')
+
+    def empty():
+        for _ in range(n):
+            pass
+
+    def manual(s):
+        for _ in range(n):
+            t = perf_counter_ns()
+            s.add(perf_counter_ns() - t)
+
+    def context(s):
+        for _ in range(n):
+            with s:
+                pass
+
+    def ticks(p):
+        for _ in range(n):
+            p.tick_begin()
+            p.tick_end()
+
+    def per_iteration(fn, *args):
+        best = float('inf')
+        for _ in range(5):
+            start = perf_counter_ns()
+            fn(*args)
+            best = min(best, perf_counter_ns() - start)
+        return best / n
+
+    base = per_iteration(empty)
+    results = (
+        ('with stage:', per_iteration(context, stage) - base),
+        ('t = clock(); stage.add(...)', per_iteration(manual, stage) - base),
+        ('tick_begin() + tick_end()', per_iteration(ticks, profiler) - base),
+        ('with stage: (disabled)', per_iteration(context, null) - base),
+        ('tick_begin() + tick_end() (disabled)', per_iteration(ticks, NULL_PROFILER) - base),
+    )
+    print(f"{'overhead per call':<40} {'ns':>7}   (best of 5 x {n})")
+    for label, ns in results:
+        print(f"{label:<40} {ns:7.0f}")
+    worst = max(ns for _, ns in results[:3])
+    print(f"{'OK' if worst < 1000 else 'OVER'}: enabled overhead up to {worst:.0f} ns per stage or tick "
+          f"(budget 1000 ns); a disabled stage still costs {results[3][1]:.0f} ns")
+    return worst < 1000
+
+
+def run_demo(args):
+    """A synthetic send loop (input / build / sendto / print) with an occasional slow print."""
+    import random
+    import socket
+
+    from scheduler import TickScheduler
+    from triton_codec import TritonBotEncoder
+
+    session = start_profiler(args, 'demo', budget=1.0 / args.rate)
+    profiler = session.profiler
+    poll, build, send, output = (profiler.stage(name) for name in ('input', 'build', 'sendto', 'print'))
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    encoder = TritonBotEncoder(2)
+    scheduler = TickScheduler(args.rate)
+    rng = random.Random(0)
+    start = time.perf_counter()
+    try:
+        while time.perf_counter() - start < args.duration:
+            profiler.tick_begin()
+            with poll:
+                forward = rng.choice((0.0, 3.0, -3.0))
+            with build:
+                data = encoder.encode(forward, 0.0, 0.0)
+            with send:
+                sock.sendto(data, ('127.0.0.1', 9))
+            with output:
+                if rng.random() < 0.02:
+                    time.sleep(1.5 / args.rate)  # a console that blocks now and then
+            profiler.tick_end()
+            scheduler.wait()
+    finally:
+        sock.close()
+        session.close()
+
+
+def check() -> int:
+    """Exports parse, overruns are sampled, the HTTP endpoint answers; return failures."""
+    import tempfile
+    import urllib.request
+
+    failures = 0
+    profiler = Profiler('check', budget=0.002)
+    fast, slow = profiler.stage('fast'), profiler.stage('slow')
+    for i in range(20):
+        profiler.tick_begin()
+        with fast:
+            pass
+        with slow:
+            if i % 10 == 0:
+                time.sleep(0.004)
+        profiler.tick_end()
+    if profiler.overruns != 2 or len(profiler.samples) != 2 or \
+            max(profiler.samples[0]['stages'], key=profiler.samples[0]['stages'].get) != 'slow':
+        print(f"MISMATCH: overruns {profiler.overruns}, samples {list(profiler.samples)}")
+        failures += 1
+
+    text = profiler.prometheus()
+    counts = {}
+    for line in text.splitlines():
+        if line.startswith('#'):
+            continue
+        name, value = line.rsplit(' ', 1)
+        float(value)
+        if '_bucket' in name and 'le="+Inf"' in name:
+            counts[name.split('stage="')[1].split('"')[0]] = int(value)
+    if counts != {'tick': 20, 'fast': 20, 'slow': 20} or 'check_tick_overruns_total 2' not in text:
+        print(f"MISMATCH: prometheus text\n{text}")
+        failures += 1
+
+    snapshot = json.loads(profiler.json_line())
+    if snapshot['stages']['slow']['count'] != 20 or snapshot['overruns'] != 2:
+        print(f"MISMATCH: JSON snapshot {snapshot}")
+        failures += 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for path in (os.path.join(tmp, 'm.prom'), os.path.join(tmp, 'm.jsonl')):
+            writer = SnapshotWriter(profiler, path, interval=0.05)
+            time.sleep(0.12)
+            writer.close()
+            with open(path) as f:
+                content = f.read()
+            ok = content == profiler.prometheus() if path.endswith('.prom') else \
+                len([json.loads(line) for line in content.splitlines()]) >= 2
+            if not ok:
+                print(f"MISMATCH: {path}")
+                failures += 1
+
+    server = serve_metrics(profiler, 0)
+    port = server.server_address[1]
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=2) as response:
+        body = response.read().decode()
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/snapshot", timeout=2) as response:
+        remote = json.loads(response.read())
+    server.shutdown()
+    if body != profiler.prometheus() or remote['overruns'] != 2:
+        print("MISMATCH: HTTP endpoint")
+        failures += 1
+    return failures
+
+
+def main():
+    p = argparse.ArgumentParser(description="Per-stage profiling hooks for the TestServer send loops")
+    p.add_argument("--bench", action="store_true", help="Measure per-stage overhead, enabled and disabled")
+    p.add_argument("--check", action="store_true", help="Verify exports, overrun sampling and the HTTP endpoint")
+    p.add_argument("--demo", action="store_true", help="Run an instrumented synthetic send loop")
+    p.add_argument("-n", type=int, default=200000, help="Iterations for --bench")
+    p.add_argument("--rate", type=float, default=100.0, help="Tick rate for --demo (Hz)")
+    p.add_argument("--duration", type=float, default=5.0, help="Seconds for --demo")
+    add_profile_arguments(p)
+    args = p.parse_args()
+
+    if args.check:
+        failures = check()
+        print(f"{'OK' if not failures else f'{failures} FAILED'}: exports, overrun sampling, HTTP endpoint")
+        if failures:
+            raise SystemExit(1)
+    if args.bench and not run_benchmark(args.n):
+        raise SystemExit(1)
+    if args.demo:
+        args.profile = True
+        run_demo(args)
+    if not (args.check or args.bench or args.demo):
+        p.print_help()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Constant-memory collector for STM32 motor feedback.
+
+The STM32 reports each wheel's rotor RPM (speed_data[], filled from CAN) to
+the ESP32 as 5-byte 0xCA 0xFE <motor> <int16 speed> frames. This collector
+reads those frames from a serial device or pty (the raw UART, or a USB-serial
+tap on it) or from UDP datagrams carrying the same bytes, one robot per
+source address, and keeps them in a TelemetryRing:
+
+    speed[robot, motor, slot]   int16 reported rpm
+    target[robot, motor, slot]  int16 commanded wheel speed at that sample
+    stamp[robot, motor, slot]   float64 time.monotonic() seconds
+
+Each FeedbackFramer batch is scattered into the ring in one vectorized
+step, so nothing is allocated per sample, and the ring never grows: at the
+default 16384 slots a motor reporting at 1 kHz keeps its last ~16 s for 16
+robots in ~12 MB, however long the match runs. Commanded speeds come from
+set_command(), or from the protobuf command multicast through
+kinematics.wheel_speeds_scalar with --commands.
+
+window() gives per robot/motor count, mean, min, max and tracking error
+over the last N seconds; downsample() reduces one motor's history to
+min/max buckets for plotting without hiding spikes.
+
+Usage:
+    python telemetry.py --serial /dev/ttyUSB0=3 --commands
+    python telemetry.py --udp 3334 --robots robots.txt --window 2
+    python telemetry.py --loopback 5 --rate 1000   # pty + UDP self-test with synthetic motors
+"""
+import argparse
+import math
+import os
+import selectors
+import socket
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+
+from kinematics import wheel_speeds_scalar
+from messages import MULTICAST_GROUP, PORT
+from triton_codec import decode
+from uart_framer import UART_BAUD, FeedbackFramer, pack_feedback_frames
+from unicast_fanout import load_robot_table
+from vision_receiver import MAX_ROBOTS, vision_socket
+
+MOTORS = 4
+RING_CAPACITY = 1 << 14
+WINDOW_FIELDS = ('count', 'mean', 'min', 'max', 'err_mean', 'err_rms')
+
+
+class TelemetryRing:
+    """Fixed-size per robot/motor sample history; head counts every sample ever written."""
+
+    def __init__(self, robots: int = MAX_ROBOTS, motors: int = MOTORS, capacity: int = RING_CAPACITY):
+        self.robots = robots
+        self.motors = motors
+        self.capacity = capacity
+        shape = (robots, motors, capacity)
+        self.speed = np.zeros(shape, np.int16)
+        self.target = np.zeros(shape, np.int16)
+        self.stamp = np.zeros(shape, np.float64)
+        self.head = np.zeros((robots, motors), np.int64)
+        self.command = np.zeros((robots, motors), np.int16)
+        self.last_batch = np.zeros(robots, np.float64)
+        self.dropped = 0
+        self._motor_ids = np.arange(motors)
+
+    @property
+    def nbytes(self) -> int:
+        return self.speed.nbytes + self.target.nbytes + self.stamp.nbytes
+
+    def set_command(self, robot: int, wheel_speeds):
+        """Commanded FR, BR, BL, FL speeds for the samples that follow."""
+        self.command[robot] = wheel_speeds
+
+    def extend(self, robot: int, motor: np.ndarray, speed: np.ndarray, now: float = None):
+        """Append one framer batch; samples are spread evenly since the robot's previous batch."""
+        n = len(motor)
+        if n == 0:
+            return
+        if n > self.capacity:
+            motor, speed = motor[-self.capacity:], speed[-self.capacity:]
+            n = self.capacity
+        if now is None:
+            now = time.monotonic()
+        ok = motor < self.motors
+        if not ok.all():
+            self.dropped += int(n - ok.sum())
+            motor, speed = motor[ok], speed[ok]
+            n = len(motor)
+        since = self.last_batch[robot] if self.last_batch[robot] else now
+        self.last_batch[robot] = now
+        stamps = since + (now - since) * np.arange(1, n + 1) / n
+
+        # rank of each sample among its own motor's samples in this batch
+        onehot = motor[:, None] == self._motor_ids
+        rank = np.cumsum(onehot, axis=0)[np.arange(n), motor] - 1
+        slot = (self.head[robot, motor] + rank) % self.capacity
+        self.speed[robot, motor, slot] = speed
+        self.target[robot, motor, slot] = self.command[robot, motor]
+        self.stamp[robot, motor, slot] = stamps
+        self.head[robot] += onehot.sum(axis=0)
+
+    def active_robots(self) -> np.ndarray:
+        return np.flatnonzero(self.head.any(axis=1))
+
+    def window(self, seconds: float, now: float = None) -> dict:
+        """Per (robot, motor) stats over the last `seconds`, as (robots, motors) arrays keyed by WINDOW_FIELDS."""
+        if now is None:
+            now = time.monotonic()
+        robots = self.active_robots()
+        stamp = self.stamp[robots]
+        mask = (stamp > 0) & (stamp >= now - seconds)
+        speed = self.speed[robots].astype(np.float64)
+        error = speed - self.target[robots]
+
+        count = mask.sum(axis=-1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(mask, speed, 0).sum(axis=-1) / count
+            err_mean = np.where(mask, np.abs(error), 0).sum(axis=-1) / count
+            err_rms = np.sqrt(np.where(mask, error * error, 0).sum(axis=-1) / count)
+        lo = np.where(mask, speed, np.inf).min(axis=-1)
+        hi = np.where(mask, speed, -np.inf).max(axis=-1)
+        empty = count == 0
+        lo[empty] = np.nan
+        hi[empty] = np.nan
+
+        stats = {name: np.full((self.robots, self.motors), np.nan) for name in WINDOW_FIELDS}
+        stats['count'][:] = 0
+        for name, value in zip(WINDOW_FIELDS, (count, mean, lo, hi, err_mean, err_rms)):
+            stats[name][robots] = value
+        return stats
+
+    def series(self, robot: int, motor: int, seconds: float = None, now: float = None):
+        """Time-ordered (stamp, speed, target) copies of one motor's retained samples."""
+        head = int(self.head[robot, motor])
+        n = min(head, self.capacity)
+        order = (np.arange(head - n, head)) % self.capacity
+        stamp = self.stamp[robot, motor, order]
+        if seconds is not None:
+            cutoff = (time.monotonic() if now is None else now) - seconds
+            first = np.searchsorted(stamp, cutoff)
+            order, stamp = order[first:], stamp[first:]
+        return stamp, self.speed[robot, motor, order], self.target[robot, motor, order]
+
+    def downsample(self, robot: int, motor: int, buckets: int, seconds: float = None, now: float = None):
+        """Reduce one motor's history to at most `buckets` equal-time (start, min, max) buckets."""
+        stamp, speed, _ = self.series(robot, motor, seconds, now)
+        if len(stamp) == 0:
+            empty = np.empty(0)
+            return empty, empty.astype(np.int16), empty.astype(np.int16)
+        starts = np.linspace(stamp[0], stamp[-1], buckets, endpoint=False)
+        edges = np.searchsorted(stamp, starts)
+        keep = np.diff(np.append(edges, len(stamp))) > 0
+        edges = edges[keep]
+        return starts[keep], np.minimum.reduceat(speed, edges), np.maximum.reduceat(speed, edges)
+
+
+class TelemetryCollector:
+    """Feeds one FeedbackFramer per robot into a TelemetryRing from serial, UDP and command sockets."""
+
+    def __init__(self, ring: TelemetryRing):
+        self.ring = ring
+        self.framers = {}
+        self.selector = selectors.DefaultSelector()
+        self.unknown_datagrams = 0
+        self._files = []
+        self._buf = bytearray(65536)
+
+    def framer(self, robot: int) -> FeedbackFramer:
+        framer = self.framers.get(robot)
+        if framer is None:
+            framer = FeedbackFramer()
+            framer.on_frames = lambda n: self.ring.extend(robot, framer.motor[:n], framer.speed[:n])
+            self.framers[robot] = framer
+        return framer
+
+    def add_serial(self, path: str, robot: int, baud: int = UART_BAUD):
+        """Read raw UART bytes from a tty or pty, switched to raw mode at `baud`."""
+        import termios
+        import tty
+
+        fd = os.open(path, os.O_RDONLY | os.O_NOCTTY | os.O_NONBLOCK)
+        tty.setraw(fd)
+        attrs = termios.tcgetattr(fd)
+        speed = getattr(termios, f'B{baud}', None)
+        if speed is not None:
+            attrs[4] = attrs[5] = speed
+            termios.tcsetattr(fd, termios.TCSANOW, attrs)
+        self._files.append(fd)
+        framer = self.framer(robot)
+        self.selector.register(fd, selectors.EVENT_READ, lambda: self._read_fd(fd, framer))
+
+    def add_udp(self, port: int, table: dict = None, robot: int = 0, host: str = '0.0.0.0'):
+        """Receive forwarded UART bytes; the sender's address picks the robot via an id -> (ip, port) table."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        sock.bind((host, port))
+        sock.setblocking(False)
+        by_addr, by_ip = {}, {}
+        for rid, addr in (table or {}).items():
+            by_addr[addr] = rid
+            by_ip.setdefault(addr[0], rid)
+        self._files.append(sock)
+        self.selector.register(sock, selectors.EVENT_READ, lambda: self._read_udp(sock, by_addr, by_ip, robot))
+        return sock
+
+    def add_commands(self, group: str = MULTICAST_GROUP, port: int = PORT):
+        """Track commanded wheel speeds from the protobuf command multicast."""
+        sock = vision_socket(group, port)
+        sock.setblocking(False)
+        self._files.append(sock)
+        self.selector.register(sock, selectors.EVENT_READ, lambda: self._read_commands(sock))
+        return sock
+
+    def _read_fd(self, fd: int, framer: FeedbackFramer):
+        try:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            # the other end of a pty went away
+            self.selector.unregister(fd)
+            return
+        framer.feed(chunk)
+
+    def _read_udp(self, sock, by_addr: dict, by_ip: dict, default: int):
+        while True:
+            try:
+                n, addr = sock.recvfrom_into(self._buf)
+            except BlockingIOError:
+                return
+            robot = by_addr.get(addr, by_ip.get(addr[0], default if not by_addr else None))
+            if robot is None:
+                self.unknown_datagrams += 1
+                continue
+            self.framer(robot).feed(bytes(self._buf[:n]))
+
+    def _read_commands(self, sock):
+        while True:
+            try:
+                data = sock.recv(65536)
+            except BlockingIOError:
+                return
+            try:
+                fields = decode(data)
+            except (IndexError, ValueError):
+                continue
+            if 0 <= fields.id < self.ring.robots:
+                self.ring.set_command(fields.id, wheel_speeds_scalar(fields.forward, fields.left, fields.angular))
+
+    def poll(self, timeout: float):
+        for key, _ in self.selector.select(timeout):
+            key.data()
+
+    def run(self, duration: float = None, interval: float = 1.0, window: float = 1.0, report=None):
+        """Collect until `duration` elapses (forever if None), printing window stats every `interval`."""
+        report = report or (lambda: print(format_window(self.ring, self.ring.window(window))))
+        end = None if duration is None else time.monotonic() + duration
+        next_report = time.monotonic() + interval
+        while end is None or time.monotonic() < end:
+            now = time.monotonic()
+            self.poll(max(0.0, min(next_report, end or next_report) - now))
+            if time.monotonic() >= next_report:
+                report()
+                next_report += interval
+
+    def summary(self) -> str:
+        frames = sum(f.frames for f in self.framers.values())
+        desyncs = sum(f.desyncs for f in self.framers.values())
+        return (f"{frames} frames from {len(self.framers)} robots, {desyncs} desyncs, "
+                f"{self.ring.dropped} bad motor indices, {self.unknown_datagrams} unknown datagrams")
+
+    def close(self):
+        self.selector.close()
+        for f in self._files:
+            if isinstance(f, int):
+                os.close(f)
+            else:
+                f.close()
+        self._files.clear()
+
+
+def format_window(ring: TelemetryRing, stats: dict) -> str:
+    lines = [f"{'robot':>5} {'motor':>5} {'n':>6} {'mean':>8} {'min':>7} {'max':>7} {'|err|':>7} {'rms':>7}"]
+    for robot in ring.active_robots().tolist():
+        for motor in range(ring.motors):
+            lines.append(f"{robot:5d} {motor:5d} {int(stats['count'][robot, motor]):6d} "
+                         f"{stats['mean'][robot, motor]:8.1f} {stats['min'][robot, motor]:7.0f} "
+                         f"{stats['max'][robot, motor]:7.0f} {stats['err_mean'][robot, motor]:7.1f} "
+                         f"{stats['err_rms'][robot, motor]:7.1f}")
+    return '\n'.join(lines)
+
+
+class SyntheticMotors:
+    """Four first-order motors tracking a changing command, emitted as feedback frames at `rate` per motor."""
+
+    def __init__(self, ring: TelemetryRing, robot: int, rate: float, seed: int = 0):
+        self.ring = ring
+        self.robot = robot
+        self.rate = rate
+        self.rng = np.random.default_rng(seed)
+        self.rpm = np.zeros(MOTORS)
+        self.sent = 0
+        self._motor_index = np.arange(MOTORS, dtype=np.uint8)
+
+    def frames(self, t: float, n: int) -> bytes:
+        command = np.round(np.array([1, -1, -1, 1]) * 3000 * math.sin(t * 1.3)).astype(np.int16)
+        self.ring.set_command(self.robot, command)
+        decay = math.exp(-1.0 / (self.rate * 0.05))
+        out = np.empty((n, MOTORS), np.int16)
+        for i in range(n):
+            self.rpm = decay * self.rpm + (1 - decay) * command
+            out[i] = self.rpm + self.rng.normal(0, 30, MOTORS)
+        out[self.rng.random((n, MOTORS)) < 1e-3] = 9000  # occasional spikes for downsample() to keep
+        self.sent += n * MOTORS
+        if len(self._motor_index) != n * MOTORS:
+            self._motor_index = np.tile(np.arange(MOTORS, dtype=np.uint8), n)
+        return pack_feedback_frames(self._motor_index, out.reshape(-1))
+
+    def run(self, write, duration: float, batch: float = 0.005):
+        start = time.monotonic()
+        per_batch = max(1, int(self.rate * batch))
+        while time.monotonic() - start < duration:
+            write(self.frames(time.monotonic() - start, per_batch))
+            time.sleep(batch)
+
+
+def run_loopback(duration: float, rate: float, window: float):
+    """Robot 0 over a pty, robot 1 over UDP, both from synthetic motors; checks counts and memory."""
+    ring = TelemetryRing()
+    collector = TelemetryCollector(ring)
+
+    master, slave = os.openpty()
+    collector.add_serial(os.ttyname(slave), robot=0)
+    os.close(slave)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender.bind(('127.0.0.1', 0))
+    listen = collector.add_udp(0, {1: sender.getsockname()}, host='127.0.0.1')
+    dest = listen.getsockname()
+
+    motors = (SyntheticMotors(ring, 0, rate, seed=0), SyntheticMotors(ring, 1, rate, seed=1))
+    writers = (
+        threading.Thread(target=motors[0].run, args=(lambda data: os.write(master, data), duration), daemon=True),
+        threading.Thread(target=motors[1].run, args=(lambda data: sender.sendto(data, dest), duration), daemon=True),
+    )
+
+    # warm up, then measure Python heap growth over the rest of the run
+    tracemalloc.start()
+    for w in writers:
+        w.start()
+    collector.run(min(1.0, duration / 2), interval=duration)
+    baseline = tracemalloc.take_snapshot()
+    start = time.process_time()
+    collector.run(duration - min(1.0, duration / 2) + 0.2, interval=max(1.0, duration / 3), window=window,
+                  report=lambda: print(format_window(ring, ring.window(window)) + '\n'))
+    cpu = time.process_time() - start
+    growth = sum(s.size_diff for s in tracemalloc.take_snapshot().compare_to(baseline, 'filename'))
+    tracemalloc.stop()
+
+    sent = sum(m.sent for m in motors)
+    received = int(ring.head.sum())
+    print(collector.summary())
+    print(f"{received}/{sent} samples received, ring {ring.nbytes / 1e6:.1f} MB, "
+          f"heap growth {growth / 1024:.1f} KB after warm-up, process CPU {cpu / duration * 100:.0f}%")
+    starts, lo, hi = ring.downsample(0, 0, 20, seconds=window * 2)
+    print("robot 0 motor 0, min/max per bucket:")
+    print('  ' + ' '.join(f"{a}/{b}" for a, b in zip(lo.tolist(), hi.tolist())))
+
+    collector.close()
+    os.close(master)
+    sender.close()
+    if received < sent * 0.95:
+        raise SystemExit("too many samples lost")
+
+
+def main():
+    p = argparse.ArgumentParser(description="Ring-buffer telemetry collector for STM32 motor feedback")
+    p.add_argument("--serial", action="append", default=[], metavar="PATH[=ROBOT]",
+                   help="Serial device or pty carrying feedback frames, optionally with its robot id (repeatable)")
+    p.add_argument("--baud", type=int, default=UART_BAUD, help=f"Serial baud rate (default: {UART_BAUD})")
+    p.add_argument("--udp", type=int, default=None, metavar="PORT", help="Receive forwarded feedback bytes on this UDP port")
+    p.add_argument("--robots", default=None, help="Robot table (id=ip[:port]) mapping UDP senders to robot ids")
+    p.add_argument("--robot", type=int, default=0, help="Robot id for untabled sources (default: 0)")
+    p.add_argument("--commands", action="store_true", help=f"Track commanded speeds from {MULTICAST_GROUP}:{PORT}")
+    p.add_argument("--capacity", type=int, default=RING_CAPACITY, help=f"Samples kept per motor (default: {RING_CAPACITY})")
+    p.add_argument("--window", type=float, default=1.0, help="Stats window in seconds (default: 1.0)")
+    p.add_argument("--interval", type=float, default=1.0, help="Seconds between reports (default: 1.0)")
+    p.add_argument("--duration", type=float, default=None, help="Stop after this many seconds")
+    p.add_argument("--loopback", type=float, default=0.0, metavar="SECONDS",
+                   help="Self-test: synthetic motors over a pty and UDP for this long")
+    p.add_argument("--rate", type=float, default=1000.0, help="Loopback samples/s per motor (default: 1000)")
+    args = p.parse_args()
+
+    if args.loopback:
+        run_loopback(args.loopback, args.rate, args.window)
+        return
+    if not args.serial and args.udp is None:
+        p.print_help()
+        return
+
+    collector = TelemetryCollector(TelemetryRing(capacity=args.capacity))
+    for spec in args.serial:
+        path, _, robot = spec.partition('=')
+        collector.add_serial(path, int(robot) if robot else args.robot, args.baud)
+    if args.udp is not None:
+        collector.add_udp(args.udp, load_robot_table(args.robots) if args.robots else None, args.robot)
+    if args.commands:
+        collector.add_commands()
+    try:
+        collector.run(args.duration, args.interval, args.window)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(collector.summary())
+        collector.close()
+
+
+if __name__ == '__main__':
+    main()
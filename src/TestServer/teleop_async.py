@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""
+Asyncio teleop engine with input decoupled from transmission.
+
+UserControl.py polls a dict filled by the pynput thread once per 100 ms tick
+and wasd_teleop.py reads stdin in the same loop that sends, so a key press can
+wait a full period before it goes out, and both print to the console every
+iteration. Here every piece runs as its own task on one event loop:
+
+  - an input source pushes setpoint changes into TeleopEngine as they happen
+    (pynput via call_soon_threadsafe, stdin via loop.add_reader, or a script)
+  - the send loop transmits at a fixed rate, and a setpoint change or kick
+    wakes it so the command goes out immediately instead of at the next tick
+  - the status line is redrawn at most `status_rate` times per second
+
+Transports wrap the existing wire formats: TritonBotMessage to the multicast
+group or a unicast ESP32, or the "<id> dash <power> <rot>" text protocol of
+wasd_teleop.py. --transport sim sends RobotControl to a simulator team port
+through sim_transport.SimTransport instead.
+
+Usage:
+    python teleop_async.py --input pynput --transport multicast --robot 2
+    python teleop_async.py --input stdin --transport text --robot 1
+    python teleop_async.py --input script --script moves.txt --transport unicast --ip 127.0.0.1
+    python teleop_async.py --input stdin --transport sim --ip 127.0.0.1 --team blue
+    python teleop_async.py --input pynput --smooth --rate 50   # ramped, never saturating a wheel
+    python teleop_async.py --input stdin --transport text --profile   # input/sendto/print stage times
+"""
+import argparse
+import asyncio
+import socket
+import struct
+import sys
+import time
+
+from command_log import KIND_TEXT, CommandRecorder, RecordingSocket
+from latency_probe import LatencyHistogram
+from messages import MULTICAST_GROUP, PORT, UDP_IP, UDP_PORT
+from stage_profiler import NULL_PROFILER, add_profile_arguments, start_profiler
+from triton_codec import TritonBotEncoder
+
+TEXT_GROUP = "239.42.42.42"
+TEXT_PORT = 10000
+
+# full-scale setpoints used by UserControl.py; the text protocol maps them to +-10
+FULL_FORWARD = 3.0
+FULL_LEFT = 3.0
+FULL_ANGULAR = 25.0
+TEXT_STEPS = 10
+
+
+class Setpoint:
+    """Current operator command for one robot."""
+
+    __slots__ = ('forward', 'left', 'angular', 'dribbler')
+
+    def __init__(self, forward=0.0, left=0.0, angular=0.0, dribbler=0.0):
+        self.forward = forward
+        self.left = left
+        self.angular = angular
+        self.dribbler = dribbler
+
+    def values(self):
+        return self.forward, self.left, self.angular, self.dribbler
+
+    def __repr__(self):
+        return (f"forward={self.forward:+5.2f} left={self.left:+5.2f} "
+                f"angular={self.angular:+6.2f} dribbler={self.dribbler:.0f}")
+
+
+class ProtobufTransport:
+    """Sends TritonBotMessages to a multicast group or a unicast ESP32."""
+
+    def __init__(self, sock, dest, robot_id: int):
+        self.sock = sock
+        self.dest = dest
+        self.encoder = TritonBotEncoder(robot_id)
+
+    def send(self, setpoint: Setpoint, kick: bool):
+        forward, left, angular, dribbler = setpoint.values()
+        self.sock.sendto(self.encoder.encode(forward, left, angular, 1.0 if kick else 0.0, 0.0, dribbler), self.dest)
+
+    def close(self):
+        self.sock.close()
+
+
+class TextTransport:
+    """Sends the wasd_teleop.py text protocol; forward and angular map onto power/rot in [-10, 10]."""
+
+    def __init__(self, sock, dest, robot_id: int):
+        self.sock = sock
+        self.dest = dest
+        self.robot_id = robot_id
+        self.kick_datagram = f"{robot_id} kick\n".encode("utf-8")
+
+    def send(self, setpoint: Setpoint, kick: bool):
+        if kick:
+            self.sock.sendto(self.kick_datagram, self.dest)
+        power = _to_steps(setpoint.forward, FULL_FORWARD)
+        rot = _to_steps(setpoint.angular, FULL_ANGULAR)
+        self.sock.sendto(f"{self.robot_id} dash {power} {rot}\n".encode("utf-8"), self.dest)
+
+    def close(self):
+        self.sock.close()
+
+
+class PlannedTransport:
+    """Passes setpoints through motion_planner.MotionPlanner (accel/jerk limits, wheel saturation) first."""
+
+    def __init__(self, transport, planner):
+        self.transport = transport
+        self.planner = planner
+        self.last = None
+
+    def send(self, setpoint: Setpoint, kick: bool):
+        now = time.perf_counter()
+        dt = self.planner.dt if self.last is None else now - self.last
+        self.last = now
+        forward, left, angular = self.planner.update([setpoint.forward, setpoint.left, setpoint.angular], dt)[0]
+        self.transport.send(Setpoint(float(forward), float(left), float(angular), setpoint.dribbler), kick)
+
+    def send_now(self, setpoint: Setpoint, kick: bool):
+        """Send unplanned and restart the ramp from there; for the shutdown stop burst."""
+        self.planner.reset()
+        self.planner.velocity[0] = setpoint.forward, setpoint.left, setpoint.angular
+        self.transport.send(setpoint, kick)
+
+    def close(self):
+        self.transport.close()
+
+
+def _to_steps(value: float, full_scale: float) -> int:
+    return max(-TEXT_STEPS, min(TEXT_STEPS, int(round(value / full_scale * TEXT_STEPS))))
+
+
+class TeleopStats:
+    """Send counters plus input-event-to-sendto latency."""
+
+    def __init__(self):
+        self.ticks = 0
+        self.immediate = 0
+        self.kicks = 0
+        self.events = 0
+        self.latency = LatencyHistogram()
+
+    def summary(self) -> str:
+        return (f"{self.ticks} periodic sends, {self.immediate} immediate, {self.kicks} kicks, "
+                f"{self.events} input events\ninput-to-send {self.latency.summary()}")
+
+
+class TeleopEngine:
+    """Owns the setpoint; input sources update it, the send loop transmits it.
+
+    There is no fixed tick to bracket, so the profiler only gets stages: 'input'
+    around each key event an input source handles, 'sendto' around each send
+    and 'print' around each status redraw.
+    """
+
+    def __init__(self, transport, rate: float = 10.0, status_rate: float = 4.0, quiet: bool = False,
+                 profiler=NULL_PROFILER):
+        self.transport = transport
+        self.period = 1.0 / rate
+        self.status_period = 1.0 / status_rate if status_rate > 0 else 0.0
+        self.quiet = quiet
+        self.setpoint = Setpoint()
+        self.stats = TeleopStats()
+        self.kick_pending = False
+        self.dirty = False
+        self.event_ns = 0
+        self.stopping = False
+        self.wakeup = None
+        self.shown = None
+        self.poll, self.send_stage, self.output = (profiler.stage(name) for name in ('input', 'sendto', 'print'))
+
+    # called by input sources, always on the event loop thread
+    def update(self, forward=None, left=None, angular=None, dribbler=None):
+        sp = self.setpoint
+        before = sp.values()
+        if forward is not None:
+            sp.forward = forward
+        if left is not None:
+            sp.left = left
+        if angular is not None:
+            sp.angular = angular
+        if dribbler is not None:
+            sp.dribbler = dribbler
+        if sp.values() != before:
+            self._notify()
+
+    def kick(self):
+        self.kick_pending = True
+        self._notify()
+
+    def stop(self):
+        self.stopping = True
+        self._notify()
+
+    def _notify(self):
+        self.stats.events += 1
+        if not self.dirty:
+            self.event_ns = time.perf_counter_ns()
+        self.dirty = True
+        if self.wakeup is not None and not self.wakeup.done():
+            self.wakeup.set_result(None)
+
+    def _send(self):
+        kick = self.kick_pending
+        self.kick_pending = False
+        with self.send_stage:
+            self.transport.send(self.setpoint, kick)
+        if kick:
+            self.stats.kicks += 1
+        if self.dirty:
+            self.stats.latency.record(time.perf_counter_ns() - self.event_ns)
+            self.dirty = False
+
+    async def send_loop(self):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while not self.stopping:
+            self.wakeup = loop.create_future()
+            timeout = deadline - loop.time()
+            if timeout > 0 and not self.dirty:
+                try:
+                    await asyncio.wait_for(self.wakeup, timeout)
+                except asyncio.TimeoutError:
+                    pass
+            if self.stopping:
+                break
+            if loop.time() >= deadline:
+                self._send()
+                self.stats.ticks += 1
+                deadline += self.period
+                if deadline < loop.time():  # overran; resume at the next future deadline
+                    deadline = loop.time() + self.period
+            else:
+                # out of cycle: input changed, don't wait for the tick
+                self._send()
+                self.stats.immediate += 1
+
+    async def status_loop(self):
+        if self.quiet or not self.status_period:
+            return
+        while not self.stopping:
+            with self.output:
+                line = repr(self.setpoint)
+                if line != self.shown:
+                    print(line, end="\r", flush=True)
+                    self.shown = line
+            await asyncio.sleep(self.status_period)
+
+    async def run(self, source):
+        tasks = [asyncio.create_task(self.send_loop()), asyncio.create_task(self.status_loop())]
+        try:
+            await source.run(self)
+        finally:
+            self.stop()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # same stop burst as wasd_teleop.py
+            self.setpoint = Setpoint()
+            send = getattr(self.transport, 'send_now', self.transport.send)  # no ramp-down on exit
+            for _ in range(3):
+                send(self.setpoint, False)
+                await asyncio.sleep(0.05)
+
+
+class PynputInput:
+    """UserControl.py key map (held keys): W/S forward, A/D left, J/L rotate, B dribble, K kick, ESC quit."""
+
+    def __init__(self):
+        self.held = set()
+
+    def _apply(self, engine: TeleopEngine):
+        held = self.held
+        engine.update(
+            forward=FULL_FORWARD * (('w' in held) - ('s' in held)),
+            left=FULL_LEFT * (('d' in held) - ('a' in held)),
+            angular=FULL_ANGULAR * (('j' in held) - ('l' in held)),
+            dribbler=1.0 if 'b' in held else 0.0,
+        )
+
+    def _on_key(self, engine, char, pressed):
+        if char is None:
+            return
+        with engine.poll:
+            if pressed:
+                if char == 'k' and 'k' not in self.held:
+                    engine.kick()
+                self.held.add(char)
+            else:
+                self.held.discard(char)
+            self._apply(engine)
+
+    async def run(self, engine: TeleopEngine):
+        from pynput import keyboard
+
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+
+        def char_of(key):
+            return getattr(key, 'char', None)
+
+        def on_press(key):
+            loop.call_soon_threadsafe(self._on_key, engine, char_of(key), True)
+
+        def on_release(key):
+            if key == keyboard.Key.esc:
+                loop.call_soon_threadsafe(lambda: done.done() or done.set_result(None))
+                return False
+            loop.call_soon_threadsafe(self._on_key, engine, char_of(key), False)
+
+        listener = keyboard.Listener(on_press=on_press, on_release=on_release)
+        listener.start()
+        try:
+            await done
+        finally:
+            listener.stop()
+
+
+class StdinInput:
+    """wasd_teleop.py key map (terminal, no key-up events): W/S and A/D step, SPACE stop, K kick, Q/ESC quit."""
+
+    def __init__(self, step_power: int = 1, step_rot: int = 1):
+        self.power = 0
+        self.rot = 0
+        self.step_power = step_power
+        self.step_rot = step_rot
+
+    def _on_char(self, engine, ch, done):
+        if ch in ('q', 'Q', '\x1b', ''):
+            if not done.done():
+                done.set_result(None)
+            return
+        if ch in ('w', 'W'):
+            self.power = min(TEXT_STEPS, self.power + self.step_power)
+        elif ch in ('s', 'S'):
+            self.power = max(-TEXT_STEPS, self.power - self.step_power)
+        elif ch in ('a', 'A'):
+            self.rot = min(TEXT_STEPS, self.rot + self.step_rot)
+        elif ch in ('d', 'D'):
+            self.rot = max(-TEXT_STEPS, self.rot - self.step_rot)
+        elif ch == ' ':
+            self.power = self.rot = 0
+        elif ch in ('k', 'K'):
+            engine.kick()
+            return
+        engine.update(forward=self.power * FULL_FORWARD / TEXT_STEPS, angular=self.rot * FULL_ANGULAR / TEXT_STEPS)
+
+    def _read(self, engine, done):
+        with engine.poll:  # the termios read and the setpoint update it causes
+            self._on_char(engine, sys.stdin.read(1), done)
+
+    async def run(self, engine: TeleopEngine):
+        import termios
+        import tty
+
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+        loop.add_reader(fd, self._read, engine, done)
+        try:
+            await done
+        finally:
+            loop.remove_reader(fd)
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+class ScriptedInput:
+    """Replays timed events, one per line: "<seconds> move <forward> <left> <angular> [dribbler]",
+    "<seconds> kick" or "<seconds> stop". Blank lines and '#' comments are ignored."""
+
+    def __init__(self, events):
+        self.events = sorted(events, key=lambda event: event[0])
+
+    @classmethod
+    def from_file(cls, path: str):
+        events = []
+        with open(path) as f:
+            for lineno, line in enumerate(f, 1):
+                line = line.split('#', 1)[0].split()
+                if not line:
+                    continue
+                try:
+                    at, action, values = float(line[0]), line[1], [float(v) for v in line[2:]]
+                except (IndexError, ValueError):
+                    raise ValueError(f"{path}:{lineno}: cannot parse script line") from None
+                events.append((at, action, values))
+        return cls(events)
+
+    async def run(self, engine: TeleopEngine):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for at, action, values in self.events:
+            await asyncio.sleep(max(0.0, start + at - loop.time()))
+            if action == 'move':
+                engine.update(*values[:4])
+            elif action == 'kick':
+                engine.kick()
+            elif action == 'stop':
+                engine.update(0.0, 0.0, 0.0, 0.0)
+            elif action == 'end':
+                return
+            else:
+                raise ValueError(f"unknown script action {action!r}")
+        await asyncio.sleep(engine.period)  # let the last event go out on a tick too
+
+
+def make_transport(kind: str, robot_id: int, ip: str = UDP_IP, iface: str = None, record: str = None,
+                   team: str = 'blue'):
+    if kind == 'sim':
+        from sim_transport import SimTransport
+        return ProtobufTransport(SimTransport(team, ip, autoflush=True), None, robot_id)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, struct.pack('b', 1))
+    if iface:
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(iface))
+    if kind == 'text':
+        if record:
+            sock = RecordingSocket(sock, CommandRecorder(record), KIND_TEXT)
+        return TextTransport(sock, (TEXT_GROUP, TEXT_PORT), robot_id)
+    if record:
+        sock = RecordingSocket(sock, CommandRecorder(record))
+    dest = (MULTICAST_GROUP, PORT) if kind == 'multicast' else (ip, UDP_PORT)
+    return ProtobufTransport(sock, dest, robot_id)
+
+
+def make_input(args):
+    if args.input == 'pynput':
+        return PynputInput()
+    if args.input == 'stdin':
+        return StdinInput(args.step_power, args.step_rot)
+    if not args.script:
+        raise SystemExit("--input script needs --script")
+    return ScriptedInput.from_file(args.script)
+
+
+def main():
+    p = argparse.ArgumentParser(description="Asyncio teleop with pluggable input and transport")
+    p.add_argument("--input", choices=("pynput", "stdin", "script"), default="pynput", help="Input source")
+    p.add_argument("--transport", choices=("multicast", "unicast", "text", "sim"), default="multicast",
+                   help=f"multicast: {MULTICAST_GROUP}:{PORT}, unicast: --ip:{UDP_PORT}, text: {TEXT_GROUP}:{TEXT_PORT}, "
+                        f"sim: --ip:10301 (blue) or 10302 (yellow)")
+    p.add_argument("--robot", type=int, default=2, help="Robot id")
+    p.add_argument("--ip", default=UDP_IP, help="ESP32 address for --transport unicast, simulator for --transport sim")
+    p.add_argument("--team", choices=("blue", "yellow"), default="blue", help="Simulator team for --transport sim")
+    p.add_argument("--iface", default=None, help="Optional local interface IP for multicast")
+    p.add_argument("--rate", type=float, default=10.0, help="Periodic send rate (Hz)")
+    p.add_argument("--status-rate", type=float, default=4.0, help="Status line redraws per second (0 = off)")
+    p.add_argument("--script", default=None, help="Event script for --input script")
+    p.add_argument("--step-power", type=int, default=1, help="Power increment per W/S press for --input stdin")
+    p.add_argument("--step-rot", type=int, default=1, help="Rotation increment per A/D press for --input stdin")
+    p.add_argument("--smooth", action="store_true",
+                   help="Ramp setpoints under accel/jerk limits and scale them to the wheel limit (motion_planner)")
+    p.add_argument("--record", default=None, help="Log every sent datagram to this command log")
+    p.add_argument("--quiet", action="store_true", help="No status line")
+    add_profile_arguments(p)
+    args = p.parse_args()
+
+    transport = make_transport(args.transport, args.robot, args.ip, args.iface, args.record, args.team)
+    if args.smooth:
+        from motion_planner import MotionPlanner
+        transport = PlannedTransport(transport, MotionPlanner(1, 1.0 / args.rate))
+    session = start_profiler(args, 'teleop')
+    engine = TeleopEngine(transport, args.rate, args.status_rate, args.quiet, session.profiler)
+    source = make_input(args)
+    try:
+        asyncio.run(engine.run(source))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        transport.close()
+        print("\nStopped.")
+        print(engine.stats.summary())
+        session.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Recording and replay-lookup tests for command_log.py (python -m pytest src/TestServer)."""
+import pytest
+
+from command_log import KIND_TEXT, CommandLog, CommandRecorder, RecordingSocket
+
+
+class _Socket:
+    def __init__(self, fail_port=None):
+        self.fail_port = fail_port
+
+    def sendto(self, data, dest):
+        if dest[1] == self.fail_port:
+            raise OSError("network is unreachable")
+        return len(data)
+
+    def close(self):
+        pass
+
+
+def test_failed_sends_are_not_recorded(tmp_path):
+    path = str(tmp_path / 'log.trcl')
+    sock = RecordingSocket(_Socket(fail_port=2), CommandRecorder(path), KIND_TEXT)
+    assert sock.sendto(b'1 kick\n', ('127.0.0.1', 1)) == 7
+    with pytest.raises(OSError):
+        sock.sendto(b'1 dash 3 0\n', ('127.0.0.1', 2))
+    sock.sendto(b'1 dash 0 0\n', ('127.0.0.1', 1))
+    sock.close()
+
+    log = CommandLog(path)
+    records = [(dest, kind, bytes(payload)) for _, dest, kind, payload in log.records()]
+    log.close()
+    assert records == [(('127.0.0.1', 1), KIND_TEXT, b'1 kick\n'), (('127.0.0.1', 1), KIND_TEXT, b'1 dash 0 0\n')]
+
+
+def test_seek_by_time_across_index_entries(tmp_path):
+    path = str(tmp_path / 'log.trcl')
+    recorder = CommandRecorder(path)
+    for k in range(5000):
+        recorder.record(k.to_bytes(4, 'little'), ('127.0.0.1', 3333), stamp_ns=1000 + 10 * k)
+    recorder.close()
+    log = CommandLog(path)
+    stamp, _, _, payload = next(log.records(from_ns=1000 + 10 * 3001 - 5))
+    assert (stamp, int.from_bytes(payload, 'little')) == (1000 + 10 * 3001, 3001)
+    del payload
+    log.close()
@@ -0,0 +1,44 @@
+"""Round-trip and sequence tests for compact_codec.py (python -m pytest src/TestServer)."""
+import asyncio
+
+from compact_codec import RESET_AFTER, CompactDecoder, CompactEncoder, check, run_loopback
+from esp32_emulator import EmulatedRobot
+
+
+def test_check():
+    assert check() == 0
+
+
+def test_restarted_sender_is_accepted():
+    decoder = CompactDecoder()
+    before = CompactEncoder()
+    for _ in range(5000):
+        decoder.decode(before.encode(3, 1.0, 0.0, 0.0))
+    restarted = CompactEncoder()
+    accepted = sum(len(decoder.decode(restarted.encode(3, 0.0, 0.0, 0.0))) for _ in range(3000))
+    assert accepted == 3000
+    assert decoder.stats.resets == 1
+
+
+def test_restart_close_to_the_last_seq_waits_for_silence():
+    clock = [0.0]
+    decoder = CompactDecoder(clock=lambda: clock[0])
+    for seq in range(1, 101):
+        assert decoder.accept(3, seq)
+    assert not decoder.accept(3, 1)           # could still be a late datagram
+    clock[0] = RESET_AFTER
+    assert decoder.accept(3, 2)               # the old sender has been quiet long enough
+    assert decoder.accept(3, 3)
+
+
+def test_emulated_robot_takes_commands_after_a_sender_restart():
+    robot = EmulatedRobot(4)
+    for encoder in (CompactEncoder(), CompactEncoder()):
+        for _ in range(1000):
+            robot.datagram_received(bytes(encoder.encode(4, 0.5, 0.0, 0.0)), None)
+        robot.datagram_received(bytes(encoder.encode(4, 0.0, 0.0, 0.0)), None)
+    assert robot.stats.frames == 2002
+
+
+def test_loopback(multicast):
+    assert asyncio.run(run_loopback(range(4), rate=100.0, duration=1.0, port=10511))
@@ -0,0 +1,31 @@
+"""Delta, heartbeat and loss-convergence tests for delta_sender.py (python -m pytest src/TestServer)."""
+import asyncio
+import socket
+
+import pytest
+
+from delta_sender import DeltaSender, run_loss_test
+
+
+@pytest.mark.parametrize('loss', [0.2, 0.5])
+def test_converges_through_loss(loss):
+    assert asyncio.run(run_loss_test(list(range(6)), loss, duration=2.0, rate=100.0, heartbeat=0.05,
+                                     repeats=1, port=0))
+
+
+def test_unchanged_robot_only_gets_heartbeats():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        now = [0.0]
+        sender = DeltaSender([1], sock, ('127.0.0.1', 9), heartbeat=0.25, repeats=1, clock=lambda: now[0])
+        sender.set_command(1, 1.0, 0.0, 0.0)
+        sent = []
+        for tick in range(100):  # 1 s at 100 Hz
+            now[0] = tick * 0.01
+            sent.append(sender.tick())
+        stats = sender.stats
+        assert (stats.changes, stats.repeats) == (1, 1)
+        assert stats.heartbeats == 3  # every 0.25 s after the repeat at 10 ms
+        assert sum(sent) == 5
+    finally:
+        sock.close()
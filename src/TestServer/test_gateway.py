@@ -0,0 +1,136 @@
+"""Arbitration, routing and send-loop tests for gateway.py (python -m pytest src/TestServer)."""
+import argparse
+import asyncio
+
+import pytest
+
+from gateway import (STOP_REPEATS, CompactOutput, Gateway, PROTO_TEXT, TextInput, TritonInput, TritonOutput,
+                     run_loopback)
+from triton_codec import TritonBotEncoder, decode
+
+NOW = 10 ** 9  # perf_counter_ns() stand-in, past the first send interval
+MS = 10 ** 6
+
+
+class _Socket:
+    """Records sendto() calls in place of a UDP socket."""
+
+    def __init__(self):
+        self.sent = []
+
+    def sendto(self, data, dest):
+        self.sent.append((bytes(data), dest))
+
+    def getsockname(self):
+        return ('127.0.0.1', 0)
+
+
+@pytest.mark.parametrize('fmt', ['triton', 'compact'])
+def test_loopback(fmt, multicast):
+    args = argparse.Namespace(format=fmt, robots='1-6', senders=16, burst=5, duration=1.0,
+                              rate=50.0, keepalive=0.2)
+    assert asyncio.run(run_loopback(args))
+
+
+@pytest.mark.parametrize('output, robot_id', [
+    (TritonOutput, 9),      # not in the table and no default destination
+    (TritonOutput, -1),     # the vision robot_id is a uint32
+    (CompactOutput, 256),   # one-byte id
+])
+def test_unroutable_ids_are_counted_not_sent(output, robot_id):
+    sock = _Socket()
+    table = {1: ('127.0.0.1', 3333)}
+    if robot_id != 9:
+        table[robot_id] = ('127.0.0.1', 3333)
+    gateway = Gateway(output(sock, table))
+    key = (PROTO_TEXT, ('127.0.0.1', 5000))
+    gateway.command(robot_id, key, NOW, 1.0, 0.0, 0.0, False, 0.0)
+    gateway.command(1, key, NOW, 1.0, 0.0, 0.0, False, 0.0)
+    gateway.service(NOW)
+    assert gateway.stats.unroutable == 1
+    assert robot_id not in gateway.robots
+    assert [dest for _, dest in sock.sent] == [('127.0.0.1', 3333)]
+
+
+def test_send_errors_do_not_stop_the_loop():
+    class Failing(_Socket):
+        def sendto(self, data, dest):
+            if dest[1] == 1:
+                raise ValueError("encoder rejected a value")
+            super().sendto(data, dest)
+
+    sock = Failing()
+    gateway = Gateway(TritonOutput(sock, {1: ('127.0.0.1', 1), 2: ('127.0.0.1', 2)}))
+    key = (PROTO_TEXT, ('127.0.0.1', 5000))
+    for rid in (1, 2):
+        gateway.command(rid, key, NOW, 1.0, 0.0, 0.0, False, 0.0)
+    gateway.service(NOW)
+    assert gateway.stats.send_errors == 1
+    assert gateway.stats.sent == 1
+    assert [dest for _, dest in sock.sent] == [('127.0.0.1', 2)]
+
+
+def test_equal_priority_senders_do_not_trade_a_robot():
+    gateway = Gateway(TritonOutput(_Socket(), {1: ('127.0.0.1', 3333)}), freshness=0.5)
+    first, second = (PROTO_TEXT, ('127.0.0.1', 5000)), (PROTO_TEXT, ('127.0.0.1', 5001))
+    for k in range(10):
+        now = NOW + k * 10 ** 7
+        gateway.command(1, first, now, 1.0, 0.0, 0.0, False, 0.0)
+        gateway.command(1, second, now, -1.0, 0.0, 0.0, False, 0.0)
+    slot = gateway.robots[1]
+    assert (slot.owner, slot.forward) == (first, 1.0)
+    assert gateway.stats.handovers == 0
+    assert gateway.stats.rejected == 10
+    gateway.command(1, second, now + 6 * 10 ** 8, -1.0, 0.0, 0.0, False, 0.0)  # first went stale
+    assert (slot.owner, slot.forward) == (second, -1.0)
+    assert gateway.stats.handovers == 1
+
+
+def test_arbitration_from_injected_datagrams():
+    """The --loopback arbitration phases on a fake clock: no sockets, no sleeps."""
+    clock = [NOW]
+    sock = _Socket()
+    table = {1: ('127.0.0.1', 1), 2: ('127.0.0.1', 2)}
+    gateway = Gateway(TritonOutput(sock, table), rate=50.0, keepalive=0.2, freshness=0.3,
+                      priorities={'text': 1, 'triton': 2, ('127.0.0.1', 7000): 5}, clock=lambda: clock[0])
+    text, triton = TextInput(gateway), TritonInput(gateway)
+    low, high, boss = ('127.0.0.1', 6000), ('127.0.0.1', 6001), ('127.0.0.1', 7000)
+    encoders = {rid: TritonBotEncoder(rid) for rid in (1, 2)}
+
+    def last_sent(rid):
+        return [decode(data) for data, dest in sock.sent if dest == table[rid]][-1]
+
+    def run(ms, feed):
+        end = clock[0] + ms * MS
+        while clock[0] < end:
+            feed()
+            gateway.service(clock[0])
+            clock[0] += 10 * MS
+
+    # TritonBot (priority 2) beats text (1); the priority 5 sender beats both
+    run(500, lambda: (triton.datagram_received(bytes(encoders[1].encode(0.7, 0.0, -0.3)), high),
+                      text.datagram_received(b'1 dash -5 5\n', low),
+                      triton.datagram_received(bytes(encoders[2].encode(0.2, 0.0, 0.2)), high),
+                      text.datagram_received(b'2 dash -8 1\n', boss)))
+    assert last_sent(1).forward == pytest.approx(0.7)
+    assert gateway.robots[2].owner == (PROTO_TEXT, boss)
+    assert last_sent(2).forward < 0
+
+    # the TritonBot sender goes quiet: text takes robot 1 once it is stale, and its kick is sent
+    run(400, lambda: text.datagram_received(b'1 kick\n1 dash -5 5\n', low))
+    assert gateway.robots[1].owner == (PROTO_TEXT, low)
+    assert last_sent(1).forward < 0
+    assert any(f.kick_speed for f in map(decode, (d for d, dest in sock.sent if dest == table[1])))
+
+    # unroutable ids are counted and leave the others alone
+    run(100, lambda: text.datagram_received(b'9 dash 3 3\n2 dash -8 1\n', boss))
+    assert gateway.stats.unroutable == 10 and 9 not in gateway.robots
+
+    # everyone goes quiet: each robot gets STOP_REPEATS stops and is released
+    stops = gateway.stats.stops
+    run(1000, lambda: None)
+    assert gateway.stats.stops - stops == 2 * STOP_REPEATS
+    for rid in (1, 2):
+        assert gateway.robots[rid].owner is None
+        assert (last_sent(rid).forward, last_sent(rid).angular) == (0.0, 0.0)
+    assert gateway.stats.parse_errors == [0, 0]
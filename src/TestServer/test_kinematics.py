@@ -0,0 +1,22 @@
+"""Golden-vector tests for kinematics.py (python -m pytest src/TestServer)."""
+import numpy as np
+import pytest
+
+from kinematics import GOLDEN_VECTORS, UART_HEADER, check_golden, uart_frame, wheel_speeds, wheel_speeds_scalar
+
+
+def test_check_golden():
+    assert check_golden() == 0
+
+
+@pytest.mark.parametrize('command, speeds', GOLDEN_VECTORS)
+def test_golden_vector(command, speeds):
+    assert wheel_speeds_scalar(*command) == speeds
+    assert tuple(wheel_speeds(*(np.array([v]) for v in command))[0].tolist()) == speeds
+
+
+def test_uart_frame_layout():
+    frame = uart_frame(*GOLDEN_VECTORS[0][0], dribbler_speed=1.0)
+    assert len(frame) == 11
+    assert tuple(frame[:2]) == tuple(UART_HEADER)
+    assert frame[-1] == 1
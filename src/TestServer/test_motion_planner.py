@@ -0,0 +1,15 @@
+"""Feasibility-table and planner tests for motion_planner.py (python -m pytest src/TestServer)."""
+import numpy as np
+
+from motion_planner import FeasibilityTable, check, exact_load_array, random_commands
+
+
+def test_check():
+    assert check(FeasibilityTable()) == 0
+
+
+def test_coarse_table_still_never_overloads_a_wheel():
+    table = FeasibilityTable(32, 16)
+    limited = table.limit_array(random_commands(20000, seed=2))
+    assert exact_load_array(limited).max() <= 1.0 + 1e-9
+    assert np.isfinite(limited).all()
@@ -0,0 +1,23 @@
+"""Golden-vector and scoring tests for pid_sim.py (python -m pytest src/TestServer)."""
+import numpy as np
+import pytest
+
+from pid_sim import DT, FIRMWARE_GAINS, check_golden, score, simulate, step_setpoint
+
+
+def test_check_golden():
+    assert check_golden() == 0
+
+
+def test_rise_time_is_interpolated_between_ticks():
+    # progress 0.03, 0.06, ... per tick: 10% at 2.33 ticks after the step, 90% at 29
+    setpoint = np.full((40, 1), 1000.0, dtype=np.float32)
+    ramp = np.minimum(0.03 * np.arange(1, 41), 1.0) * 1000.0
+    history = ramp.reshape(40, 1, 1)
+    assert score(setpoint, history)['rise'][0] == pytest.approx((29 - 7 / 3) * DT, rel=1e-5)
+
+
+def test_firmware_gains_reach_the_step():
+    setpoint = step_setpoint([3000.0], 1.0)
+    results = score(setpoint, simulate(np.array([FIRMWARE_GAINS], dtype=np.float32), setpoint))
+    assert 0 < results['rise'][0] < 1.0
@@ -0,0 +1,53 @@
+"""Accuracy and track-ageing tests for pose_filter.py (python -m pytest src/TestServer)."""
+import math
+
+import numpy as np
+import pytest
+
+from pose_filter import VisionFilter, run_accuracy
+from vision_receiver import TEAM_BLUE, VisionState
+
+
+@pytest.fixture(scope='module')
+def accuracy():
+    return run_accuracy(11, 60.0, 0.05, 10.0, 0.03)
+
+
+def test_filtering_beats_raw_measurements(accuracy):
+    pos_rmse, _, angle_rmse = accuracy['filtered']
+    assert pos_rmse < 12.5  # raw is ~14 mm at 10 mm noise
+    assert pos_rmse < accuracy['raw'][0]
+    assert angle_rmse < accuracy['raw'][2]
+
+
+def test_prediction_compensates_latency(accuracy):
+    pos_rmse, pos_p95, angle_rmse = accuracy['predicted']
+    assert pos_rmse < 40.0     # holding the raw pose is ~150 mm behind at 50 ms
+    assert pos_p95 < 70.0
+    assert angle_rmse < 0.12
+    assert pos_rmse < 0.3 * accuracy['hold'][0]
+
+
+def _observe(state, robot_id, t, x):
+    row = state.robots[TEAM_BLUE, robot_id]
+    row['x'], row['y'], row['orientation'] = x, 0.0, 0.0
+    row['t_capture'] = row['t_received'] = t
+    row['valid'] = True
+
+
+def test_track_expires_after_max_age():
+    state = VisionState()
+    filt = VisionFilter(state, latency=0.0, max_age=0.5)
+    for k in range(30):
+        _observe(state, 3, 100.0 + k / 60, 1000.0 * k / 60)  # 1 m/s along x
+        filt.ingest()
+    last = 100.0 + 29 / 60
+
+    assert filt.predicted_vision(TEAM_BLUE, 3, now=last + 0.1)[2] == pytest.approx(1000 * 29 / 60 + 100, abs=20)
+    assert filt.predicted_vision(TEAM_BLUE, 3, now=last + 0.6) is None
+    assert np.isnan(filt.predicted_poses(now=last + 0.6)[TEAM_BLUE, 3]).all()
+
+    _observe(state, 3, last + 1.0, 0.0)  # back in view: a fresh track at the new position
+    filt.ingest()
+    x = filt.predicted_vision(TEAM_BLUE, 3, now=last + 1.0)[2]
+    assert math.isclose(x, 0.0, abs_tol=1e-6)
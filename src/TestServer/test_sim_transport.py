@@ -0,0 +1,35 @@
+"""Encoding, wheel-model and closed-loop tests for sim_transport.py (python -m pytest src/TestServer)."""
+import argparse
+
+from sim_transport import MAX_RECORD_ID, SimTransport, check_encoding, check_kinematics, run_loopback
+from triton_codec import TritonBotEncoder
+
+
+class _Capture:
+    data = None
+
+    def sendto(self, data, dest):
+        self.data = bytes(data)
+        return len(data)
+
+
+def test_hand_packed_encoding_matches_protobuf():
+    assert check_encoding() == 0
+
+
+def test_wheel_model_inverts_the_firmware_kinematics():
+    assert check_kinematics() == 0
+
+
+def test_out_of_range_tritonbot_ids_are_counted():
+    transport = SimTransport(sock=_Capture())
+    for rid in (MAX_RECORD_ID + 1, -1):
+        transport.sendto(TritonBotEncoder(rid, None, command_id=0).encode(1.0, 0.0, 0.0), None)
+    assert transport.stats.decode_errors == 2
+    assert not transport.slots
+
+
+def test_loopback_reaches_waypoints(multicast):
+    args = argparse.Namespace(robots=4, team='blue', rate=100.0, physics_rate=200.0, vision_rate=60.0,
+                              vision_port=10026, duration=4.0, gain=3.0, max_speed=2.0, tolerance=20.0)
+    assert run_loopback(args)
@@ -0,0 +1,40 @@
+"""Stage timing and export tests for stage_profiler.py (python -m pytest src/TestServer)."""
+import pytest
+
+from stage_profiler import NULL_PROFILER, Profiler, check
+
+
+def test_check():
+    assert check() == 0
+
+
+def test_reentering_a_stage_is_rejected():
+    profiler = Profiler('test')
+    outer = profiler.stage('outer')
+    with outer:
+        with pytest.raises(RuntimeError):
+            with outer:
+                pass
+    assert outer.count == 1
+    with outer:                 # the failed entry left the stage usable
+        pass
+    assert outer.count == 2
+
+
+def test_stage_recovers_after_an_exception():
+    stage = Profiler('test').stage('body')
+    with pytest.raises(ValueError):
+        with stage:
+            raise ValueError
+    with stage:
+        pass
+    assert stage.count == 2
+
+
+def test_disabled_stages_are_one_shared_object():
+    null = NULL_PROFILER.stage('a')
+    assert NULL_PROFILER.stage('b') is null
+    with null:
+        with null:              # nothing to corrupt, so nesting is fine
+            pass
+    assert not NULL_PROFILER.tick_end()
@@ -0,0 +1,21 @@
+"""Protobuf-equivalence tests for triton_codec.py (python -m pytest src/TestServer)."""
+import pytest
+
+from triton_codec import TritonBotEncoder, check, decode
+
+
+def test_check():
+    assert check() == 0
+
+
+@pytest.mark.parametrize('data', [b'\x08', b'\x1a\x05\x08', b'\x0f', b'\x1a\xff\xff\xff\xff\x0f'])
+def test_malformed_input_raises_value_error(data):
+    with pytest.raises(ValueError):
+        decode(data)
+
+
+def test_negative_id_needs_an_explicit_command_id():
+    with pytest.raises(ValueError):
+        TritonBotEncoder(-1, None)
+    fields = decode(bytes(TritonBotEncoder(-1, None, command_id=0).encode(1.0, 0.0, 0.0)))
+    assert (fields.id, fields.command_id, fields.forward) == (-1, 0, 1.0)
@@ -0,0 +1,59 @@
+"""Framing and resynchronization tests for uart_framer.py (python -m pytest src/TestServer)."""
+import numpy as np
+import pytest
+
+from uart_framer import (CommandFramer, FeedbackFramer, StreamFramer, pack_command_frames, pack_feedback_frames,
+                         synthetic_stream)
+
+
+def _collect(framer, *names):
+    """Copies of the named output arrays per flush, as lists to concatenate."""
+    out = [[] for _ in names]
+
+    def on_frames(n):
+        for store, name in zip(out, names):
+            store.append(getattr(framer, name)[:n].copy())
+    framer.on_frames = on_frames
+    return out
+
+
+@pytest.mark.parametrize('chunk', [1, 5, 11, 4096])
+def test_command_frames_round_trip_in_any_chunking(chunk):
+    rng = np.random.default_rng(chunk)
+    speeds = rng.integers(-15000, 15000, (300, 4))
+    dribble = rng.integers(0, 2, 300)
+    stream = pack_command_frames(speeds, dribble)
+    framer = CommandFramer(capacity=64)
+    got = _collect(framer, 'wheel_speeds', 'dribble')
+    for i in range(0, len(stream), chunk):
+        framer.feed(stream[i:i + chunk])
+    np.testing.assert_array_equal(np.concatenate(got[0]), speeds)
+    np.testing.assert_array_equal(np.concatenate(got[1]), dribble)
+    assert framer.desyncs == 0
+
+
+def test_feedback_frames_resynchronize_after_garbage():
+    motor, speed = [0, 1, 2, 3], [-15000, -1, 0, 14999]
+    frames = pack_feedback_frames(motor, speed)
+    framer = FeedbackFramer()
+    got = _collect(framer, 'motor', 'speed')
+    framer.feed(b'\x01\x02\xca' + frames[:5] + b'\x00\x17' + frames[5:])
+    assert framer.frames == 4
+    assert framer.desyncs == 2
+    assert framer.skipped_bytes == 5
+    np.testing.assert_array_equal(np.concatenate(got[0]), motor)
+    np.testing.assert_array_equal(np.concatenate(got[1]), speed)
+
+
+@pytest.mark.parametrize('kind', ['command', 'feedback'])
+def test_synthetic_stream_recovers_every_frame(kind):
+    stream, expected = synthetic_stream(200_000, kind)
+    framer = CommandFramer() if kind == 'command' else FeedbackFramer()
+    for i in range(0, len(stream), 4096):
+        framer.feed(stream[i:i + 4096])
+    assert framer.frames == expected
+
+
+def test_stream_framer_is_abstract():
+    with pytest.raises(TypeError):
+        StreamFramer()
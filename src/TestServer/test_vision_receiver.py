@@ -0,0 +1,45 @@
+"""Merge and reader-consistency tests for vision_receiver.py (python -m pytest src/TestServer)."""
+import threading
+
+import numpy as np
+
+from vision_receiver import MAX_ROBOTS, ROBOT_DTYPE, TEAM_BLUE, VisionFrameGenerator, VisionState
+
+
+def test_generated_frames_merge_every_robot():
+    state = VisionState()
+    generator = VisionFrameGenerator(cameras=4)
+    for camera in range(4):
+        state.handle_packet(generator.frame(camera, 0.5), now=0.5)
+    robots, ball = state.snapshot()
+    assert robots['valid'][:, :11].all() and not robots['valid'][:, 11:].any()
+    assert ball['valid']
+    assert state.stats.decode_errors == state.stats.out_of_range == 0
+
+
+def test_readers_never_see_a_half_written_frame():
+    """Every field of a written row holds the same frame number; a reader must never see two."""
+    state = VisionState(merge_window=0.0)
+    slots = np.arange(2 * MAX_ROBOTS)
+    done = threading.Event()
+
+    def write():
+        rows = np.zeros(len(slots), dtype=ROBOT_DTYPE)
+        rows['valid'] = True
+        for k in range(1, 20001):
+            for field in ('confidence', 'x', 'y', 'orientation', 'pixel_x', 'pixel_y', 'height', 't_capture'):
+                rows[field] = k
+            state._merge_rows(slots, rows)
+        done.set()
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    torn = 0
+    while not done.is_set():
+        robots, _ = state.snapshot()
+        torn += len(np.unique(robots['t_capture'])) > 1 or not (robots['x'] == robots['t_capture']).all()
+        row = state.robot(TEAM_BLUE, MAX_ROBOTS - 1)
+        torn += row is not None and not row['x'] == row['y'] == row['height'] == row['t_capture']
+    writer.join()
+    assert torn == 0
+    assert (state.robots['x'] == 20000).all()
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Hand-rolled TritonBotMessage encoder/decoder that bypasses the protobuf runtime.
+
+TritonBotMessage (triton_bot_communication.proto) always has the same shape on
+the wire: an id varint, an SSL_DetectionRobot vision block and a RobotCommand
+carrying a MoveLocalVelocity. The encoder writes the id/vision head and the
+fixed RobotCommand tags into a reusable bytearray once, then each encode() is
+a single struct.pack_into of the six command floats.
+
+Output is byte-for-byte identical to TritonBotMessage.SerializeToString() for
+messages built the way the TestServer scripts build them (every command field
+set, vision present or cleared). The decoder accepts any field order, skips
+unknown fields and raises ValueError on truncated input. It is pure Python and
+several times slower than ParseFromString on the C/upb runtime; it exists for
+tools that only need the command fields, not for speed. --bench shows both.
+
+A negative (int32) message id is encoded as a 10-byte varint, as protobuf
+does; the vision robot_id and command id are uint32, so an encoder for a
+negative id needs an explicit command_id and vision robot_id, and raises
+ValueError otherwise.
+
+Usage:
+    encoder = TritonBotEncoder(robot_id=2)
+    sock.sendto(encoder.encode(forward=3, left=0, angular=0), dest)
+
+    python triton_codec.py --check   # byte-for-byte and field-for-field against the protobuf runtime
+    python triton_codec.py --bench   # compare against SerializeToString/ParseFromString
+"""
+import argparse
+import math
+import struct
+import time
+from collections import namedtuple
+from operator import itemgetter
+
+from messages import encode_varint
+
+# (field number << 3) | wire type
+_VARINT = 0
+_FIXED64 = 1
+_LEN = 2
+_FIXED32 = 5
+
+DEFAULT_VISION = (0.8, None, 1.0, 1.0, math.pi, 1.0, 1.0, 1.0)
+"""confidence, robot_id, x, y, orientation, pixel_x, pixel_y, height; robot_id None means the robot's own id."""
+
+VISION_FIELDS = ('confidence', 'robot_id', 'x', 'y', 'orientation', 'pixel_x', 'pixel_y', 'height')
+
+TritonBotFields = namedtuple('TritonBotFields', (
+    'id', 'vision', 'command_id', 'forward', 'left', 'angular',
+    'kick_speed', 'kick_angle', 'dribbler_speed',
+))
+
+# RobotCommand.move_command (2) -> RobotMoveCommand.local_velocity (2) -> 3 x 5-byte floats
+_MOVE_HEAD = bytes((2 << 3 | _LEN, 17, 2 << 3 | _LEN, 15))
+# forward, left, angular, kick_speed, kick_angle, dribbler_speed with their tags
+_COMMAND_BODY = struct.Struct('<BfBfBfBfBfBf')
+_COMMAND_TAGS = (1 << 3 | _FIXED32, 2 << 3 | _FIXED32, 3 << 3 | _FIXED32,
+                 3 << 3 | _FIXED32, 4 << 3 | _FIXED32, 5 << 3 | _FIXED32)
+_F32 = struct.Struct('<f')
+
+
+def _int32_varint(value: int) -> bytes:
+    # negative int32 values are sign-extended to 64 bits on the wire
+    return encode_varint(value & 0xFFFFFFFFFFFFFFFF if value < 0 else value)
+
+
+def _uint32_varint(value: int, name: str) -> bytes:
+    if not 0 <= value <= 0xFFFFFFFF:
+        raise ValueError(f"{name} {value} is not a uint32")
+    return encode_varint(value)
+
+
+def encode_vision(confidence, robot_id, x, y, orientation, pixel_x, pixel_y, height) -> bytes:
+    """Serialize an SSL_DetectionRobot body with every field present."""
+    return b''.join((
+        bytes((1 << 3 | _FIXED32,)), _F32.pack(confidence),
+        bytes((2 << 3 | _VARINT,)), _uint32_varint(robot_id, 'vision robot_id'),
+        bytes((3 << 3 | _FIXED32,)), _F32.pack(x),
+        bytes((4 << 3 | _FIXED32,)), _F32.pack(y),
+        bytes((5 << 3 | _FIXED32,)), _F32.pack(orientation),
+        bytes((6 << 3 | _FIXED32,)), _F32.pack(pixel_x),
+        bytes((7 << 3 | _FIXED32,)), _F32.pack(pixel_y),
+        bytes((8 << 3 | _FIXED32,)), _F32.pack(height),
+    ))
+
+
+class TritonBotEncoder:
+    """Encodes TritonBotMessages for one robot into a reusable buffer."""
+
+    def __init__(self, robot_id: int, vision=DEFAULT_VISION, command_id: int = None):
+        self.robot_id = robot_id
+        self.command_id = robot_id if command_id is None else command_id
+        self.buffer = bytearray(256)
+        self.set_vision(vision)
+
+    def set_vision(self, vision):
+        """Replace the vision block (a VISION_FIELDS tuple) or drop it with None."""
+        head = b''
+        if self.robot_id != 0:  # proto3 scalar, omitted when zero
+            head += bytes((1 << 3 | _VARINT,)) + _int32_varint(self.robot_id)
+        if vision is not None:
+            values = list(vision)
+            if values[1] is None:
+                values[1] = self.robot_id
+            body = encode_vision(*values)
+            head += bytes((2 << 3 | _LEN,)) + encode_varint(len(body)) + body
+
+        command_id = bytes((1 << 3 | _VARINT,)) + _uint32_varint(self.command_id, 'command id')
+        command_len = len(command_id) + len(_MOVE_HEAD) + _COMMAND_BODY.size
+        head += bytes((3 << 3 | _LEN,)) + encode_varint(command_len) + command_id + _MOVE_HEAD
+
+        self.buffer[:len(head)] = head
+        self.body_offset = len(head)
+        self.size = len(head) + _COMMAND_BODY.size
+        self.view = memoryview(self.buffer)[:self.size]
+
+    def encode(self, forward: float, left: float, angular: float,
+               kick_speed: float = 0.0, kick_angle: float = 0.0, dribbler_speed: float = 0.0) -> memoryview:
+        """Write the command into the buffer and return a view of the datagram.
+
+        The view is overwritten by the next encode(); copy it with bytes() to keep it.
+        """
+        fwd_tag, left_tag, ang_tag, kick_tag, angle_tag, drib_tag = _COMMAND_TAGS
+        _COMMAND_BODY.pack_into(self.buffer, self.body_offset,
+                                fwd_tag, forward, left_tag, left, ang_tag, angular,
+                                kick_tag, kick_speed, angle_tag, kick_angle, drib_tag, dribbler_speed)
+        return self.view
+
+
+def _read_varint(buf, pos: int):
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 70:
+            raise ValueError("varint too long")
+
+
+def _skip(buf, pos: int, wire_type: int) -> int:
+    if wire_type == _VARINT:
+        return _read_varint(buf, pos)[1]
+    if wire_type == _FIXED64:
+        return pos + 8
+    if wire_type == _LEN:
+        length, pos = _read_varint(buf, pos)
+        return pos + length
+    if wire_type == _FIXED32:
+        return pos + 4
+    raise ValueError(f"unsupported wire type {wire_type}")
+
+
+def _decode_vision(buf, pos: int, end: int) -> tuple:
+    values = [0.0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+    while pos < end:
+        key, pos = _read_varint(buf, pos)
+        field, wire_type = key >> 3, key & 7
+        if 1 <= field <= 8 and field != 2 and wire_type == _FIXED32:
+            values[field - 1] = _F32.unpack_from(buf, pos)[0]
+            pos += 4
+        elif field == 2 and wire_type == _VARINT:
+            values[1], pos = _read_varint(buf, pos)
+        else:
+            pos = _skip(buf, pos, wire_type)
+    return tuple(values)
+
+
+def _decode_local_velocity(buf, pos: int, end: int, out: list):
+    while pos < end:
+        key, pos = _read_varint(buf, pos)
+        field, wire_type = key >> 3, key & 7
+        if 1 <= field <= 3 and wire_type == _FIXED32:
+            out[field] = _F32.unpack_from(buf, pos)[0]  # forward, left, angular -> out[1..3]
+            pos += 4
+        else:
+            pos = _skip(buf, pos, wire_type)
+
+
+def _decode_command(buf, pos: int, end: int) -> list:
+    # command_id, forward, left, angular, kick_speed, kick_angle, dribbler_speed
+    out = [0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+    while pos < end:
+        key, pos = _read_varint(buf, pos)
+        field, wire_type = key >> 3, key & 7
+        if field == 1 and wire_type == _VARINT:
+            out[0], pos = _read_varint(buf, pos)
+        elif field == 2 and wire_type == _LEN:
+            length, pos = _read_varint(buf, pos)
+            move_end = pos + length
+            while pos < move_end:
+                key, pos = _read_varint(buf, pos)
+                if key == (2 << 3 | _LEN):
+                    length, pos = _read_varint(buf, pos)
+                    _decode_local_velocity(buf, pos, pos + length, out)
+                    pos += length
+                else:
+                    pos = _skip(buf, pos, key & 7)
+        elif 3 <= field <= 5 and wire_type == _FIXED32:
+            out[field + 1] = _F32.unpack_from(buf, pos)[0]
+            pos += 4
+        else:
+            pos = _skip(buf, pos, wire_type)
+    return out
+
+
+# Canonical layouts written by TritonBotEncoder (and SerializeToString) when every
+# id fits in one varint byte: decoded with one unpack_from after a tag check.
+_CANONICAL_COMMAND = 'BBBB4sBfBfBfBfBfBf'
+_CANONICAL_VISION = struct.Struct('<BBBB' + 'BfBBBfBfBfBfBfBf' + _CANONICAL_COMMAND)
+_CANONICAL_BARE = struct.Struct('<BB' + _CANONICAL_COMMAND)
+
+
+def _canonical_layout(layout: struct.Struct, tags: dict, ids: tuple, floats: tuple):
+    expected = sorted(tags.items())
+    return (layout, itemgetter(*(i for i, _ in expected)), tuple(tag for _, tag in expected),
+            itemgetter(*ids), itemgetter(*floats))
+
+
+_CANONICAL_LAYOUTS = {
+    _CANONICAL_VISION.size: _canonical_layout(
+        _CANONICAL_VISION,
+        {0: 1 << 3 | _VARINT, 2: 2 << 3 | _LEN, 3: 37, 4: 0x0d, 6: 0x10, 8: 0x1d, 10: 0x25, 12: 0x2d,
+         14: 0x35, 16: 0x3d, 18: 0x45, 20: 3 << 3 | _LEN, 21: 36, 22: 0x08, 24: _MOVE_HEAD,
+         25: 0x0d, 27: 0x15, 29: 0x1d, 31: 0x1d, 33: 0x25, 35: 0x2d},
+        ids=(1, 7, 23), floats=(5, 9, 11, 13, 15, 17, 19, 26, 28, 30, 32, 34, 36)),
+    _CANONICAL_BARE.size: _canonical_layout(
+        _CANONICAL_BARE,
+        {0: 1 << 3 | _VARINT, 2: 3 << 3 | _LEN, 3: 36, 4: 0x08, 6: _MOVE_HEAD,
+         7: 0x0d, 9: 0x15, 11: 0x1d, 13: 0x1d, 15: 0x25, 17: 0x2d},
+        ids=(1, 5), floats=(8, 10, 12, 14, 16, 18)),
+}
+
+
+def _decode_canonical(data):
+    layout = _CANONICAL_LAYOUTS.get(len(data))
+    if layout is None:
+        return None
+    struct_, get_tags, tags, get_ids, get_floats = layout
+    values = struct_.unpack_from(data)
+    if get_tags(values) != tags:
+        return None
+    ids = get_ids(values)
+    floats = get_floats(values)
+    if len(floats) == 6:  # vision cleared
+        robot_id, command_id = ids
+        if robot_id >= 0x80 or command_id >= 0x80:
+            return None
+        return TritonBotFields(robot_id, None, command_id, *floats)
+    robot_id, vision_id, command_id = ids
+    if robot_id >= 0x80 or vision_id >= 0x80 or command_id >= 0x80:
+        return None
+    vision = (floats[0], vision_id) + floats[1:7]
+    return TritonBotFields(robot_id, vision, command_id, *floats[7:])
+
+
+def decode(data) -> TritonBotFields:
+    """Decode a serialized TritonBotMessage. Missing fields read as zero, missing vision as None.
+
+    Truncated or malformed input raises ValueError.
+    """
+    fields = _decode_canonical(data)
+    if fields is not None:
+        return fields
+    try:
+        return _decode_fields(data)
+    except (IndexError, struct.error) as e:
+        raise ValueError(f"truncated TritonBotMessage: {e}") from None
+
+
+def _decode_fields(data) -> TritonBotFields:
+    buf = memoryview(data)
+    pos = 0
+    end = len(buf)
+    robot_id = 0
+    vision = None
+    command = [0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+    while pos < end:
+        key, pos = _read_varint(buf, pos)
+        field, wire_type = key >> 3, key & 7
+        if field == 1 and wire_type == _VARINT:
+            robot_id, pos = _read_varint(buf, pos)
+            if robot_id >= 1 << 63:
+                robot_id -= 1 << 64
+        elif field == 2 and wire_type == _LEN:
+            length, pos = _read_varint(buf, pos)
+            if pos + length > end:
+                raise ValueError("truncated TritonBotMessage")
+            vision = _decode_vision(buf, pos, pos + length)
+            pos += length
+        elif field == 3 and wire_type == _LEN:
+            length, pos = _read_varint(buf, pos)
+            if pos + length > end:
+                raise ValueError("truncated TritonBotMessage")
+            command = _decode_command(buf, pos, pos + length)
+            pos += length
+        else:
+            pos = _skip(buf, pos, wire_type)
+    if pos != end:
+        raise ValueError("truncated TritonBotMessage")
+    return TritonBotFields(robot_id, vision, *command)
+
+
+def _bench_cases():
+    # field combinations the TestServer scripts send
+    return (
+        ('idle', dict(forward=0, left=0, angular=0), True),
+        ('drive', dict(forward=3, left=-3, angular=25), True),
+        ('kick+dribble', dict(forward=0, left=0, angular=0, kick_speed=1, dribbler_speed=1), True),
+        ('no vision', dict(forward=3, left=0, angular=-25), False),
+    )
+
+
+def _timeit(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n
+
+
+def _fill(message, fields: dict):
+    # what UserControl.py does every tick
+    message.command.move_command.local_velocity.forward = fields.get('forward', 0)
+    message.command.move_command.local_velocity.left = fields.get('left', 0)
+    message.command.move_command.local_velocity.angular = fields.get('angular', 0)
+    message.command.kick_speed = fields.get('kick_speed', 0)
+    message.command.dribbler_speed = fields.get('dribbler_speed', 0)
+    return message
+
+
+def check(robot_ids=(0, 2, 200, -1)) -> int:
+    """Encoder output and decoded fields against the protobuf runtime, and malformed input; return failures."""
+    from messages import new_bot_message
+    from triton_bot_communication_pb2 import TritonBotMessage
+
+    failures = 0
+    for robot_id in robot_ids:
+        for name, fields, with_vision in _bench_cases():
+            # the uint32 command id and vision robot_id can't repeat a negative id; they stay 0
+            reference = new_bot_message(max(robot_id, 0))
+            reference.id = robot_id
+            if not with_vision:
+                reference.ClearField('vision')
+            wire = _fill(reference, fields).SerializeToString()
+            vision = None
+            if with_vision:
+                vision = DEFAULT_VISION if robot_id >= 0 else DEFAULT_VISION[:1] + (0,) + DEFAULT_VISION[2:]
+            encoder = TritonBotEncoder(robot_id, vision, None if robot_id >= 0 else 0)
+            if bytes(encoder.encode(**fields)) != wire:
+                print(f"MISMATCH: {name}, id {robot_id}: encoder output differs from SerializeToString")
+                failures += 1
+            parsed = TritonBotMessage.FromString(wire)
+            command = parsed.command
+            velocity = command.move_command.local_velocity
+            expected = (parsed.id, command.id, velocity.forward, velocity.left, velocity.angular,
+                        command.kick_speed, command.kick_angle, command.dribbler_speed)
+            decoded = decode(wire)
+            got = (decoded.id, decoded.command_id, decoded.forward, decoded.left, decoded.angular,
+                   decoded.kick_speed, decoded.kick_angle, decoded.dribbler_speed)
+            if got != expected or (decoded.vision is not None) != parsed.HasField('vision'):
+                print(f"MISMATCH: {name}, id {robot_id}: decoder disagrees with ParseFromString")
+                failures += 1
+
+    # truncated and corrupted datagrams raise ValueError and nothing else
+    wire = bytes(TritonBotEncoder(2).encode(3.0, -3.0, 25.0))
+    for end in range(len(wire)):
+        for data in (wire[:end], wire[:end] + b'\xff' * 3):
+            try:
+                decode(data)
+            except ValueError:
+                pass
+            except Exception as e:  # anything but ValueError is what this checks for
+                print(f"MISMATCH: {type(e).__name__} on {data.hex()}")
+                failures += 1
+    return failures
+
+
+def run_benchmark(n: int, robot_id: int = 2):
+    from messages import new_bot_message
+    from triton_bot_communication_pb2 import TritonBotMessage
+
+    if check((robot_id,)):
+        raise SystemExit("codec disagrees with the protobuf runtime")
+    print(f"{'case':<14} {'pb2 new msg':>11} {'pb2 reuse':>10} {'codec enc':>10} {'speedup':>8}"
+          f" {'pb2 parse':>10} {'codec dec':>10}")
+    for name, fields, with_vision in _bench_cases():
+        encoder = TritonBotEncoder(robot_id, DEFAULT_VISION if with_vision else None)
+        reused = new_bot_message(robot_id)
+        if not with_vision:
+            reused.ClearField('vision')
+
+        def fill_and_serialize(message):
+            return _fill(message, fields).SerializeToString()
+
+        def build_and_serialize():
+            message = new_bot_message(robot_id)
+            if not with_vision:
+                message.ClearField('vision')
+            return fill_and_serialize(message)
+
+        reference = build_and_serialize()
+        parsed = TritonBotMessage()
+
+        t_build = _timeit(build_and_serialize, n)
+        t_reuse = _timeit(lambda: fill_and_serialize(reused), n)
+        t_fast = _timeit(lambda: encoder.encode(**fields), n)
+        t_parse = _timeit(lambda: parsed.ParseFromString(reference), n)
+        t_dec = _timeit(lambda: decode(reference), n)
+        print(f"{name:<14} {t_build * 1e6:8.2f} us {t_reuse * 1e6:7.2f} us {t_fast * 1e6:7.2f} us"
+              f" {t_reuse / t_fast:7.1f}x {t_parse * 1e6:7.2f} us {t_dec * 1e6:7.2f} us")
+
+
+def main():
+    p = argparse.ArgumentParser(description="Hand-rolled TritonBotMessage codec")
+    p.add_argument("--check", action="store_true", help="Verify against the protobuf runtime")
+    p.add_argument("--bench", action="store_true", help="Benchmark against the protobuf runtime")
+    p.add_argument("-n", type=int, default=100000, help="Iterations per benchmark case")
+    args = p.parse_args()
+    if args.check:
+        failures = check()
+        print(f"{'OK' if not failures else f'{failures} FAILED'}: encoder and decoder match the protobuf runtime")
+        if failures:
+            raise SystemExit(1)
+    if args.bench:
+        run_benchmark(args.n)
+    if not (args.check or args.bench):
+        p.print_help()
+
+
+if __name__ == '__main__':
+    main()
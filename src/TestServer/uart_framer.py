@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Incremental, resynchronizing parser for the ESP32 <-> STM32 UART framing.
+
+Two frame types share the 0xCA 0xFE header:
+  - command frames, ESP32 -> STM32 (HAL_UART_RxCpltCallback in drivetrain main.c):
+        0xCA 0xFE, 4 x big-endian int16 wheel speeds, 1 dribble flag byte (11 bytes)
+  - feedback frames, STM32 -> ESP32 (read back in esp32.ino):
+        0xCA 0xFE, motor index, big-endian int16 speed (5 bytes)
+
+feed() accepts chunks of any size. bytes, bytearray and mmap chunks are
+parsed in place through NumPy views; runs of back-to-back frames are decoded
+in one vectorized step into preallocated arrays, and only the < 1 frame tail
+of each chunk is carried over to the next call. Anything that isn't a header
+where one is expected counts as a desync event and the parser skips to the
+next 0xCA 0xFE, like the firmware's header state machine.
+
+Usage:
+    framer = CommandFramer(on_frames=lambda n: print(framer.wheel_speeds[:n]))
+    framer.feed(serial_port.read(4096))
+
+    python uart_framer.py --bench 8                       # 8 MB synthetic stream
+    python uart_framer.py --file capture.bin --type feedback
+"""
+import abc
+import argparse
+import time
+
+import numpy as np
+
+HEADER = b'\xca\xfe'
+HEADER_1, HEADER_2 = HEADER
+COMMAND_FRAME_SIZE = 11
+FEEDBACK_FRAME_SIZE = 5
+UART_BAUD = 115200
+
+
+class StreamFramer(abc.ABC):
+    """Base framer: finds fixed-size 0xCA 0xFE frames and hands runs of them to _store()."""
+
+    frame_size = 0
+
+    def __init__(self, capacity: int = 4096, on_frames=None):
+        self.capacity = capacity
+        self.on_frames = on_frames
+        self.carry = b''
+        self.filled = 0
+        self.frames = 0
+        self.desyncs = 0
+        self.skipped_bytes = 0
+        self.bytes_in = 0
+
+    @abc.abstractmethod
+    def _store(self, rows: np.ndarray, index: int):
+        """Decode a run of validated frame rows into the output arrays starting at index."""
+
+    def flush(self):
+        """Hand the decoded frames to on_frames and start refilling the output arrays."""
+        if self.filled and self.on_frames is not None:
+            self.on_frames(self.filled)
+        self.filled = 0
+
+    def feed(self, chunk) -> int:
+        """Parse one chunk; return the number of frames completed by it."""
+        if not hasattr(chunk, 'find'):
+            chunk = bytes(chunk)  # memoryview and friends have no find()
+        before = self.frames
+        self.bytes_in += len(chunk)
+        start = 0
+        if self.carry:
+            # the carried tail plus one frame of new data always holds the frame it began
+            joined = self.carry + bytes(chunk[:self.frame_size])
+            pos = self._parse(joined, 0, len(joined), stop_at=len(self.carry))
+            if pos < len(self.carry):
+                self.carry = joined[pos:]
+                self.flush()
+                return self.frames - before
+            start = pos - len(self.carry)
+            self.carry = b''
+        pos = self._parse(chunk, start, len(chunk))
+        self.carry = bytes(chunk[pos:])
+        self.flush()
+        return self.frames - before
+
+    def _parse(self, buf, pos: int, end: int, stop_at: int = None) -> int:
+        """Decode frames from buf[pos:end]; return where the unconsumed tail begins."""
+        fs = self.frame_size
+        limit = end if stop_at is None else stop_at
+        while pos < limit:
+            avail = (end - pos) // fs
+            if avail == 0:
+                break
+            if buf[pos] == HEADER_1 and buf[pos + 1] == HEADER_2:
+                n = min(avail, self.capacity - self.filled)
+                rows = np.frombuffer(buf, np.uint8, n * fs, pos).reshape(n, fs)
+                ok = (rows[:, 0] == HEADER_1) & (rows[:, 1] == HEADER_2)
+                run = n if ok.all() else int(ok.argmin())
+                self._store(rows[:run], self.filled)
+                self.filled += run
+                self.frames += run
+                pos += run * fs
+                if self.filled == self.capacity:
+                    self.flush()
+                continue
+
+            self.desyncs += 1
+            nxt = buf.find(HEADER, pos + 1, end)
+            if nxt < 0:
+                # a trailing 0xCA may be the first half of the next header
+                nxt = end - 1 if buf[end - 1] == HEADER_1 else end
+                self.skipped_bytes += nxt - pos
+                return nxt
+            self.skipped_bytes += nxt - pos
+            pos = nxt
+        return pos
+
+    def summary(self) -> str:
+        return (f"{self.frames} frames from {self.bytes_in} bytes, "
+                f"{self.desyncs} desyncs, {self.skipped_bytes} bytes skipped")
+
+
+class CommandFramer(StreamFramer):
+    """ESP32 -> STM32 command frames: wheel_speeds[i] is FR, BR, BL, FL; dribble[i] the flag byte."""
+
+    frame_size = COMMAND_FRAME_SIZE
+
+    def __init__(self, capacity: int = 4096, on_frames=None):
+        super().__init__(capacity, on_frames)
+        self.wheel_speeds = np.zeros((capacity, 4), dtype=np.int16)
+        self.dribble = np.zeros(capacity, dtype=np.uint8)
+
+    def _store(self, rows: np.ndarray, index: int):
+        n = rows.shape[0]
+        self.wheel_speeds[index:index + n] = rows[:, 2:10].copy().view('>i2')
+        self.dribble[index:index + n] = rows[:, 10]
+
+
+class FeedbackFramer(StreamFramer):
+    """STM32 -> ESP32 feedback frames: motor[i] index and speed[i] RPM."""
+
+    frame_size = FEEDBACK_FRAME_SIZE
+
+    def __init__(self, capacity: int = 4096, on_frames=None):
+        super().__init__(capacity, on_frames)
+        self.motor = np.zeros(capacity, dtype=np.uint8)
+        self.speed = np.zeros(capacity, dtype=np.int16)
+
+    def _store(self, rows: np.ndarray, index: int):
+        n = rows.shape[0]
+        self.motor[index:index + n] = rows[:, 2]
+        self.speed[index:index + n] = (rows[:, 3].astype(np.int16) << 8) | rows[:, 4]
+
+
+def pack_command_frames(wheel_speeds, dribble) -> bytes:
+    """Concatenate command frames for (N, 4) wheel speeds and N dribble flags."""
+    speeds = np.asarray(wheel_speeds, dtype='>i2').reshape(-1, 4)
+    frames = np.empty((speeds.shape[0], COMMAND_FRAME_SIZE), dtype=np.uint8)
+    frames[:, 0], frames[:, 1] = HEADER_1, HEADER_2
+    frames[:, 2:10] = speeds.view(np.uint8).reshape(-1, 8)
+    frames[:, 10] = np.asarray(dribble, dtype=np.uint8)
+    return frames.tobytes()
+
+
+def pack_feedback_frames(motor, speed) -> bytes:
+    """Concatenate feedback frames for N motor indices and N int16 speeds."""
+    motor = np.asarray(motor, dtype=np.uint8).reshape(-1)
+    frames = np.empty((motor.shape[0], FEEDBACK_FRAME_SIZE), dtype=np.uint8)
+    frames[:, 0], frames[:, 1] = HEADER_1, HEADER_2
+    frames[:, 2] = motor
+    frames[:, 3:5] = np.asarray(speed, dtype='>i2').view(np.uint8).reshape(-1, 2)
+    return frames.tobytes()
+
+
+def synthetic_stream(size: int, kind: str = 'command', garbage_every: int = 50, seed: int = 0):
+    """Build a ~size-byte stream of valid frames with a few garbage bytes every `garbage_every` frames.
+
+    Returns (stream, frames_written). Garbage bytes never contain 0xCA, so every
+    written frame is recoverable.
+    """
+    rng = np.random.default_rng(seed)
+    blocks = []
+    written = 0
+    total = 0
+    while total < size:
+        if kind == 'command':
+            block = pack_command_frames(rng.integers(-15000, 15000, (garbage_every, 4)),
+                                        rng.integers(0, 2, garbage_every))
+        else:
+            block = pack_feedback_frames(rng.integers(0, 4, garbage_every),
+                                         rng.integers(-15000, 15000, garbage_every))
+        block += rng.integers(0, 0xC0, int(rng.integers(1, 8)), dtype=np.uint8).tobytes()
+        written += garbage_every
+        blocks.append(block)
+        total += len(block)
+    return b''.join(blocks), written
+
+
+def run_benchmark(size_mb: float, kind: str, chunk: int):
+    stream, expected = synthetic_stream(int(size_mb * 1e6), kind)
+    framer = CommandFramer() if kind == 'command' else FeedbackFramer()
+    chunks = [stream[i:i + chunk] for i in range(0, len(stream), chunk)]
+    start = time.perf_counter()
+    for part in chunks:
+        framer.feed(part)
+    elapsed = time.perf_counter() - start
+    rate = len(stream) / elapsed
+    print(f"{kind}: {len(stream) / 1e6:.1f} MB in {chunk}-byte chunks, {elapsed * 1e3:.1f} ms "
+          f"({rate / 1e6:.1f} MB/s, {framer.frames / elapsed / 1e6:.2f} M frames/s, "
+          f"{rate * 10 / UART_BAUD:.0f}x a saturated {UART_BAUD} baud link)")
+    print(f"  {framer.summary()}; expected {expected} frames")
+    if framer.frames != expected:
+        raise SystemExit("frame count mismatch")
+
+
+def main():
+    p = argparse.ArgumentParser(description="Parse ESP32 <-> STM32 UART frame streams")
+    p.add_argument("--type", choices=("command", "feedback"), default="command", help="Frame type in the stream")
+    p.add_argument("--file", default=None, help="Parse a captured byte stream from this file")
+    p.add_argument("--bench", type=float, default=0.0, metavar="MB", help="Benchmark on a synthetic stream of this size")
+    p.add_argument("--chunk", type=int, default=4096, help="Bytes per feed() call")
+    args = p.parse_args()
+
+    if args.bench:
+        run_benchmark(args.bench, args.type, args.chunk)
+        return
+    if not args.file:
+        p.print_help()
+        return
+
+    if args.type == 'command':
+        framer = CommandFramer()
+        framer.on_frames = lambda n: [print(f"wheels {list(framer.wheel_speeds[i])} dribble {framer.dribble[i]}")
+                                      for i in range(n)]
+    else:
+        framer = FeedbackFramer()
+        framer.on_frames = lambda n: [print(f"motor {framer.motor[i]} speed {framer.speed[i]}") for i in range(n)]
+    with open(args.file, 'rb') as f:
+        while True:
+            part = f.read(args.chunk)
+            if not part:
+                break
+            framer.feed(part)
+    print(framer.summary())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Unicast fan-out transport for a team of ESP32s.
+
+UserControlUnicast.py sends through one unconnected socket with sendto(), so
+the kernel parses the address and looks up a route for every datagram. For a
+team this transport resolves a robot-id -> (ip, port) table once, then sends
+a whole tick's worth of per-robot datagrams in one pass:
+
+  connected  one connected, non-blocking UDP socket per robot; each datagram
+             is a plain send() on a socket whose route is already cached
+  sendmmsg   Linux only: one unconnected socket and a prebuilt mmsghdr array
+             with the robots' sockaddr_in, so the whole tick is one syscall
+             (called through ctypes; the socket module has no sendmmsg)
+
+On loopback with CPython the two are within noise of each other and of
+sendto(): the kernel's per-datagram delivery dominates, and the ctypes field
+writes cost about what the saved syscalls do. connected is the default
+because it never does worse and it reports per-robot errors; run --bench on
+the target machine before switching to sendmmsg.
+Every destination keeps sent / queue-full (EAGAIN, ENOBUFS) / error counters;
+a robot that is down shows up as ECONNREFUSED errors on the connected path.
+
+Robot tables are "id=ip[:port]" lists, e.g. "2=192.168.8.80,3=192.168.8.81",
+or a file with one "id ip[:port]" per line.
+
+Usage:
+    fanout = UnicastFanout(load_robot_table("robots.txt"))
+    fanout.send_tick([(rid, encoders[rid].encode(...)) for rid in team])
+
+    python unicast_fanout.py --table 2=192.168.8.80,3=192.168.8.81 --rate 100
+    python unicast_fanout.py --bench                  # vs sendto at 6, 11, 22 robots
+"""
+import argparse
+import ctypes
+import ctypes.util
+import errno
+import os
+import socket
+import sys
+import time
+
+from messages import UDP_PORT, parse_robot_ids
+from scheduler import TickScheduler
+from triton_codec import TritonBotEncoder
+
+QUEUE_FULL_ERRNOS = (errno.EAGAIN, errno.EWOULDBLOCK, errno.ENOBUFS)
+MAX_DATAGRAM = 2048
+
+
+def parse_robot_table(spec: str, port: int = UDP_PORT) -> dict:
+    """Parse "2=192.168.8.80,3=192.168.8.81:3334" into {robot_id: (ip, port)}."""
+    table = {}
+    for entry in spec.replace('\n', ',').split(','):
+        entry = entry.split('#', 1)[0].strip()
+        if not entry:
+            continue
+        rid, _, addr = entry.replace('=', ' ').partition(' ')
+        host, _, entry_port = addr.strip().partition(':')
+        table[int(rid)] = (socket.gethostbyname(host), int(entry_port) if entry_port else port)
+    return table
+
+
+def load_robot_table(path_or_spec: str, port: int = UDP_PORT) -> dict:
+    """Read a robot table from a file if one exists at path_or_spec, else parse it as a spec."""
+    if os.path.exists(path_or_spec):
+        with open(path_or_spec) as f:
+            return parse_robot_table(f.read(), port)
+    return parse_robot_table(path_or_spec, port)
+
+
+class DestinationStats:
+    """Counters for one robot's destination."""
+
+    __slots__ = ('sent', 'bytes', 'queue_full', 'errors', 'last_error')
+
+    def __init__(self):
+        self.sent = 0
+        self.bytes = 0
+        self.queue_full = 0
+        self.errors = 0
+        self.last_error = None
+
+    def record_error(self, err: OSError):
+        if err.errno in QUEUE_FULL_ERRNOS:
+            self.queue_full += 1
+        else:
+            self.errors += 1
+            self.last_error = errno.errorcode.get(err.errno, str(err.errno))
+
+    def summary(self) -> str:
+        line = f"sent {self.sent:8d}  queue-full {self.queue_full:5d}  errors {self.errors:5d}"
+        return line + (f" (last {self.last_error})" if self.last_error else "")
+
+
+class _Iovec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+
+class _Msghdr(ctypes.Structure):
+    _fields_ = [('msg_name', ctypes.c_void_p), ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.POINTER(_Iovec)), ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p), ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
+
+
+class _Mmsghdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _Msghdr), ('msg_len', ctypes.c_uint)]
+
+
+_MMSGHDR_SIZE = ctypes.sizeof(_Mmsghdr)
+
+
+class _SockaddrIn(ctypes.Structure):
+    _fields_ = [('sin_family', ctypes.c_ushort), ('sin_port', ctypes.c_ubyte * 2),
+                ('sin_addr', ctypes.c_ubyte * 4), ('sin_zero', ctypes.c_ubyte * 8)]
+
+
+def _load_sendmmsg():
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        fn = libc.sendmmsg
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = (ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int)
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_sendmmsg = _load_sendmmsg()
+SENDMMSG_AVAILABLE = _sendmmsg is not None
+
+
+class UnicastFanout:
+    """Sends one datagram per robot per tick to a robot-id -> (ip, port) table."""
+
+    def __init__(self, table: dict, mode: str = 'connected', sndbuf: int = 1 << 20):
+        if mode == 'sendmmsg' and not SENDMMSG_AVAILABLE:
+            raise ValueError("sendmmsg is not available on this platform")
+        if mode not in ('connected', 'sendmmsg'):
+            raise ValueError(f"unknown fan-out mode {mode!r}")
+        self.mode = mode
+        self.table = dict(table)
+        self.stats = {rid: DestinationStats() for rid in self.table}
+        self.sockets = {}
+        if mode == 'connected':
+            for rid, addr in self.table.items():
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+                sock.setblocking(False)
+                sock.connect(addr)
+                self.sockets[rid] = sock
+            self._senders = {rid: sock.send for rid, sock in self.sockets.items()}
+        else:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+            self.sock.setblocking(False)
+            self._build_mmsg()
+
+    def _build_mmsg(self):
+        # msgs[k] always points at iovs[k]; only the destination of position k and
+        # the iovec need touching per tick, and the names only when the order changes
+        n = len(self.table)
+        self._slot = {rid: i for i, rid in enumerate(self.table)}
+        self._names = (_SockaddrIn * n)()
+        self._iovs = (_Iovec * n)()
+        self._msgs = (_Mmsghdr * n)()
+        self._name_at = list(range(n))
+        # datagrams are copied into fixed slots of one pool so the iovecs never move
+        self._pool = bytearray(n * MAX_DATAGRAM)
+        pool_addr = ctypes.addressof((ctypes.c_char * len(self._pool)).from_buffer(self._pool))
+        for k in range(n):
+            self._iovs[k].iov_base = pool_addr + k * MAX_DATAGRAM
+        for i, (ip, port) in enumerate(self.table.values()):
+            name = self._names[i]
+            name.sin_family = socket.AF_INET
+            name.sin_port[:] = port.to_bytes(2, 'big')  # network byte order
+            name.sin_addr[:] = socket.inet_aton(ip)
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name = ctypes.addressof(name)
+            hdr.msg_namelen = ctypes.sizeof(_SockaddrIn)
+            hdr.msg_iov = ctypes.pointer(self._iovs[i])
+            hdr.msg_iovlen = 1
+        self._name_addr = [ctypes.addressof(name) for name in self._names]
+
+    def send_tick(self, datagrams) -> int:
+        """Send (robot_id, datagram) pairs in one pass; return how many were accepted by the kernel.
+
+        In sendmmsg mode, raises ValueError for more pairs than robots or a datagram over MAX_DATAGRAM.
+        """
+        if self.mode == 'connected':
+            return self._send_connected(datagrams)
+        return self._send_mmsg(datagrams)
+
+    def _send_connected(self, datagrams) -> int:
+        senders = self._senders
+        stats = self.stats
+        sent = 0
+        for rid, data in datagrams:
+            try:
+                senders[rid](data)
+            except OSError as err:
+                stats[rid].record_error(err)
+                continue
+            s = stats[rid]
+            s.sent += 1
+            s.bytes += len(data)
+            sent += 1
+        return sent
+
+    def _send_mmsg(self, datagrams) -> int:
+        slot = self._slot
+        iovs = self._iovs
+        msgs = self._msgs
+        name_at = self._name_at
+        pool = self._pool
+        order = []
+        for k, (rid, data) in enumerate(datagrams):
+            if k >= len(msgs):
+                raise ValueError(f"more than {len(msgs)} datagrams in one tick (one per robot)")
+            size = len(data)
+            if size > MAX_DATAGRAM:
+                raise ValueError(f"datagram for robot {rid} is {size} B, over MAX_DATAGRAM ({MAX_DATAGRAM} B)")
+            i = slot[rid]
+            if name_at[k] != i:
+                msgs[k].msg_hdr.msg_name = self._name_addr[i]
+                name_at[k] = i
+            offset = k * MAX_DATAGRAM
+            pool[offset:offset + size] = data
+            iovs[k].iov_len = size
+            order.append((rid, size))
+        fd = self.sock.fileno()
+        base = ctypes.addressof(msgs)
+        total = len(order)
+        done = 0
+        sent = 0
+        while done < total:
+            count = _sendmmsg(fd, base + done * _MMSGHDR_SIZE, total - done, 0)
+            if count < 0:
+                # the datagram at `done` failed; count it and carry on with the rest of the tick
+                err = ctypes.get_errno()
+                self.stats[order[done][0]].record_error(OSError(err, os.strerror(err)))
+                done += 1
+                continue
+            for rid, size in order[done:done + count]:
+                s = self.stats[rid]
+                s.sent += 1
+                s.bytes += size
+            done += count
+            sent += count
+        return sent
+
+    def close(self):
+        for sock in self.sockets.values():
+            sock.close()
+        if self.mode == 'sendmmsg':
+            self.sock.close()
+
+    def summary(self) -> str:
+        return "\n".join(f"robot {rid:2d} -> {ip}:{port}  {self.stats[rid].summary()}"
+                         for rid, (ip, port) in self.table.items())
+
+
+class SendtoFanout:
+    """The UserControlUnicast.py path: one unconnected socket, sendto() per datagram. Benchmark baseline."""
+
+    def __init__(self, table: dict):
+        self.table = dict(table)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+
+    def send_tick(self, datagrams) -> int:
+        sendto = self.sock.sendto
+        table = self.table
+        for rid, data in datagrams:
+            sendto(data, table[rid])
+        return len(datagrams)
+
+    def close(self):
+        self.sock.close()
+
+
+def run_benchmark(sizes=(6, 11, 22), ticks: int = 2000):
+    print(f"{'robots':>6} {'mode':<10} {'us/tick':>9} {'us/pkt':>8} {'kpkt/s':>9}  received")
+    for n in sizes:
+        receivers = []
+        table = {}
+        for rid in range(n):
+            rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            rx.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 21)
+            rx.bind(('127.0.0.1', 0))
+            rx.setblocking(False)
+            receivers.append(rx)
+            table[rid] = rx.getsockname()
+        datagrams = [(rid, bytes(TritonBotEncoder(rid).encode(3.0, 0.0, 25.0))) for rid in table]
+
+        modes = [('sendto', lambda: SendtoFanout(table)), ('connected', lambda: UnicastFanout(table, 'connected'))]
+        if SENDMMSG_AVAILABLE:
+            modes.append(('sendmmsg', lambda: UnicastFanout(table, 'sendmmsg')))
+        for name, make in modes:
+            fanout = make()
+            received = 0
+            best = float('inf')
+            for _ in range(5):
+                elapsed = 0.0
+                for chunk in range(0, ticks, 100):
+                    start = time.perf_counter()
+                    for _ in range(100):
+                        fanout.send_tick(datagrams)
+                    elapsed += time.perf_counter() - start
+                    for rx in receivers:  # drain outside the timed region
+                        try:
+                            while True:
+                                rx.recv(MAX_DATAGRAM)
+                                received += 1
+                        except BlockingIOError:
+                            pass
+                best = min(best, elapsed / ticks)
+            fanout.close()
+            print(f"{n:6d} {name:<10} {best * 1e6:9.2f} {best / n * 1e6:8.3f} {n / best / 1e3:9.1f}  "
+                  f"{received}/{5 * ticks * n}")
+        for rx in receivers:
+            rx.close()
+
+
+def main():
+    p = argparse.ArgumentParser(description="Unicast fan-out to a team of robots")
+    p.add_argument("--table", default=None, help="Robot table file or spec, e.g. 2=192.168.8.80,3=192.168.8.81")
+    p.add_argument("--port", type=int, default=UDP_PORT, help="Port for table entries without one")
+    p.add_argument("--mode", choices=("connected", "sendmmsg"), default="connected", help="Fan-out method")
+    p.add_argument("--rate", type=float, default=100.0, help="Tick rate (Hz)")
+    p.add_argument("--spin", type=float, default=0.0, help="Angular velocity command for every robot (rad/s)")
+    p.add_argument("--duration", type=float, default=0.0, help="Stop after this many seconds (0 = until Ctrl-C)")
+    p.add_argument("--bench", action="store_true", help="Benchmark against per-packet sendto at 6, 11 and 22 robots")
+    p.add_argument("--bench-robots", default="6,11,22", help="Team sizes for --bench")
+    args = p.parse_args()
+
+    if args.bench:
+        run_benchmark(parse_robot_ids(args.bench_robots))
+        return
+    if not args.table:
+        p.error("--table is required unless --bench is given")
+
+    fanout = UnicastFanout(load_robot_table(args.table, args.port), args.mode)
+    encoders = {rid: TritonBotEncoder(rid) for rid in fanout.table}
+    print(f"Unicast fan-out ({fanout.mode}) to {len(encoders)} robots at {args.rate:g} Hz")
+    scheduler = TickScheduler(args.rate)
+    start = last_report = time.perf_counter()
+    try:
+        while True:
+            fanout.send_tick([(rid, enc.encode(0.0, 0.0, args.spin)) for rid, enc in encoders.items()])
+            now = time.perf_counter()
+            if now - last_report >= 1.0:
+                print(fanout.summary())
+                last_report = now
+            if args.duration and now - start >= args.duration:
+                break
+            scheduler.wait()
+    except KeyboardInterrupt:
+        print('\nStopping.')
+    finally:
+        fanout.send_tick([(rid, enc.encode(0.0, 0.0, 0.0)) for rid, enc in encoders.items()])
+        print(fanout.summary())
+        fanout.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+SSL-Vision receiver that keeps the latest pose of every robot and the ball.
+
+Decodes SSL_WrapperPacket datagrams from the vision multicast group and merges
+the detections of all cameras into preallocated NumPy structured arrays
+indexed by (team, robot_id). Overlapping cameras see the same robot at almost
+the same capture time; within `merge_window` seconds the more confident
+detection wins, otherwise the newer one does. Each frame's detections are
+merged in one vectorized pass.
+
+There is one writer (the receive task or thread) and any number of readers.
+NumPy may drop the GIL while it copies structured rows, so a single assignment
+is not atomic to another thread: the writer stores each frame's merged rows and
+the ball under VisionState.lock, and robot(), age() and snapshot() copy under
+it, so readers never see a half-updated pose. The merge itself reads the
+tables without the lock; only the writer changes them. vision_tuple() returns
+the fields in the order TritonBotEncoder.set_vision() and DeltaSender.set_vision()
+expect.
+
+The loopback generator moves 2 x 11 robots and a ball across a 2 x 2 camera
+layout with overlapping views and publishes noisy frames at a fixed rate.
+
+Usage:
+    state = VisionState()
+    start_vision_thread(state)                     # or: await start_vision(state)
+    vision = state.vision_tuple(TEAM_YELLOW, 2)    # None until robot 2 is seen
+
+    python vision_receiver.py --listen
+    python vision_receiver.py --generate --cameras 4 --rate 60
+    python vision_receiver.py --loopback --cameras 4 --rate 60 --duration 5
+"""
+import argparse
+import asyncio
+import math
+import socket
+import struct
+import threading
+import time
+from array import array
+
+import numpy as np
+from google.protobuf.message import DecodeError
+
+from protocols import SSL_WrapperPacket
+
+VISION_GROUP = '224.5.23.2'
+VISION_PORT = 10006
+
+TEAM_YELLOW = 0
+TEAM_BLUE = 1
+TEAM_NAMES = {'yellow': TEAM_YELLOW, 'blue': TEAM_BLUE}
+MAX_ROBOTS = 16
+
+ROBOT_DTYPE = np.dtype([
+    ('confidence', 'f4'), ('x', 'f4'), ('y', 'f4'), ('orientation', 'f4'),
+    ('pixel_x', 'f4'), ('pixel_y', 'f4'), ('height', 'f4'),
+    ('t_capture', 'f8'), ('t_received', 'f8'), ('camera', 'i2'), ('valid', '?'),
+])
+BALL_DTYPE = np.dtype([
+    ('confidence', 'f4'), ('x', 'f4'), ('y', 'f4'), ('z', 'f4'),
+    ('t_capture', 'f8'), ('t_received', 'f8'), ('camera', 'i2'), ('valid', '?'),
+])
+
+
+class VisionStats:
+    """Per-receiver counters; frame gaps are counted per camera from frame_number."""
+
+    def __init__(self, capacity: int = 4096):
+        self.packets = 0
+        self.frames = 0
+        self.geometry = 0
+        self.decode_errors = 0
+        self.detections = 0
+        self.rejected = 0
+        self.out_of_range = 0
+        self.camera_frames = {}
+        self.camera_gaps = {}
+        self.last_frame_number = {}
+        self.capacity = capacity
+        self.handle_ns = array('q', bytes(8 * capacity))
+
+    def record_frame(self, camera: int, frame_number: int):
+        self.frames += 1
+        self.camera_frames[camera] = self.camera_frames.get(camera, 0) + 1
+        last = self.last_frame_number.get(camera)
+        if last is not None and frame_number > last + 1:
+            self.camera_gaps[camera] = self.camera_gaps.get(camera, 0) + frame_number - last - 1
+        self.last_frame_number[camera] = frame_number
+
+    def handle_percentile(self, q: float) -> float:
+        n = min(self.packets, self.capacity)
+        if n == 0:
+            return 0.0
+        ordered = sorted(self.handle_ns[:n])
+        return ordered[min(n - 1, int(q / 100.0 * n))] / 1e3
+
+    def summary(self) -> str:
+        cams = "  ".join(f"cam{c}: {n} ({self.camera_gaps.get(c, 0)} lost)"
+                         for c, n in sorted(self.camera_frames.items()))
+        return (f"{self.frames} frames, {self.geometry} geometry, {self.decode_errors} bad, "
+                f"{self.detections} detections ({self.rejected} merged away, {self.out_of_range} bad id); "
+                f"handle p50 {self.handle_percentile(50):.1f} us p99 {self.handle_percentile(99):.1f} us\n  {cams}")
+
+
+class VisionState:
+    """Latest merged pose per (team, robot_id) plus the ball, in preallocated arrays."""
+
+    def __init__(self, merge_window: float = 0.008, max_robots: int = MAX_ROBOTS):
+        self.merge_window = merge_window
+        self.max_robots = max_robots
+        self.robots = np.zeros((2, max_robots), dtype=ROBOT_DTYPE)
+        self.ball = np.zeros(1, dtype=BALL_DTYPE)
+        self.field_size = None  # (field_length, field_width) in mm once geometry arrives
+        self._flat = self.robots.reshape(-1)  # a view: writes land in self.robots
+        self.lock = threading.Lock()          # held by the writer's stores and the readers' copies
+        self.stats = VisionStats()
+
+    def handle_packet(self, data: bytes, now: float = None):
+        start = time.perf_counter_ns()
+        stats = self.stats
+        packet = SSL_WrapperPacket()
+        try:
+            packet.ParseFromString(data)
+        except DecodeError:
+            stats.decode_errors += 1
+            return
+        if now is None:
+            now = time.time()
+        if packet.HasField('geometry'):
+            stats.geometry += 1
+            field = packet.geometry.field
+            self.field_size = (field.field_length, field.field_width)
+        if packet.HasField('detection'):
+            self.merge_frame(packet.detection, now)
+        stats.handle_ns[stats.packets % stats.capacity] = time.perf_counter_ns() - start
+        stats.packets += 1
+
+    def merge_frame(self, frame, now: float):
+        """Merge one SSL_DetectionFrame into the tables."""
+        stats = self.stats
+        stats.record_frame(frame.camera_id, frame.frame_number)
+        t_capture = frame.t_capture
+        camera = frame.camera_id
+        max_robots = self.max_robots
+        slots = []
+        rows = []
+        for base, detections in ((0, frame.robots_yellow), (max_robots, frame.robots_blue)):
+            for r in detections:
+                if r.robot_id >= max_robots:
+                    stats.out_of_range += 1
+                    continue
+                slots.append(base + r.robot_id)
+                rows.append((r.confidence, r.x, r.y, r.orientation, r.pixel_x, r.pixel_y, r.height,
+                             t_capture, now, camera, True))
+        if rows:
+            stats.detections += len(rows)
+            self._merge_rows(np.array(slots), np.array(rows, dtype=ROBOT_DTYPE), len(set(slots)) != len(slots))
+        if frame.balls:
+            best = max(frame.balls, key=lambda b: b.confidence)
+            current = self.ball[0]
+            if self._accept(current['valid'], current['t_capture'], current['confidence'], t_capture, best.confidence):
+                with self.lock:
+                    self.ball[0] = (best.confidence, best.x, best.y, best.z, t_capture, now, camera, True)
+
+    def _accept(self, valid, t_old, conf_old, t_new, conf_new):
+        window = self.merge_window
+        return (~valid) | (t_new > t_old + window) | ((abs(t_new - t_old) <= window) & (conf_new >= conf_old))
+
+    def _merge_rows(self, slots: np.ndarray, rows: np.ndarray, duplicates: bool = False):
+        # slots index the flattened (team, robot_id) table: team * max_robots + robot_id
+        flat = self._flat
+        current = flat[slots]
+        accept = self._accept(current['valid'], current['t_capture'], current['confidence'],
+                              rows['t_capture'], rows['confidence'])
+        if not accept.all():
+            self.stats.rejected += int(len(slots) - accept.sum())
+            slots = slots[accept]
+            rows = rows[accept]
+        if duplicates:
+            # duplicate ids within one frame: assign in confidence order so the best lands last
+            order = np.argsort(rows['confidence'], kind='stable')
+            slots = slots[order]
+            rows = rows[order]
+        with self.lock:
+            flat[slots] = rows
+
+    def snapshot(self):
+        """Copies of the (team, robot_id) table and the ball, both from the same merged frame."""
+        with self.lock:
+            return self.robots.copy(), self.ball[0].copy()
+
+    def robot(self, team: int, robot_id: int):
+        """Return a copy of the robot's row (a NumPy record), or None if it hasn't been seen."""
+        with self.lock:
+            row = self.robots[team, robot_id].copy()
+        return row if row['valid'] else None
+
+    def vision_tuple(self, team: int, robot_id: int):
+        """(confidence, robot_id, x, y, orientation, pixel_x, pixel_y, height), or None if unseen."""
+        row = self.robot(team, robot_id)
+        if row is None:
+            return None
+        return (float(row['confidence']), robot_id, float(row['x']), float(row['y']), float(row['orientation']),
+                float(row['pixel_x']), float(row['pixel_y']), float(row['height']))
+
+    def age(self, team: int, robot_id: int, now: float = None) -> float:
+        """Seconds since the robot's current pose was received (inf if unseen)."""
+        with self.lock:
+            row = self.robots[team, robot_id].copy()
+        if not row['valid']:
+            return math.inf
+        return (time.time() if now is None else now) - float(row['t_received'])
+
+
+class VisionProtocol(asyncio.DatagramProtocol):
+    def __init__(self, state: VisionState):
+        self.state = state
+
+    def datagram_received(self, data: bytes, addr):
+        self.state.handle_packet(data)
+
+
+def vision_socket(group: str = VISION_GROUP, port: int = VISION_PORT, iface: str = '0.0.0.0') -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+    sock.bind(('', port))
+    mreq = struct.pack('4s4s', socket.inet_aton(group), socket.inet_aton(iface))
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+    return sock
+
+
+async def start_vision(state: VisionState, group: str = VISION_GROUP, port: int = VISION_PORT):
+    """Receive vision on the running event loop; returns the transport."""
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(lambda: VisionProtocol(state), sock=vision_socket(group, port))
+    return transport
+
+
+def start_vision_thread(state: VisionState, group: str = VISION_GROUP, port: int = VISION_PORT) -> threading.Thread:
+    """Receive vision on a daemon thread, for the synchronous send loops."""
+    sock = vision_socket(group, port)
+
+    def receive():
+        while True:
+            state.handle_packet(sock.recv(65536))
+
+    thread = threading.Thread(target=receive, name='vision', daemon=True)
+    thread.start()
+    return thread
+
+
+class VisionFrameGenerator:
+    """Synthetic SSL-Vision: robots on smooth paths, a 2 x 2 (or 1 x N) camera layout with overlap."""
+
+    def __init__(self, cameras: int = 4, robots_per_team: int = 11, field=(12000, 9000),
+                 overlap: float = 600.0, noise: float = 2.0, seed: int = 0):
+        self.cameras = cameras
+        self.field = field
+        self.noise = noise
+        self.rng = np.random.default_rng(seed)
+        n = 2 * robots_per_team
+        self.robots_per_team = robots_per_team
+        self.phase = self.rng.uniform(0, 2 * math.pi, n)
+        self.speed = self.rng.uniform(0.2, 0.6, n)
+        self.radius = self.rng.uniform(500, 2500, n)
+        self.center = np.column_stack([self.rng.uniform(-field[0] / 3, field[0] / 3, n),
+                                       self.rng.uniform(-field[1] / 4, field[1] / 4, n)])
+        self.frame_numbers = [0] * cameras
+        cols = 2 if cameras >= 4 else cameras
+        rows = math.ceil(cameras / cols)
+        half_l, half_w = field[0] / 2, field[1] / 2
+        self.views = []
+        for c in range(cameras):
+            col, row = c % cols, c // cols
+            x0 = -half_l + col * field[0] / cols
+            y0 = -half_w + row * field[1] / rows
+            self.views.append((x0 - overlap, x0 + field[0] / cols + overlap,
+                               y0 - overlap, y0 + field[1] / rows + overlap))
+
+    def truth(self, t: float):
+        """Noise-free (x, y, orientation) of every robot at time t, yellow first."""
+        angle = self.phase + self.speed * t
+        x = self.center[:, 0] + self.radius * np.cos(angle)
+        y = self.center[:, 1] + self.radius * np.sin(angle)
+        orientation = (angle + math.pi / 2 + math.pi) % (2 * math.pi) - math.pi
+        return x, y, orientation
+
+    def ball(self, t: float):
+        return 3000 * math.sin(0.3 * t), 2000 * math.sin(0.5 * t)
+
+    def frame(self, camera: int, t: float) -> bytes:
+        x, y, orientation = self.truth(t)
+        x0, x1, y0, y1 = self.views[camera]
+        noise = self.rng.normal(0.0, self.noise, (2, len(x)))
+        packet = SSL_WrapperPacket()
+        det = packet.detection
+        self.frame_numbers[camera] += 1
+        det.frame_number = self.frame_numbers[camera]
+        det.t_capture = t
+        det.t_sent = t
+        det.camera_id = camera
+        n = self.robots_per_team
+        for i in range(len(x)):
+            if not (x0 <= x[i] <= x1 and y0 <= y[i] <= y1):
+                continue
+            robot = (det.robots_yellow if i < n else det.robots_blue).add()
+            robot.confidence = 0.9 - 0.1 * self.rng.random()
+            robot.robot_id = i % n
+            robot.x = x[i] + noise[0, i]
+            robot.y = y[i] + noise[1, i]
+            robot.orientation = orientation[i]
+            robot.pixel_x = 0.0
+            robot.pixel_y = 0.0
+            robot.height = 150.0
+        bx, by = self.ball(t)
+        if x0 <= bx <= x1 and y0 <= by <= y1:
+            ball = det.balls.add()
+            ball.confidence = 0.95
+            ball.x = bx
+            ball.y = by
+            ball.pixel_x = 0.0
+            ball.pixel_y = 0.0
+        return packet.SerializeToString()
+
+    def geometry(self) -> bytes:
+        packet = SSL_WrapperPacket()
+        field = packet.geometry.field
+        field.field_length, field.field_width = self.field
+        field.goal_width = 1800
+        field.goal_depth = 180
+        field.boundary_width = 300
+        packet.geometry.calib.add(camera_id=0, focal_length=500, principal_point_x=390, principal_point_y=290,
+                                  distortion=0.0, q0=0, q1=0, q2=0, q3=1, tx=0, ty=0, tz=3500)
+        return packet.SerializeToString()
+
+
+async def run_generator(generator: VisionFrameGenerator, rate: float, duration: float,
+                        dest=(VISION_GROUP, VISION_PORT)) -> int:
+    """Publish one frame per camera every 1/rate s (0 = as fast as possible); return frames sent."""
+    loop = asyncio.get_running_loop()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, struct.pack('b', 1))
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+    period = 1.0 / rate if rate > 0 else 0.0
+    start = loop.time()
+    tick = 0
+    sent = 0
+    geometry = generator.geometry()
+    try:
+        while not duration or loop.time() - start < duration:
+            t = time.time()
+            if tick % max(int(rate), 1) == 0:
+                sock.sendto(geometry, dest)
+            for camera in range(generator.cameras):
+                sock.sendto(generator.frame(camera, t), dest)
+                sent += 1
+            tick += 1
+            await asyncio.sleep(max(0.0, start + tick * period - loop.time()))
+    finally:
+        sock.close()
+    return sent
+
+
+async def run_loopback(args):
+    state = VisionState()
+    transport = await start_vision(state, args.group, args.port)
+    generator = VisionFrameGenerator(args.cameras, seed=args.seed)
+    sent = await run_generator(generator, args.rate, args.duration or 5.0, (args.group, args.port))
+    await asyncio.sleep(0.2)
+    transport.close()
+
+    now = time.time()
+    x, y, _ = generator.truth(now)
+    errors = []
+    n = generator.robots_per_team
+    for i in range(2 * n):
+        row = state.robot(TEAM_YELLOW if i < n else TEAM_BLUE, i % n)
+        if row is not None:
+            # compare with the truth at the row's own capture time
+            tx, ty, _ = generator.truth(float(row['t_capture']))
+            errors.append(math.hypot(float(row['x']) - tx[i], float(row['y']) - ty[i]))
+    stats = state.stats
+    rate = stats.frames / (args.duration or 5.0)
+    print(f"loopback: {args.cameras} cameras at {args.rate:g} Hz, sent {sent} frames, received {stats.frames} "
+          f"({rate:.0f} frames/s)")
+    print(f"  {stats.summary()}")
+    print(f"  tracked {len(errors)}/{2 * n} robots, position error mean {np.mean(errors):.1f} mm "
+          f"max {np.max(errors):.1f} mm, field {state.field_size}")
+    if stats.frames < 0.99 * sent:
+        raise SystemExit("receiver fell behind")
+
+
+async def run_listen(args):
+    state = VisionState()
+    await start_vision(state, args.group, args.port)
+    while True:
+        await asyncio.sleep(args.report)
+        now = time.time()
+        print(state.stats.summary())
+        for team, name in ((TEAM_YELLOW, 'yellow'), (TEAM_BLUE, 'blue')):
+            seen = [f"{rid}:({row['x']:.0f},{row['y']:.0f})"
+                    for rid in range(state.max_robots)
+                    for row in (state.robot(team, rid),) if row is not None and now - row['t_received'] < 1.0]
+            print(f"  {name:6} {' '.join(seen)}")
+
+
+def main():
+    p = argparse.ArgumentParser(description="SSL-Vision receiver and loopback frame generator")
+    mode = p.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--listen", action="store_true", help="Receive vision and print the robot table")
+    mode.add_argument("--generate", action="store_true", help="Publish synthetic vision frames")
+    mode.add_argument("--loopback", action="store_true", help="Generate and receive in one process and report")
+    p.add_argument("--group", default=VISION_GROUP, help="Vision multicast group")
+    p.add_argument("--port", type=int, default=VISION_PORT, help="Vision port")
+    p.add_argument("--cameras", type=int, default=4, help="Cameras for --generate/--loopback")
+    p.add_argument("--rate", type=float, default=60.0, help="Frames per camera per second (0 = flat out)")
+    p.add_argument("--duration", type=float, default=0.0, help="Seconds to run (0 = until Ctrl-C; 5 for --loopback)")
+    p.add_argument("--report", type=float, default=1.0, help="Report interval for --listen (s)")
+    p.add_argument("--seed", type=int, default=0, help="Generator seed")
+    args = p.parse_args()
+
+    try:
+        if args.listen:
+            asyncio.run(run_listen(args))
+        elif args.generate:
+            generator = VisionFrameGenerator(args.cameras, seed=args.seed)
+            print(f"Publishing {args.cameras} cameras at {args.rate:g} Hz to {args.group}:{args.port}")
+            asyncio.run(run_generator(generator, args.rate, args.duration, (args.group, args.port)))
+        else:
+            asyncio.run(run_loopback(args))
+    except KeyboardInterrupt:
+        print('\nStopping.')
+
+
+if __name__ == '__main__':
+    main()
@@ -17,6 +17,10 @@ import struct
 import sys
 import time
 
+from command_log import KIND_TEXT, CommandRecorder, RecordingSocket
+from scheduler import TickScheduler
+from stage_profiler import add_profile_arguments, start_profiler
+
 MCAST_GRP = "239.42.42.42"
 MCAST_PORT = 10000
 
@@ -28,6 +32,8 @@ def main():
     p.add_argument("--step-power", type=int, default=1, help="Increment per W/S keypress ([-10,10])")
     p.add_argument("--step-rot", type=int, default=1, help="Increment per A/D keypress ([-10,10])")
     p.add_argument("--iface", default=None, help="Optional local interface IP for multicast (e.g., 192.168.x.x)")
+    p.add_argument("--record", default=None, help="Log every sent datagram to this command log")
+    add_profile_arguments(p)
     args = p.parse_args()
 
     # UDP socket to multicast group
@@ -38,6 +44,8 @@ def main():
             sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(args.iface))
         except OSError as e:
             print(f"Warning: failed to set multicast interface {args.iface}: {e}")
+    if args.record:
+        sock = RecordingSocket(sock, CommandRecorder(args.record), KIND_TEXT)
 
     def send_dash(power: int, rot: int = 0):
         msg = f"{args.robot} dash {int(power)} {int(rot)}\n"
@@ -59,16 +67,23 @@ def main():
     print("WASD teleop active -> sending to %s:%d for robot %d" % (MCAST_GRP, MCAST_PORT, args.robot))
     print("Controls: W/S forward/back, A/D rotate CCW/CW, SPACE stop, K kick, Q/ESC quit")
 
-    period = 1.0 / max(args.rate, 1e-3)
+    scheduler = TickScheduler(rate=args.rate)
+    session = start_profiler(args, 'wasd', budget=1.0 / args.rate)
+    profiler = session.profiler
+    poll, send, output = (profiler.stage(name) for name in ('input', 'sendto', 'print'))
     last_print = 0.0
 
     try:
         if using_msvcrt:
             import msvcrt
             while True:
+                profiler.tick_begin()
                 # non-blocking key read(s)
-                while msvcrt.kbhit():
-                    ch = msvcrt.getwch()
+                while True:
+                    with poll:
+                        ch = msvcrt.getwch() if msvcrt.kbhit() else None
+                    if ch is None:
+                        break
                     if ch in ('q', 'Q'):
                         return
                     if ord(ch) == 27:  # ESC
@@ -86,12 +101,15 @@ def main():
                     elif ch in ('k', 'K'):
                         send_kick()
 
-                send_dash(power, rot)
-                now = time.time()
-                if now - last_print > 0.5:
-                    print(f"power={power:>4}, rot={rot:>4}", end="\r", flush=True)
-                    last_print = now
-                time.sleep(period)
+                with send:
+                    send_dash(power, rot)
+                with output:
+                    now = time.time()
+                    if now - last_print > 0.5:
+                        print(f"power={power:>4}, rot={rot:>4}", end="\r", flush=True)
+                        last_print = now
+                profiler.tick_end()
+                scheduler.wait()
         else:
             # POSIX fallback (simple, blocking getch using termios)
             import tty, termios, select
@@ -100,9 +118,11 @@ def main():
             tty.setcbreak(fd)
             try:
                 while True:
-                    r, _, _ = select.select([sys.stdin], [], [], 0)
-                    if r:
-                        ch = sys.stdin.read(1)
+                    profiler.tick_begin()
+                    with poll:
+                        r, _, _ = select.select([sys.stdin], [], [], 0)
+                        ch = sys.stdin.read(1) if r else None
+                    if ch is not None:
                         if ch in ('q', 'Q', '\x1b'):
                             return
                         if ch in ('w', 'W'):
@@ -117,12 +137,15 @@ def main():
                             power = 0; rot = 0
                         elif ch in ('k', 'K'):
                             send_kick()
-                    send_dash(power, rot)
-                    now = time.time()
-                    if now - last_print > 0.5:
-                        print(f"power={power:>4}, rot={rot:>4}", end="\r", flush=True)
-                        last_print = now
-                    time.sleep(period)
+                    with send:
+                        send_dash(power, rot)
+                    with output:
+                        now = time.time()
+                        if now - last_print > 0.5:
+                            print(f"power={power:>4}, rot={rot:>4}", end="\r", flush=True)
+                            last_print = now
+                    profiler.tick_end()
+                    scheduler.wait()
             finally:
                 termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
     finally:
@@ -131,6 +154,9 @@ def main():
             send_dash(0, 0)
             time.sleep(0.05)
         print("\nStopped.")
+        print(scheduler.stats.summary())
+        session.close()
+        sock.close()
 
 
 if __name__ == "__main__":